@@ -0,0 +1,126 @@
+"""
+Benchmark `AaveClient` market cache behaviour around entry expiry.
+
+Main responsibility: Serve a stub Aave GraphQL `markets` endpoint with a fixed
+per-query latency, then run concurrent callers that request all five chains in
+a loop for a few TTLs and report p50/p99/max latency and the number of
+upstream queries. The same load runs with a blocking refresh on expiry
+(`cache_stale_seconds=0`), with stale-while-revalidate, and with
+stale-while-revalidate plus the proactive refresh loop.
+
+Usage (from the project root):
+    uv run python scripts/bench_market_cache.py
+    uv run python scripts/bench_market_cache.py --callers 50 --latency-ms 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from mcp_server_aave.aave.config import AaveConfig  # noqa: E402
+from mcp_server_aave.aave.module import CHAIN_ID_BY_NETWORK, AaveClient  # noqa: E402
+
+SCENARIOS = {
+    "refresh on expiry": {"cache_stale_seconds": 0},
+    "stale-while-revalidate": {},
+    "swr + refresh loop": {"cache_refresh_interval_seconds": 0.25},
+}
+
+
+def market(chain_id: int) -> dict:
+    return {
+        "name": f"Market {chain_id}",
+        "chain": {"name": str(chain_id), "chainId": chain_id},
+        "address": "0x0",
+        "totalMarketSize": "1000",
+        "totalAvailableLiquidity": "400",
+        "reserves": [],
+    }
+
+
+async def start_stub(latency_ms: float, queries: list[int]) -> TestServer:
+    async def graphql(request: web.Request) -> web.Response:
+        chain_ids = (await request.json())["variables"]["chainIds"]
+        queries.append(len(chain_ids))
+        await asyncio.sleep(latency_ms / 1000)
+        return web.json_response({"data": {"markets": [market(c) for c in chain_ids]}})
+
+    app = web.Application()
+    app.router.add_post("/graphql", graphql)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def measure(url: str, overrides: dict, args: argparse.Namespace) -> list[float]:
+    """Latencies in ms of every request made by the callers."""
+    config = AaveConfig(api_base_url=url, cache_ttl_seconds=args.ttl, **overrides)
+    client = AaveClient(config)
+    chain_ids = list(CHAIN_ID_BY_NETWORK.values())
+    latencies: list[float] = []
+    # Warm the cache so only expiry shows up in the latencies
+    await client.get_markets_report(chain_ids)
+    deadline = time.perf_counter() + args.ttl * args.ttls
+
+    async def caller() -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await client.get_markets_report(chain_ids)
+            latencies.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(args.think_ms / 1000)
+
+    try:
+        await asyncio.gather(*(caller() for _ in range(args.callers)))
+    finally:
+        await client.close()
+    return latencies
+
+
+async def run(args: argparse.Namespace) -> None:
+    queries: list[int] = []
+    server = await start_stub(args.latency_ms, queries)
+    url = f"http://{server.host}:{server.port}/graphql"
+    print(
+        f"{args.callers} callers, {len(CHAIN_ID_BY_NETWORK)} chains, query latency "
+        f"{args.latency_ms:.0f} ms, TTL {args.ttl} s, {args.ttls} TTLs"
+    )
+    print(
+        f"{'':<24} {'requests':>8} {'p50 ms':>7} {'p99 ms':>7} {'max ms':>7} "
+        f"{'queries':>8}"
+    )
+    try:
+        for name, overrides in SCENARIOS.items():
+            queries.clear()
+            latencies = await measure(url, overrides, args)
+            cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+            print(
+                f"{name:<24} {len(latencies):>8} {cuts[49]:7.1f} {cuts[98]:7.1f} "
+                f"{max(latencies):7.1f} {len(queries):>8}"
+            )
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--callers", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--think-ms", type=float, default=20.0)
+    parser.add_argument("--ttl", type=int, default=1)
+    parser.add_argument("--ttls", type=int, default=6)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
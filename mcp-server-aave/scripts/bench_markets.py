@@ -0,0 +1,154 @@
+"""
+Benchmark `AaveClient.get_markets_report` tail latency with a slow chain.
+
+Main responsibility: Serve a stub Aave GraphQL `markets` endpoint from an
+aiohttp app where every chain answers after a lognormal delay and one chain is
+occasionally very slow, then time repeated five-chain requests (cache off) in
+`combined` mode (one query for all chains) and `per_chain` mode (one query per
+chain, in parallel, with a per-chain timeout) and report p50/p95/p99 latency
+and how often the slow chain was left out.
+
+Usage (from the project root):
+    uv run python scripts/bench_markets.py
+    uv run python scripts/bench_markets.py --slow-ms 3000 --slow-rate 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from mcp_server_aave.aave.config import AaveConfig  # noqa: E402
+from mcp_server_aave.aave.module import CHAIN_ID_BY_NETWORK, AaveClient  # noqa: E402
+
+SLOW_CHAIN = CHAIN_ID_BY_NETWORK["avalanche"]
+
+
+def market(chain_id: int, reserves: int) -> dict:
+    reserve = {
+        "underlyingToken": {
+            "address": "0x1",
+            "symbol": "USDC",
+            "decimals": 6,
+            "name": "USD Coin",
+        },
+        "aToken": {"symbol": "aUSDC"},
+        "supplyInfo": {"apy": {"value": "0.02"}, "total": {"value": "900"}},
+        "borrowInfo": {
+            "apy": {"value": "0.03"},
+            "total": {"amount": {"value": "600"}},
+            "utilizationRate": {"formatted": "66.67"},
+        },
+        "usdExchangeRate": "1",
+        "isFrozen": False,
+    }
+    return {
+        "name": f"Market {chain_id}",
+        "chain": {"name": str(chain_id), "chainId": chain_id},
+        "address": "0x0",
+        "totalMarketSize": "1000",
+        "totalAvailableLiquidity": "400",
+        "reserves": [dict(reserve) for _ in range(reserves)],
+    }
+
+
+async def start_stub(args: argparse.Namespace) -> TestServer:
+    rng = random.Random(args.seed)
+
+    def chain_delay(chain_id: int) -> float:
+        if chain_id == SLOW_CHAIN and rng.random() < args.slow_rate:
+            return args.slow_ms / 1000
+        return rng.lognormvariate(0, 0.5) * args.latency_ms / 1000
+
+    async def graphql(request: web.Request) -> web.Response:
+        chain_ids = (await request.json())["variables"]["chainIds"]
+        await asyncio.sleep(max(chain_delay(c) for c in chain_ids))
+        return web.json_response(
+            {"data": {"markets": [market(c, args.reserves) for c in chain_ids]}}
+        )
+
+    app = web.Application()
+    app.router.add_post("/graphql", graphql)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def measure(
+    url: str, mode: str, args: argparse.Namespace
+) -> tuple[list[float], int]:
+    """Latencies in ms and the number of responses missing a chain."""
+    config = AaveConfig(
+        api_base_url=url,
+        enable_caching=False,
+        markets_query_mode=mode,
+        chain_timeout_seconds=args.timeout_ms / 1000,
+    )
+    client = AaveClient(config)
+    chain_ids = list(CHAIN_ID_BY_NETWORK.values())
+    latencies, partial = [], 0
+    try:
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            report = await client.get_markets_report(chain_ids)
+            latencies.append((time.perf_counter() - start) * 1000)
+            partial += bool(report.errors)
+    finally:
+        await client.close()
+    return latencies, partial
+
+
+def percentile(values: list[float], percent: float) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[int(percent) - 1]
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = await start_stub(args)
+    url = f"http://{server.host}:{server.port}/graphql"
+    print(
+        f"{len(CHAIN_ID_BY_NETWORK)} chains, median chain latency "
+        f"{args.latency_ms:.0f} ms, chain {SLOW_CHAIN} takes {args.slow_ms:.0f} ms "
+        f"in {args.slow_rate:.0%} of queries, per-chain timeout "
+        f"{args.timeout_ms:.0f} ms, {args.rounds} requests"
+    )
+    print(f"{'mode':<10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'partial':>8}")
+    try:
+        for mode in ("combined", "per_chain"):
+            latencies, partial = await measure(url, mode, args)
+            print(
+                f"{mode:<10} {percentile(latencies, 50):8.0f} "
+                f"{percentile(latencies, 95):8.0f} {percentile(latencies, 99):8.0f} "
+                f"{partial:>8}"
+            )
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency-ms", type=float, default=60.0)
+    parser.add_argument("--slow-ms", type=float, default=1500.0)
+    parser.add_argument("--slow-rate", type=float, default=0.15)
+    parser.add_argument("--timeout-ms", type=float, default=400.0)
+    parser.add_argument("--reserves", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    # Timeouts are expected here; keep the client's warnings out of the table
+    logging.getLogger("mcp_server_aave").setLevel(logging.CRITICAL)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
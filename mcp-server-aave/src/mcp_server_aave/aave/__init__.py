@@ -7,13 +7,25 @@ from mcp_server_aave.aave.config import (
                                          AaveError,
                                          get_aave_config,
 )
-from mcp_server_aave.aave.models import AssetData, PoolData, ReserveData, RiskData
-from mcp_server_aave.aave.module import AaveClient, get_aave_client
+from mcp_server_aave.aave.models import (
+    AssetData,
+    ChainQueryError,
+    MarketsReport,
+    PoolData,
+    ReserveData,
+    RiskData,
+)
+from mcp_server_aave.aave.module import (
+    CHAIN_ID_BY_NETWORK,
+    AaveClient,
+    get_aave_client,
+)
 
 __all__ = [
     # Client
     "AaveClient",
     "get_aave_client",
+    "CHAIN_ID_BY_NETWORK",
     # Config
     "AaveConfig",
     "get_aave_config",
@@ -26,6 +38,8 @@ __all__ = [
     # Models
     "ReserveData",
     "PoolData",
+    "MarketsReport",
+    "ChainQueryError",
     "AssetData",
     "RiskData",
 ]
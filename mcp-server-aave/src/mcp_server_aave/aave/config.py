@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -48,6 +49,15 @@ class AaveConfig(BaseSettings):
         timeout_seconds: Timeout for API requests in seconds
         enable_caching: Whether to enable caching of responses
         cache_ttl_seconds: Cache time-to-live in seconds
+        cache_stale_seconds: Grace period after the TTL during which expired
+            entries are still served while one background refresh runs
+        cache_max_entries: Entries kept before the least recently used is evicted
+        cache_refresh_interval_seconds: How often hot entries are refreshed
+            before they expire; 0 disables the refresh loop
+        markets_query_mode: "per_chain" queries every chain separately and in
+            parallel, returning partial results; "combined" sends one query
+        max_concurrent_chain_queries: Chains queried at once in per_chain mode
+        chain_timeout_seconds: Time budget per chain (retries included)
         max_retries: Maximum number of retry attempts
         retry_delay: Delay between retries in seconds
 
@@ -71,9 +81,17 @@ class AaveConfig(BaseSettings):
     max_retries: int = 3
     retry_delay: float = 1.0
 
+    # Market query configuration
+    markets_query_mode: Literal["per_chain", "combined"] = "per_chain"
+    max_concurrent_chain_queries: int = 4
+    chain_timeout_seconds: float = 10.0
+
     # Caching configuration
     enable_caching: bool = True
     cache_ttl_seconds: int = 300  # 5 minutes
+    cache_stale_seconds: int = 600
+    cache_max_entries: int = 256
+    cache_refresh_interval_seconds: float = 0.0
 
     # Contract addresses (will be loaded from AAVE API)
     pool_addresses_provider: str = (
@@ -76,6 +76,24 @@ class PoolData(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class ChainQueryError(BaseModel):
+    """A chain whose markets could not be fetched."""
+
+    chain_id: int
+    error: str
+
+
+class MarketsReport(BaseModel):
+    """Markets of the chains that answered, and an error for each that did not."""
+
+    markets: list[PoolData]
+    errors: list[ChainQueryError] = Field(default_factory=list)
+    # Age of the oldest cached markets in the report; 0 if all were just fetched
+    cache_age_seconds: float = 0.0
+    # Whether any markets were served past their TTL while being refreshed
+    stale: bool = False
+
+
 class AssetData(BaseModel):
     """Asset data for financial analysis."""
 
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import Any
 
@@ -20,12 +24,54 @@ from mcp_server_aave.aave.config import (
     AaveConfig,
     get_aave_config,
 )
-from mcp_server_aave.aave.models import PoolData
+from mcp_server_aave.aave.models import ChainQueryError, MarketsReport, PoolData
 
 # --- Logger Setup --- #
 
 logger = logging.getLogger(__name__)
 
+# Placeholder mapping of network names to chain IDs; a proper mapping should
+# come from the API
+CHAIN_ID_BY_NETWORK: dict[str, int] = {
+    "ethereum": 1,
+    "polygon": 137,
+    "avalanche": 43114,
+    "arbitrum": 42161,
+    "optimism": 10,
+}
+
+MARKETS_QUERY = """
+    query GetMarkets($chainIds: [ChainId!]!) {
+        markets(request: { chainIds: $chainIds }) {
+            name
+            chain { name chainId }
+            address
+            totalMarketSize
+            totalAvailableLiquidity
+            reserves(request: { orderBy: { tokenName: ASC } }) {
+                underlyingToken { address symbol decimals name }
+                aToken { symbol }
+                supplyInfo {
+                    apy { value }
+                    total { value }
+                    maxLTV { value }
+                    liquidationThreshold { value }
+                    liquidationBonus { value }
+                    canBeCollateral
+                }
+                borrowInfo {
+                    apy { value }
+                    total { amount { value } }
+                    utilizationRate { formatted }
+                    reserveFactor { value }
+                }
+                usdExchangeRate
+                isFrozen
+            }
+        }
+    }
+"""
+
 # --- Setup Retry Decorators --- #
 retry_api_call = retry(
     stop=stop_after_attempt(5),
@@ -36,6 +82,22 @@ retry_api_call = retry(
 )
 
 
+@dataclass
+class _CacheEntry:
+    """A cached value, when it was stored and how to fetch it again."""
+
+    data: Any
+    stored_at: float = field(default_factory=time.monotonic)
+    # Re-runs the query; None for values stored without one
+    fetch: Callable[[], Awaitable[Any]] | None = None
+    # Reads since the value was stored; only read entries are refreshed early
+    hits: int = 0
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+
 @lru_cache(maxsize=1)
 def get_aave_client() -> AaveClient:
     """
@@ -56,7 +118,8 @@ class AaveClient:
     """
     AAVE v3 GraphQL client.
 
-    Provides minimal, normalized market data with retry and in-memory caching.
+    Provides minimal, normalized market data with retry and a bounded
+    stale-while-revalidate in-memory cache.
     """
 
     def __init__(self, config: AaveConfig) -> None:
@@ -71,9 +134,12 @@ class AaveClient:
 
         """
         self.config = config
-        self._cache: dict[str, tuple[float, Any]] = {}
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._refreshes: dict[str, asyncio.Task[Any]] = {}
+        self._refresh_loop: asyncio.Task[None] | None = None
         self._session: aiohttp.ClientSession | None = None
         self._available_networks: list[str] | None = None
+        self._chain_semaphore = asyncio.Semaphore(config.max_concurrent_chain_queries)
         logger.info("AaveClient initialized")
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
@@ -105,47 +171,150 @@ class AaveClient:
         params = ":".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
         return f"{method}:{params}"
 
-    def _get_from_cache(self, cache_key: str) -> Any | None:
+    def _lookup(self, cache_key: str) -> _CacheEntry | None:
         """
-        Try to get data from cache.
+        Find a cache entry that is fresh or within the stale grace period.
+
+        Entries older than `cache_ttl_seconds + cache_stale_seconds` are
+        dropped. A found entry becomes the most recently used one.
 
         Args:
             cache_key: Cache key
 
         Returns:
-            Cached data if found and not expired, None otherwise
+            The cache entry if found and still usable, None otherwise
 
         """
         if not self.config.enable_caching:
             return None
 
-        if cache_key not in self._cache:
+        entry = self._cache.get(cache_key)
+        if entry is None:
             return None
 
-        timestamp, data = self._cache[cache_key]
-        if time.time() - timestamp > self.config.cache_ttl_seconds:
-            # Cache expired
+        max_age = self.config.cache_ttl_seconds + self.config.cache_stale_seconds
+        if entry.age > max_age:
+            # Too old to serve even while refreshing
             del self._cache[cache_key]
             return None
 
-        logger.debug(f"Cache hit for {cache_key}")
-        return data
+        self._cache.move_to_end(cache_key)
+        return entry
 
-    def _store_in_cache(self, cache_key: str, data: Any) -> None:
+    def _store_in_cache(
+        self,
+        cache_key: str,
+        data: Any,
+        fetch: Callable[[], Awaitable[Any]] | None = None,
+    ) -> None:
         """
-        Store data in cache.
+        Store data in cache, evicting the least recently used entries.
 
         Args:
             cache_key: Cache key
             data: Data to cache
+            fetch: Optional coroutine factory the refresh loop can re-run
 
         """
         if not self.config.enable_caching:
             return
 
-        self._cache[cache_key] = (time.time(), data)
+        self._cache[cache_key] = _CacheEntry(data=data, fetch=fetch)
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.config.cache_max_entries:
+            evicted, _ = self._cache.popitem(last=False)
+            logger.debug(f"Evicted from cache: {evicted}")
         logger.debug(f"Stored in cache: {cache_key}")
 
+    async def _get_cached(
+        self, cache_key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, float]:
+        """
+        Get data through the cache, running at most one fetch per key.
+
+        - Fresh entries are returned as they are.
+        - Entries past the TTL but within `cache_stale_seconds` are returned
+          too, and a single background refresh replaces them.
+        - Otherwise the caller waits for the fetch. Concurrent callers of the
+          same key share it instead of each querying the API.
+
+        Args:
+            cache_key: Cache key
+            fetch: Coroutine factory that queries the API
+
+        Returns:
+            The data and its age in seconds (0 if it was just fetched)
+
+        """
+        self._ensure_refresh_loop()
+
+        entry = self._lookup(cache_key)
+        if entry is not None:
+            entry.hits += 1
+            age = entry.age
+            if age > self.config.cache_ttl_seconds:
+                logger.debug(f"Serving stale cache entry for {cache_key}")
+                self._refresh(cache_key, fetch)
+            else:
+                logger.debug(f"Cache hit for {cache_key}")
+            return entry.data, age
+
+        # Shielded so a cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(self._refresh(cache_key, fetch)), 0.0
+
+    def _refresh(
+        self, cache_key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task[Any]:
+        """Start fetching `cache_key` unless a fetch for it is already running."""
+        task = self._refreshes.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._run_refresh(cache_key, fetch))
+            task.add_done_callback(_log_refresh_failure)
+            self._refreshes[cache_key] = task
+        return task
+
+    async def _run_refresh(
+        self, cache_key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        try:
+            data = await fetch()
+            self._store_in_cache(cache_key, data, fetch)
+            return data
+        finally:
+            self._refreshes.pop(cache_key, None)
+
+    def _ensure_refresh_loop(self) -> None:
+        """Start the proactive refresh loop on first use, if it is enabled."""
+        if (
+            self.config.enable_caching
+            and self.config.cache_refresh_interval_seconds > 0
+            and (self._refresh_loop is None or self._refresh_loop.done())
+        ):
+            self._refresh_loop = asyncio.create_task(self._refresh_hot_entries())
+
+    async def _refresh_hot_entries(self) -> None:
+        """
+        Refresh hot entries before they expire.
+
+        An entry is hot if it was read since it was stored. Hot entries that
+        would expire before the next run are refreshed in the background, so
+        their readers never wait or see stale data; entries nobody reads are
+        left to expire and be evicted.
+        """
+        interval = self.config.cache_refresh_interval_seconds
+        while True:
+            await asyncio.sleep(interval)
+            refresh_after = self.config.cache_ttl_seconds - interval
+            due = [
+                self._refresh(key, entry.fetch)
+                for key, entry in list(self._cache.items())
+                if entry.hits and entry.fetch and entry.age >= refresh_after
+            ]
+            if due:
+                logger.debug(f"Refreshing {len(due)} hot cache entries")
+                # Failures are logged by the tasks; stale entries stay usable
+                await asyncio.wait(due)
+
     async def _fetch_available_networks(self) -> None:
         """Fetch and cache the list of available networks from the Aave API."""
         if self._available_networks is None:
@@ -196,12 +365,28 @@ class AaveClient:
         return self._available_networks or []
 
     async def close(self) -> None:
-        """Close the HTTP session."""
+        """Stop background cache refreshes and close the HTTP session."""
+        if self._refresh_loop is not None:
+            self._refresh_loop.cancel()
+            self._refresh_loop = None
+        for task in list(self._refreshes.values()):
+            task.cancel()
+
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
 
-    @retry_api_call
+    async def _resolve_chain_ids(self, chain_ids: list[int] | None) -> list[int]:
+        """Return the requested chain IDs, or those of all available networks."""
+        if chain_ids is not None:
+            return chain_ids
+        available_networks = await self.get_available_networks()
+        return [
+            CHAIN_ID_BY_NETWORK[n.lower()]
+            for n in available_networks
+            if n.lower() in CHAIN_ID_BY_NETWORK
+        ]
+
     async def get_markets_data(
         self,
         chain_ids: list[int] | None = None,
@@ -209,71 +394,133 @@ class AaveClient:
         """
         Fetch markets from Aave GraphQL and normalize nested values.
 
-        - Queries `markets` with a minimal selection set
-        - Normalizes nested percentage/amount objects into flat numeric strings
-        - Returns parsed `PoolData` instances
+        Returns the markets of every chain that answered; see
+        `get_markets_report` for the per-chain errors.
 
         Args:
             chain_ids: Optional list of chain IDs to query. If None, resolves from available networks.
 
+        Raises:
+            AaveApiError: If no chain could be fetched
+            AaveClientError: On unexpected errors
+
         """
-        if chain_ids is None:
-            available_networks = await self.get_available_networks()
-            # This is a placeholder to map network names to chain IDs.
-            # A proper mapping should be implemented.
-            chain_id_map = {
-                "ethereum": 1,
-                "polygon": 137,
-                "avalanche": 43114,
-                "arbitrum": 42161,
-                "optimism": 10,
-            }
-            chain_ids = [chain_id_map.get(n.lower(), 0) for n in available_networks]
-            chain_ids = [c for c in chain_ids if c != 0]
+        report = await self.get_markets_report(chain_ids)
+        return report.markets
+
+    async def get_markets_report(
+        self,
+        chain_ids: list[int] | None = None,
+    ) -> MarketsReport:
+        """
+        Fetch markets and report which chains failed.
+
+        In `per_chain` mode every chain is queried on its own, concurrently
+        (at most `max_concurrent_chain_queries` at once), with its own retries
+        and a `chain_timeout_seconds` budget. A slow or failing chain then only
+        costs its own entry: the other chains' markets are returned, with a
+        `ChainQueryError` for each chain that failed. In `combined` mode all
+        chains share one query, which succeeds or fails as a whole.
 
-        cache_key = self._get_cache_key("get_markets_data", chain_ids=str(chain_ids))
-        cached_data = self._get_from_cache(cache_key)
-        if cached_data:
-            return cached_data
+        Results go through the cache (see `_get_cached`); the report carries
+        the age of the oldest cached markets it contains.
 
+        Args:
+            chain_ids: Optional list of chain IDs to query. If None, resolves
+                from available networks.
+
+        Returns:
+            MarketsReport with markets in the requested chain order
+
+        Raises:
+            AaveApiError: If no chain could be fetched
+            AaveClientError: On unexpected errors
+
+        """
+        chain_ids = await self._resolve_chain_ids(chain_ids)
+
+        if self.config.markets_query_mode == "combined":
+            cache_key = self._get_cache_key(
+                "get_markets_data", chain_ids=str(chain_ids)
+            )
+            markets, age = await self._get_cached(
+                cache_key, lambda: self._fetch_markets(chain_ids)
+            )
+            return MarketsReport(
+                markets=markets,
+                cache_age_seconds=age,
+                stale=age > self.config.cache_ttl_seconds,
+            )
+
+        results = await asyncio.gather(
+            *(self._get_chain_markets(chain_id) for chain_id in chain_ids),
+            return_exceptions=True,
+        )
+
+        markets: list[PoolData] = []
+        errors: list[ChainQueryError] = []
+        failures: list[Exception] = []
+        age = 0.0
+        for chain_id, result in zip(chain_ids, results, strict=True):
+            if isinstance(result, Exception):
+                failures.append(result)
+                errors.append(ChainQueryError(chain_id=chain_id, error=str(result)))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                chain_markets, chain_age = result
+                markets.extend(chain_markets)
+                age = max(age, chain_age)
+
+        if failures and len(failures) == len(chain_ids):
+            # Nothing to return: fail like a single query would
+            raise failures[0]
+
+        if errors:
+            logger.warning(
+                f"Returning partial market data; failed chains: "
+                f"{[e.chain_id for e in errors]}"
+            )
+        return MarketsReport(
+            markets=markets,
+            errors=errors,
+            cache_age_seconds=age,
+            stale=age > self.config.cache_ttl_seconds,
+        )
+
+    async def _get_chain_markets(self, chain_id: int) -> tuple[list[PoolData], float]:
+        """Markets of one chain through the cache, and their age in seconds."""
+        cache_key = self._get_cache_key("get_markets_data", chain_ids=str([chain_id]))
+        return await self._get_cached(cache_key, lambda: self._query_chain(chain_id))
+
+    async def _query_chain(self, chain_id: int) -> list[PoolData]:
+        """Markets of one chain from a query bounded in concurrency and time."""
+        async with self._chain_semaphore:
+            try:
+                async with asyncio.timeout(self.config.chain_timeout_seconds):
+                    markets = await self._fetch_markets([chain_id])
+            except TimeoutError as e:
+                logger.error(f"Market query for chain {chain_id} timed out")
+                raise AaveApiError(
+                    f"Market query for chain {chain_id} timed out after "
+                    f"{self.config.chain_timeout_seconds}s"
+                ) from e
+        return markets
+
+    @retry_api_call
+    async def _fetch_markets(self, chain_ids: list[int]) -> list[PoolData]:
+        """
+        Run the markets query for the given chains and parse the result.
+
+        - Queries `markets` with a minimal selection set
+        - Normalizes nested percentage/amount objects into flat numeric strings
+        - Returns parsed `PoolData` instances
+
+        """
         try:
             logger.info(f"Fetching market data for chain IDs: {chain_ids}")
             session = await self._ensure_session()
-
-            query = {
-                "query": """
-                    query GetMarkets($chainIds: [ChainId!]!) {
-                        markets(request: { chainIds: $chainIds }) {
-                            name
-                            chain { name chainId }
-                            address
-                            totalMarketSize
-                            totalAvailableLiquidity
-                            reserves(request: { orderBy: { tokenName: ASC } }) {
-                                underlyingToken { address symbol decimals name }
-                                aToken { symbol }
-                                supplyInfo {
-                                    apy { value }
-                                    total { value }
-                                    maxLTV { value }
-                                    liquidationThreshold { value }
-                                    liquidationBonus { value }
-                                    canBeCollateral
-                                }
-                                borrowInfo {
-                                    apy { value }
-                                    total { amount { value } }
-                                    utilizationRate { formatted }
-                                    reserveFactor { value }
-                                }
-                                usdExchangeRate
-                                isFrozen
-                            }
-                        }
-                    }
-                """,
-                "variables": {"chainIds": chain_ids},
-            }
+            query = {"query": MARKETS_QUERY, "variables": {"chainIds": chain_ids}}
 
             async with session.post(self.config.api_base_url, json=query) as response:
                 if response.status != 200:
@@ -283,71 +530,31 @@ class AaveClient:
 
                 raw = await response.json()
 
-                # Handle GraphQL errors explicitly
-                if isinstance(raw, dict) and raw.get("errors"):
-                    logger.error(f"GraphQL errors: {raw['errors']}")
-                    raise AaveApiError(
-                        "AAVE GraphQL returned errors for markets request"
-                    )
+            # Handle GraphQL errors explicitly
+            if isinstance(raw, dict) and raw.get("errors"):
+                logger.error(f"GraphQL errors: {raw['errors']}")
+                raise AaveApiError("AAVE GraphQL returned errors for markets request")
 
-                data = raw.get("data") if isinstance(raw, dict) else None
-                if not data or "markets" not in data or data["markets"] is None:
-                    logger.error(f"Unexpected GraphQL response: {raw}")
-                    raise AaveApiError(
-                        "Unexpected GraphQL response: missing markets data"
-                    )
+            data = raw.get("data") if isinstance(raw, dict) else None
+            if not data or "markets" not in data or data["markets"] is None:
+                logger.error(f"Unexpected GraphQL response: {raw}")
+                raise AaveApiError("Unexpected GraphQL response: missing markets data")
 
-                markets_data = data.get("markets", [])
-                if not isinstance(markets_data, list):
-                    raise AaveApiError(
-                        "Unexpected API response format: expected a list of markets"
-                    )
-
-                # Normalize nested PercentValue/TokenAmount fields into flat decimals as our models expect
-                for market in markets_data:
-                    reserves = market.get("reserves") or []
-                    for reserve in reserves:
-                        supply = reserve.get("supplyInfo") or {}
-                        apy_obj = supply.get("apy") or {}
-                        total_obj = supply.get("total") or {}
-                        supply["apy"] = apy_obj.get("value", "0")
-                        supply["total"] = total_obj.get("value", "0")
-                        # risk-related optional values
-                        if isinstance(supply.get("maxLTV"), dict):
-                            supply["maxLTV"] = supply["maxLTV"].get("value", "0")
-                        if isinstance(supply.get("liquidationThreshold"), dict):
-                            supply["liquidationThreshold"] = supply[
-                                "liquidationThreshold"
-                            ].get("value", "0")
-                        if isinstance(supply.get("liquidationBonus"), dict):
-                            supply["liquidationBonus"] = supply["liquidationBonus"].get(
-                                "value", "0"
-                            )
-                        reserve["supplyInfo"] = supply
-
-                        borrow = reserve.get("borrowInfo")
-                        if borrow is not None:
-                            b_apy_obj = borrow.get("apy") or {}
-                            b_total_obj = borrow.get("total") or {}
-                            amount_obj = b_total_obj.get("amount") or {}
-                            util_obj = borrow.get("utilizationRate") or {}
-                            borrow["apy"] = b_apy_obj.get("value", "0")
-                            borrow["total"] = amount_obj.get("value", "0")
-                            borrow["utilizationRate"] = util_obj.get("formatted", "0")
-                            if isinstance(borrow.get("reserveFactor"), dict):
-                                borrow["reserveFactor"] = borrow["reserveFactor"].get(
-                                    "value", "0"
-                                )
-                            reserve["borrowInfo"] = borrow
-
-                pool_data = [PoolData(**item) for item in markets_data]
-
-                self._store_in_cache(cache_key, pool_data)
-
-                logger.info(
-                    f"Successfully retrieved market data for chain IDs {chain_ids}: {len(pool_data)} markets found"
+            markets_data = data.get("markets", [])
+            if not isinstance(markets_data, list):
+                raise AaveApiError(
+                    "Unexpected API response format: expected a list of markets"
                 )
-                return pool_data
+
+            pool_data = [PoolData(**_normalize_market(item)) for item in markets_data]
+
+            logger.info(
+                f"Successfully retrieved market data for chain IDs {chain_ids}: {len(pool_data)} markets found"
+            )
+            return pool_data
+
+        except AaveApiError:
+            raise
 
         except aiohttp.ClientError as e:
             logger.error(f"Request error: {e}")
@@ -356,3 +563,44 @@ class AaveClient:
         except Exception as e:
             logger.error(f"Unexpected error: {e}", exc_info=True)
             raise AaveClientError(f"Unexpected error getting market data: {e}") from e
+
+
+def _log_refresh_failure(task: asyncio.Task[Any]) -> None:
+    """Log a failed cache refresh, which may have no caller to raise to."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Cache refresh failed: {task.exception()}")
+
+
+def _normalize_market(market: dict[str, Any]) -> dict[str, Any]:
+    """Flatten nested PercentValue/TokenAmount fields into flat decimal strings."""
+    reserves = market.get("reserves") or []
+    for reserve in reserves:
+        supply = reserve.get("supplyInfo") or {}
+        apy_obj = supply.get("apy") or {}
+        total_obj = supply.get("total") or {}
+        supply["apy"] = apy_obj.get("value", "0")
+        supply["total"] = total_obj.get("value", "0")
+        # risk-related optional values
+        if isinstance(supply.get("maxLTV"), dict):
+            supply["maxLTV"] = supply["maxLTV"].get("value", "0")
+        if isinstance(supply.get("liquidationThreshold"), dict):
+            supply["liquidationThreshold"] = supply["liquidationThreshold"].get(
+                "value", "0"
+            )
+        if isinstance(supply.get("liquidationBonus"), dict):
+            supply["liquidationBonus"] = supply["liquidationBonus"].get("value", "0")
+        reserve["supplyInfo"] = supply
+
+        borrow = reserve.get("borrowInfo")
+        if borrow is not None:
+            b_apy_obj = borrow.get("apy") or {}
+            b_total_obj = borrow.get("total") or {}
+            amount_obj = b_total_obj.get("amount") or {}
+            util_obj = borrow.get("utilizationRate") or {}
+            borrow["apy"] = b_apy_obj.get("value", "0")
+            borrow["total"] = amount_obj.get("value", "0")
+            borrow["utilizationRate"] = util_obj.get("formatted", "0")
+            if isinstance(borrow.get("reserveFactor"), dict):
+                borrow["reserveFactor"] = borrow["reserveFactor"].get("value", "0")
+            reserve["borrowInfo"] = borrow
+    return market
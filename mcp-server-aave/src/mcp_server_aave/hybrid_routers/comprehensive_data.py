@@ -5,13 +5,20 @@ from fastapi import APIRouter, Depends
 from fastmcp.exceptions import ToolError
 from pydantic import BaseModel, Field
 
-from mcp_server_aave.aave import AaveApiError, AaveClient, AaveClientError
+from mcp_server_aave.aave import (
+    CHAIN_ID_BY_NETWORK,
+    AaveApiError,
+    AaveClient,
+    AaveClientError,
+)
 from mcp_server_aave.dependencies import get_aave_client
 from mcp_server_aave.schemas import (
     AAVE_ASSETS,
     AAVE_NETWORKS,
     ComprehensiveAaveData,
     NetworkAaveData,
+    NetworkError,
+    ResponseMetadata,
 )
 
 logger = logging.getLogger(__name__)
@@ -56,6 +63,10 @@ async def get_comprehensive_aave_data(
     Optional filters:
       - networks: restricts to a list of networks (e.g. ["ethereum", "polygon"])
       - asset_symbols: restricts reserves to the specified token symbols
+
+    Networks are queried independently; if some fail, the others are still
+    returned and each failed network is listed in `errors`. `metadata`
+    reports the age of the oldest cached data in the response.
     """
     try:
         networks_to_query = (
@@ -63,20 +74,14 @@ async def get_comprehensive_aave_data(
             if request_data.networks
             else await aave_client.get_available_networks()
         )
-        chain_id_map = {
-            "ethereum": 1,
-            "polygon": 137,
-            "avalanche": 43114,
-            "arbitrum": 42161,
-            "optimism": 10,
-        }
         chain_ids = [
-            chain_id_map.get(n.lower())
+            CHAIN_ID_BY_NETWORK[n.lower()]
             for n in networks_to_query
-            if chain_id_map.get(n.lower())
+            if n.lower() in CHAIN_ID_BY_NETWORK
         ]
 
-        markets = await aave_client.get_markets_data(chain_ids=chain_ids)
+        report = await aave_client.get_markets_report(chain_ids=chain_ids)
+        markets = report.markets
 
         all_network_data = []
 
@@ -98,7 +103,24 @@ async def get_comprehensive_aave_data(
 
             all_network_data.append(network_data)
 
-        return ComprehensiveAaveData(data=all_network_data)
+        network_by_chain_id = {v: k for k, v in CHAIN_ID_BY_NETWORK.items()}
+        errors = [
+            NetworkError(
+                network=network_by_chain_id.get(e.chain_id, str(e.chain_id)),
+                chain_id=e.chain_id,
+                error=e.error,
+            )
+            for e in report.errors
+        ]
+
+        metadata = ResponseMetadata(
+            cache_age_seconds=round(report.cache_age_seconds, 3),
+            stale=report.stale,
+        )
+
+        return ComprehensiveAaveData(
+            data=all_network_data, errors=errors, metadata=metadata
+        )
 
     except AaveApiError as api_err:
         logger.error(f"AAVE API error: {api_err}", exc_info=True)
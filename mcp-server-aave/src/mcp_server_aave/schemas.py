@@ -203,9 +203,40 @@ class NetworkAaveData(BaseModel):
         )
 
 
+class NetworkError(BaseModel):
+    """A network whose data could not be fetched."""
+
+    network: str = Field(description="Blockchain network")
+    chain_id: int = Field(description="Chain ID")
+    error: str = Field(description="Why the network's data is missing")
+
+
+class ResponseMetadata(BaseModel):
+    """How current the returned market data is."""
+
+    cache_age_seconds: float = Field(
+        default=0.0,
+        description="Age of the oldest cached market data in the response; "
+        "0 if all of it was fetched for this request",
+    )
+    stale: bool = Field(
+        default=False,
+        description="Whether some data is past its cache TTL and is being "
+        "refreshed in the background",
+    )
+
+
 class ComprehensiveAaveData(BaseModel):
     """Comprehensive AAVE data response, potentially spanning multiple networks."""
 
     data: list[NetworkAaveData] = Field(
         description="List of Aave data for each network"
     )
+    errors: list[NetworkError] = Field(
+        default_factory=list,
+        description="Networks that failed; `data` holds the ones that answered",
+    )
+    metadata: ResponseMetadata = Field(
+        default_factory=ResponseMetadata,
+        description="Freshness of the returned data",
+    )
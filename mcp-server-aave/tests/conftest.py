@@ -32,6 +32,12 @@ def mock_aave_config():
     config.retry_delay = 1.0
     config.enable_caching = True
     config.cache_ttl_seconds = 300
+    config.cache_stale_seconds = 600
+    config.cache_max_entries = 256
+    config.cache_refresh_interval_seconds = 0.0
+    config.markets_query_mode = "per_chain"
+    config.max_concurrent_chain_queries = 4
+    config.chain_timeout_seconds = 10.0
     config.pool_addresses_provider = "0xB53C1a33016B2DC2fF3653530bfF1848a515c8c5"
     config.gas_limit_multiplier = 1.2
     config.max_gas_price_gwei = 100
@@ -1,5 +1,6 @@
 """Test cases for AaveClient module."""
 
+import asyncio
 import time
 from unittest.mock import Mock, patch
 
@@ -7,9 +8,9 @@ import aiohttp
 import pytest
 from aioresponses import aioresponses
 
-from mcp_server_aave.aave.config import AaveApiError
+from mcp_server_aave.aave.config import AaveApiError, AaveClientError
 from mcp_server_aave.aave.models import PoolData
-from mcp_server_aave.aave.module import AaveClient, get_aave_client
+from mcp_server_aave.aave.module import AaveClient, _CacheEntry, get_aave_client
 
 
 class TestAaveClient:
@@ -36,49 +37,61 @@ class TestAaveClient:
         )
         assert key == "get_asset_risk_data:asset_address=0x123:network=polygon"
 
-    def test_get_from_cache_disabled(self, mock_aave_config, sample_pool_data):
+    def test_lookup_disabled(self, mock_aave_config, sample_pool_data):
         """Test cache retrieval when caching is disabled."""
         mock_aave_config.enable_caching = False
         client = AaveClient(mock_aave_config)
 
         # Add item to cache (shouldn't be retrieved)
         cache_key = "test-key"
-        client._cache[cache_key] = (time.time(), sample_pool_data)
+        client._cache[cache_key] = _CacheEntry(data=sample_pool_data)
 
-        result = client._get_from_cache(cache_key)
+        result = client._lookup(cache_key)
         assert result is None
 
-    def test_get_from_cache_miss(self, mock_aave_config):
+    def test_lookup_miss(self, mock_aave_config):
         """Test cache miss."""
         client = AaveClient(mock_aave_config)
-        result = client._get_from_cache("nonexistent-key")
+        result = client._lookup("nonexistent-key")
         assert result is None
 
-    def test_get_from_cache_expired(self, mock_aave_config, sample_pool_data):
-        """Test expired cache item."""
+    def test_lookup_expired(self, mock_aave_config, sample_pool_data):
+        """Test cache item past the TTL and the stale grace period."""
         client = AaveClient(mock_aave_config)
 
         # Add expired item to cache
         cache_key = "expired-key"
-        client._cache[cache_key] = (
-            time.time() - 600,
-            sample_pool_data,
-        )  # 10 minutes old
+        client._cache[cache_key] = _CacheEntry(
+            data=sample_pool_data, stored_at=time.monotonic() - 3600
+        )  # 1 hour old
 
-        result = client._get_from_cache(cache_key)
+        result = client._lookup(cache_key)
         assert result is None
         assert cache_key not in client._cache  # Should be removed
 
-    def test_get_from_cache_hit(self, mock_aave_config, sample_pool_data):
+    def test_lookup_stale(self, mock_aave_config, sample_pool_data):
+        """Test cache item past the TTL but within the stale grace period."""
+        client = AaveClient(mock_aave_config)
+
+        cache_key = "stale-key"
+        client._cache[cache_key] = _CacheEntry(
+            data=sample_pool_data, stored_at=time.monotonic() - 600
+        )  # 10 minutes old
+
+        entry = client._lookup(cache_key)
+        assert entry.data == sample_pool_data
+        assert entry.age > mock_aave_config.cache_ttl_seconds
+
+    def test_lookup_hit(self, mock_aave_config, sample_pool_data):
         """Test successful cache hit."""
         client = AaveClient(mock_aave_config)
 
         # Add fresh item to cache
         cache_key = "fresh-key"
-        client._cache[cache_key] = (time.time(), sample_pool_data)
+        client._cache[cache_key] = _CacheEntry(data=sample_pool_data)
 
-        result = client._get_from_cache(cache_key)
-        assert result == sample_pool_data
+        result = client._lookup(cache_key)
+        assert result.data == sample_pool_data
 
     def test_store_in_cache_disabled(self, mock_aave_config, sample_pool_data):
         """Test storing in cache when caching is disabled."""
@@ -96,7 +109,21 @@ class TestAaveClient:
         client._store_in_cache(cache_key, sample_pool_data)
 
         assert cache_key in client._cache
-        assert client._cache[cache_key][1] == sample_pool_data
+        assert client._cache[cache_key].data == sample_pool_data
+
+    def test_store_in_cache_evicts_least_recently_used(
+        self, mock_aave_config, sample_pool_data
+    ):
+        """Test the cache never grows past cache_max_entries."""
+        mock_aave_config.cache_max_entries = 2
+        client = AaveClient(mock_aave_config)
+
+        client._store_in_cache("a", sample_pool_data)
+        client._store_in_cache("b", sample_pool_data)
+        client._lookup("a")  # "b" is now the least recently used
+        client._store_in_cache("c", sample_pool_data)
+
+        assert list(client._cache) == ["a", "c"]
 
     @pytest.mark.asyncio
     async def test_ensure_session(self, mock_aave_config):
@@ -169,7 +196,7 @@ class TestAaveClient:
 
         # Add item to cache
         cache_key = client._get_cache_key("get_markets_data", chain_ids=[1])
-        client._cache[cache_key] = (time.time(), [sample_pool_data])
+        client._cache[cache_key] = _CacheEntry(data=[sample_pool_data])
 
         with aioresponses() as mocked:
             # API should not be called
@@ -274,3 +301,266 @@ class TestGetAaveClient:
 
         # Verify same instance
         assert client1 is client2
+
+
+# --- Per-chain queries against a stub GraphQL server --- #
+
+
+def graphql_market(chain_id: int, name: str) -> dict:
+    """One market in the shape the Aave GraphQL API returns it."""
+    return {
+        "name": f"{name} Market",
+        "chain": {"name": name, "chainId": chain_id},
+        "address": f"0x{chain_id:040x}",
+        "totalMarketSize": "1000",
+        "totalAvailableLiquidity": "400",
+        "reserves": [
+            {
+                "underlyingToken": {
+                    "address": "0x1",
+                    "symbol": "USDC",
+                    "decimals": 6,
+                    "name": "USD Coin",
+                },
+                "aToken": {"symbol": "aUSDC"},
+                "supplyInfo": {
+                    "apy": {"value": "0.02"},
+                    "total": {"value": "900"},
+                    "maxLTV": {"value": "0.8"},
+                    "liquidationThreshold": {"value": "0.85"},
+                    "liquidationBonus": {"value": "0.05"},
+                    "canBeCollateral": True,
+                },
+                "borrowInfo": {
+                    "apy": {"value": "0.03"},
+                    "total": {"amount": {"value": "600"}},
+                    "utilizationRate": {"formatted": "66.67"},
+                    "reserveFactor": {"value": "0.1"},
+                },
+                "usdExchangeRate": "1",
+                "isFrozen": False,
+            }
+        ],
+    }
+
+
+CHAIN_NAMES = {1: "Ethereum", 137: "Polygon", 43114: "Avalanche", 10: "Optimism"}
+
+
+@pytest.fixture
+async def graphql_server(mock_aave_config):
+    """Stub GraphQL endpoint with per-chain delays and malformed chains."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    state = {"requests": [], "delay": {}, "malformed": set(), "in_flight": 0}
+    state["peak"] = 0
+
+    async def handler(request):
+        chain_ids = (await request.json())["variables"]["chainIds"]
+        state["requests"].append(chain_ids)
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            await asyncio.sleep(max(state["delay"].get(c, 0.05) for c in chain_ids))
+        finally:
+            state["in_flight"] -= 1
+        markets = [
+            {"name": "broken"} if c in state["malformed"] else graphql_market(
+                c, CHAIN_NAMES[c]
+            )
+            for c in chain_ids
+        ]
+        return web.json_response({"data": {"markets": markets}})
+
+    app = web.Application()
+    app.router.add_post("/graphql", handler)
+    server = TestServer(app)
+    await server.start_server()
+    mock_aave_config.api_base_url = f"http://{server.host}:{server.port}/graphql"
+    yield state
+    await server.close()
+
+
+class TestPerChainQueries:
+    """Test the per-chain query mode of get_markets_report."""
+
+    @pytest.mark.asyncio
+    async def test_chains_queried_concurrently_under_limit(
+        self, mock_aave_config, graphql_server
+    ):
+        """Each chain gets its own query, at most max_concurrent at a time."""
+        mock_aave_config.max_concurrent_chain_queries = 2
+        client = AaveClient(mock_aave_config)
+
+        report = await client.get_markets_report(chain_ids=[1, 137, 43114, 10])
+
+        assert [m.chain.chain_id for m in report.markets] == [1, 137, 43114, 10]
+        assert report.errors == []
+        assert sorted(graphql_server["requests"]) == [[1], [10], [137], [43114]]
+        assert graphql_server["peak"] == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_partial_results_with_chain_errors(
+        self, mock_aave_config, graphql_server
+    ):
+        """A slow and a broken chain are annotated; the rest is returned."""
+        mock_aave_config.chain_timeout_seconds = 0.3
+        graphql_server["delay"][10] = 5
+        graphql_server["malformed"].add(137)
+        client = AaveClient(mock_aave_config)
+
+        start = time.perf_counter()
+        report = await client.get_markets_report(chain_ids=[1, 137, 10])
+        elapsed = time.perf_counter() - start
+
+        assert [m.chain.name for m in report.markets] == ["Ethereum"]
+        errors = {e.chain_id: e.error for e in report.errors}
+        assert errors[137].startswith("Unexpected error getting market data")
+        assert "timed out after 0.3s" in errors[10]
+        assert elapsed < 1
+        # Only the successful chain is cached
+        assert await client.get_markets_data(chain_ids=[1]) == report.markets
+        assert graphql_server["requests"].count([1]) == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_all_chains_failed_raises(self, mock_aave_config, graphql_server):
+        """With nothing to return the chain's own error is raised."""
+        graphql_server["malformed"].add(1)
+        client = AaveClient(mock_aave_config)
+
+        with pytest.raises(AaveClientError, match="Unexpected error"):
+            await client.get_markets_data(chain_ids=[1])
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_combined_mode_sends_one_query(
+        self, mock_aave_config, graphql_server
+    ):
+        """The combined mode keeps the single all-chains query."""
+        mock_aave_config.markets_query_mode = "combined"
+        client = AaveClient(mock_aave_config)
+
+        markets = await client.get_markets_data(chain_ids=[1, 137])
+
+        assert [m.chain.chain_id for m in markets] == [1, 137]
+        assert graphql_server["requests"] == [[1, 137]]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_data_lists_failed_networks(
+        self, mock_aave_config, graphql_server
+    ):
+        """The hybrid endpoint returns partial data plus per-network errors."""
+        from mcp_server_aave.hybrid_routers.comprehensive_data import (
+            ComprehensiveAaveDataRequest,
+            get_comprehensive_aave_data,
+        )
+
+        graphql_server["malformed"].add(137)
+        client = AaveClient(mock_aave_config)
+
+        response = await get_comprehensive_aave_data(
+            ComprehensiveAaveDataRequest(networks=["Ethereum", "Polygon"]), client
+        )
+
+        assert [n.network for n in response.data] == ["Ethereum"]
+        assert [(e.network, e.chain_id) for e in response.errors] == [
+            ("polygon", 137)
+        ]
+        await client.close()
+
+
+class TestMarketCache:
+    """Test the stale-while-revalidate market cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_query(
+        self, mock_aave_config, graphql_server
+    ):
+        """Callers of a cold key wait on a single query instead of stampeding."""
+        client = AaveClient(mock_aave_config)
+
+        reports = await asyncio.gather(
+            *(client.get_markets_report(chain_ids=[1]) for _ in range(10))
+        )
+
+        assert graphql_server["requests"] == [[1]]
+        assert all(r.markets == reports[0].markets for r in reports)
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_one_refresh_runs(
+        self, mock_aave_config, graphql_server
+    ):
+        """Expired entries within the grace period are served without waiting."""
+        client = AaveClient(mock_aave_config)
+        await client.get_markets_report(chain_ids=[1])
+        entry = next(iter(client._cache.values()))
+        entry.stored_at -= mock_aave_config.cache_ttl_seconds + 1
+        graphql_server["delay"][1] = 0.5
+
+        start = time.perf_counter()
+        reports = await asyncio.gather(
+            *(client.get_markets_report(chain_ids=[1]) for _ in range(10))
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.25
+        assert all(r.stale for r in reports)
+        assert reports[0].cache_age_seconds > mock_aave_config.cache_ttl_seconds
+        await asyncio.sleep(0.7)
+        assert graphql_server["requests"] == [[1], [1]]
+        report = await client.get_markets_report(chain_ids=[1])
+        assert not report.stale
+        assert report.cache_age_seconds < 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_refresh_loop_renews_only_read_entries(
+        self, mock_aave_config, graphql_server
+    ):
+        """Hot entries are refreshed before expiry; unread ones are left alone."""
+        mock_aave_config.cache_ttl_seconds = 0.4
+        mock_aave_config.cache_refresh_interval_seconds = 0.1
+        client = AaveClient(mock_aave_config)
+
+        await client.get_markets_report(chain_ids=[1, 137])
+        await client.get_markets_report(chain_ids=[1])
+        await asyncio.sleep(0.45)
+
+        assert graphql_server["requests"].count([1]) >= 2
+        assert graphql_server["requests"].count([137]) == 1
+        report = await client.get_markets_report(chain_ids=[1])
+        assert not report.stale
+        await client.close()
+        assert client._refresh_loop is None
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_data_reports_cache_age(
+        self, mock_aave_config, graphql_server
+    ):
+        """The hybrid endpoint exposes the age of the data it returns."""
+        from mcp_server_aave.hybrid_routers.comprehensive_data import (
+            ComprehensiveAaveDataRequest,
+            get_comprehensive_aave_data,
+        )
+
+        client = AaveClient(mock_aave_config)
+        request = ComprehensiveAaveDataRequest(networks=["Ethereum", "Polygon"])
+
+        fresh = await get_comprehensive_aave_data(request, client)
+        client._cache[client._get_cache_key("get_markets_data", chain_ids=[1])] = (
+            _CacheEntry(
+                data=[], stored_at=time.monotonic() - 400, fetch=lambda: None
+            )
+        )
+        stale = await get_comprehensive_aave_data(request, client)
+
+        assert fresh.metadata.cache_age_seconds == 0
+        assert not fresh.metadata.stale
+        assert stale.metadata.cache_age_seconds >= 400
+        assert stale.metadata.stale
+        await client.close()
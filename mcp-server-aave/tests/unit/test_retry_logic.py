@@ -54,6 +54,13 @@ class TestRetryApiCallDecorator:
         config.max_retries = 3
         config.retry_delay = 1.0
         config.enable_caching = False  # Disable caching for tests
+        config.cache_ttl_seconds = 300
+        config.cache_stale_seconds = 600
+        config.cache_max_entries = 256
+        config.cache_refresh_interval_seconds = 0.0
+        config.markets_query_mode = "per_chain"
+        config.max_concurrent_chain_queries = 4
+        config.chain_timeout_seconds = 10.0
 
         client = AaveClient(config)
         return client
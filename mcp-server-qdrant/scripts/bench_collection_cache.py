@@ -0,0 +1,105 @@
+"""
+Count Qdrant round-trips per store/search with and without the collection cache.
+
+Main responsibility: Run `QdrantConnector.store` and `search` against an
+embedded (local `path`) Qdrant, once with the collection state cache cleared
+before every operation (the previous behaviour) and once warm, then report
+client calls and latency per operation.
+
+Usage (from the project root):
+    uv run python scripts/bench_collection_cache.py --ops 500 --indexes 3
+
+Local mode runs in-process, so latencies exclude network time; on a remote
+server every saved call also saves a network round-trip.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import warnings
+
+from bench_common import CountingClient, HashEmbeddingProvider
+
+from mcp_server_qdrant.qdrant.collection_cache import get_collection_cache
+from mcp_server_qdrant.qdrant.config import (
+    CollectionConfig,
+    PayloadIndexConfig,
+    QdrantConfig,
+)
+from mcp_server_qdrant.qdrant.module import Entry, QdrantConnector
+
+
+async def run(path: str, ops: int, indexes: int, cold: bool) -> dict[str, dict]:
+    """Store then search `ops` times; returns calls and timings per operation."""
+    config = QdrantConfig(
+        local_path=path,
+        collection_config=CollectionConfig(
+            payload_indexes=[
+                PayloadIndexConfig(field_name=f"metadata.field_{i}")
+                for i in range(indexes)
+            ]
+        ),
+    )
+    connector = QdrantConnector(config, HashEmbeddingProvider())
+    client = CountingClient(connector._client)
+    connector._client = client
+    cache = get_collection_cache()
+    cache.clear()
+
+    # Create the collection up front so both modes measure the steady state
+    await connector.store(Entry(content="seed"), "bench")
+
+    results: dict[str, dict] = {}
+    for name in ("store", "search"):
+        client.calls.clear()
+        timings = []
+        for i in range(ops):
+            if cold:
+                cache.clear()
+            start = time.perf_counter()
+            if name == "store":
+                await connector.store(
+                    Entry(content=f"document {i}", metadata={"field_0": str(i % 7)}),
+                    "bench",
+                )
+            else:
+                await connector.search(f"document {i}", "bench", limit=5)
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = {
+            "calls_per_op": sum(client.calls.values()) / ops,
+            "breakdown": {k: v / ops for k, v in sorted(client.calls.items())},
+            "p50_ms": statistics.median(timings),
+            "mean_ms": statistics.fmean(timings),
+        }
+    await client.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument(
+        "--indexes", type=int, default=2, help="Configured payload indexes"
+    )
+    args = parser.parse_args()
+
+    # Local mode warns that payload indexes have no effect; the calls still count
+    warnings.filterwarnings("ignore", message="Payload indexes have no effect")
+
+    for label, cold in (("uncached", True), ("cached", False)):
+        with tempfile.TemporaryDirectory() as path:
+            results = asyncio.run(run(path, args.ops, args.indexes, cold))
+        for op, r in results.items():
+            breakdown = ", ".join(f"{k}={v:g}" for k, v in r["breakdown"].items())
+            print(
+                f"{label:>9} {op:<6} calls/op={r['calls_per_op']:<4g} "
+                f"p50={r['p50_ms']:.2f} ms mean={r['mean_ms']:.2f} ms  [{breakdown}]"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Shared helpers for the Qdrant benchmark scripts.
+
+Main responsibility: Provide a model-free embedding provider and a client proxy
+that counts Qdrant calls, so benchmarks run offline against local-mode Qdrant.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp_server_qdrant.qdrant.embeddings.base import EmbeddingProvider  # noqa: E402
+
+
+class HashEmbeddingProvider(EmbeddingProvider):
+    """Deterministic embeddings so benchmarks need no model download."""
+
+    def __init__(self, vector_size: int = 64):
+        self.vector_size = vector_size
+
+    def _embed(self, text: str) -> list[float]:
+        digest = hashlib.sha256(text.encode()).digest()
+        return [digest[i % len(digest)] / 255 for i in range(self.vector_size)]
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        return [self._embed(d) for d in documents]
+
+    async def embed_query(self, query: str) -> list[float]:
+        return self._embed(query)
+
+    def get_vector_name(self) -> str:
+        return "bench"
+
+    def get_vector_size(self) -> int:
+        return self.vector_size
+
+
+def create_provider(model_name: str | None) -> EmbeddingProvider:
+    """FastEmbed provider for `model_name`, or the hash provider when None."""
+    if model_name is None:
+        return HashEmbeddingProvider()
+    from mcp_server_qdrant.qdrant.embeddings.fastembed import FastEmbedProvider
+
+    return FastEmbedProvider(model_name)
+
+
+class CountingClient:
+    """Proxy around the Qdrant client counting every awaited method call."""
+
+    def __init__(self, client):
+        self._client = client
+        self.calls: Counter[str] = Counter()
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        async def wrapper(*args, **kwargs):
+            self.calls[name] += 1
+            return await attr(*args, **kwargs)
+
+        return wrapper
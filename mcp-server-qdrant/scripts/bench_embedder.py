@@ -0,0 +1,143 @@
+"""
+Load test query embedding with and without cross-request micro-batching.
+
+Main responsibility: Fire many concurrent `embed_query` calls, once through the
+previous per-call `run_in_executor(None, ...)` path and once through
+`MicroBatcher`, and report throughput, p50/p99 latency and model calls.
+
+Usage (from the project root):
+    uv run python scripts/bench_embedder.py --queries 4000 --concurrency 64
+    uv run python scripts/bench_embedder.py --model BAAI/bge-small-en-v1.5
+
+Without `--model` a simulated model is used: each run costs a fixed overhead plus
+a per-text cost, and only one run executes at a time (an ONNX session already
+uses every core). Tune both with `--call-ms` and `--text-ms`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp_server_qdrant.qdrant.embeddings.batching import MicroBatcher  # noqa: E402
+
+
+class SimulatedModel:
+    """Model stand-in with per-call overhead that serializes like one ONNX session."""
+
+    def __init__(self, call_ms: float, text_ms: float):
+        self.call_s = call_ms / 1000
+        self.text_s = text_ms / 1000
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, kind: str, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            self.calls += 1
+            time.sleep(self.call_s + self.text_s * len(texts))
+        return [[0.0] for _ in texts]
+
+
+class FastEmbedModel:
+    """Real FastEmbed model with the same (kind, texts) interface."""
+
+    def __init__(self, model_name: str):
+        from fastembed import TextEmbedding
+
+        self.model = TextEmbedding(model_name)
+        self.calls = 0
+
+    def __call__(self, kind: str, texts: list[str]) -> list[Any]:
+        self.calls += 1
+        if kind == "query":
+            return list(self.model.query_embed(texts))
+        return list(self.model.passage_embed(texts))
+
+
+async def load(
+    embed: Callable[[str], Any], queries: int, concurrency: int
+) -> tuple[float, list[float]]:
+    """Run `queries` calls from `concurrency` workers; returns (seconds, latencies ms)."""
+    latencies: list[float] = []
+    counter = iter(range(queries))
+
+    async def worker() -> None:
+        for i in counter:
+            start = time.perf_counter()
+            await embed(f"what did I store about topic {i}?")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+async def run_direct(model, queries: int, concurrency: int):
+    """Previous behaviour: one executor job per call on the default pool."""
+    loop = asyncio.get_running_loop()
+
+    async def embed(query: str):
+        return (await loop.run_in_executor(None, model, "query", [query]))[0]
+
+    return await load(embed, queries, concurrency)
+
+
+async def run_batched(model, queries: int, concurrency: int, args) -> tuple:
+    batcher = MicroBatcher(
+        model,
+        max_batch_size=args.batch_size,
+        max_wait_ms=args.wait_ms,
+        workers=args.workers,
+    )
+
+    async def embed(query: str):
+        return (await batcher.embed("query", [query]))[0]
+
+    result = await load(embed, queries, concurrency)
+    await batcher.close()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--model", default=None, help="FastEmbed model name")
+    parser.add_argument("--call-ms", type=float, default=3.0)
+    parser.add_argument("--text-ms", type=float, default=0.3)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--wait-ms", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    def make_model():
+        if args.model:
+            return FastEmbedModel(args.model)
+        return SimulatedModel(args.call_ms, args.text_ms)
+
+    for label in ("direct", "batched"):
+        model = make_model()
+        if label == "direct":
+            coro = run_direct(model, args.queries, args.concurrency)
+        else:
+            coro = run_batched(model, args.queries, args.concurrency, args)
+        elapsed, latencies = asyncio.run(coro)
+        p99 = statistics.quantiles(latencies, n=100)[98]
+        print(
+            f"{label:<8} {args.queries / elapsed:8.0f} q/s  "
+            f"p50={statistics.median(latencies):7.1f} ms  p99={p99:7.1f} ms  "
+            f"model calls={model.calls}"
+        )
+
+
+if __name__ == "__main__":
+    main()
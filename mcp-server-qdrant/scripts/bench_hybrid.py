@@ -0,0 +1,202 @@
+"""
+Compare dense, sparse and hybrid retrieval on a small bundled corpus.
+
+Main responsibility: Load `scripts/data/hybrid_corpus.json` (DeFi notes with
+contract addresses, tickers and names, plus keyword and paraphrased queries
+with relevance labels) into one hybrid collection, run every query through
+`QdrantConnector.search` in each mode and report recall@5, MRR@10 and p50
+search latency per query kind.
+
+Usage (from the project root):
+    uv run python scripts/bench_hybrid.py
+    uv run python scripts/bench_hybrid.py \
+        --model sentence-transformers/all-MiniLM-L6-v2 --sparse-model Qdrant/bm25
+
+Without `--model` / `--sparse-model` the benchmark runs fully offline with
+stand-ins: 64 hashed character-trigram buckets for the dense side (fuzzy
+lexical overlap with collisions, no real semantics) and hashed term counts
+with Qdrant's IDF modifier for the sparse side (BM25-like). Real FastEmbed models are downloaded on
+first use. Latency is measured against in-memory local mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import statistics
+import tempfile
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+
+import bench_common  # noqa: F401  (puts src/ on sys.path)
+import numpy as np
+from qdrant_client import AsyncQdrantClient, models
+
+from mcp_server_qdrant.qdrant.config import QdrantConfig
+from mcp_server_qdrant.qdrant.embeddings.base import (
+    EmbeddingProvider,
+    SparseEmbeddingProvider,
+)
+from mcp_server_qdrant.qdrant.module import Entry, QdrantConnector
+
+CORPUS = Path(__file__).parent / "data" / "hybrid_corpus.json"
+MODES = ("dense", "sparse", "hybrid")
+RECALL_K = 5
+MRR_K = 10
+
+
+def tokens(text: str) -> list[str]:
+    return re.findall(r"[\w.\-]+", text.lower())
+
+
+class TrigramEmbeddingProvider(EmbeddingProvider):
+    """Hashed character-trigram vectors, an offline stand-in for a dense model."""
+
+    def __init__(self, vector_size: int = 64):
+        self.vector_size = vector_size
+
+    def _embed(self, text: str) -> list[float]:
+        vector = np.zeros(self.vector_size, dtype=np.float32)
+        for token in tokens(text):
+            padded = f" {token} "
+            for i in range(len(padded) - 2):
+                vector[zlib.crc32(padded[i : i + 3].encode()) % self.vector_size] += 1
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        return [self._embed(d) for d in documents]
+
+    async def embed_query(self, query: str) -> list[float]:
+        return self._embed(query)
+
+    def get_vector_name(self) -> str:
+        return "trigram"
+
+    def get_vector_size(self) -> int:
+        return self.vector_size
+
+
+class TermCountSparseProvider(SparseEmbeddingProvider):
+    """Hashed term counts; with the IDF modifier Qdrant scores them like BM25."""
+
+    def _embed(self, text: str) -> models.SparseVector:
+        counts = Counter(zlib.crc32(t.encode()) for t in tokens(text))
+        indices = sorted(counts)
+        return models.SparseVector(
+            indices=indices, values=[float(counts[i]) for i in indices]
+        )
+
+    async def embed_documents(self, documents: list[str]) -> list[models.SparseVector]:
+        return [self._embed(d) for d in documents]
+
+    async def embed_query(self, query: str) -> models.SparseVector:
+        return self._embed(query)
+
+    def get_vector_name(self) -> str:
+        return "terms"
+
+    def requires_idf(self) -> bool:
+        return True
+
+
+def providers(
+    args: argparse.Namespace,
+) -> tuple[EmbeddingProvider, SparseEmbeddingProvider]:
+    dense: EmbeddingProvider = TrigramEmbeddingProvider(args.dim)
+    sparse: SparseEmbeddingProvider = TermCountSparseProvider()
+    if args.model or args.sparse_model:
+        from mcp_server_qdrant.qdrant.embeddings.fastembed import (
+            FastEmbedProvider,
+            FastEmbedSparseProvider,
+        )
+
+        if args.model:
+            dense = FastEmbedProvider(args.model)
+        if args.sparse_model:
+            sparse = FastEmbedSparseProvider(args.sparse_model)
+    return dense, sparse
+
+
+async def run(args: argparse.Namespace) -> dict[tuple[str, str], list[tuple]]:
+    """Search every query in every mode; returns (mode, kind) -> results."""
+    corpus = json.loads(CORPUS.read_text())
+    dense, sparse = providers(args)
+    with tempfile.TemporaryDirectory() as path:
+        connector = QdrantConnector(QdrantConfig(local_path=path), dense, sparse)
+        await connector._client.close()
+    connector._client = AsyncQdrantClient(location=":memory:")
+
+    await connector.store_batch(
+        [
+            Entry(content=doc["text"], metadata={"id": doc["id"]})
+            for doc in corpus["documents"]
+        ],
+        "bench-hybrid",
+    )
+
+    results: dict[tuple[str, str], list[tuple]] = {}
+    for _ in range(args.warmup):
+        for mode in MODES:
+            await connector.search("warmup", "bench-hybrid", mode=mode)
+    for mode in MODES:
+        for query in corpus["queries"]:
+            start = time.perf_counter()
+            result = await connector.search(
+                query["text"], "bench-hybrid", limit=MRR_K, mode=mode
+            )
+            latency = (time.perf_counter() - start) * 1000
+            found = [p.payload["metadata"]["id"] for p in result.points]
+            for kind in (query["kind"], "all"):
+                results.setdefault((mode, kind), []).append(
+                    (found, set(query["relevant"]), latency)
+                )
+
+    await connector._client.close()
+    await dense.close()
+    await sparse.close()
+    return results
+
+
+def recall_at(found: list[int], relevant: set[int], k: int) -> float:
+    return len(set(found[:k]) & relevant) / len(relevant)
+
+
+def reciprocal_rank(found: list[int], relevant: set[int]) -> float:
+    for rank, doc_id in enumerate(found[:MRR_K], start=1):
+        if doc_id in relevant:
+            return 1 / rank
+    return 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", default=None, help="FastEmbed dense model")
+    parser.add_argument("--sparse-model", default=None, help="FastEmbed sparse model")
+    parser.add_argument(
+        "--dim", type=int, default=64, help="Trigram stand-in size (without --model)"
+    )
+    parser.add_argument("--warmup", type=int, default=3)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    print(
+        f"{'mode':<7} {'queries':<9} {f'recall@{RECALL_K}':>9} "
+        f"{f'MRR@{MRR_K}':>7} {'p50 ms':>7}"
+    )
+    for (mode, kind), rows in sorted(
+        results.items(), key=lambda item: (MODES.index(item[0][0]), item[0][1])
+    ):
+        recall = statistics.mean(recall_at(f, r, RECALL_K) for f, r, _ in rows)
+        mrr = statistics.mean(reciprocal_rank(f, r) for f, r, _ in rows)
+        p50 = statistics.median(latency for _, _, latency in rows)
+        print(f"{mode:<7} {kind:<9} {recall:9.3f} {mrr:7.3f} {p50:7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Compare collection performance profiles on a generated dataset.
+
+Main responsibility: Load the same clustered vectors into one collection per
+profile, run the same queries through `QdrantConnector.search` and report
+recall@10 against exact ground truth, p50/p99 search latency and the vector
+memory footprint of each profile.
+
+Usage (from the project root):
+    uv run python scripts/bench_profiles.py --docs 10000 --dim 384
+    uv run python scripts/bench_profiles.py --host localhost --port 6333
+
+Local mode (the default) always runs exact brute-force search and ignores
+quantization and `hnsw_ef`, so its `recall` column is 1.0 for every profile.
+The `est. recall` column replays each profile's quantized scoring (int8 or 1-bit
+codes, oversampling, rescoring) in numpy on the same data, which is what the
+profile changes on a server. Memory is estimated from the collection settings:
+RAM holds the quantized vectors, the original vectors unless they are on disk,
+and the HNSW links. Pass `--host` to measure against a real Qdrant server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+
+import bench_common  # noqa: F401  (puts src/ on sys.path)
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+
+from mcp_server_qdrant.qdrant.collection_cache import get_collection_cache
+from mcp_server_qdrant.qdrant.config import (
+    CollectionConfig,
+    PerformanceProfile,
+    QdrantConfig,
+    QuantizationType,
+)
+from mcp_server_qdrant.qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.qdrant.module import Entry, QdrantConnector
+
+K = 10
+
+
+class DatasetEmbeddingProvider(EmbeddingProvider):
+    """Maps "doc-<i>" / "query-<i>" texts to rows of the generated dataset."""
+
+    def __init__(self, docs: np.ndarray, queries: np.ndarray):
+        self.docs = docs
+        self.queries = queries
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        return [self.docs[int(d.split("-")[1])].tolist() for d in documents]
+
+    async def embed_query(self, query: str) -> list[float]:
+        return self.queries[int(query.split("-")[1])].tolist()
+
+    def get_vector_name(self) -> str:
+        return "bench"
+
+    def get_vector_size(self) -> int:
+        return self.docs.shape[1]
+
+
+def generate(
+    docs: int, queries: int, dim: int, seed: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Unit vectors around random cluster centers, like sentence embeddings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(docs // 200, 1), dim))
+
+    def sample(count: int) -> np.ndarray:
+        points = centers[rng.integers(len(centers), size=count)]
+        points = points + 0.8 * rng.standard_normal((count, dim))
+        return (points / np.linalg.norm(points, axis=1, keepdims=True)).astype(
+            np.float32
+        )
+
+    return sample(docs), sample(queries)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores per row, best first."""
+    k = min(k, scores.shape[1])
+    idx = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, idx, axis=1), axis=1)
+    return np.take_along_axis(idx, order, axis=1)
+
+
+def recall(found: np.ndarray | list[list[int]], truth: np.ndarray) -> float:
+    """Mean recall@K of `found` against exact `truth`."""
+    return float(
+        np.mean([len(set(f[:K]) & set(t)) / K for f, t in zip(found, truth)])
+    )
+
+
+def quantized_search(
+    config: CollectionConfig, docs: np.ndarray, queries: np.ndarray
+) -> np.ndarray | None:
+    """Top-K per query when scoring with the profile's quantized vectors."""
+    quantization = config.quantization
+    search = config.search
+    if quantization.type == QuantizationType.NONE:
+        return top_k(queries @ docs.T, K)
+
+    if quantization.type == QuantizationType.SCALAR:
+        quantile = quantization.quantile or 1.0
+        low, high = np.quantile(docs, [(1 - quantile) / 2, (1 + quantile) / 2])
+        scale = (high - low) / 255
+
+        def codec(x: np.ndarray) -> np.ndarray:
+            codes = np.round((np.clip(x, low, high) - low) / scale)
+            return codes * scale + low
+
+        approx = codec(queries) @ codec(docs).T
+    elif quantization.type == QuantizationType.BINARY:
+        approx = np.sign(queries) @ np.sign(docs).T
+    else:
+        return None  # product quantization needs trained codebooks
+
+    candidates = top_k(approx, int(K * (search.oversampling or 1.0)))
+    if not search.rescore:
+        return candidates[:, :K]
+    exact = np.einsum("qd,qcd->qc", queries, docs[candidates])
+    return np.take_along_axis(candidates, top_k(exact, K), axis=1)
+
+
+def memory_mib(config: CollectionConfig, docs: int, dim: int) -> tuple[float, float]:
+    """Estimated (RAM, disk) MiB for vectors and HNSW links."""
+    quantization = config.quantization
+    original = docs * dim * 4
+    quantized = {
+        QuantizationType.NONE: 0,
+        QuantizationType.SCALAR: docs * dim,
+        QuantizationType.BINARY: docs * dim / 8,
+        QuantizationType.PRODUCT: original / int(quantization.compression[1:]),
+    }[quantization.type]
+    m = config.hnsw_config.m or config.hnsw_config.payload_m or 0
+    links = docs * m * 2 * 4  # layer 0 keeps 2*m 4-byte links per point
+
+    ram = links
+    ram += 0 if config.on_disk_vectors else original
+    ram += quantized if quantization.always_ram else 0
+    disk = original + quantized + links
+    return ram / 2**20, disk / 2**20
+
+
+async def run_profile(
+    profile: PerformanceProfile,
+    docs: np.ndarray,
+    queries: np.ndarray,
+    truth: np.ndarray,
+    args: argparse.Namespace,
+) -> tuple[float, list[float]]:
+    """Load the dataset and search it; returns (recall@K, latencies ms)."""
+    get_collection_cache().clear()
+    collection_config = CollectionConfig(profile=profile)
+    with tempfile.TemporaryDirectory() as path:
+        if args.host:
+            config = QdrantConfig(
+                host=args.host, port=args.port, collection_config=collection_config
+            )
+        else:
+            config = QdrantConfig(local_path=path, collection_config=collection_config)
+        connector = QdrantConnector(config, DatasetEmbeddingProvider(docs, queries))
+        if not args.host:
+            await connector._client.close()
+            connector._client = AsyncQdrantClient(location=":memory:")
+
+        collection = f"bench-{profile.value}"
+        if await connector._client.collection_exists(collection):
+            await connector._client.delete_collection(collection)
+        for offset in range(0, len(docs), 1000):
+            await connector.store_batch(
+                [
+                    Entry(content=f"doc-{i}")
+                    for i in range(offset, min(offset + 1000, len(docs)))
+                ],
+                collection,
+            )
+
+        found, latencies = [], []
+        for i in range(len(queries)):
+            start = time.perf_counter()
+            result = await connector.search(f"query-{i}", collection, limit=K)
+            latencies.append((time.perf_counter() - start) * 1000)
+            found.append(
+                [int(p.payload["document"].split("-")[1]) for p in result.points]
+            )
+
+        if args.host:
+            await connector._client.delete_collection(collection)
+        await connector._client.close()
+    return recall(found, truth), latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--host", default=None, help="Qdrant server (default: local)")
+    parser.add_argument("--port", type=int, default=6333)
+    args = parser.parse_args()
+
+    docs, queries = generate(args.docs, args.queries, args.dim, args.seed)
+    truth = top_k(queries @ docs.T, K)
+
+    print(
+        f"{'profile':<13} {'recall':>7} {'est. recall':>11} {'p50 ms':>7} "
+        f"{'p99 ms':>7} {'RAM MiB':>8} {'disk MiB':>8}"
+    )
+    for profile in PerformanceProfile:
+        config = CollectionConfig(profile=profile)
+        measured, latencies = asyncio.run(
+            run_profile(profile, docs, queries, truth, args)
+        )
+        estimated = quantized_search(config, docs, queries)
+        estimated_recall = (
+            recall(estimated, truth) if estimated is not None else float("nan")
+        )
+        ram, disk = memory_mib(config, args.docs, args.dim)
+        p99 = statistics.quantiles(latencies, n=100)[98]
+        print(
+            f"{profile.value:<13} {measured:7.3f} {estimated_recall:11.3f} "
+            f"{statistics.median(latencies):7.2f} {p99:7.2f} {ram:8.1f} {disk:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
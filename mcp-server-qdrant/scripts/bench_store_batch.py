@@ -0,0 +1,129 @@
+"""
+Compare ingestion throughput of per-entry `store` and `store_batch`.
+
+Main responsibility: Ingest the same synthetic corpus into an embedded (local
+`path`) Qdrant once entry by entry and once through `store_batch` in request
+sized batches, then report documents per second and Qdrant calls.
+
+Usage (from the project root):
+    uv run python scripts/bench_store_batch.py --docs 10000
+    uv run python scripts/bench_store_batch.py --docs 2000 --model BAAI/bge-small-en-v1.5
+
+Without `--model` a hash based embedder is used, which isolates the Qdrant side;
+with a FastEmbed model the gap also includes batched ONNX inference. Local mode
+commits to SQLite once per point whatever the request size, so `--in-memory`
+shows the client/request overhead without that fixed cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from bench_common import CountingClient, create_provider
+from qdrant_client import AsyncQdrantClient
+
+from mcp_server_qdrant.qdrant.collection_cache import get_collection_cache
+from mcp_server_qdrant.qdrant.config import QdrantConfig
+from mcp_server_qdrant.qdrant.module import Entry, QdrantConnector
+from mcp_server_qdrant.schemas import MAX_BATCH_ENTRIES
+
+WORDS = "vector search memory agent tenant index payload collection query store".split()
+
+
+def corpus(count: int) -> list[Entry]:
+    """Short documents with a little metadata, like typical stored memories."""
+    return [
+        Entry(
+            content=f"Document {i}: "
+            + " ".join(WORDS[(i * 7 + k) % len(WORDS)] for k in range(30)),
+            metadata={"user_id": f"user_{i % 50}", "category": f"c{i % 5}"},
+        )
+        for i in range(count)
+    ]
+
+
+async def ingest(
+    path: str,
+    entries: list[Entry],
+    model: str | None,
+    batched: bool,
+    batch_size: int,
+    upsert_batch_size: int,
+    parallelism: int,
+    in_memory: bool,
+) -> tuple[float, int]:
+    """Ingest `entries`; returns (seconds, Qdrant calls)."""
+    get_collection_cache().clear()
+    config = QdrantConfig(
+        local_path=path,
+        upsert_batch_size=upsert_batch_size,
+        upsert_parallelism=parallelism,
+    )
+    connector = QdrantConnector(config, create_provider(model))
+    if in_memory:
+        await connector._client.close()
+        connector._client = AsyncQdrantClient(location=":memory:")
+    client = CountingClient(connector._client)
+    connector._client = client
+
+    start = time.perf_counter()
+    if batched:
+        # One store_batch call per HTTP request worth of entries
+        for offset in range(0, len(entries), batch_size):
+            results = await connector.store_batch(
+                entries[offset : offset + batch_size], "bench"
+            )
+            assert all(r.stored for r in results)
+    else:
+        for entry in entries:
+            await connector.store(entry, "bench")
+    elapsed = time.perf_counter() - start
+
+    assert (await client.count("bench")).count == len(entries)
+    await client.close()
+    return elapsed, sum(client.calls.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs", type=int, default=10_000)
+    parser.add_argument("--model", default=None, help="FastEmbed model name")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=MAX_BATCH_ENTRIES,
+        help="Entries per store_batch call",
+    )
+    parser.add_argument("--upsert-batch-size", type=int, default=256)
+    parser.add_argument("--parallelism", type=int, default=4)
+    parser.add_argument(
+        "--in-memory", action="store_true", help="Use :memory: instead of a path"
+    )
+    args = parser.parse_args()
+
+    entries = corpus(args.docs)
+    for label, batched in (("store", False), ("store_batch", True)):
+        with tempfile.TemporaryDirectory() as path:
+            elapsed, calls = asyncio.run(
+                ingest(
+                    path,
+                    entries,
+                    args.model,
+                    batched,
+                    args.batch_size,
+                    args.upsert_batch_size,
+                    args.parallelism,
+                    args.in_memory,
+                )
+            )
+        print(
+            f"{label:<12} {args.docs} docs in {elapsed:7.2f} s "
+            f"({args.docs / elapsed:8.0f} docs/s, {calls} Qdrant calls)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 from fastapi import APIRouter
 
+from .admin import router as admin_router
+from .collections import router as collections_router
 from .health import router as health_router
 
 routers: list[APIRouter] = [
     health_router,
+    admin_router,
+    collections_router,
 ]
@@ -0,0 +1,36 @@
+import logging
+
+from fastapi import APIRouter, Depends
+
+from mcp_server_qdrant.dependencies import get_qdrant_connector
+from mcp_server_qdrant.qdrant import QdrantConnector
+from mcp_server_qdrant.qdrant.collection_cache import get_collection_cache
+from mcp_server_qdrant.schemas import InvalidateCollectionCacheRequest
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.post(
+    "/admin/collection_cache/invalidate",
+    tags=["Admin"],
+    operation_id="invalidate_collection_cache",
+)
+async def invalidate_collection_cache(
+    request_body: InvalidateCollectionCacheRequest,
+    qdrant_connector: QdrantConnector = Depends(get_qdrant_connector),
+) -> dict[str, int]:
+    """
+    Drops cached collection state so the next store/search re-checks Qdrant.
+
+    Call this after collections were dropped, re-created or re-indexed outside
+    this server. It is not exposed to MCP because it is an operator action.
+    """
+    invalidated = qdrant_connector.invalidate_collection_cache(
+        request_body.collection_name
+    )
+    logger.info(
+        f"Invalidated collection cache for "
+        f"{request_body.collection_name or 'all collections'}: {invalidated} entries"
+    )
+    return {"invalidated": invalidated, **get_collection_cache().stats()}
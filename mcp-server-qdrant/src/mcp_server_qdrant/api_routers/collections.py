@@ -0,0 +1,169 @@
+import json
+import logging
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from fastmcp.exceptions import ToolError
+
+from mcp_server_qdrant.dependencies import get_qdrant_connector
+from mcp_server_qdrant.qdrant import ImportResult, PointRecord, QdrantConnector
+from mcp_server_qdrant.schemas import MAX_EXPORT_PAGE_SIZE, QdrantExportRequest
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _ndjson_line(obj: dict[str, Any]) -> bytes:
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode()
+
+
+def _point_line(point: PointRecord) -> bytes:
+    line = {"type": "point", **point.model_dump(mode="json")}
+    if line["vector"] is None:
+        del line["vector"]
+    return _ndjson_line(line)
+
+
+async def _read_points(chunks: AsyncIterable[bytes]) -> AsyncIterator[PointRecord]:
+    """
+    Parse an export stream line by line, skipping cursor lines.
+
+    Only the current partial line is buffered, never the whole body.
+    """
+    buffer = b""
+    line_number = 0
+
+    def parse(raw: bytes) -> PointRecord | None:
+        try:
+            obj = json.loads(raw)
+            kind = obj.pop("type", "point")
+            if kind == "cursor":
+                return None
+            if kind == "error":
+                raise ValueError(f"export stream ended with an error: {obj}")
+            return PointRecord.model_validate(obj)
+        except Exception as e:
+            raise ValueError(f"Invalid NDJSON line {line_number}: {e}") from e
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            line_number += 1
+            if raw.strip() and (point := parse(raw)) is not None:
+                yield point
+    if buffer.strip():
+        line_number += 1
+        if (point := parse(buffer)) is not None:
+            yield point
+
+
+@router.post(
+    "/export",
+    tags=["Qdrant"],
+    operation_id="qdrant_export_collection",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def qdrant_export_collection(
+    request_body: QdrantExportRequest,
+    qdrant_connector: QdrantConnector = Depends(get_qdrant_connector),
+) -> StreamingResponse:
+    """
+    Streams every point of a collection as NDJSON, one page at a time.
+
+    Each point is a `{"type": "point", "id", "payload", "vector"?}` line. After
+    every page comes a `{"type": "cursor", "next_offset": ...}` line; pass that
+    offset back to resume an interrupted export. The last cursor has
+    `next_offset: null`. A failure mid-stream ends with a `{"type": "error"}` line.
+    The body can be posted unchanged to `/import`. It is not exposed to MCP
+    because agents cannot consume a streamed body.
+    """
+    pages = qdrant_connector.scroll_pages(
+        request_body.collection_name,
+        page_size=request_body.page_size,
+        offset=request_body.offset,
+        with_vectors=request_body.with_vectors,
+        filters=request_body.filters,
+    )
+    # Fetch the first page eagerly so a missing collection fails the request
+    try:
+        first_page = await anext(pages)
+    except Exception as e:
+        logger.error(f"Error exporting collection: {e}", exc_info=True)
+        raise ToolError(f"Error exporting collection: {e}") from e
+
+    async def stream() -> AsyncIterator[bytes]:
+        exported = 0
+        page = first_page
+        try:
+            while True:
+                points, next_offset = page
+                for point in points:
+                    yield _point_line(point)
+                exported += len(points)
+                yield _ndjson_line({"type": "cursor", "next_offset": next_offset})
+                if next_offset is None:
+                    break
+                page = await anext(pages)
+        except Exception as e:
+            logger.error(f"Export stopped after {exported} points: {e}", exc_info=True)
+            yield _ndjson_line({"type": "error", "message": str(e)})
+            return
+        finally:
+            await pages.aclose()
+        logger.info(
+            f"Exported {exported} points from {request_body.collection_name}"
+        )
+
+    return StreamingResponse(stream(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.post(
+    "/import",
+    tags=["Qdrant"],
+    operation_id="qdrant_import_collection",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def qdrant_import_collection(
+    request: Request,
+    collection_name: str = Query(..., description="Collection to import into."),
+    batch_size: int | None = Query(
+        None,
+        ge=1,
+        le=MAX_EXPORT_PAGE_SIZE,
+        description="Points per upsert (defaults to QDRANT_UPSERT_BATCH_SIZE).",
+    ),
+    qdrant_connector: QdrantConnector = Depends(get_qdrant_connector),
+) -> ImportResult:
+    """
+    Bulk-imports an NDJSON stream produced by `/export`.
+
+    The body is read incrementally and upserted in bounded batches. Point ids
+    are kept, so an interrupted import can simply be re-run. Points exported
+    without vectors are re-embedded from their document text.
+    """
+    try:
+        result = await qdrant_connector.import_points(
+            collection_name,
+            _read_points(request.stream()),
+            batch_size=batch_size,
+        )
+        logger.info(
+            f"Imported {result.imported} points into {collection_name} "
+            f"({result.embedded} re-embedded)"
+        )
+        return result
+
+    except Exception as e:
+        logger.error(f"Error importing collection: {e}", exc_info=True)
+        raise ToolError(f"Error importing collection: {e}") from e
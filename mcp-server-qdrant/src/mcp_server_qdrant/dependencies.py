@@ -2,7 +2,14 @@ import logging
 
 from mcp_server_qdrant.qdrant import QdrantConnector
 from mcp_server_qdrant.qdrant.config import EmbeddingProviderSettings, QdrantConfig
-from mcp_server_qdrant.qdrant.embeddings.factory import create_embedding_provider
+from mcp_server_qdrant.qdrant.embeddings.base import (
+    EmbeddingProvider,
+    SparseEmbeddingProvider,
+)
+from mcp_server_qdrant.qdrant.embeddings.factory import (
+    create_embedding_provider,
+    create_sparse_embedding_provider,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +33,8 @@ class DependencyContainer:
     """
 
     _qdrant_connector: QdrantConnector | None = None
+    _embedding_provider: EmbeddingProvider | None = None
+    _sparse_embedding_provider: SparseEmbeddingProvider | None = None
 
     @classmethod
     def initialize(cls) -> None:
@@ -38,8 +47,13 @@ class DependencyContainer:
 
         config = QdrantConfig()
         embedding_provider_settings = EmbeddingProviderSettings()
-        embedding_provider = create_embedding_provider(embedding_provider_settings)
-        cls._qdrant_connector = QdrantConnector(config, embedding_provider)
+        cls._embedding_provider = create_embedding_provider(embedding_provider_settings)
+        cls._sparse_embedding_provider = create_sparse_embedding_provider(
+            embedding_provider_settings
+        )
+        cls._qdrant_connector = QdrantConnector(
+            config, cls._embedding_provider, cls._sparse_embedding_provider
+        )
 
         logger.info("Dependencies initialized successfully.")
 
@@ -52,6 +66,12 @@ class DependencyContainer:
         """
         logger.info("Shutting down dependencies...")
 
+        if cls._embedding_provider is not None:
+            await cls._embedding_provider.close()
+            cls._embedding_provider = None
+        if cls._sparse_embedding_provider is not None:
+            await cls._sparse_embedding_provider.close()
+            cls._sparse_embedding_provider = None
         cls._qdrant_connector = None
 
         logger.info("Dependencies shut down successfully.")
@@ -1,14 +1,16 @@
 import logging
+from typing import Any
 
 from fastapi import APIRouter, Depends
 from fastmcp.exceptions import ToolError
-from qdrant_client.models import CollectionInfo, ScoredPoint
+from qdrant_client.models import ScoredPoint
 
 from mcp_server_qdrant.dependencies import get_qdrant_connector
-from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from mcp_server_qdrant.qdrant import BatchStoreResult, Entry, QdrantConnector
 from mcp_server_qdrant.schemas import (
     QdrantFindRequest,
     QdrantGetCollectionInfoRequest,
+    QdrantStoreBatchRequest,
     QdrantStoreRequest,
 )
 
@@ -46,6 +48,40 @@ async def qdrant_store(
         raise ToolError(f"Error storing information: {e}") from e
 
 
+@router.post(
+    "/store_batch",
+    tags=["Qdrant"],
+    operation_id="qdrant_store_batch",
+)
+async def qdrant_store_batch(
+    request_body: QdrantStoreBatchRequest,
+    qdrant_connector: QdrantConnector = Depends(get_qdrant_connector),
+) -> list[BatchStoreResult]:
+    """
+    Keep many memories at once, e.g. when ingesting a set of documents.
+    Prefer this over repeated qdrant_store calls when storing more than a few entries.
+    Returns one result per entry (in input order) telling whether it was stored.
+    """
+    try:
+        entries = [
+            Entry(content=item.information, metadata=item.metadata)
+            for item in request_body.entries
+        ]
+        results = await qdrant_connector.store_batch(
+            entries, collection_name=request_body.collection_name
+        )
+
+        stored = sum(result.stored for result in results)
+        logger.info(
+            f"Stored {stored}/{len(results)} entries in collection {request_body.collection_name}"
+        )
+        return results
+
+    except Exception as e:
+        logger.error(f"Error storing batch: {e}", exc_info=True)
+        raise ToolError(f"Error storing batch: {e}") from e
+
+
 @router.post(
     "/find",
     tags=["Qdrant"],
@@ -58,7 +94,10 @@ async def qdrant_find(
     """
     Look up memories in Qdrant. Use this tool when you need to find memories by their content.
     You can optionally filter by metadata fields (e.g., {"metadata.user_id": "alice", "metadata.category": "work"}).
+    Use operator objects for ranges, multiple values, geo areas or missing fields
+    (e.g., {"metadata.created_at": {"gte": "2024-01-01T00:00:00Z"}, "metadata.tag": {"any": ["a", "b"]}}).
     Filtering by tenant fields (if configured) will be much faster than filtering by other fields.
+    When hybrid search is enabled, results combine semantic and exact keyword matches.
     """
     try:
         # Execute core logic using the validated request data
@@ -67,6 +106,7 @@ async def qdrant_find(
             collection_name=request_body.collection_name,
             limit=request_body.search_limit,
             filters=request_body.filters,
+            mode=request_body.mode,
         )
 
         # Format response
@@ -93,11 +133,12 @@ async def qdrant_find(
 async def qdrant_get_collection_info(
     request_body: QdrantGetCollectionInfoRequest,
     qdrant_connector: QdrantConnector = Depends(get_qdrant_connector),
-) -> CollectionInfo | dict[str, str]:
+) -> dict[str, Any]:
     """
     Retrieves detailed configuration and schema information for a specific Qdrant collection.
     Use this to understand how a collection is set up, what fields are indexed,
     if it's configured for multi-tenancy, and its vector parameters.
+    The `query_cache` key reports hit/miss metrics of the server's query embedding cache.
     """
     try:
         collection_details = await qdrant_connector.get_collection_details(
@@ -106,7 +147,10 @@ async def qdrant_get_collection_info(
         logger.info(
             f"Successfully retrieved details for collection {request_body.collection_name}"
         )
-        return collection_details
+        return {
+            **collection_details.model_dump(mode="json"),
+            "query_cache": qdrant_connector.get_query_cache_stats(),
+        }
 
     except Exception as e:
         collection_name = request_body.collection_name
@@ -10,7 +10,16 @@ from mcp_server_qdrant.qdrant.config import (
                                              QdrantConfigError,
                                              QdrantServiceError,
 )
-from mcp_server_qdrant.qdrant.module import Entry, Metadata, QdrantConnector
+from mcp_server_qdrant.qdrant.filters import FieldFilter, build_filter
+from mcp_server_qdrant.qdrant.module import (
+    BatchStoreResult,
+    Entry,
+    ImportResult,
+    Metadata,
+    PointRecord,
+    QdrantConnector,
+    SearchMode,
+)
 
 __all__ = [
     # Error classes
@@ -20,5 +29,12 @@ __all__ = [
     # Main classes and types
     "QdrantConnector",
     "Entry",
+    "BatchStoreResult",
+    "PointRecord",
+    "ImportResult",
     "Metadata",
+    "SearchMode",
+    # Search filters
+    "FieldFilter",
+    "build_filter",
 ]
@@ -0,0 +1,154 @@
+"""
+Process-wide cache of verified Qdrant collections.
+
+Main responsibility: Remember which collections are known to exist and which
+payload indexes were already ensured on them, so the steady-state store and
+search paths skip `collection_exists` / `create_payload_index` round-trips.
+Entries are dropped when Qdrant reports a collection as missing or when an
+admin invalidates them explicitly.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# (Qdrant location or local path, collection name)
+CollectionKey = tuple[str, str]
+
+
+@dataclass
+class CollectionState:
+    """What has been verified for a single collection."""
+
+    exists: bool = False
+    indexed_fields: frozenset[str] = field(default_factory=frozenset)
+    # Fields indexed in the collection's payload schema; None until fetched
+    schema_fields: frozenset[str] | None = None
+    warned_fields: set[str] = field(default_factory=set)
+    # Whether the collection has the configured sparse vector; None until checked
+    sparse: bool | None = None
+
+
+class CollectionStateCache:
+    """
+    Known collection state shared by every connector in the process.
+
+    The cache only ever records positive facts (the collection exists, these
+    indexes were created). Anything else falls back to asking Qdrant.
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[CollectionKey, CollectionState] = {}
+        self._locks: dict[CollectionKey, asyncio.Lock] = {}
+        self._invalidations = 0
+
+    def lock(self, key: CollectionKey) -> asyncio.Lock:
+        """Lock serializing create/index work for one collection."""
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    def exists(self, key: CollectionKey) -> bool:
+        """Whether the collection was already seen to exist."""
+        state = self._states.get(key)
+        return state is not None and state.exists
+
+    def is_indexed(self, key: CollectionKey, fields: frozenset[str]) -> bool:
+        """Whether the collection exists and all `fields` were already indexed."""
+        state = self._states.get(key)
+        return state is not None and state.exists and fields <= state.indexed_fields
+
+    def mark_exists(self, key: CollectionKey) -> None:
+        """Record that the collection exists."""
+        self._states.setdefault(key, CollectionState()).exists = True
+
+    def mark_indexed(self, key: CollectionKey, fields: frozenset[str]) -> None:
+        """Record that the collection exists with `fields` indexed."""
+        state = self._states.setdefault(key, CollectionState())
+        state.exists = True
+        state.indexed_fields = state.indexed_fields | fields
+
+    def known_indexed_fields(self, key: CollectionKey) -> frozenset[str] | None:
+        """
+        Fields known to be indexed, or None if the payload schema was not fetched.
+
+        Args:
+            key: The collection key
+
+        """
+        state = self._states.get(key)
+        if state is None or state.schema_fields is None:
+            return None
+        return state.schema_fields | state.indexed_fields
+
+    def mark_schema(self, key: CollectionKey, fields: frozenset[str]) -> None:
+        """Record the indexed fields reported by the collection's payload schema."""
+        state = self._states.setdefault(key, CollectionState())
+        state.exists = True
+        state.schema_fields = fields
+
+    def first_warnings(self, key: CollectionKey, fields: frozenset[str]) -> set[str]:
+        """Return the subset of `fields` not warned about yet, marking them warned."""
+        state = self._states.setdefault(key, CollectionState())
+        new = set(fields) - state.warned_fields
+        state.warned_fields |= new
+        return new
+
+    def has_sparse(self, key: CollectionKey) -> bool | None:
+        """Whether the collection stores sparse vectors, or None if not checked yet."""
+        state = self._states.get(key)
+        return state.sparse if state is not None else None
+
+    def mark_sparse(self, key: CollectionKey, sparse: bool) -> None:
+        """Record whether the collection stores sparse vectors."""
+        state = self._states.setdefault(key, CollectionState())
+        state.exists = True
+        state.sparse = sparse
+
+    def invalidate(
+        self, collection_name: str | None = None, location: str | None = None
+    ) -> int:
+        """
+        Forget cached state.
+
+        Args:
+            collection_name: Only drop this collection (all when None)
+            location: Only drop entries for this Qdrant location (all when None)
+
+        Returns:
+            Number of entries removed
+
+        """
+        keys = [
+            key
+            for key in self._states
+            if (collection_name is None or key[1] == collection_name)
+            and (location is None or key[0] == location)
+        ]
+        for key in keys:
+            del self._states[key]
+        self._invalidations += len(keys)
+        if keys:
+            logger.info(f"Invalidated cached state for {len(keys)} collection(s)")
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries, locks and counters."""
+        self._states.clear()
+        self._locks.clear()
+        self._invalidations = 0
+
+    def stats(self) -> dict[str, int]:
+        """Counters for the admin endpoint and benchmarks."""
+        return {
+            "collections": len(self._states),
+            "invalidations": self._invalidations,
+        }
+
+
+_collection_cache = CollectionStateCache()
+
+
+def get_collection_cache() -> CollectionStateCache:
+    """Return the process-wide collection state cache."""
+    return _collection_cache
@@ -1,6 +1,6 @@
 import logging
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -91,16 +91,128 @@ class HnswConfig(BaseModel):
             )
 
 
+class QuantizationType(str, Enum):
+    """Supported vector quantization methods."""
+
+    NONE = "none"
+    SCALAR = "scalar"
+    PRODUCT = "product"
+    BINARY = "binary"
+
+
+class QuantizationConfig(BaseModel):
+    """Vector quantization applied when a collection is created."""
+
+    type: QuantizationType = Field(
+        default=QuantizationType.NONE, description="Quantization method"
+    )
+    always_ram: bool = Field(
+        default=True, description="Keep quantized vectors in RAM even if on disk"
+    )
+    quantile: float | None = Field(
+        default=None,
+        gt=0.5,
+        le=1.0,
+        description="Scalar only: share of values used to pick the int8 range",
+    )
+    compression: Literal["x4", "x8", "x16", "x32", "x64"] = Field(
+        default="x16", description="Product only: compression ratio"
+    )
+
+
+class SearchParamsConfig(BaseModel):
+    """Search-time parameters sent with every query."""
+
+    hnsw_ef: int | None = Field(
+        default=None, ge=1, description="Candidate list size while searching"
+    )
+    exact: bool = Field(default=False, description="Bypass the HNSW index")
+    rescore: bool | None = Field(
+        default=None, description="Re-rank quantized results with original vectors"
+    )
+    oversampling: float | None = Field(
+        default=None,
+        ge=1.0,
+        description="Fetch limit * oversampling quantized candidates before rescoring",
+    )
+
+
+class PerformanceProfile(str, Enum):
+    """Named presets trading recall, latency and memory."""
+
+    BALANCED = "balanced"
+    LOW_LATENCY = "low-latency"
+    MEMORY_SAVER = "memory-saver"
+    HIGH_RECALL = "high-recall"
+
+
+# Defaults each profile applies under explicitly configured values
+PERFORMANCE_PROFILES: dict[PerformanceProfile, dict[str, Any]] = {
+    PerformanceProfile.BALANCED: {},
+    # int8 vectors in RAM, small ef, light oversampling rescored from RAM originals
+    PerformanceProfile.LOW_LATENCY: {
+        "quantization": {"type": "scalar", "quantile": 0.99, "always_ram": True},
+        "search": {"hnsw_ef": 64, "rescore": True, "oversampling": 1.5},
+    },
+    # Originals on disk, int8 vectors in RAM (4x smaller), oversample + rescore
+    PerformanceProfile.MEMORY_SAVER: {
+        "on_disk_vectors": True,
+        "quantization": {"type": "scalar", "quantile": 0.99, "always_ram": True},
+        "search": {"rescore": True, "oversampling": 2.0},
+    },
+    # Full precision, denser graph build and wide search
+    PerformanceProfile.HIGH_RECALL: {
+        "hnsw_config": {"ef_construct": 400},
+        "search": {"hnsw_ef": 256},
+    },
+}
+
+
+def _merge_defaults(
+    defaults: dict[str, Any], values: dict[str, Any]
+) -> dict[str, Any]:
+    """Recursively merge `values` over `defaults` (values win)."""
+    merged = dict(defaults)
+    for key, value in values.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_defaults(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
 class CollectionConfig(BaseModel):
     """Configuration for collection creation and indexing."""
 
+    profile: PerformanceProfile = Field(
+        default=PerformanceProfile.BALANCED,
+        description="Performance preset; explicit settings override its values",
+    )
     hnsw_config: HnswConfig = Field(
         default_factory=HnswConfig, description="HNSW algorithm settings"
     )
+    on_disk_vectors: bool = Field(
+        default=False, description="Store original vectors on disk (memmap)"
+    )
+    quantization: QuantizationConfig = Field(
+        default_factory=QuantizationConfig, description="Vector quantization"
+    )
+    search: SearchParamsConfig = Field(
+        default_factory=SearchParamsConfig, description="Search-time parameters"
+    )
     payload_indexes: list[PayloadIndexConfig] = Field(
         default_factory=list, description="Payload indexes to create"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def apply_profile(cls, data: Any) -> Any:
+        """Fill settings that were not given explicitly from the chosen profile."""
+        if not isinstance(data, dict):
+            return data
+        profile = PerformanceProfile(data.get("profile", PerformanceProfile.BALANCED))
+        return _merge_defaults(PERFORMANCE_PROFILES[profile], data)
+
     @model_validator(mode="before")
     @classmethod
     def convert_dict_to_list(cls, data: Any) -> Any:
@@ -157,6 +269,19 @@ class EmbeddingProviderSettings(BaseSettings):
         default="sentence-transformers/all-MiniLM-L6-v2",
         validation_alias="MODEL",
     )
+    # Hybrid search: sparse model stored next to the dense vectors (e.g. Qdrant/bm25)
+    sparse_model_name: str | None = Field(
+        default=None, description="FastEmbed sparse model; unset disables hybrid search"
+    )
+
+    # Micro-batching of concurrent embedding calls
+    batch_max_size: int = Field(default=64, ge=1, description="Max texts per model run")
+    batch_max_wait_ms: float = Field(
+        default=5.0, ge=0, description="Max time a request waits to be batched"
+    )
+    executor_workers: int = Field(
+        default=1, ge=1, description="Dedicated threads running the embedding model"
+    )
 
 
 class QdrantConfig(BaseSettings):
@@ -181,6 +306,29 @@ class QdrantConfig(BaseSettings):
     api_key: str | None = None  # API key for cloud deployments
     local_path: str | None = None  # Local path for storage (alternative to host/port)
 
+    # Bulk ingestion settings
+    upsert_batch_size: int = Field(
+        default=256, ge=1, description="Points per upsert request in batch stores"
+    )
+    upsert_parallelism: int = Field(
+        default=4, ge=1, description="Upsert requests in flight during batch stores"
+    )
+
+    # Hybrid search
+    hybrid_prefetch_factor: int = Field(
+        default=4,
+        ge=1,
+        description="Dense and sparse each prefetch limit * factor fusion candidates",
+    )
+
+    # Query embedding cache
+    query_cache_size: int = Field(
+        default=1024, ge=0, description="Cached query vectors (0 disables the cache)"
+    )
+    query_cache_path: str | None = Field(
+        default=None, description="SQLite file persisting cached query vectors"
+    )
+
     # Collection configuration
     collection_config: CollectionConfig = Field(
         default_factory=CollectionConfig,
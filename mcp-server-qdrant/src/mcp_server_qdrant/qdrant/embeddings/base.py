@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from qdrant_client import models
+
 
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
@@ -23,3 +25,38 @@ class EmbeddingProvider(ABC):
     def get_vector_size(self) -> int:
         """Get the size of the vector for the Qdrant collection."""
         pass
+
+    def get_model_name(self) -> str:
+        """Identify the model for caches keyed by model (defaults to the vector name)."""
+        return self.get_vector_name()
+
+    async def close(self) -> None:
+        """Release resources held by the provider (no-op by default)."""
+        return None
+
+
+class SparseEmbeddingProvider(ABC):
+    """Abstract base class for sparse (lexical) embedding providers."""
+
+    @abstractmethod
+    async def embed_documents(self, documents: list[str]) -> list[models.SparseVector]:
+        """Embed a list of documents into sparse vectors."""
+        pass
+
+    @abstractmethod
+    async def embed_query(self, query: str) -> models.SparseVector:
+        """Embed a query into a sparse vector."""
+        pass
+
+    @abstractmethod
+    def get_vector_name(self) -> str:
+        """Get the name of the sparse vector for the Qdrant collection."""
+        pass
+
+    def requires_idf(self) -> bool:
+        """Whether Qdrant should apply the IDF modifier (e.g. for BM25 term counts)."""
+        return False
+
+    async def close(self) -> None:
+        """Release resources held by the provider (no-op by default)."""
+        return None
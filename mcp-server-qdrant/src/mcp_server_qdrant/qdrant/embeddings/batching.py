@@ -0,0 +1,186 @@
+"""
+Cross-request micro-batching for synchronous embedding models.
+
+Main responsibility: Queue embedding requests from concurrent callers, combine
+them into batches bounded by size and wait time, run each batch once on a
+dedicated bounded thread pool and hand every caller its own vectors back.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# (kind, texts) -> one vector per text; kind separates e.g. queries from passages
+EmbedFunction = Callable[[str, list[str]], Sequence[Any]]
+
+
+@dataclass
+class _Request:
+    kind: str
+    texts: list[str]
+    future: asyncio.Future = field(repr=False)
+
+
+class MicroBatcher:
+    """
+    Combine concurrent embedding calls into batched model runs.
+
+    The first queued request opens a batch; further requests of any kind join
+    it until `max_batch_size` texts are collected or `max_wait_ms` passes.
+    The wait only applies while another batch is running (i.e. with several
+    workers): a free model takes whatever is already queued right away, since
+    requests arriving during a run form the next batch anyway. A lone caller
+    therefore pays no delay.
+    Requests are grouped by kind within the batch. While all `workers` are busy
+    new requests keep queuing, so batches grow with load.
+    """
+
+    def __init__(
+        self,
+        embed_fn: EmbedFunction,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        workers: int = 1,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            embed_fn: Synchronous function embedding a list of texts of one kind
+            max_batch_size: Maximum texts per model run (a larger single request
+                            still runs alone)
+            max_wait_ms: How long the first request of a batch waits for company
+                         while another batch is running
+            workers: Threads running the model; also the number of batches in flight
+
+        """
+        self._embed_fn = embed_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._workers = workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="embedding"
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[_Request] | None = None
+        self._collector: asyncio.Task | None = None
+        self._running = 0
+        self._batches = 0
+        self._texts = 0
+
+    async def embed(self, kind: str, texts: list[str]) -> list[Any]:
+        """
+        Embed `texts` as part of the next batch.
+
+        Args:
+            kind: Which model entry point to use (passed through to `embed_fn`)
+            texts: Texts to embed
+
+        Returns:
+            One vector per text, in order
+
+        """
+        if not texts:
+            return []
+        self._ensure_started()
+        future = self._loop.create_future()
+        self._queue.put_nowait(_Request(kind, texts, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop collecting batches and shut the model threads down."""
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+            self._collector = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, float]:
+        """Batch counters, used by the load benchmark."""
+        return {
+            "batches": self._batches,
+            "texts": self._texts,
+            "mean_batch_size": self._texts / self._batches if self._batches else 0.0,
+        }
+
+    def _ensure_started(self) -> None:
+        """Start the collector on the running loop (again, if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._collector is not None:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._collector = loop.create_task(self._collect())
+
+    async def _collect(self) -> None:
+        """Form batches from the queue and dispatch them to the executor."""
+        slots = asyncio.Semaphore(self._workers)
+        carry: _Request | None = None
+        while True:
+            first = carry or await self._queue.get()
+            carry = None
+            await slots.acquire()
+
+            batch, size = [first], len(first.texts)
+            wait = self._max_wait if self._running else 0.0
+            deadline = time.monotonic() + wait
+            while size < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        request = await asyncio.wait_for(self._queue.get(), remaining)
+                    else:
+                        request = self._queue.get_nowait()
+                except (TimeoutError, asyncio.QueueEmpty):
+                    break
+                if size + len(request.texts) > self._max_batch_size:
+                    carry = request  # opens the next batch
+                    break
+                batch.append(request)
+                size += len(request.texts)
+
+            self._running += 1
+            task = asyncio.create_task(self._run(batch))
+            task.add_done_callback(lambda _: self._release(slots))
+
+    def _release(self, slots: asyncio.Semaphore) -> None:
+        self._running -= 1
+        slots.release()
+
+    async def _run(self, batch: list[_Request]) -> None:
+        """Embed one batch, one model call per kind, and resolve its futures."""
+        by_kind: dict[str, list[_Request]] = {}
+        for request in batch:
+            by_kind.setdefault(request.kind, []).append(request)
+
+        loop = asyncio.get_running_loop()
+        for kind, requests in by_kind.items():
+            texts = [text for request in requests for text in request.texts]
+            try:
+                vectors = await loop.run_in_executor(
+                    self._executor, self._embed_fn, kind, texts
+                )
+            except Exception as e:
+                logger.error(f"Embedding batch of {len(texts)} {kind} texts failed: {e}")
+                for request in requests:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+
+            self._batches += 1
+            self._texts += len(texts)
+            offset = 0
+            for request in requests:
+                end = offset + len(request.texts)
+                if not request.future.done():
+                    request.future.set_result(list(vectors[offset:end]))
+                offset = end
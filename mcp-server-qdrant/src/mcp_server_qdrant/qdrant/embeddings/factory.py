@@ -1,7 +1,10 @@
 import logging
 
 from mcp_server_qdrant.qdrant.config import EmbeddingProviderSettings
-from mcp_server_qdrant.qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.qdrant.embeddings.base import (
+    EmbeddingProvider,
+    SparseEmbeddingProvider,
+)
 from mcp_server_qdrant.qdrant.embeddings.types import EmbeddingProviderType
 
 # Get module-level logger
@@ -21,7 +24,43 @@ def create_embedding_provider(settings: EmbeddingProviderSettings) -> EmbeddingP
     if settings.provider_type == EmbeddingProviderType.FASTEMBED:
         from mcp_server_qdrant.qdrant.embeddings.fastembed import FastEmbedProvider
 
-        return FastEmbedProvider(settings.model_name)
+        return FastEmbedProvider(
+            settings.model_name,
+            batch_max_size=settings.batch_max_size,
+            batch_max_wait_ms=settings.batch_max_wait_ms,
+            executor_workers=settings.executor_workers,
+        )
+
+    logger.error(f"Unsupported embedding provider: {settings.provider_type}")
+    raise ValueError(f"Unsupported embedding provider: {settings.provider_type}")
+
+
+def create_sparse_embedding_provider(
+    settings: EmbeddingProviderSettings,
+) -> SparseEmbeddingProvider | None:
+    """
+    Create the sparse embedding provider used for hybrid search, if configured.
+    :param settings: The settings for the embedding provider.
+    :return: A sparse embedding provider, or None when no sparse model is set.
+    """
+    if not settings.sparse_model_name:
+        return None
+
+    logger.info(
+        f"Creating sparse embedding provider of type {settings.provider_type} with model {settings.sparse_model_name}"
+    )
+
+    if settings.provider_type == EmbeddingProviderType.FASTEMBED:
+        from mcp_server_qdrant.qdrant.embeddings.fastembed import (
+            FastEmbedSparseProvider,
+        )
+
+        return FastEmbedSparseProvider(
+            settings.sparse_model_name,
+            batch_max_size=settings.batch_max_size,
+            batch_max_wait_ms=settings.batch_max_wait_ms,
+            executor_workers=settings.executor_workers,
+        )
 
     logger.error(f"Unsupported embedding provider: {settings.provider_type}")
     raise ValueError(f"Unsupported embedding provider: {settings.provider_type}")
@@ -1,10 +1,18 @@
-import asyncio
 import logging
+from typing import Any
 
-from fastembed import TextEmbedding
-from fastembed.common.model_description import DenseModelDescription
+from fastembed import SparseTextEmbedding, TextEmbedding
+from fastembed.common.model_description import (
+    DenseModelDescription,
+    SparseModelDescription,
+)
+from qdrant_client import models
 
-from mcp_server_qdrant.qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.qdrant.embeddings.base import (
+    EmbeddingProvider,
+    SparseEmbeddingProvider,
+)
+from mcp_server_qdrant.qdrant.embeddings.batching import MicroBatcher
 
 # Get module-level logger
 logger = logging.getLogger(__name__)
@@ -13,34 +21,58 @@ logger = logging.getLogger(__name__)
 class FastEmbedProvider(EmbeddingProvider):
     """
     FastEmbed implementation of the embedding provider.
+
+    Concurrent calls are combined into micro-batches and run on a dedicated
+    thread pool (see `MicroBatcher`).
     :param model_name: The name of the FastEmbed model to use.
+    :param batch_max_size: Maximum texts per model run.
+    :param batch_max_wait_ms: How long a request waits for others to join its batch.
+    :param executor_workers: Threads running the model.
     """
 
-    def __init__(self, model_name: str):
+    def __init__(
+        self,
+        model_name: str,
+        batch_max_size: int = 64,
+        batch_max_wait_ms: float = 5.0,
+        executor_workers: int = 1,
+    ):
         self.model_name = model_name
         logger.info(f"Initializing FastEmbedProvider with model {model_name}")
         self.embedding_model = TextEmbedding(model_name)
+        self._batcher = MicroBatcher(
+            self._embed_sync,
+            max_batch_size=batch_max_size,
+            max_wait_ms=batch_max_wait_ms,
+            workers=executor_workers,
+        )
+
+    def _embed_sync(self, kind: str, texts: list[str]) -> list[Any]:
+        """Run the model on one batch (called on the batcher's threads)."""
+        if kind == "query":
+            return list(self.embedding_model.query_embed(texts))
+        return list(self.embedding_model.passage_embed(texts))
 
     async def embed_documents(self, documents: list[str]) -> list[list[float]]:
         """Embed a list of documents into vectors."""
         logger.debug(f"Embedding {len(documents)} documents")
-        # Run in a thread pool since FastEmbed is synchronous
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None, lambda: list(self.embedding_model.passage_embed(documents))
-        )
+        embeddings = await self._batcher.embed("passage", documents)
         return [embedding.tolist() for embedding in embeddings]
 
     async def embed_query(self, query: str) -> list[float]:
         """Embed a query into a vector."""
         logger.debug(f"Embedding query: {query[:50]}...")
-        # Run in a thread pool since FastEmbed is synchronous
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None, lambda: list(self.embedding_model.query_embed([query]))
-        )
+        embeddings = await self._batcher.embed("query", [query])
         return embeddings[0].tolist()
 
+    async def close(self) -> None:
+        """Stop the micro-batcher and its model threads."""
+        await self._batcher.close()
+
+    def get_model_name(self) -> str:
+        """Return the FastEmbed model name."""
+        return self.model_name
+
     def get_vector_name(self) -> str:
         """
         Return the name of the vector for the Qdrant collection.
@@ -55,3 +87,70 @@ class FastEmbedProvider(EmbeddingProvider):
             self.embedding_model._get_model_description(self.model_name)
         )
         return model_description.dim
+
+
+class FastEmbedSparseProvider(SparseEmbeddingProvider):
+    """
+    FastEmbed implementation of the sparse embedding provider (BM25, SPLADE, ...).
+
+    Runs on its own micro-batcher so sparse and dense models never share a thread.
+    :param model_name: The name of the FastEmbed sparse model to use.
+    :param batch_max_size: Maximum texts per model run.
+    :param batch_max_wait_ms: How long a request waits for others to join its batch.
+    :param executor_workers: Threads running the model.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        batch_max_size: int = 64,
+        batch_max_wait_ms: float = 5.0,
+        executor_workers: int = 1,
+    ):
+        self.model_name = model_name
+        logger.info(f"Initializing FastEmbedSparseProvider with model {model_name}")
+        self.embedding_model = SparseTextEmbedding(model_name)
+        self._batcher = MicroBatcher(
+            self._embed_sync,
+            max_batch_size=batch_max_size,
+            max_wait_ms=batch_max_wait_ms,
+            workers=executor_workers,
+        )
+
+    def _embed_sync(self, kind: str, texts: list[str]) -> list[Any]:
+        """Run the model on one batch (called on the batcher's threads)."""
+        if kind == "query":
+            return list(self.embedding_model.query_embed(texts))
+        return list(self.embedding_model.passage_embed(texts))
+
+    @staticmethod
+    def _to_sparse_vector(embedding: Any) -> models.SparseVector:
+        return models.SparseVector(
+            indices=embedding.indices.tolist(), values=embedding.values.tolist()
+        )
+
+    async def embed_documents(self, documents: list[str]) -> list[models.SparseVector]:
+        """Embed a list of documents into sparse vectors."""
+        embeddings = await self._batcher.embed("passage", documents)
+        return [self._to_sparse_vector(embedding) for embedding in embeddings]
+
+    async def embed_query(self, query: str) -> models.SparseVector:
+        """Embed a query into a sparse vector."""
+        embeddings = await self._batcher.embed("query", [query])
+        return self._to_sparse_vector(embeddings[0])
+
+    async def close(self) -> None:
+        """Stop the micro-batcher and its model threads."""
+        await self._batcher.close()
+
+    def get_vector_name(self) -> str:
+        """Return the sparse vector name, following FastEmbed's naming."""
+        model_name = self.model_name.split("/")[-1].lower()
+        return f"fast-sparse-{model_name}"
+
+    def requires_idf(self) -> bool:
+        """Whether the model emits term counts that need Qdrant's IDF modifier."""
+        model_description: SparseModelDescription = (
+            self.embedding_model._get_model_description(self.model_name)
+        )
+        return bool(model_description.requires_idf)
@@ -0,0 +1,146 @@
+"""
+Bounded LRU cache of query embeddings.
+
+Main responsibility: Return previously computed query vectors keyed by
+(model name, normalized query) so repeated searches skip the embedding model,
+optionally persisting entries to a SQLite file so restarts start warm.
+"""
+
+import logging
+import re
+import sqlite3
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    Canonical form of a query for cache lookups.
+
+    Applies NFKC and collapses whitespace. Case is kept because cased
+    embedding models produce different vectors for different casing.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", query)).strip()
+
+
+class QueryEmbeddingCache:
+    """
+    LRU cache of query vectors with an optional SQLite write-through tier.
+
+    Vectors are stored on disk as float32, which is lossless for FastEmbed
+    output. On startup the most recently written `max_entries` rows are loaded.
+    """
+
+    def __init__(self, max_entries: int = 1024, path: str | Path | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum vectors kept in memory (and on disk)
+            path: SQLite file for persistence; memory only when None
+
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._open(Path(path))
+
+    def get(self, model: str, query: str) -> list[float] | None:
+        """Cached vector for `query` under `model`, or None."""
+        key = (model, normalize_query(query))
+        vector = self._entries.get(key)
+        if vector is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return vector
+
+    def put(self, model: str, query: str, vector: list[float]) -> None:
+        """Store the vector for `query` under `model`."""
+        if self._max_entries <= 0:
+            return
+        key = (model, normalize_query(query))
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        evicted = []
+        while len(self._entries) > self._max_entries:
+            evicted.append(self._entries.popitem(last=False)[0])
+        if self._db is not None:
+            self._persist(key, vector, evicted)
+
+    def stats(self) -> dict[str, float]:
+        """Hit/miss counters for the collection info endpoint."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "persistent": self._db is not None,
+        }
+
+    def close(self) -> None:
+        """Close the SQLite file, if any."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _open(self, path: Path) -> None:
+        """Open (or create) the SQLite tier and load the most recent entries."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                path, isolation_level=None, check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS query_embeddings ("
+                " model TEXT NOT NULL, query TEXT NOT NULL, vector BLOB NOT NULL,"
+                " written_at REAL NOT NULL, PRIMARY KEY (model, query))"
+            )
+            rows = self._db.execute(
+                "SELECT model, query, vector FROM query_embeddings"
+                " ORDER BY written_at DESC LIMIT ?",
+                (self._max_entries,),
+            ).fetchall()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Query embedding cache at {path} unavailable: {e}")
+            self._db = None
+            return
+
+        # Oldest first, so the most recent rows end up most recently used
+        for model, query, blob in reversed(rows):
+            self._entries[(model, query)] = array("f", blob).tolist()
+        logger.info(f"Loaded {len(rows)} cached query embeddings from {path}")
+
+    def _persist(
+        self,
+        key: tuple[str, str],
+        vector: list[float],
+        evicted: list[tuple[str, str]],
+    ) -> None:
+        """Write one entry through to SQLite and drop evicted rows."""
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO query_embeddings VALUES (?, ?, ?, ?)",
+                (*key, array("f", vector).tobytes(), time.time()),
+            )
+            if evicted:
+                self._db.executemany(
+                    "DELETE FROM query_embeddings WHERE model = ? AND query = ?",
+                    evicted,
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist query embedding: {e}")
@@ -0,0 +1,176 @@
+"""
+Typed payload filter DSL for semantic search.
+
+Main responsibility: Describe per-field conditions (equality, ranges, multi-value
+matches, geo areas, emptiness) as validated models and compile them into a single
+Qdrant `Filter`, so filtering happens inside the vector search instead of on
+over-fetched results.
+"""
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from qdrant_client import models
+
+# Plain values keep the original field_path -> value equality semantics
+FilterValue = str | int | bool
+
+_RANGE_OPERATORS = ("gt", "gte", "lt", "lte")
+
+
+class FieldFilter(BaseModel):
+    """
+    Conditions on a single payload field; all given operators must hold.
+
+    Range bounds are either all numbers or all ISO 8601 datetimes.
+    """
+
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+    eq: FilterValue | None = Field(None, description="Field equals this value.")
+    any: list[str] | list[int] | None = Field(
+        None, description="Field matches any of these values."
+    )
+    except_: list[str] | list[int] | None = Field(
+        None,
+        alias="except",
+        description="Field has a value other than these (for arrays: any element).",
+    )
+    text: str | None = Field(
+        None, description="Full-text match (needs a text index on the field)."
+    )
+    gt: float | datetime | None = Field(None, description="Greater than.")
+    gte: float | datetime | None = Field(None, description="Greater than or equal.")
+    lt: float | datetime | None = Field(None, description="Less than.")
+    lte: float | datetime | None = Field(None, description="Less than or equal.")
+    geo_radius: models.GeoRadius | None = Field(
+        None, description="Geo point within `radius` meters of `center` (lon/lat)."
+    )
+    geo_bounding_box: models.GeoBoundingBox | None = Field(
+        None,
+        description="Geo point inside the box spanned by `top_left`/`bottom_right`.",
+    )
+    is_empty: bool | None = Field(
+        None,
+        description="True: field is missing, null or []. False: field has a value.",
+    )
+    is_null: bool | None = Field(
+        None, description="True: field is explicitly null. False: it is not."
+    )
+
+    @model_validator(mode="after")
+    def validate_operators(self) -> "FieldFilter":
+        """Require at least one operator and consistently typed range bounds."""
+        if all(getattr(self, name) is None for name in type(self).model_fields):
+            raise ValueError("A field filter needs at least one operator")
+        bounds = [getattr(self, op) for op in _RANGE_OPERATORS]
+        kinds = {isinstance(bound, datetime) for bound in bounds if bound is not None}
+        if len(kinds) > 1:
+            raise ValueError("Range bounds must be all numbers or all datetimes")
+        return self
+
+    def conditions(
+        self, key: str
+    ) -> tuple[list[models.Condition], list[models.Condition]]:
+        """
+        Compile into Qdrant conditions.
+
+        Args:
+            key: Payload field path the operators apply to
+
+        Returns:
+            (must, must_not) condition lists
+
+        """
+        must: list[models.Condition] = []
+        must_not: list[models.Condition] = []
+
+        if self.eq is not None:
+            must.append(
+                models.FieldCondition(key=key, match=models.MatchValue(value=self.eq))
+            )
+        if self.any is not None:
+            must.append(
+                models.FieldCondition(key=key, match=models.MatchAny(any=self.any))
+            )
+        if self.except_ is not None:
+            must.append(
+                models.FieldCondition(
+                    key=key, match=models.MatchExcept(**{"except": self.except_})
+                )
+            )
+        if self.text is not None:
+            must.append(
+                models.FieldCondition(key=key, match=models.MatchText(text=self.text))
+            )
+
+        bounds = {op: getattr(self, op) for op in _RANGE_OPERATORS}
+        if any(bound is not None for bound in bounds.values()):
+            if any(isinstance(bound, datetime) for bound in bounds.values()):
+                range_ = models.DatetimeRange(**bounds)
+            else:
+                range_ = models.Range(**bounds)
+            must.append(models.FieldCondition(key=key, range=range_))
+
+        if self.geo_radius is not None:
+            must.append(models.FieldCondition(key=key, geo_radius=self.geo_radius))
+        if self.geo_bounding_box is not None:
+            must.append(
+                models.FieldCondition(key=key, geo_bounding_box=self.geo_bounding_box)
+            )
+
+        field = models.PayloadField(key=key)
+        if self.is_empty is not None:
+            target = must if self.is_empty else must_not
+            target.append(models.IsEmptyCondition(is_empty=field))
+        if self.is_null is not None:
+            target = must if self.is_null else must_not
+            target.append(models.IsNullCondition(is_null=field))
+
+        return must, must_not
+
+
+def build_filter(filters: Mapping[str, Any] | None) -> models.Filter | None:
+    """
+    Compile field_path -> condition pairs into a Qdrant filter.
+
+    Args:
+        filters: Plain values match by equality; `FieldFilter` instances (or
+                 dicts of their operators) compile to range, multi-value, geo
+                 and emptiness conditions. None values are ignored.
+
+    Returns:
+        The combined filter, or None when there is nothing to filter on
+
+    Raises:
+        pydantic.ValidationError: If an operator dict is invalid
+
+    """
+    must: list[models.Condition] = []
+    must_not: list[models.Condition] = []
+    for key, value in (filters or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, Mapping):
+            value = FieldFilter.model_validate(value)
+        if isinstance(value, FieldFilter):
+            field_must, field_must_not = value.conditions(key)
+            must.extend(field_must)
+            must_not.extend(field_must_not)
+        else:
+            must.append(
+                models.FieldCondition(key=key, match=models.MatchValue(value=value))
+            )
+
+    if not must and not must_not:
+        return None
+    return models.Filter(must=must or None, must_not=must_not or None)
+
+
+def filter_fields(filters: Mapping[str, Any] | None) -> frozenset[str]:
+    """Payload field paths that `build_filter` would put conditions on."""
+    return frozenset(
+        key for key, value in (filters or {}).items() if value is not None
+    )
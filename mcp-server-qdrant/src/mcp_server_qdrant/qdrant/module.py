@@ -1,25 +1,48 @@
+import asyncio
 import logging
 import uuid
-from collections.abc import Sequence
-from typing import Any
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from typing import Any, Literal
 
 from pydantic import BaseModel
 from qdrant_client import AsyncQdrantClient, models
 from qdrant_client.models import CollectionInfo
 
+from mcp_server_qdrant.qdrant.collection_cache import (
+    CollectionKey,
+    get_collection_cache,
+)
 from mcp_server_qdrant.qdrant.config import (
     PayloadIndexConfig,
     PayloadIndexType,
     QdrantAPIError,
     QdrantConfig,
+    QuantizationType,
+)
+from mcp_server_qdrant.qdrant.embeddings.base import (
+    EmbeddingProvider,
+    SparseEmbeddingProvider,
 )
-from mcp_server_qdrant.qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.qdrant.embeddings.query_cache import QueryEmbeddingCache
+from mcp_server_qdrant.qdrant.filters import build_filter, filter_fields
 
 logger = logging.getLogger(__name__)
 
 # --- Type Definitions --- #
 
 Metadata = dict[str, Any]
+# "auto" fuses dense and sparse results when the collection has sparse vectors
+SearchMode = Literal["auto", "dense", "sparse", "hybrid"]
+
+
+def _is_not_found_error(error: Exception) -> bool:
+    """Whether a Qdrant client error means the collection does not exist."""
+    err_str = str(error).lower()
+    return (
+        "not found" in err_str
+        or "status_code=404" in err_str
+        or "statuscode.not_found" in err_str
+    )
 
 
 class Entry(BaseModel):
@@ -37,6 +60,37 @@ class Entry(BaseModel):
         return f"Entry(content={self.content}, metadata={self.metadata})"
 
 
+class BatchStoreResult(BaseModel):
+    """
+    Outcome of storing one entry of a batch.
+    """
+
+    index: int
+    id: str | None = None
+    stored: bool
+    error: str | None = None
+
+
+class PointRecord(BaseModel):
+    """
+    A point as exported to and imported from NDJSON streams.
+    """
+
+    id: int | str
+    payload: dict[str, Any] | None = None
+    vector: list[float] | dict[str, Any] | None = None
+
+
+class ImportResult(BaseModel):
+    """
+    Summary of a bulk import.
+    """
+
+    imported: int = 0
+    embedded: int = 0
+    batches: int = 0
+
+
 # --- Main Service Class --- #
 
 
@@ -49,6 +103,7 @@ class QdrantConnector:
         self,
         config: QdrantConfig,
         embedding_provider: EmbeddingProvider,
+        sparse_embedding_provider: SparseEmbeddingProvider | None = None,
     ):
         """
         Initialize the Qdrant connector.
@@ -56,12 +111,21 @@ class QdrantConnector:
         Args:
             config: The Qdrant configuration
             embedding_provider: The embedding provider to use
+            sparse_embedding_provider: Optional sparse provider enabling hybrid search
 
         """
         self._config = config
         self._embedding_provider = embedding_provider
+        self._sparse_provider = sparse_embedding_provider
+        # The client rejects a location alongside a path; local mode passes only the path
+        location = None if config.local_path else config.location
         self._client = AsyncQdrantClient(
-            location=config.location, api_key=config.api_key, path=config.local_path
+            location=location, api_key=config.api_key, path=config.local_path
+        )
+        self._collection_cache = get_collection_cache()
+        self._cache_location = config.local_path or config.location
+        self._query_cache = QueryEmbeddingCache(
+            max_entries=config.query_cache_size, path=config.query_cache_path
         )
         logger.info(
             f"Initialized Qdrant connector: location={config.location or 'local'}"
@@ -103,12 +167,8 @@ class QdrantConnector:
                 f"Error retrieving details for collection '{collection_name}': {e}",
                 exc_info=True,
             )
-            err_str = str(e).lower()
-            if (
-                "not found" in err_str
-                or "status_code=404" in err_str
-                or "statuscode.not_found" in err_str
-            ):
+            if _is_not_found_error(e):
+                self.invalidate_collection_cache(collection_name)
                 raise QdrantAPIError(
                     f"Collection '{collection_name}' not found."
                 ) from e
@@ -116,6 +176,24 @@ class QdrantConnector:
                 f"Failed to get details for collection '{collection_name}': {str(e)}"
             ) from e
 
+    def invalidate_collection_cache(self, collection_name: str | None = None) -> int:
+        """
+        Forget cached existence/index state so the next call re-checks Qdrant.
+
+        Use after collections are dropped or re-created outside this server.
+
+        Args:
+            collection_name: The collection to forget, or None for every collection
+                             on this Qdrant location.
+
+        Returns:
+            Number of cached collections removed
+
+        """
+        return self._collection_cache.invalidate(
+            collection_name, location=self._cache_location
+        )
+
     async def store(self, entry: Entry, collection_name: str) -> None:
         """
         Store information in the Qdrant collection with metadata.
@@ -132,30 +210,297 @@ class QdrantConnector:
             # Create the collection if it doesn't exist (with configured settings)
             await self._ensure_collection_exists(collection_name)
 
-            # Embed the document
-            embeddings = await self._embedding_provider.embed_documents([entry.content])
+            # Embed the document (dense, plus sparse for hybrid collections)
+            vectors = await self._embed_documents(collection_name, [entry.content])
 
             # Add to Qdrant
-            vector_name = self._embedding_provider.get_vector_name()
             payload = {"document": entry.content, "metadata": entry.metadata}
+            points = [
+                models.PointStruct(
+                    id=uuid.uuid4().hex,
+                    vector={name: vector[0] for name, vector in vectors.items()},
+                    payload=payload,
+                )
+            ]
 
-            await self._client.upsert(
-                collection_name=collection_name,
-                points=[
-                    models.PointStruct(
-                        id=uuid.uuid4().hex,
-                        vector={vector_name: embeddings[0]},
-                        payload=payload,
+            await self._upsert_points(collection_name, points)
+            logger.debug(f"Stored {entry} in collection '{collection_name}'")
+
+        except Exception as e:
+            error_msg = f"Failed to store entry in Qdrant: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            raise QdrantAPIError(error_msg) from e
+
+    async def store_batch(
+        self, entries: Sequence[Entry], collection_name: str
+    ) -> list[BatchStoreResult]:
+        """
+        Store many entries with a single embedding call and chunked, parallel upserts.
+
+        Points are upserted in chunks of `upsert_batch_size`, with up to
+        `upsert_parallelism` chunks in flight. A failed chunk marks only its own
+        entries as failed.
+
+        Args:
+            entries: The entries to store
+            collection_name: The collection name
+
+        Returns:
+            One result per entry, in input order
+
+        Raises:
+            QdrantAPIError: If the collection cannot be prepared or embedding fails
+
+        """
+        if not entries:
+            return []
+
+        try:
+            await self._ensure_collection_exists(collection_name)
+            vectors = await self._embed_documents(
+                collection_name, [entry.content for entry in entries]
+            )
+        except Exception as e:
+            error_msg = f"Failed to store batch in Qdrant: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            raise QdrantAPIError(error_msg) from e
+
+        ids = [uuid.uuid4().hex for _ in entries]
+        payloads = [
+            {"document": entry.content, "metadata": entry.metadata}
+            for entry in entries
+        ]
+        results = [
+            BatchStoreResult(index=i, id=point_id, stored=True)
+            for i, point_id in enumerate(ids)
+        ]
+
+        chunk_size = self._config.upsert_batch_size
+        semaphore = asyncio.Semaphore(self._config.upsert_parallelism)
+
+        async def upsert_chunk(start: int) -> None:
+            end = start + chunk_size
+            # Column-oriented batches skip per-point model validation and are
+            # smaller on the wire than a list of PointStruct
+            batch = models.Batch(
+                ids=ids[start:end],
+                vectors={
+                    name: embeddings[start:end] for name, embeddings in vectors.items()
+                },
+                payloads=payloads[start:end],
+            )
+            async with semaphore:
+                try:
+                    await self._upsert_points(collection_name, batch)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to upsert points {start}-{end - 1} "
+                        f"into '{collection_name}': {e}"
                     )
+                    for result in results[start:end]:
+                        result.stored = False
+                        result.id = None
+                        result.error = str(e)
+
+        await asyncio.gather(
+            *(upsert_chunk(start) for start in range(0, len(entries), chunk_size))
+        )
+
+        stored = sum(result.stored for result in results)
+        logger.debug(
+            f"Stored {stored}/{len(results)} entries in collection '{collection_name}'"
+        )
+        return results
+
+    async def scroll_pages(
+        self,
+        collection_name: str,
+        page_size: int = 256,
+        offset: models.ExtendedPointId | None = None,
+        with_vectors: bool = False,
+        filters: dict[str, Any] | None = None,
+    ) -> AsyncIterator[tuple[list[PointRecord], models.ExtendedPointId | None]]:
+        """
+        Page through every point of a collection in id order.
+
+        Only one page is held at a time, so memory stays bounded whatever the
+        collection size.
+
+        Args:
+            collection_name: The collection name
+            page_size: Points per scroll request
+            offset: Point id to resume from (a previous page's next offset)
+            with_vectors: Whether to include vectors
+            filters: Optional filters, as accepted by `search`
+
+        Yields:
+            (points, next_offset) per page; next_offset is None on the last page
+
+        Raises:
+            QdrantAPIError: If the collection does not exist or a scroll fails
+
+        """
+        query_filter = build_filter(filters)
+        while True:
+            try:
+                records, next_offset = await self._client.scroll(
+                    collection_name=collection_name,
+                    scroll_filter=query_filter,
+                    limit=page_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=with_vectors,
+                )
+            except Exception as e:
+                if _is_not_found_error(e):
+                    self.invalidate_collection_cache(collection_name)
+                    raise await self._missing_collection_error(collection_name) from e
+                error_msg = f"Failed to scroll collection '{collection_name}': {e}"
+                logger.error(error_msg, exc_info=True)
+                raise QdrantAPIError(error_msg) from e
+
+            yield (
+                [
+                    PointRecord(id=r.id, payload=r.payload, vector=r.vector)
+                    for r in records
                 ],
+                next_offset,
             )
-            logger.debug(f"Stored {entry} in collection '{collection_name}'")
+            if next_offset is None:
+                return
+            offset = next_offset
 
+    async def import_points(
+        self,
+        collection_name: str,
+        points: AsyncIterable[PointRecord],
+        batch_size: int | None = None,
+    ) -> ImportResult:
+        """
+        Upsert a stream of points, e.g. one produced by `scroll_pages`.
+
+        Points keep their ids, so re-running an interrupted import is safe.
+        Points without a vector for the current embedding model are re-embedded
+        from `payload["document"]`, which also allows re-indexing an export
+        taken without vectors. At most `upsert_parallelism` batches are held
+        in memory at once.
+
+        Args:
+            collection_name: The collection name (created if missing)
+            points: The points to import
+            batch_size: Points per upsert (defaults to `upsert_batch_size`)
+
+        Returns:
+            Counts of imported and re-embedded points and upsert batches
+
+        Raises:
+            QdrantAPIError: If a point cannot be embedded or an upsert fails;
+                            the message says how many points were imported
+
+        """
+        batch_size = batch_size or self._config.upsert_batch_size
+        result = ImportResult()
+        pending: set[asyncio.Task] = set()
+
+        async def upsert(batch: list[PointRecord]) -> None:
+            structs, embedded = await self._import_batch(collection_name, batch)
+            await self._upsert_points(collection_name, structs)
+            result.imported += len(structs)
+            result.embedded += embedded
+            result.batches += 1
+
+        async def wait(return_when: str) -> None:
+            done, _ = await asyncio.wait(pending, return_when=return_when)
+            pending.difference_update(done)
+            for task in done:
+                task.result()  # re-raise the first failure
+
+        try:
+            await self._ensure_collection_exists(collection_name)
+            batch: list[PointRecord] = []
+            async for point in points:
+                batch.append(point)
+                if len(batch) < batch_size:
+                    continue
+                pending.add(asyncio.create_task(upsert(batch)))
+                batch = []
+                if len(pending) >= self._config.upsert_parallelism:
+                    await wait(asyncio.FIRST_COMPLETED)
+            if batch:
+                pending.add(asyncio.create_task(upsert(batch)))
+            if pending:
+                await wait(asyncio.ALL_COMPLETED)
         except Exception as e:
-            error_msg = f"Failed to store entry in Qdrant: {str(e)}"
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            error_msg = (
+                f"Import into '{collection_name}' failed after "
+                f"{result.imported} points: {e}"
+            )
             logger.error(error_msg, exc_info=True)
             raise QdrantAPIError(error_msg) from e
 
+        logger.debug(
+            f"Imported {result.imported} points into '{collection_name}' "
+            f"({result.embedded} re-embedded, {result.batches} batches)"
+        )
+        return result
+
+    async def _import_batch(
+        self, collection_name: str, batch: list[PointRecord]
+    ) -> tuple[list[models.PointStruct], int]:
+        """
+        Build upsertable points, embedding any vectors the collection needs.
+
+        Args:
+            collection_name: The collection the points are imported into
+            batch: The imported points
+
+        Returns:
+            (points, number of points that were embedded)
+
+        """
+        vector_name = self._embedding_provider.get_vector_name()
+        required = [vector_name]
+        if await self._uses_sparse(collection_name):
+            required.append(self._sparse_provider.get_vector_name())
+
+        vectors: list[dict[str, Any]] = []
+        to_embed: list[int] = []
+        for i, point in enumerate(batch):
+            if isinstance(point.vector, dict):
+                vector = {k: v for k, v in point.vector.items() if k in required}
+            elif isinstance(point.vector, list):
+                vector = {vector_name: point.vector}
+            else:
+                vector = {}
+            vectors.append(vector)
+            if len(vector) == len(required):
+                continue
+            document = (point.payload or {}).get("document")
+            if not isinstance(document, str):
+                missing = ", ".join(f"'{n}'" for n in required if n not in vector)
+                raise ValueError(
+                    f"Point {point.id} has no {missing} vector "
+                    "and no payload document to embed"
+                )
+            to_embed.append(i)
+
+        if to_embed:
+            embedded = await self._embed_documents(
+                collection_name, [batch[i].payload["document"] for i in to_embed]
+            )
+            for j, i in enumerate(to_embed):
+                for name, embeddings in embedded.items():
+                    vectors[i].setdefault(name, embeddings[j])
+
+        points = [
+            models.PointStruct(id=point.id, vector=vector, payload=point.payload)
+            for point, vector in zip(batch, vectors)
+        ]
+        return points, len(to_embed)
+
     async def search(
         self,
         query: str,
@@ -164,21 +509,32 @@ class QdrantConnector:
         filters: dict[str, Any] | None = None,
         with_payload: bool | list[str] | models.PayloadSelector | None = True,
         with_vectors: bool | Sequence[str] | None = False,
+        mode: SearchMode = "auto",
     ) -> models.QueryResponse:
         """
         Find entries in the Qdrant collection by semantic similarity.
 
+        With a sparse embedding provider, collections also store sparse
+        (keyword) vectors. Hybrid search prefetches candidates from both and
+        merges them with reciprocal-rank fusion, which ranks exact terms such as
+        tickers or addresses well without giving up semantic matches.
+
         Args:
             query: The search query
             collection_name: The name of the collection.
             limit: Max number of results.
             filters: Optional dictionary of field_path -> value for filtering.
                     Can include tenant fields, indexed fields, or any other payload fields.
-                    Example: {"metadata.user_id": "alice", "metadata.category": "work"}
+                    Plain values match by equality; `FieldFilter` values (or dicts
+                    of their operators) add ranges, any/except, geo and emptiness.
+                    Example: {"metadata.user_id": "alice",
+                              "metadata.year": {"gte": 2020, "lt": 2024}}
             with_payload: Whether to include payload in results.
                           Can be bool, list of keys, or a PayloadSelector. Defaults to True.
             with_vectors: Whether to include vectors in results.
                           Can be bool or list of vector names. Defaults to False.
+            mode: "dense", "sparse", "hybrid", or "auto" (hybrid when the
+                  collection has sparse vectors, dense otherwise).
 
         Returns:
             List of ScoredPoint objects found. Empty list if none or collection doesn't exist.
@@ -188,52 +544,42 @@ class QdrantConnector:
 
         """
         try:
-            collection_exists = await self._client.collection_exists(collection_name)
-            if not collection_exists:
-                # Get available collections to include in error message
-                available_collections = await self.get_collection_names()
-                collections_list = (
-                    ", ".join(f"'{name}'" for name in available_collections)
-                    if available_collections
-                    else "none"
-                )
+            cache_key = self._cache_key(collection_name)
+            if not self._collection_cache.exists(cache_key):
+                if not await self._client.collection_exists(collection_name):
+                    raise await self._missing_collection_error(collection_name)
+                self._collection_cache.mark_exists(cache_key)
+
+            if mode != "dense":
+                sparse = await self._uses_sparse(collection_name)
+                if mode == "auto":
+                    mode = "hybrid" if sparse else "dense"
+                elif not sparse:
+                    raise ValueError(
+                        f"{mode.capitalize()} search needs sparse vectors, but "
+                        f"'{collection_name}' has none or no sparse model is set"
+                    )
 
-                error_msg = (
-                    f"Collection '{collection_name}' does not exist. "
-                    f"Available collections: {collections_list}"
+            query_filter = build_filter(filters)
+            if query_filter is not None:
+                await self._warn_unindexed_filter_fields(
+                    collection_name, filter_fields(filters)
                 )
-                logger.warning(error_msg)
-                raise QdrantAPIError(error_msg)
 
-            # Embed the query
-            query_vector = await self._embedding_provider.embed_query(query)
-            vector_name = self._embedding_provider.get_vector_name()
-
-            query_filter: models.Filter | None = None
-            if filters:
-                # Build filter conditions from the filters dict
-                filter_conditions: list[models.Condition] = []
-                for field_path, value in filters.items():
-                    if value is not None:
-                        filter_conditions.append(
-                            models.FieldCondition(
-                                key=field_path,
-                                match=models.MatchValue(value=value),
-                            )
-                        )
-
-                if filter_conditions:
-                    query_filter = models.Filter(must=filter_conditions)
-
-            search_results = await self._client.query_points(
-                collection_name=collection_name,
-                query=query_vector,
-                query_filter=query_filter,
-                limit=limit,
-                using=vector_name,
-                with_payload=with_payload,
-                with_vectors=with_vectors,
-            )
+            query_args = await self._query_args(query, mode, limit, query_filter)
+            try:
+                search_results = await self._client.query_points(
+                    collection_name=collection_name,
+                    limit=limit,
+                    with_payload=with_payload,
+                    with_vectors=with_vectors,
+                    **query_args,
+                )
+            except Exception as e:
+                if not _is_not_found_error(e):
+                    raise
+                self.invalidate_collection_cache(collection_name)
+                raise await self._missing_collection_error(collection_name) from e
 
             logger.debug(
                 f"Found {search_results} results for query in '{collection_name}'"
@@ -246,19 +592,313 @@ class QdrantConnector:
             logger.error(error_msg, exc_info=True)
             raise QdrantAPIError(error_msg) from e
 
+    async def _query_args(
+        self,
+        query: str,
+        mode: SearchMode,
+        limit: int,
+        query_filter: models.Filter | None,
+    ) -> dict[str, Any]:
+        """
+        Build the `query_points` arguments for a resolved search mode.
+
+        Args:
+            query: The search query
+            mode: "dense", "sparse" or "hybrid"
+            limit: Max number of results
+            query_filter: The filter applied to every candidate
+
+        """
+        vector_name = self._embedding_provider.get_vector_name()
+        if mode == "dense":
+            return {
+                "query": await self._embed_query(query),
+                "query_filter": query_filter,
+                "using": vector_name,
+                "search_params": self._search_params(),
+            }
+
+        sparse_name = self._sparse_provider.get_vector_name()
+        if mode == "sparse":
+            return {
+                "query": await self._sparse_provider.embed_query(query),
+                "query_filter": query_filter,
+                "using": sparse_name,
+            }
+
+        dense_vector, sparse_vector = await asyncio.gather(
+            self._embed_query(query), self._sparse_provider.embed_query(query)
+        )
+        # Fusion only reorders prefetched candidates, so each side fetches extra
+        # and the filter must be applied inside the prefetches
+        candidates = limit * self._config.hybrid_prefetch_factor
+        return {
+            "prefetch": [
+                models.Prefetch(
+                    query=dense_vector,
+                    using=vector_name,
+                    filter=query_filter,
+                    params=self._search_params(),
+                    limit=candidates,
+                ),
+                models.Prefetch(
+                    query=sparse_vector,
+                    using=sparse_name,
+                    filter=query_filter,
+                    limit=candidates,
+                ),
+            ],
+            "query": models.FusionQuery(fusion=models.Fusion.RRF),
+        }
+
+    def get_query_cache_stats(self) -> dict[str, Any]:
+        """
+        Hit/miss metrics of the query embedding cache.
+
+        Returns:
+            Cache size, hits, misses and hit rate
+
+        """
+        return self._query_cache.stats()
+
+    async def _embed_query(self, query: str) -> list[float]:
+        """
+        Embed a search query, reusing cached vectors for repeated queries.
+
+        Args:
+            query: The search query
+
+        """
+        model_name = self._embedding_provider.get_model_name()
+        vector = self._query_cache.get(model_name, query)
+        if vector is None:
+            vector = await self._embedding_provider.embed_query(query)
+            self._query_cache.put(model_name, query, vector)
+        return vector
+
+    async def _embed_documents(
+        self, collection_name: str, documents: list[str]
+    ) -> dict[str, list[Any]]:
+        """
+        Embed documents for every vector the collection stores.
+
+        Dense and sparse models run concurrently.
+
+        Args:
+            collection_name: The collection the documents go into
+            documents: The texts to embed
+
+        Returns:
+            Vector name -> one embedding per document
+
+        """
+        names = [self._embedding_provider.get_vector_name()]
+        tasks = [self._embedding_provider.embed_documents(documents)]
+        if await self._uses_sparse(collection_name):
+            names.append(self._sparse_provider.get_vector_name())
+            tasks.append(self._sparse_provider.embed_documents(documents))
+        return dict(zip(names, await asyncio.gather(*tasks)))
+
+    async def _uses_sparse(self, collection_name: str) -> bool:
+        """
+        Whether the collection stores the configured sparse vector.
+
+        Collections created before a sparse model was configured have dense
+        vectors only; they keep working dense-only and are checked once.
+
+        Args:
+            collection_name: The collection name
+
+        """
+        if self._sparse_provider is None:
+            return False
+        cache_key = self._cache_key(collection_name)
+        sparse = self._collection_cache.has_sparse(cache_key)
+        if sparse is None:
+            info = await self._client.get_collection(collection_name)
+            sparse_name = self._sparse_provider.get_vector_name()
+            sparse = sparse_name in (info.config.params.sparse_vectors or {})
+            if not sparse:
+                logger.warning(
+                    f"Collection '{collection_name}' has no '{sparse_name}' sparse "
+                    "vector; storing and searching it dense-only"
+                )
+            self._collection_cache.mark_sparse(cache_key, sparse)
+        return sparse
+
+    async def _upsert_points(
+        self, collection_name: str, points: list[models.PointStruct] | models.Batch
+    ) -> None:
+        """
+        Upsert points, re-creating the collection once if it was dropped.
+
+        Args:
+            collection_name: The collection name
+            points: The points to upsert
+
+        """
+        try:
+            await self._client.upsert(collection_name=collection_name, points=points)
+        except Exception as e:
+            if not _is_not_found_error(e):
+                raise
+            # The collection was dropped behind our back: re-create and retry once
+            self.invalidate_collection_cache(collection_name)
+            await self._ensure_collection_exists(collection_name)
+            await self._client.upsert(collection_name=collection_name, points=points)
+
+    async def _warn_unindexed_filter_fields(
+        self, collection_name: str, fields: frozenset[str]
+    ) -> None:
+        """
+        Log a warning for filter fields without a payload index.
+
+        Unindexed fields still filter correctly but force Qdrant to check the
+        payload of every candidate. The collection's payload schema is fetched
+        once and cached; each field is warned about once per collection.
+
+        Args:
+            collection_name: The collection being searched
+            fields: Payload field paths used by the filter
+
+        """
+        cache_key = self._cache_key(collection_name)
+        indexed = self._collection_cache.known_indexed_fields(cache_key)
+        if indexed is None:
+            try:
+                info = await self._client.get_collection(collection_name)
+                schema_fields = frozenset((info.payload_schema or {}).keys())
+            except Exception as e:
+                # Only a diagnostic: never fail the search over it
+                logger.debug(
+                    f"Could not read payload schema of '{collection_name}': {e}"
+                )
+                return
+            self._collection_cache.mark_schema(cache_key, schema_fields)
+            indexed = self._collection_cache.known_indexed_fields(cache_key)
+
+        unindexed = self._collection_cache.first_warnings(cache_key, fields - indexed)
+        for field_name in sorted(unindexed):
+            logger.warning(
+                f"Filter field '{field_name}' has no payload index in collection "
+                f"'{collection_name}'; add it to the configured payload indexes "
+                "to avoid scanning payloads"
+            )
+
+    def _quantization_config(self) -> models.QuantizationConfig | None:
+        """Quantization for new collections, from the configured profile/settings."""
+        quantization = self._config.collection_config.quantization
+        if quantization.type == QuantizationType.SCALAR:
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=quantization.quantile,
+                    always_ram=quantization.always_ram,
+                )
+            )
+        if quantization.type == QuantizationType.PRODUCT:
+            return models.ProductQuantization(
+                product=models.ProductQuantizationConfig(
+                    compression=models.CompressionRatio(quantization.compression),
+                    always_ram=quantization.always_ram,
+                )
+            )
+        if quantization.type == QuantizationType.BINARY:
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(
+                    always_ram=quantization.always_ram
+                )
+            )
+        return None
+
+    def _search_params(self) -> models.SearchParams | None:
+        """Search-time parameters, or None to use the server defaults."""
+        collection_config = self._config.collection_config
+        search = collection_config.search
+        quantization = None
+        if collection_config.quantization.type != QuantizationType.NONE and (
+            search.rescore is not None or search.oversampling is not None
+        ):
+            quantization = models.QuantizationSearchParams(
+                rescore=search.rescore, oversampling=search.oversampling
+            )
+        if search.hnsw_ef is None and not search.exact and quantization is None:
+            return None
+        return models.SearchParams(
+            hnsw_ef=search.hnsw_ef, exact=search.exact, quantization=quantization
+        )
+
+    def _sparse_vectors_config(self) -> dict[str, models.SparseVectorParams] | None:
+        """Sparse vector settings for new collections, if a sparse model is set."""
+        if self._sparse_provider is None:
+            return None
+        modifier = models.Modifier.IDF if self._sparse_provider.requires_idf() else None
+        return {
+            self._sparse_provider.get_vector_name(): models.SparseVectorParams(
+                modifier=modifier
+            )
+        }
+
+    def _cache_key(self, collection_name: str) -> CollectionKey:
+        """Key of a collection in the process-wide collection state cache."""
+        return (self._cache_location, collection_name)
+
+    def _indexed_fields(self) -> frozenset[str]:
+        """Field names of the configured payload indexes."""
+        return frozenset(
+            index.field_name
+            for index in self._config.collection_config.payload_indexes
+        )
+
+    async def _missing_collection_error(self, collection_name: str) -> QdrantAPIError:
+        """
+        Build the error for a missing collection, listing the available ones.
+
+        Args:
+            collection_name: The collection that does not exist
+
+        """
+        available_collections = await self.get_collection_names()
+        collections_list = (
+            ", ".join(f"'{name}'" for name in available_collections)
+            if available_collections
+            else "none"
+        )
+
+        error_msg = (
+            f"Collection '{collection_name}' does not exist. "
+            f"Available collections: {collections_list}"
+        )
+        logger.warning(error_msg)
+        return QdrantAPIError(error_msg)
+
     async def _ensure_collection_exists(self, collection_name: str) -> None:
         """
         Ensure that the collection exists, creating it with configured settings if necessary.
 
+        Collections already verified (and indexed) by this process are skipped
+        without contacting Qdrant.
+
         Args:
             collection_name: The collection name to check/create
 
         """
-        collection_exists = await self._client.collection_exists(collection_name)
-        if not collection_exists:
-            await self._create_configured_collection(collection_name)
-        else:
-            await self._ensure_payload_indexes(collection_name)
+        cache_key = self._cache_key(collection_name)
+        fields = self._indexed_fields()
+        if self._collection_cache.is_indexed(cache_key, fields):
+            return
+
+        async with self._collection_cache.lock(cache_key):
+            # Another request may have finished the work while we waited
+            if self._collection_cache.is_indexed(cache_key, fields):
+                return
+
+            collection_exists = await self._client.collection_exists(collection_name)
+            if not collection_exists:
+                await self._create_configured_collection(collection_name)
+            else:
+                await self._ensure_payload_indexes(collection_name)
+            self._collection_cache.mark_indexed(cache_key, fields)
 
     async def _create_configured_collection(self, collection_name: str) -> None:
         """
@@ -293,13 +933,21 @@ class QdrantConnector:
                     vector_name: models.VectorParams(
                         size=vector_size,
                         distance=models.Distance.COSINE,
+                        on_disk=self._config.collection_config.on_disk_vectors or None,
                     )
                 },
+                sparse_vectors_config=self._sparse_vectors_config(),
                 hnsw_config=hnsw_config,
+                quantization_config=self._quantization_config(),
             )
+            if self._sparse_provider is not None:
+                self._collection_cache.mark_sparse(
+                    self._cache_key(collection_name), True
+                )
 
             logger.info(
                 f"Created new collection '{collection_name}' with HNSW config: {hnsw_config_dict or 'default'}"
+                f" (profile {self._config.collection_config.profile.value})"
             )
 
             # Create payload indexes as configured
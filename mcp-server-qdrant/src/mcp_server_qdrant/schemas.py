@@ -2,6 +2,12 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from mcp_server_qdrant.qdrant.filters import FieldFilter, FilterValue
+from mcp_server_qdrant.qdrant.module import SearchMode
+
+MAX_BATCH_ENTRIES = 1000
+MAX_EXPORT_PAGE_SIZE = 1000
+
 
 class Base(BaseModel):
     """Base model for all schemas."""
@@ -28,6 +34,26 @@ class QdrantStoreRequest(QdrantGetCollectionInfoRequest):
     )
 
 
+class QdrantBatchEntry(Base):
+    """A single entry of a qdrant-store-batch request."""
+
+    information: str = Field(..., description="The information to store.")
+    metadata: dict[str, Any] | None = Field(
+        None, description="JSON metadata to store with the information, optional."
+    )
+
+
+class QdrantStoreBatchRequest(QdrantGetCollectionInfoRequest):
+    """Input schema for the qdrant-store-batch tool."""
+
+    entries: list[QdrantBatchEntry] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_ENTRIES,
+        description=f"The entries to store (at most {MAX_BATCH_ENTRIES}).",
+    )
+
+
 class QdrantFindRequest(QdrantGetCollectionInfoRequest):
     """Input schema for the qdrant-find tool."""
 
@@ -35,8 +61,50 @@ class QdrantFindRequest(QdrantGetCollectionInfoRequest):
     search_limit: int = Field(
         10, description="The maximum number of results to return."
     )
-    filters: dict[str, Any] | None = Field(
+    filters: dict[str, FieldFilter | FilterValue | None] | None = Field(
         None,
-        description="Optional filters as field_path -> value pairs. "
+        description="Optional filters as field_path -> condition pairs, all of which must hold. "
+        "A plain value matches by equality; an object combines operators: "
+        "eq, any, except, text, gt/gte/lt/lte (numbers or ISO datetimes), "
+        "geo_radius, geo_bounding_box, is_empty, is_null. "
+        'Example: {"metadata.category": "work", "metadata.year": {"gte": 2020}}. '
         "Filtering by tenant fields (if configured) will be much faster than filtering by other fields.",
     )
+    mode: SearchMode = Field(
+        "auto",
+        description="Retrieval mode: 'dense' (semantic), 'sparse' (keyword), "
+        "'hybrid' (both, fused by rank) or 'auto' (hybrid when the collection "
+        "has sparse vectors). Keyword-heavy queries such as tickers, contract "
+        "addresses or names work best with hybrid.",
+    )
+
+
+class QdrantExportRequest(QdrantGetCollectionInfoRequest):
+    """Input schema for the collection export endpoint."""
+
+    page_size: int = Field(
+        256,
+        ge=1,
+        le=MAX_EXPORT_PAGE_SIZE,
+        description="Points per scroll page; a cursor line follows every page.",
+    )
+    offset: int | str | None = Field(
+        None,
+        description="Resume from this point id (the `next_offset` of a cursor line).",
+    )
+    with_vectors: bool = Field(
+        False,
+        description="Include vectors. Without them an import re-embeds the documents.",
+    )
+    filters: dict[str, FieldFilter | FilterValue | None] | None = Field(
+        None, description="Only export matching points (same syntax as qdrant-find)."
+    )
+
+
+class InvalidateCollectionCacheRequest(Base):
+    """Input schema for the collection cache invalidation admin endpoint."""
+
+    collection_name: str | None = Field(
+        None,
+        description="Collection to forget. Omit to invalidate every cached collection.",
+    )
@@ -64,6 +64,7 @@ async def qdrant_find_logic(
             collection_name=validated_request.collection_name,
             limit=validated_request.search_limit,
             filters=validated_request.filters,
+            mode=validated_request.mode,
         )
 
         # Format response
@@ -49,6 +49,16 @@ def clear_dependency_container():
     DependencyContainer._qdrant_connector = None
 
 
+@pytest.fixture(autouse=True)
+def clear_collection_cache():
+    """Reset the process-wide collection state cache between tests."""
+    from mcp_server_qdrant.qdrant.collection_cache import get_collection_cache
+
+    get_collection_cache().clear()
+    yield
+    get_collection_cache().clear()
+
+
 @pytest.fixture
 def mock_logger():
     with patch("mcp_server_qdrant.qdrant.module.logger") as mock_log:
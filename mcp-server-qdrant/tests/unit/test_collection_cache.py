@@ -0,0 +1,206 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from mcp_server_qdrant.qdrant.collection_cache import (
+    CollectionStateCache,
+    get_collection_cache,
+)
+from mcp_server_qdrant.qdrant.config import (
+    CollectionConfig,
+    PayloadIndexConfig,
+    QdrantAPIError,
+    QdrantConfig,
+)
+from mcp_server_qdrant.qdrant.module import Entry, QdrantConnector
+
+
+class CountingClient:
+    """Proxy around a Qdrant client recording every awaited method call."""
+
+    def __init__(self, client):
+        self._client = client
+        self.calls: list[str] = []
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        async def wrapper(*args, **kwargs):
+            self.calls.append(name)
+            return await attr(*args, **kwargs)
+
+        return wrapper
+
+
+class TestCollectionStateCache:
+    def test_indexed_requires_all_fields(self):
+        cache = CollectionStateCache()
+        key = ("localhost:6333", "notes")
+        cache.mark_indexed(key, frozenset({"metadata.user_id"}))
+
+        assert cache.exists(key)
+        assert cache.is_indexed(key, frozenset({"metadata.user_id"}))
+        assert not cache.is_indexed(key, frozenset({"metadata.user_id", "x"}))
+
+    def test_exists_does_not_imply_indexed(self):
+        cache = CollectionStateCache()
+        key = ("localhost:6333", "notes")
+        cache.mark_exists(key)
+
+        assert cache.exists(key)
+        assert not cache.is_indexed(key, frozenset({"metadata.user_id"}))
+        # Without configured indexes an existing collection needs nothing more
+        assert cache.is_indexed(key, frozenset())
+
+    def test_invalidate_scoped_by_name_and_location(self):
+        cache = CollectionStateCache()
+        cache.mark_exists(("a", "notes"))
+        cache.mark_exists(("b", "notes"))
+        cache.mark_exists(("a", "other"))
+
+        assert cache.invalidate("notes", location="a") == 1
+        assert cache.exists(("b", "notes"))
+        assert cache.invalidate() == 2
+        assert cache.stats() == {"collections": 0, "invalidations": 3}
+
+
+class TestConnectorCaching:
+    @pytest.mark.asyncio
+    async def test_steady_state_store_is_one_call(self, qdrant_connector):
+        client = qdrant_connector._client
+        client.collection_exists = AsyncMock(return_value=True)
+
+        await qdrant_connector.store(Entry(content="first"), "notes")
+        client.reset_mock()
+        await qdrant_connector.store(Entry(content="second"), "notes")
+
+        assert [c[0] for c in client.method_calls] == ["upsert"]
+
+    @pytest.mark.asyncio
+    async def test_steady_state_search_is_one_call(self, qdrant_connector):
+        client = qdrant_connector._client
+        client.collection_exists = AsyncMock(return_value=True)
+        client.query_points = AsyncMock(return_value=MagicMock(points=[]))
+
+        await qdrant_connector.search("q", "notes")
+        client.reset_mock()
+        await qdrant_connector.search("q", "notes")
+
+        assert [c[0] for c in client.method_calls] == ["query_points"]
+
+    @pytest.mark.asyncio
+    async def test_store_warms_search(self, qdrant_connector):
+        client = qdrant_connector._client
+        client.collection_exists = AsyncMock(return_value=False)
+        client.query_points = AsyncMock(return_value=MagicMock(points=[]))
+
+        await qdrant_connector.store(Entry(content="doc"), "notes")
+        await qdrant_connector.search("q", "notes")
+
+        client.collection_exists.assert_called_once_with("notes")
+
+    @pytest.mark.asyncio
+    async def test_search_not_found_invalidates(self, qdrant_connector):
+        client = qdrant_connector._client
+        client.collection_exists = AsyncMock(return_value=True)
+        client.query_points = AsyncMock(return_value=MagicMock(points=[]))
+        await qdrant_connector.search("q", "notes")
+
+        client.query_points.side_effect = ValueError("Collection notes not found")
+        client.get_collections.return_value = MagicMock(collections=[])
+        with pytest.raises(QdrantAPIError, match="does not exist"):
+            await qdrant_connector.search("q", "notes")
+
+        client.collection_exists.return_value = False
+        with pytest.raises(QdrantAPIError, match="does not exist"):
+            await qdrant_connector.search("q", "notes")
+        assert client.collection_exists.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_store_recreates_dropped_collection(self, qdrant_connector):
+        client = qdrant_connector._client
+        client.collection_exists = AsyncMock(return_value=True)
+        await qdrant_connector.store(Entry(content="first"), "notes")
+
+        client.collection_exists.return_value = False
+        client.upsert = AsyncMock(
+            side_effect=[Exception("Collection `notes` not found"), None]
+        )
+        await qdrant_connector.store(Entry(content="second"), "notes")
+
+        client.create_collection.assert_called_once()
+        assert client.upsert.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_explicit_invalidation(self, qdrant_connector):
+        client = qdrant_connector._client
+        client.collection_exists = AsyncMock(return_value=True)
+        await qdrant_connector.store(Entry(content="first"), "notes")
+
+        assert qdrant_connector.invalidate_collection_cache("notes") == 1
+        await qdrant_connector.store(Entry(content="second"), "notes")
+
+        assert client.collection_exists.call_count == 2
+
+
+class TestLocalModeRoundTrips:
+    @pytest.mark.asyncio
+    async def test_round_trips_per_operation(self, tmp_path, mock_embedding_provider):
+        config = QdrantConfig(
+            local_path=str(tmp_path),
+            collection_config=CollectionConfig(
+                payload_indexes=[PayloadIndexConfig(field_name="metadata.category")]
+            ),
+        )
+        connector = QdrantConnector(config, mock_embedding_provider)
+        client = CountingClient(connector._client)
+        connector._client = client
+        try:
+            with pytest.warns(UserWarning, match="Payload indexes"):
+                await connector.store(Entry(content="first"), "notes")
+            assert client.calls == [
+                "collection_exists",
+                "create_collection",
+                "create_payload_index",
+                "upsert",
+            ]
+
+            client.calls.clear()
+            await connector.store(Entry(content="second"), "notes")
+            assert client.calls == ["upsert"]
+
+            client.calls.clear()
+            result = await connector.search("query", "notes")
+            assert client.calls == ["query_points"]
+            assert len(result.points) == 2
+        finally:
+            await client.close()
+
+
+class TestAdminEndpoint:
+    def test_invalidate_endpoint(self):
+        from mcp_server_qdrant.api_routers.admin import router
+        from mcp_server_qdrant.dependencies import get_qdrant_connector
+
+        connector = MagicMock()
+        connector.invalidate_collection_cache.return_value = 1
+        app = FastAPI()
+        app.include_router(router, prefix="/api")
+        app.dependency_overrides[get_qdrant_connector] = lambda: connector
+        get_collection_cache().mark_exists(("localhost:6333", "other"))
+
+        response = TestClient(app).post(
+            "/api/admin/collection_cache/invalidate", json={"collection_name": "notes"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "invalidated": 1,
+            "collections": 1,
+            "invalidations": 0,
+        }
+        connector.invalidate_collection_cache.assert_called_once_with("notes")
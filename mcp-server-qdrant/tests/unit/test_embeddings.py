@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from mcp_server_qdrant.qdrant.embeddings.batching import MicroBatcher
+
+
+class RecordingModel:
+    """Synchronous fake model recording each batch it runs."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls: list[tuple[str, list[str]]] = []
+        self.threads: set[str] = set()
+        self.delay = delay
+
+    def __call__(self, kind: str, texts: list[str]) -> list[str]:
+        self.calls.append((kind, list(texts)))
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return [f"{kind}:{text}" for text in texts]
+
+
+class TestMicroBatcher:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_model_call(self):
+        model = RecordingModel()
+        batcher = MicroBatcher(model, max_batch_size=64, max_wait_ms=20)
+
+        results = await asyncio.gather(
+            *(batcher.embed("query", [f"q{i}"]) for i in range(10))
+        )
+
+        assert results == [[f"query:q{i}"] for i in range(10)]
+        assert len(model.calls) == 1
+        assert all(name.startswith("embedding") for name in model.threads)
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_batches_bounded_by_size(self):
+        model = RecordingModel()
+        batcher = MicroBatcher(model, max_batch_size=4, max_wait_ms=20)
+
+        results = await asyncio.gather(
+            *(batcher.embed("query", [f"q{i}"]) for i in range(10))
+        )
+
+        assert [r[0] for r in results] == [f"query:q{i}" for i in range(10)]
+        assert [len(texts) for _, texts in model.calls] == [4, 4, 2]
+        assert batcher.stats()["batches"] == 3
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_kinds_run_separately_and_multi_text_requests_split_back(self):
+        model = RecordingModel()
+        batcher = MicroBatcher(model, max_wait_ms=20)
+
+        query, docs, more_docs = await asyncio.gather(
+            batcher.embed("query", ["q"]),
+            batcher.embed("passage", ["a", "b"]),
+            batcher.embed("passage", ["c"]),
+        )
+
+        assert query == ["query:q"]
+        assert docs == ["passage:a", "passage:b"]
+        assert more_docs == ["passage:c"]
+        assert sorted(model.calls) == [("passage", ["a", "b", "c"]), ("query", ["q"])]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_runs_alone(self):
+        model = RecordingModel()
+        batcher = MicroBatcher(model, max_batch_size=2, max_wait_ms=20)
+
+        big, small = await asyncio.gather(
+            batcher.embed("passage", ["a", "b", "c"]),
+            batcher.embed("passage", ["d"]),
+        )
+
+        assert big == ["passage:a", "passage:b", "passage:c"]
+        assert small == ["passage:d"]
+        assert [texts for _, texts in model.calls] == [["a", "b", "c"], ["d"]]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_queue_while_worker_busy(self):
+        model = RecordingModel(delay=0.05)
+        batcher = MicroBatcher(model, max_wait_ms=0)
+
+        first = asyncio.create_task(batcher.embed("query", ["first"]))
+        await asyncio.sleep(0.01)
+        rest = await asyncio.gather(
+            *(batcher.embed("query", [f"q{i}"]) for i in range(5))
+        )
+        await first
+
+        assert len(rest) == 5
+        assert [len(texts) for _, texts in model.calls] == [1, 5]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_lone_caller_does_not_wait(self):
+        batcher = MicroBatcher(RecordingModel(), max_wait_ms=1000)
+
+        start = time.monotonic()
+        await batcher.embed("query", ["a"])
+        await batcher.embed("query", ["b"])
+
+        assert time.monotonic() - start < 0.5
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_model_error_reaches_every_caller(self):
+        def failing(kind, texts):
+            raise RuntimeError("onnx failure")
+
+        batcher = MicroBatcher(failing, max_wait_ms=20)
+
+        results = await asyncio.gather(
+            batcher.embed("query", ["a"]),
+            batcher.embed("query", ["b"]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await batcher.embed("query", []) == []
+        await batcher.close()
+
+    def test_survives_event_loop_change(self):
+        model = RecordingModel()
+        batcher = MicroBatcher(model, max_wait_ms=1)
+
+        assert asyncio.run(batcher.embed("query", ["a"])) == ["query:a"]
+        assert asyncio.run(batcher.embed("query", ["b"])) == ["query:b"]
+
+
+class TestFastEmbedProvider:
+    @pytest.fixture
+    def provider(self):
+        with patch(
+            "mcp_server_qdrant.qdrant.embeddings.fastembed.TextEmbedding"
+        ) as model_class:
+            model = MagicMock()
+            model.query_embed.side_effect = lambda texts: [
+                np.array([1.0, float(len(t))]) for t in texts
+            ]
+            model.passage_embed.side_effect = lambda texts: [
+                np.array([2.0, float(len(t))]) for t in texts
+            ]
+            model_class.return_value = model
+
+            from mcp_server_qdrant.qdrant.embeddings.fastembed import (
+                FastEmbedProvider,
+            )
+
+            yield FastEmbedProvider("test-model", batch_max_wait_ms=20), model
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_batched(self, provider):
+        provider, model = provider
+
+        vectors = await asyncio.gather(
+            *(provider.embed_query("x" * i) for i in range(1, 6))
+        )
+
+        assert vectors == [[1.0, float(i)] for i in range(1, 6)]
+        model.query_embed.assert_called_once_with(["x", "xx", "xxx", "xxxx", "xxxxx"])
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_documents_use_passage_embed(self, provider):
+        provider, model = provider
+
+        vectors = await provider.embed_documents(["ab", "abc"])
+
+        assert vectors == [[2.0, 2.0], [2.0, 3.0]]
+        model.query_embed.assert_not_called()
+        await provider.close()
@@ -0,0 +1,171 @@
+import json
+import warnings
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from qdrant_client import models
+
+from mcp_server_qdrant.api_routers.collections import router
+from mcp_server_qdrant.dependencies import get_qdrant_connector
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from mcp_server_qdrant.qdrant.config import QdrantConfig
+
+
+@pytest.fixture
+async def connector(tmp_path, mock_embedding_provider):
+    connector = QdrantConnector(
+        QdrantConfig(local_path=str(tmp_path), upsert_batch_size=7),
+        mock_embedding_provider,
+    )
+    entries = [
+        Entry(content=f"note {i}", metadata={"i": i, "even": i % 2 == 0, "tag": None})
+        for i in range(25)
+    ]
+    await connector.store_batch(entries, "notes")
+    yield connector
+    await connector._client.close()
+
+
+def make_client(connector, raise_app_exceptions: bool = True) -> httpx.AsyncClient:
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_qdrant_connector] = lambda: connector
+    transport = httpx.ASGITransport(
+        app=app, raise_app_exceptions=raise_app_exceptions
+    )
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+def parse(body: str) -> list[dict]:
+    return [json.loads(line) for line in body.splitlines()]
+
+
+async def export(client, **request) -> list[dict]:
+    response = await client.post(
+        "/api/export", json={"collection_name": "notes", **request}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return parse(response.text)
+
+
+class TestExport:
+    @pytest.mark.asyncio
+    async def test_pages_with_cursors(self, connector):
+        async with make_client(connector) as client:
+            lines = await export(client, page_size=10)
+
+        kinds = [line["type"] for line in lines]
+        page = ["point"] * 10 + ["cursor"]
+        assert kinds == page + page + ["point"] * 5 + ["cursor"]
+        assert lines[-1]["next_offset"] is None
+        points = [line for line in lines if line["type"] == "point"]
+        assert len({p["id"] for p in points}) == 25
+        assert "vector" not in points[0]
+        assert points[0]["payload"]["metadata"]["tag"] is None
+
+    @pytest.mark.asyncio
+    async def test_resume_from_cursor(self, connector):
+        async with make_client(connector) as client:
+            full = await export(client, page_size=10)
+            cursor = full[10]["next_offset"]
+            resumed = await export(client, page_size=10, offset=cursor)
+
+        assert resumed == full[11:]
+
+    @pytest.mark.asyncio
+    async def test_filtered_export_with_vectors(self, connector):
+        async with make_client(connector) as client:
+            lines = await export(
+                client, with_vectors=True, filters={"metadata.even": True}
+            )
+
+        points = [line for line in lines if line["type"] == "point"]
+        assert len(points) == 13
+        # Cosine collections store normalized vectors
+        assert points[0]["vector"] == {"text": pytest.approx([384**-0.5] * 384)}
+
+    @pytest.mark.asyncio
+    async def test_missing_collection_fails_request(self, connector):
+        async with make_client(connector, raise_app_exceptions=False) as client:
+            response = await client.post(
+                "/api/export", json={"collection_name": "missing"}
+            )
+
+        assert response.status_code == 500
+
+    @pytest.mark.asyncio
+    async def test_failure_mid_stream_ends_with_error_line(self, qdrant_connector):
+        page = [models.Record(id=1, payload={"document": "a"})]
+        qdrant_connector._client.scroll = AsyncMock(
+            side_effect=[(page, 2), Exception("connection reset")]
+        )
+        async with make_client(qdrant_connector) as client:
+            lines = await export(client, page_size=1)
+
+        assert [line["type"] for line in lines] == ["point", "cursor", "error"]
+        assert lines[1]["next_offset"] == 2
+        assert "connection reset" in lines[2]["message"]
+
+
+class TestImport:
+    async def round_trip(self, connector, with_vectors: bool) -> dict:
+        async with make_client(connector) as client:
+            exported = await client.post(
+                "/api/export",
+                json={"collection_name": "notes", "with_vectors": with_vectors},
+            )
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                response = await client.post(
+                    "/api/import",
+                    params={"collection_name": "copy", "batch_size": 10},
+                    content=exported.content,
+                    headers={"content-type": "application/x-ndjson"},
+                )
+        assert response.status_code == 200
+        return response.json()
+
+    @pytest.mark.asyncio
+    async def test_round_trip_keeps_ids_payloads_and_vectors(self, connector):
+        result = await self.round_trip(connector, with_vectors=True)
+
+        assert result == {"imported": 25, "embedded": 0, "batches": 3}
+        original, _ = await connector._client.scroll("notes", limit=100)
+        copied, _ = await connector._client.scroll("copy", limit=100)
+        assert [(p.id, p.payload) for p in copied] == [
+            (p.id, p.payload) for p in original
+        ]
+
+    @pytest.mark.asyncio
+    async def test_import_without_vectors_re_embeds(self, connector):
+        connector._embedding_provider.embed_documents = AsyncMock(
+            side_effect=lambda docs: [[1.0] + [0.0] * 383 for _ in docs]
+        )
+
+        result = await self.round_trip(connector, with_vectors=False)
+
+        assert result["embedded"] == 25
+        assert connector._embedding_provider.embed_documents.call_count == 3
+        points, _ = await connector._client.scroll("copy", limit=1, with_vectors=True)
+        assert points[0].vector["text"] == pytest.approx([1.0] + [0.0] * 383)
+
+    @pytest.mark.asyncio
+    async def test_invalid_line_reports_progress(self, connector):
+        body = "\n".join(
+            [
+                json.dumps({"type": "point", "id": 1, "vector": [0.1] * 384}),
+                json.dumps({"type": "point", "id": 2, "payload": {}}),
+            ]
+        )
+        async with make_client(connector, raise_app_exceptions=False) as client:
+            response = await client.post(
+                "/api/import",
+                params={"collection_name": "copy", "batch_size": 1},
+                content=body,
+            )
+
+        assert response.status_code == 500
+        assert (await connector._client.count("copy")).count == 1
@@ -0,0 +1,199 @@
+import warnings
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+from qdrant_client import models
+
+from mcp_server_qdrant.qdrant import Entry, QdrantAPIError, QdrantConnector
+from mcp_server_qdrant.qdrant.config import (
+    CollectionConfig,
+    PayloadIndexConfig,
+    QdrantConfig,
+)
+from mcp_server_qdrant.qdrant.filters import FieldFilter, build_filter
+from mcp_server_qdrant.schemas import QdrantFindRequest
+
+DOCUMENTS = [
+    (
+        "berlin",
+        {
+            "year": 2019,
+            "tags": ["travel", "food"],
+            "created_at": "2019-06-01T10:00:00Z",
+            "location": {"lon": 13.40, "lat": 52.52},
+            "note": None,
+        },
+    ),
+    (
+        "paris",
+        {
+            "year": 2021,
+            "tags": ["travel"],
+            "created_at": "2021-03-15T10:00:00Z",
+            "location": {"lon": 2.35, "lat": 48.86},
+            "note": "rainy",
+        },
+    ),
+    (
+        "tokyo",
+        {
+            "year": 2023,
+            "tags": ["work"],
+            "created_at": "2023-11-20T10:00:00Z",
+            "location": {"lon": 139.69, "lat": 35.69},
+            "note": "",
+        },
+    ),
+    ("draft", {"year": 2024, "tags": []}),
+]
+
+
+class TestBuildFilter:
+    def test_plain_values_stay_equality(self):
+        query_filter = build_filter({"metadata.user": "alice", "metadata.n": 3})
+
+        assert query_filter.must == [
+            models.FieldCondition(
+                key="metadata.user", match=models.MatchValue(value="alice")
+            ),
+            models.FieldCondition(key="metadata.n", match=models.MatchValue(value=3)),
+        ]
+        assert query_filter.must_not is None
+
+    def test_nothing_to_filter(self):
+        assert build_filter(None) is None
+        assert build_filter({"metadata.user": None}) is None
+
+    def test_operators_compile(self):
+        query_filter = build_filter(
+            {
+                "metadata.year": {"gte": 2020, "lt": 2024},
+                "metadata.created_at": {"gt": "2021-01-01T00:00:00Z"},
+                "metadata.tags": {"any": ["travel"], "except": ["work"]},
+                "metadata.note": {"is_empty": False},
+            }
+        )
+
+        year, created_at, any_tag, except_tag = query_filter.must
+        assert year.range == models.Range(gte=2020, lt=2024)
+        assert isinstance(created_at.range, models.DatetimeRange)
+        assert any_tag.match == models.MatchAny(any=["travel"])
+        assert except_tag.match == models.MatchExcept(**{"except": ["work"]})
+        assert query_filter.must_not == [
+            models.IsEmptyCondition(is_empty=models.PayloadField(key="metadata.note"))
+        ]
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {},
+            {"eq": None},
+            {"gte": 1, "lt": "2024-01-01T00:00:00Z"},
+            {"between": [1, 2]},
+            {"any": "travel"},
+        ],
+    )
+    def test_invalid_operators_rejected(self, value):
+        with pytest.raises(ValidationError):
+            FieldFilter.model_validate(value)
+
+    def test_find_request_accepts_both_forms(self):
+        request = QdrantFindRequest.model_validate(
+            {
+                "collection_name": "notes",
+                "query": "trips",
+                "filters": {"metadata.user": "alice", "metadata.year": {"gte": 2020}},
+            }
+        )
+
+        assert request.filters["metadata.user"] == "alice"
+        assert request.filters["metadata.year"] == FieldFilter(gte=2020)
+
+
+class TestLocalModeFilters:
+    @pytest.fixture
+    async def connector(self, tmp_path, mock_embedding_provider):
+        config = QdrantConfig(
+            local_path=str(tmp_path),
+            collection_config=CollectionConfig(
+                payload_indexes=[
+                    PayloadIndexConfig(field_name="metadata.year", index_type="integer")
+                ]
+            ),
+        )
+        connector = QdrantConnector(config, mock_embedding_provider)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)  # local mode ignores indexes
+            for content, metadata in DOCUMENTS:
+                entry = Entry(content=content, metadata=metadata)
+                await connector.store(entry, "trips")
+        yield connector
+        await connector._client.close()
+
+    async def find(self, connector, filters) -> list[str]:
+        result = await connector.search("trips", "trips", filters=filters)
+        return sorted(point.payload["document"] for point in result.points)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("filters", "expected"),
+        [
+            ({"metadata.year": 2021}, ["paris"]),
+            ({"metadata.year": {"gte": 2020, "lt": 2024}}, ["paris", "tokyo"]),
+            (
+                {"metadata.created_at": {"lte": "2021-12-31T23:59:59Z"}},
+                ["berlin", "paris"],
+            ),
+            ({"metadata.tags": {"any": ["food", "work"]}}, ["berlin", "tokyo"]),
+            # Arrays match when any element is outside the list; [] never does
+            ({"metadata.tags": {"except": ["travel"]}}, ["berlin", "tokyo"]),
+            (
+                {
+                    "metadata.location": {
+                        "geo_radius": {
+                            "center": {"lon": 2.29, "lat": 48.86},
+                            "radius": 10_000,
+                        }
+                    }
+                },
+                ["paris"],
+            ),
+            (
+                {
+                    "metadata.location": {
+                        "geo_bounding_box": {
+                            "top_left": {"lon": -10.0, "lat": 60.0},
+                            "bottom_right": {"lon": 20.0, "lat": 40.0},
+                        }
+                    }
+                },
+                ["berlin", "paris"],
+            ),
+            ({"metadata.tags": {"is_empty": True}}, ["draft"]),
+            ({"metadata.note": {"is_null": True}}, ["berlin"]),
+            ({"metadata.note": {"is_empty": False}}, ["paris", "tokyo"]),
+            (
+                {"metadata.year": {"gt": 2019}, "metadata.tags": {"any": ["travel"]}},
+                ["paris"],
+            ),
+        ],
+    )
+    async def test_filters_applied_by_qdrant(self, connector, filters, expected):
+        assert await self.find(connector, filters) == expected
+
+    @pytest.mark.asyncio
+    async def test_invalid_operator_dict_raises(self, connector):
+        with pytest.raises(QdrantAPIError):
+            await connector.search("trips", "trips", filters={"metadata.year": {}})
+
+    @pytest.mark.asyncio
+    async def test_unindexed_fields_warned_once(self, connector):
+        with patch("mcp_server_qdrant.qdrant.module.logger") as logger:
+            filters = {"metadata.year": 2021, "metadata.tags": {"any": ["travel"]}}
+            await connector.search("trips", "trips", filters=filters)
+            await connector.search("trips", "trips", filters=filters)
+
+        warned = [call.args[0] for call in logger.warning.call_args_list]
+        assert len(warned) == 1
+        assert "'metadata.tags'" in warned[0]
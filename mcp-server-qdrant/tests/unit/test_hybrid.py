@@ -0,0 +1,242 @@
+import asyncio
+import zlib
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from qdrant_client import models
+
+from mcp_server_qdrant.qdrant import Entry, PointRecord, QdrantAPIError, QdrantConnector
+from mcp_server_qdrant.qdrant.config import QdrantConfig
+from mcp_server_qdrant.qdrant.embeddings.base import SparseEmbeddingProvider
+
+DOCUMENTS = [
+    "Aave v3 lending pool on Arbitrum",
+    "Bridge address 0x1a2b3c for USDC transfers",
+    "Weekly notes about governance votes",
+    "ETH staking rewards summary",
+]
+
+
+class MockSparseProvider(SparseEmbeddingProvider):
+    """Term-count sparse vectors over crc32-hashed lowercase tokens."""
+
+    def __init__(self):
+        self.embed_documents_calls = 0
+
+    @staticmethod
+    def encode(text: str) -> models.SparseVector:
+        counts = Counter(zlib.crc32(t.encode()) for t in text.lower().split())
+        indices = sorted(counts)
+        return models.SparseVector(
+            indices=indices, values=[float(counts[i]) for i in indices]
+        )
+
+    async def embed_documents(self, documents: list[str]) -> list[models.SparseVector]:
+        self.embed_documents_calls += 1
+        return [self.encode(document) for document in documents]
+
+    async def embed_query(self, query: str) -> models.SparseVector:
+        return self.encode(query)
+
+    def get_vector_name(self) -> str:
+        return "fast-sparse-test"
+
+    def requires_idf(self) -> bool:
+        return True
+
+
+def documents(result: models.QueryResponse) -> list[str]:
+    return [point.payload["document"] for point in result.points]
+
+
+class TestLocalModeHybrid:
+    @pytest.fixture
+    async def connector(self, tmp_path, mock_embedding_provider):
+        connector = QdrantConnector(
+            QdrantConfig(local_path=str(tmp_path)),
+            mock_embedding_provider,
+            MockSparseProvider(),
+        )
+        await connector.store_batch([Entry(content=d) for d in DOCUMENTS], "notes")
+        yield connector
+        await connector._client.close()
+
+    @pytest.mark.asyncio
+    async def test_collection_stores_both_vectors(self, connector):
+        info = await connector._client.get_collection("notes")
+        points, _ = await connector._client.scroll("notes", limit=1, with_vectors=True)
+
+        sparse_params = info.config.params.sparse_vectors["fast-sparse-test"]
+        assert sparse_params.modifier == models.Modifier.IDF
+        assert set(points[0].vector) == {"text", "fast-sparse-test"}
+
+    @pytest.mark.asyncio
+    async def test_keyword_query_ranks_exact_match_first(self, connector):
+        # The mock dense provider scores every document the same
+        sparse = await connector.search("0x1a2b3c", "notes", mode="sparse")
+        hybrid = await connector.search("0x1a2b3c", "notes", limit=4)
+
+        assert documents(sparse) == [DOCUMENTS[1]]
+        assert documents(hybrid)[0] == DOCUMENTS[1]
+        assert len(hybrid.points) == 4  # dense candidates are still fused in
+
+    @pytest.mark.asyncio
+    async def test_dense_mode_skips_sparse(self, connector):
+        connector._sparse_provider.embed_query = AsyncMock()
+
+        result = await connector.search("staking", "notes", mode="dense")
+
+        assert len(result.points) == 4
+        connector._sparse_provider.embed_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hybrid_respects_filters(self, connector):
+        await connector.store(
+            Entry(content="0x1a2b3c audit", metadata={"kind": "audit"}), "notes"
+        )
+
+        result = await connector.search(
+            "0x1a2b3c", "notes", filters={"metadata.kind": "audit"}
+        )
+
+        assert documents(result) == ["0x1a2b3c audit"]
+
+    @pytest.mark.asyncio
+    async def test_import_embeds_missing_sparse_vectors(self, connector):
+        async def points():
+            yield PointRecord(
+                id=1, payload={"document": "ETH gas"}, vector={"text": [0.3] * 384}
+            )
+            yield PointRecord(id=2, payload={"document": "SOL"}, vector=[0.3] * 384)
+
+        result = await connector.import_points("notes", points())
+
+        assert result.embedded == 2
+        records = await connector._client.retrieve("notes", [1, 2], with_vectors=True)
+        assert all("fast-sparse-test" in record.vector for record in records)
+
+
+class TestLegacyCollections:
+    @pytest.mark.asyncio
+    async def test_dense_only_collection_falls_back(
+        self, tmp_path, mock_embedding_provider
+    ):
+        config = QdrantConfig(local_path=str(tmp_path))
+        dense = QdrantConnector(config, mock_embedding_provider)
+        await dense.store(Entry(content="legacy note"), "legacy")
+        await dense._client.close()
+
+        sparse_provider = MockSparseProvider()
+        connector = QdrantConnector(config, mock_embedding_provider, sparse_provider)
+        try:
+            with patch("mcp_server_qdrant.qdrant.module.logger") as logger:
+                await connector.store(Entry(content="new note"), "legacy")
+                result = await connector.search("note", "legacy")
+            with pytest.raises(QdrantAPIError, match="needs sparse vectors"):
+                await connector.search("note", "legacy", mode="hybrid")
+        finally:
+            await connector._client.close()
+
+        assert len(result.points) == 2
+        assert sparse_provider.embed_documents_calls == 0
+        assert logger.warning.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sparse_mode_without_provider_raises(self, qdrant_connector):
+        qdrant_connector._client.collection_exists = AsyncMock(return_value=True)
+
+        with pytest.raises(QdrantAPIError, match="no sparse model"):
+            await qdrant_connector.search("x", "notes", mode="sparse")
+
+
+class TestHybridQuery:
+    @pytest.mark.asyncio
+    async def test_prefetches_scale_with_limit(self, mock_embedding_provider):
+        config = QdrantConfig(hybrid_prefetch_factor=3)
+        with patch("mcp_server_qdrant.qdrant.module.AsyncQdrantClient") as client:
+            client.return_value = AsyncMock()
+            connector = QdrantConnector(
+                config, mock_embedding_provider, MockSparseProvider()
+            )
+        connector._client.collection_exists = AsyncMock(return_value=True)
+        connector._client.get_collection = AsyncMock(
+            return_value=SimpleNamespace(
+                config=SimpleNamespace(
+                    params=SimpleNamespace(
+                        sparse_vectors={"fast-sparse-test": None}
+                    )
+                ),
+                payload_schema={},
+            )
+        )
+        connector._client.query_points = AsyncMock(return_value=MagicMock(points=[]))
+
+        await connector.search("ETH", "notes", limit=5, filters={"metadata.a": 1})
+
+        call_args = connector._client.query_points.call_args[1]
+        dense, sparse = call_args["prefetch"]
+        assert call_args["query"] == models.FusionQuery(fusion=models.Fusion.RRF)
+        assert call_args["limit"] == 5
+        assert (dense.using, dense.limit) == ("text", 15)
+        assert (sparse.using, sparse.limit) == ("fast-sparse-test", 15)
+        assert sparse.query == MockSparseProvider.encode("ETH")
+        assert dense.filter == sparse.filter
+        assert dense.filter is not None
+        assert "query_filter" not in call_args
+
+
+class TestFastEmbedSparseProvider:
+    @pytest.fixture
+    def provider(self):
+        with patch(
+            "mcp_server_qdrant.qdrant.embeddings.fastembed.SparseTextEmbedding"
+        ) as model_class:
+            model = MagicMock()
+            model.query_embed.side_effect = lambda texts: [
+                SimpleNamespace(indices=np.array([len(t)]), values=np.array([1.0]))
+                for t in texts
+            ]
+            model.passage_embed.side_effect = lambda texts: [
+                SimpleNamespace(
+                    indices=np.array([1, len(t)]), values=np.array([1.0, 2.0])
+                )
+                for t in texts
+            ]
+            model._get_model_description.return_value = SimpleNamespace(
+                requires_idf=True
+            )
+            model_class.return_value = model
+
+            from mcp_server_qdrant.qdrant.embeddings.fastembed import (
+                FastEmbedSparseProvider,
+            )
+
+            yield FastEmbedSparseProvider("Qdrant/bm25", batch_max_wait_ms=20), model
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_batched(self, provider):
+        provider, model = provider
+
+        vectors = await asyncio.gather(
+            *(provider.embed_query("x" * i) for i in range(1, 4))
+        )
+
+        assert vectors == [
+            models.SparseVector(indices=[i], values=[1.0]) for i in (1, 2, 3)
+        ]
+        model.query_embed.assert_called_once_with(["x", "xx", "xxx"])
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_documents_and_metadata(self, provider):
+        provider, model = provider
+
+        vectors = await provider.embed_documents(["abc"])
+
+        assert vectors == [models.SparseVector(indices=[1, 3], values=[1.0, 2.0])]
+        assert provider.get_vector_name() == "fast-sparse-bm25"
+        assert provider.requires_idf()
+        await provider.close()
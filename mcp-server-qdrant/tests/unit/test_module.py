@@ -234,6 +234,7 @@ class TestQdrantConnector:
             query_filter=None,
             limit=10,
             using="text",
+            search_params=None,
             with_payload=True,
             with_vectors=False,
         )
@@ -493,6 +494,151 @@ class TestQdrantConnector:
         assert "Index creation failed" in str(exc_info.value)
 
 
+class TestStoreBatch:
+    @pytest.mark.asyncio
+    async def test_single_embedding_call_and_chunked_upserts(self, qdrant_connector):
+        qdrant_connector._config.upsert_batch_size = 4
+        qdrant_connector._client.collection_exists = AsyncMock(return_value=True)
+        qdrant_connector._embedding_provider.embed_documents = AsyncMock(
+            side_effect=lambda docs: [[0.1] * 384 for _ in docs]
+        )
+        entries = [Entry(content=f"doc {i}", metadata={"i": i}) for i in range(10)]
+
+        results = await qdrant_connector.store_batch(entries, "batch_collection")
+
+        qdrant_connector._embedding_provider.embed_documents.assert_called_once_with(
+            [f"doc {i}" for i in range(10)]
+        )
+        batches = [c[1]["points"] for c in qdrant_connector._client.upsert.call_args_list]
+        assert sorted(len(b.ids) for b in batches) == [2, 4, 4]
+        assert all(len(b.vectors["text"]) == len(b.ids) for b in batches)
+        assert [r.index for r in results] == list(range(10))
+        assert all(r.stored and r.id for r in results)
+
+        stored = {
+            point_id: payload
+            for b in batches
+            for point_id, payload in zip(b.ids, b.payloads, strict=True)
+        }
+        assert stored[results[3].id] == {"document": "doc 3", "metadata": {"i": 3}}
+
+    @pytest.mark.asyncio
+    async def test_parallel_upserts_are_bounded(self, qdrant_connector):
+        import asyncio
+
+        qdrant_connector._config.upsert_batch_size = 1
+        qdrant_connector._config.upsert_parallelism = 3
+        qdrant_connector._client.collection_exists = AsyncMock(return_value=True)
+        in_flight, peak = 0, 0
+
+        async def slow_upsert(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        qdrant_connector._client.upsert = AsyncMock(side_effect=slow_upsert)
+
+        await qdrant_connector.store_batch(
+            [Entry(content=str(i)) for i in range(10)], "batch_collection"
+        )
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_reported_per_item(self, qdrant_connector):
+        qdrant_connector._config.upsert_batch_size = 2
+        qdrant_connector._config.upsert_parallelism = 1
+        qdrant_connector._client.collection_exists = AsyncMock(return_value=True)
+        qdrant_connector._client.upsert = AsyncMock(
+            side_effect=[None, Exception("Payload too large"), None]
+        )
+
+        results = await qdrant_connector.store_batch(
+            [Entry(content=str(i)) for i in range(6)], "batch_collection"
+        )
+
+        assert [r.stored for r in results] == [True, True, False, False, True, True]
+        assert results[2].error == "Payload too large"
+        assert results[2].id is None
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_raises(self, qdrant_connector):
+        qdrant_connector._client.collection_exists = AsyncMock(return_value=True)
+        qdrant_connector._embedding_provider.embed_documents = AsyncMock(
+            side_effect=Exception("Model unavailable")
+        )
+
+        with pytest.raises(QdrantAPIError, match="Model unavailable"):
+            await qdrant_connector.store_batch([Entry(content="x")], "batch_collection")
+        qdrant_connector._client.upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, qdrant_connector):
+        assert await qdrant_connector.store_batch([], "batch_collection") == []
+        qdrant_connector._client.collection_exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_local_mode_round_trip(self, tmp_path, mock_embedding_provider):
+        from mcp_server_qdrant.qdrant.config import QdrantConfig
+
+        config = QdrantConfig(local_path=str(tmp_path), upsert_batch_size=50)
+        connector = QdrantConnector(config, mock_embedding_provider)
+        try:
+            results = await connector.store_batch(
+                [Entry(content=f"doc {i}") for i in range(120)], "local_batch"
+            )
+            count = await connector._client.count("local_batch")
+        finally:
+            await connector._client.close()
+
+        assert all(r.stored for r in results)
+        assert count.count == 120
+
+    def test_store_batch_endpoint(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from mcp_server_qdrant.dependencies import get_qdrant_connector
+        from mcp_server_qdrant.hybrid_routers.qdrant_tools import router
+        from mcp_server_qdrant.qdrant import BatchStoreResult
+
+        connector = MagicMock()
+        connector.store_batch = AsyncMock(
+            return_value=[
+                BatchStoreResult(index=0, id="a", stored=True),
+                BatchStoreResult(index=1, stored=False, error="boom"),
+            ]
+        )
+        app = FastAPI()
+        app.include_router(router, prefix="/hybrid")
+        app.dependency_overrides[get_qdrant_connector] = lambda: connector
+        client = TestClient(app)
+
+        response = client.post(
+            "/hybrid/store_batch",
+            json={
+                "collection_name": "notes",
+                "entries": [
+                    {"information": "one", "metadata": {"k": "v"}},
+                    {"information": "two"},
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        assert [r["stored"] for r in response.json()] == [True, False]
+        entries = connector.store_batch.call_args[0][0]
+        assert [e.content for e in entries] == ["one", "two"]
+        assert entries[0].metadata == {"k": "v"}
+
+        empty = client.post(
+            "/hybrid/store_batch", json={"collection_name": "notes", "entries": []}
+        )
+        assert empty.status_code == 422
+
+
 class TestIntegration:
     @pytest.mark.asyncio
     async def test_full_workflow_store_and_search(self, qdrant_connector):
@@ -587,7 +733,8 @@ class TestIntegration:
 
         assert qdrant_connector._client.upsert.call_count == 10
 
-        assert qdrant_connector._ensure_payload_indexes.call_count == 10
+        # Indexes are ensured once, then the collection state is served from cache
+        assert qdrant_connector._ensure_payload_indexes.call_count == 1
 
     @pytest.mark.asyncio
     async def test_concurrent_operations(self, qdrant_connector):
@@ -0,0 +1,144 @@
+import warnings
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from qdrant_client import models
+
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+from mcp_server_qdrant.qdrant.config import (
+    CollectionConfig,
+    PerformanceProfile,
+    QdrantConfig,
+    QuantizationType,
+)
+
+
+class TestProfileConfig:
+    def test_balanced_keeps_full_precision(self):
+        config = CollectionConfig()
+
+        assert config.profile == PerformanceProfile.BALANCED
+        assert config.quantization.type == QuantizationType.NONE
+        assert not config.on_disk_vectors
+        assert config.search.hnsw_ef is None
+
+    def test_profile_fills_defaults(self):
+        config = CollectionConfig(profile="memory-saver")
+
+        assert config.on_disk_vectors
+        assert config.quantization.type == QuantizationType.SCALAR
+        assert config.search.rescore is True
+        assert config.search.oversampling == 2.0
+
+    def test_explicit_settings_override_profile(self):
+        config = CollectionConfig(
+            profile="memory-saver",
+            quantization={"type": "binary"},
+            search={"oversampling": 4},
+        )
+
+        assert config.quantization.type == QuantizationType.BINARY
+        assert config.quantization.always_ram  # still from the profile
+        assert config.search.oversampling == 4.0
+        assert config.search.rescore is True
+
+    def test_profile_from_environment(self, monkeypatch):
+        monkeypatch.setenv("QDRANT_COLLECTION_CONFIG__PROFILE", "high-recall")
+        monkeypatch.setenv("QDRANT_COLLECTION_CONFIG__SEARCH__HNSW_EF", "512")
+
+        config = QdrantConfig().collection_config
+
+        assert config.hnsw_config.ef_construct == 400
+        assert config.search.hnsw_ef == 512
+
+    def test_unknown_profile_rejected(self):
+        with pytest.raises(ValueError):
+            CollectionConfig(profile="turbo")
+
+
+class TestProfileConnector:
+    def connector(self, mock_embedding_provider, **collection_config):
+        config = QdrantConfig(collection_config=CollectionConfig(**collection_config))
+        with patch("mcp_server_qdrant.qdrant.module.AsyncQdrantClient") as client:
+            client.return_value = AsyncMock()
+            return QdrantConnector(config, mock_embedding_provider)
+
+    @pytest.mark.asyncio
+    async def test_create_collection_applies_profile(self, mock_embedding_provider):
+        connector = self.connector(mock_embedding_provider, profile="memory-saver")
+
+        await connector._create_configured_collection("notes")
+
+        call_args = connector._client.create_collection.call_args[1]
+        assert call_args["vectors_config"]["text"].on_disk is True
+        quantization = call_args["quantization_config"]
+        assert isinstance(quantization, models.ScalarQuantization)
+        assert quantization.scalar.type == models.ScalarType.INT8
+        assert quantization.scalar.always_ram is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("quantization", "expected"),
+        [
+            ({"type": "product", "compression": "x32"}, models.ProductQuantization),
+            ({"type": "binary"}, models.BinaryQuantization),
+            ({"type": "none"}, type(None)),
+        ],
+    )
+    async def test_quantization_types(
+        self, mock_embedding_provider, quantization, expected
+    ):
+        connector = self.connector(mock_embedding_provider, quantization=quantization)
+
+        await connector._create_configured_collection("notes")
+
+        call_args = connector._client.create_collection.call_args[1]
+        assert isinstance(call_args["quantization_config"], expected)
+        assert call_args["vectors_config"]["text"].on_disk is None
+
+    @pytest.mark.asyncio
+    async def test_search_sends_profile_params(self, mock_embedding_provider):
+        connector = self.connector(mock_embedding_provider, profile="low-latency")
+        connector._client.query_points = AsyncMock(return_value=MagicMock(points=[]))
+
+        await connector.search("query", "notes")
+
+        search_params = connector._client.query_points.call_args[1]["search_params"]
+        assert search_params.hnsw_ef == 64
+        assert search_params.quantization == models.QuantizationSearchParams(
+            rescore=True, oversampling=1.5
+        )
+
+    @pytest.mark.asyncio
+    async def test_rescore_ignored_without_quantization(self, mock_embedding_provider):
+        connector = self.connector(
+            mock_embedding_provider, search={"rescore": True, "hnsw_ef": 128}
+        )
+        connector._client.query_points = AsyncMock(return_value=MagicMock(points=[]))
+
+        await connector.search("query", "notes")
+
+        search_params = connector._client.query_points.call_args[1]["search_params"]
+        assert search_params.hnsw_ef == 128
+        assert search_params.quantization is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("profile", list(PerformanceProfile))
+    async def test_profiles_work_in_local_mode(
+        self, tmp_path, mock_embedding_provider, profile
+    ):
+        config = QdrantConfig(
+            local_path=str(tmp_path),
+            collection_config=CollectionConfig(profile=profile),
+        )
+        connector = QdrantConnector(config, mock_embedding_provider)
+        try:
+            with warnings.catch_warnings():
+                # Local mode searches exactly and ignores index/search tuning
+                warnings.simplefilter("ignore", UserWarning)
+                await connector.store(Entry(content="hello"), "notes")
+                result = await connector.search("hello", "notes")
+        finally:
+            await connector._client.close()
+
+        assert [p.payload["document"] for p in result.points] == ["hello"]
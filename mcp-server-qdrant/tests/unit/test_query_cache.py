@@ -0,0 +1,141 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from qdrant_client import models
+
+from mcp_server_qdrant.qdrant.embeddings.query_cache import (
+    QueryEmbeddingCache,
+    normalize_query,
+)
+
+
+class TestQueryEmbeddingCache:
+    def test_normalization(self):
+        assert normalize_query("  what  is\tqdrant \n") == "what is qdrant"
+        assert normalize_query("ｑｄｒａｎｔ") == "qdrant"
+        assert normalize_query("Qdrant") != normalize_query("qdrant")
+
+    def test_lru_eviction_and_metrics(self):
+        cache = QueryEmbeddingCache(max_entries=2)
+        cache.put("m", "a", [1.0])
+        cache.put("m", "b", [2.0])
+        assert cache.get("m", " a ") == [1.0]  # a becomes most recent
+        cache.put("m", "c", [3.0])
+
+        assert cache.get("m", "b") is None
+        assert cache.get("m", "c") == [3.0]
+        assert cache.get("other-model", "c") is None
+        assert cache.stats() == {
+            "entries": 2,
+            "max_entries": 2,
+            "hits": 2,
+            "misses": 2,
+            "hit_rate": 0.5,
+            "persistent": False,
+        }
+
+    def test_disabled(self):
+        cache = QueryEmbeddingCache(max_entries=0)
+        cache.put("m", "a", [1.0])
+
+        assert cache.get("m", "a") is None
+
+    def test_persists_across_restarts(self, tmp_path):
+        path = tmp_path / "cache" / "queries.db"
+        first = QueryEmbeddingCache(max_entries=2, path=path)
+        first.put("m", "a", [0.25, -1.5])
+        first.put("m", "b", [0.5])
+        first.put("m", "c", [0.75])  # evicts a, on disk too
+        first.close()
+
+        second = QueryEmbeddingCache(max_entries=2, path=path)
+
+        assert second.get("m", "a") is None
+        assert second.get("m", "b") == [0.5]
+        assert second.get("m", "c") == [0.75]
+        assert second.stats()["persistent"] is True
+        second.close()
+
+    def test_reload_keeps_most_recent(self, tmp_path):
+        path = tmp_path / "queries.db"
+        first = QueryEmbeddingCache(max_entries=3, path=path)
+        for name in "abc":
+            first.put("m", name, [1.0])
+        first.close()
+
+        second = QueryEmbeddingCache(max_entries=2, path=path)
+
+        assert second.stats()["entries"] == 2
+        assert second.get("m", "a") is None
+
+    def test_unusable_path_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = QueryEmbeddingCache(path=blocker / "queries.db")
+        cache.put("m", "a", [1.0])
+
+        assert cache.get("m", "a") == [1.0]
+        assert cache.stats()["persistent"] is False
+
+
+class TestConnectorQueryCache:
+    @pytest.mark.asyncio
+    async def test_repeated_queries_embed_once(self, qdrant_connector):
+        qdrant_connector._client.collection_exists = AsyncMock(return_value=True)
+        qdrant_connector._client.query_points = AsyncMock(
+            return_value=MagicMock(points=[])
+        )
+        qdrant_connector._embedding_provider.embed_query = AsyncMock(
+            return_value=[0.3] * 384
+        )
+
+        await qdrant_connector.search("where is my note", "notes")
+        await qdrant_connector.search("where  is my note ", "notes")
+        await qdrant_connector.search("something else", "notes")
+
+        assert qdrant_connector._embedding_provider.embed_query.call_count == 2
+        stats = qdrant_connector.get_query_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+        second_call = qdrant_connector._client.query_points.call_args_list[1]
+        assert second_call[1]["query"] == [0.3] * 384
+
+    def test_collection_info_reports_cache_metrics(self):
+        from mcp_server_qdrant.dependencies import get_qdrant_connector
+        from mcp_server_qdrant.hybrid_routers.qdrant_tools import router
+
+        info = models.CollectionInfo(
+            status=models.CollectionStatus.GREEN,
+            optimizer_status=models.OptimizersStatusOneOf.OK,
+            points_count=3,
+            segments_count=1,
+            config=models.CollectionConfig(
+                params=models.CollectionParams(),
+                hnsw_config=models.HnswConfig(
+                    m=16, ef_construct=100, full_scan_threshold=10000
+                ),
+                optimizer_config=models.OptimizersConfig(
+                    deleted_threshold=0.2,
+                    vacuum_min_vector_number=1000,
+                    default_segment_number=0,
+                    flush_interval_sec=5,
+                ),
+            ),
+            payload_schema={},
+        )
+        connector = MagicMock()
+        connector.get_collection_details = AsyncMock(return_value=info)
+        connector.get_query_cache_stats.return_value = {"hits": 4, "misses": 1}
+        app = FastAPI()
+        app.include_router(router, prefix="/hybrid")
+        app.dependency_overrides[get_qdrant_connector] = lambda: connector
+
+        response = TestClient(app).post(
+            "/hybrid/get_collection_info", json={"collection_name": "notes"}
+        )
+
+        body = response.json()
+        assert body["points_count"] == 3
+        assert body["status"] == "green"
+        assert body["query_cache"] == {"hits": 4, "misses": 1}
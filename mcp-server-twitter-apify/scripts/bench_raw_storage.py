@@ -0,0 +1,258 @@
+"""
+Benchmark inline vs compressed raw payload storage.
+
+Main responsibility: Load a synthetic dataset of max format tweets under both
+`CACHE_RAW_STORAGE` modes, then report table sizes and cache-read latency.
+
+Usage (from the project root):
+    uv run python scripts/bench_raw_storage.py --tweets 1000000
+    uv run python scripts/bench_raw_storage.py --db-url postgresql+psycopg://...
+
+Without `--db-url` each mode gets a fresh SQLite file in a temporary directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from db import Database  # noqa: E402
+from db.models import (  # noqa: E402
+    Base,
+    QueryCacheEntry,
+    QueryCacheItem,
+    Tweet,
+    TweetAuthor,
+    TweetRawPayload,
+)
+from db.raw_store import encode_raw  # noqa: E402
+
+WORDS = "crypto market launch update thread community build ship agent model data".split()
+
+
+def synthetic_tweet(i: int, rng: random.Random) -> dict[str, Any]:
+    """Build a max format tweet shaped like the Apify actor output (~3 KB)."""
+    author_id = f"u{i % 5000}"
+    text_ = " ".join(rng.choices(WORDS, k=rng.randint(10, 40)))
+    return {
+        "type": "tweet",
+        "id": str(1_800_000_000_000_000_000 + i),
+        "url": f"https://x.com/user{author_id}/status/{i}",
+        "twitterUrl": f"https://twitter.com/user{author_id}/status/{i}",
+        "text": text_,
+        "fullText": text_,
+        "source": "Twitter Web App",
+        "retweetCount": rng.randint(0, 500),
+        "replyCount": rng.randint(0, 100),
+        "likeCount": rng.randint(0, 5000),
+        "quoteCount": rng.randint(0, 50),
+        "viewCount": rng.randint(0, 100_000),
+        "createdAt": "Thu Dec 25 13:49:02 +0000 2025",
+        "lang": "en",
+        "bookmarkCount": rng.randint(0, 50),
+        "isReply": False,
+        "isRetweet": False,
+        "isQuote": False,
+        "author": {
+            "type": "user",
+            "id": author_id,
+            "userName": f"user{author_id}",
+            "name": f"User {author_id}",
+            "url": f"https://x.com/user{author_id}",
+            "isVerified": False,
+            "isBlueVerified": rng.random() < 0.3,
+            "profilePicture": f"https://pbs.twimg.com/profile_images/{i}/photo.jpg",
+            "description": " ".join(rng.choices(WORDS, k=20)),
+            "followers": rng.randint(0, 1_000_000),
+            "following": rng.randint(0, 5000),
+            "createdAt": "Mon Jan 01 00:00:00 +0000 2018",
+            "entities": {"description": {"urls": []}, "url": {"urls": []}},
+        },
+        "entities": {
+            "hashtags": [{"text": w, "indices": [0, len(w)]} for w in rng.sample(WORDS, 3)],
+            "symbols": [],
+            "urls": [
+                {
+                    "display_url": "example.com/post",
+                    "expanded_url": f"https://example.com/post/{i}",
+                    "url": f"https://t.co/{i:x}",
+                    "indices": [10, 33],
+                }
+            ],
+            "user_mentions": [],
+        },
+        "extendedEntities": {},
+        "conversationId": str(1_800_000_000_000_000_000 + i),
+    }
+
+
+def open_db(db_url: str | None, workdir: Path, mode: str) -> tuple[Database, str]:
+    url = db_url or f"sqlite:///{workdir / f'bench_{mode}.db'}"
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    db = Database.__new__(Database)
+    db.engine = engine
+    db.Session = sessionmaker(bind=engine)
+    db.raw_storage = mode
+    return db, url
+
+
+def load(db: Database, n: int, query_size: int, batch: int = 5000) -> None:
+    """Bulk-insert tweets plus one cache entry per `query_size` tweets."""
+    rng = random.Random(42)
+    expires = datetime.now(UTC) + timedelta(days=1)
+    with db.engine.begin() as conn:
+        conn.execute(
+            insert(TweetAuthor),
+            [
+                {"id": f"u{a}", "username": f"useru{a}", "name": f"User u{a}"}
+                for a in range(min(n, 5000))
+            ],
+        )
+        for start in range(0, n, batch):
+            items = [synthetic_tweet(i, rng) for i in range(start, min(n, start + batch))]
+            conn.execute(
+                insert(Tweet),
+                [
+                    {
+                        "id": t["id"],
+                        "url": t["url"],
+                        "text": t["text"],
+                        "full_text": t["fullText"],
+                        "author_id": t["author"]["id"],
+                        "retweet_count": t["retweetCount"],
+                        "reply_count": t["replyCount"],
+                        "like_count": t["likeCount"],
+                        "quote_count": t["quoteCount"],
+                        "view_count": t["viewCount"],
+                        "format": "max",
+                        "raw_data": t if db.raw_storage == "inline" else None,
+                    }
+                    for t in items
+                ],
+            )
+            if db.raw_storage == "compressed":
+                conn.execute(
+                    insert(TweetRawPayload),
+                    [
+                        {
+                            "tweet_id": t["id"],
+                            "codec": db.raw_codec,
+                            "payload": encode_raw(t, db.raw_codec),  # type: ignore[arg-type]
+                            "raw_size": len(json.dumps(t).encode("utf-8")),
+                        }
+                        for t in items
+                    ],
+                )
+            entries, links = [], []
+            for offset in range(0, len(items), query_size):
+                key = f"q{start + offset}"
+                chunk = items[offset : offset + query_size]
+                entries.append(
+                    {
+                        "query_key": key,
+                        "query_type": "topic",
+                        "params": {"searchTerms": [key]},
+                        "item_count": len(chunk),
+                        "expires_at": expires,
+                    }
+                )
+                links.extend(
+                    {"query_key": key, "tweet_id": t["id"], "idx": idx}
+                    for idx, t in enumerate(chunk)
+                )
+            conn.execute(insert(QueryCacheEntry), entries)
+            conn.execute(insert(QueryCacheItem), links)
+            print(f"  loaded {min(n, start + batch):,}/{n:,}", end="\r", flush=True)
+    print()
+
+
+def table_sizes(db: Database, url: str) -> dict[str, int]:
+    tables = ["twitter_tweets", "twitter_tweet_raw"]
+    with db.engine.connect() as conn:
+        if url.startswith("postgresql"):
+            return {
+                t: conn.execute(
+                    text("SELECT pg_total_relation_size(:t)"), {"t": t}
+                ).scalar_one()
+                for t in tables
+            }
+        try:
+            return {
+                t: conn.execute(
+                    text("SELECT SUM(pgsize) FROM dbstat WHERE name = :t"), {"t": t}
+                ).scalar_one()
+                or 0
+                for t in tables
+            }
+        except Exception:
+            path = Path(url.removeprefix("sqlite:///"))
+            return {"database_file": path.stat().st_size}
+
+
+def read_latency(
+    db: Database, n_queries: int, samples: int, output_format: str
+) -> dict[str, float]:
+    rng = random.Random(7)
+    with db.Session() as session:
+        keys = [k for (k,) in session.query(QueryCacheEntry.query_key).limit(n_queries)]
+    timings = []
+    payload_bytes = 0
+    for key in rng.choices(keys, k=samples):
+        t0 = time.perf_counter()
+        items = db.get_cached_query(key, output_format)  # type: ignore[arg-type]
+        timings.append((time.perf_counter() - t0) * 1000)
+        payload_bytes += len(json.dumps(items))
+    timings.sort()
+    return {
+        "p50_ms": statistics.median(timings),
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+        "avg_payload_kb": payload_bytes / samples / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tweets", type=int, default=1_000_000)
+    parser.add_argument("--query-size", type=int, default=100)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--db-url", default=None, help="Reused for both modes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("inline", "compressed"):
+            db, url = open_db(args.db_url, Path(tmp), mode)
+            print(f"[{mode}] loading {args.tweets:,} tweets")
+            t0 = time.perf_counter()
+            load(db, args.tweets, args.query_size)
+            print(f"[{mode}] load: {time.perf_counter() - t0:.1f}s")
+            for table, size in table_sizes(db, url).items():
+                print(f"[{mode}] size {table}: {size / 1024 / 1024:.1f} MiB")
+            for fmt in ("min", "max"):
+                stats = read_latency(
+                    db, args.tweets // args.query_size, args.samples, fmt
+                )
+                print(
+                    f"[{mode}] read {fmt}: p50={stats['p50_ms']:.2f}ms "
+                    f"p95={stats['p95_ms']:.2f}ms "
+                    f"payload={stats['avg_payload_kb']:.1f}KiB"
+                )
+            db.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,14 @@ Provides Postgres-backed caching to replace file-based results storage.
 from __future__ import annotations
 
 from .database import Database, generate_query_key, get_db_instance
-from .models import Base, QueryCacheEntry, QueryCacheItem, Tweet, TweetAuthor
+from .models import (
+    Base,
+    QueryCacheEntry,
+    QueryCacheItem,
+    Tweet,
+    TweetAuthor,
+    TweetRawPayload,
+)
 
 __all__ = [
     "Base",
@@ -16,6 +23,7 @@ __all__ = [
     "QueryCacheItem",
     "Tweet",
     "TweetAuthor",
+    "TweetRawPayload",
     "generate_query_key",
     "get_db_instance",
 ]
@@ -13,16 +13,24 @@ import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, func, null, text
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, joinedload, selectinload, sessionmaker
 
 from mcp_twitter.config import AppSettings
 
 logger = logging.getLogger(__name__)
 from mcp_twitter.twitter import OutputFormat, QueryType
 
-from .models import Base, QueryCacheEntry, QueryCacheItem, Tweet, TweetAuthor
+from .models import (
+    Base,
+    QueryCacheEntry,
+    QueryCacheItem,
+    Tweet,
+    TweetAuthor,
+    TweetRawPayload,
+)
+from .raw_store import decode_raw, encode_raw, resolve_codec
 
 log = logging.getLogger("mcp_twitter.db")
 
@@ -65,11 +73,16 @@ class Database:
     Handles connection, table creation, and cache operations.
     """
 
+    # Raw payload storage mode (see DatabaseConfig.raw_storage)
+    raw_storage: str = "inline"
+    raw_codec: str = "gzip"
+
     def __init__(
         self,
         db_url: str | None = None,
         max_retries: int = 30,
         retry_delay: int = 2,
+        raw_storage: str | None = None,
     ):
         """
         Initialize database connection with retry logic.
@@ -78,10 +91,14 @@ class Database:
             db_url: Optional database URL. If None, reads from DatabaseConfig
             max_retries: Maximum number of connection retry attempts
             retry_delay: Initial delay between retries in seconds (exponential backoff)
+            raw_storage: Raw payload storage mode (inline/compressed). If None,
+                reads from DatabaseConfig
 
         """
+        settings = AppSettings()
+        self.raw_storage = raw_storage or settings.database.raw_storage
+        self.raw_codec = resolve_codec(settings.database.raw_codec)
         if db_url is None:
-            settings = AppSettings()
             db_url = settings.database.DATABASE_URL
             if not db_url:
                 raise RuntimeError(
@@ -191,7 +208,11 @@ class Database:
             return 1800  # Default 30 minutes
 
     def get_cached_query(
-        self, query_key: str, output_format: OutputFormat = "min"
+        self,
+        query_key: str,
+        output_format: OutputFormat = "min",
+        allow_expired: bool = False,
+        max_stale_seconds: float | None = None,
     ) -> list[dict[str, Any]] | None:
         """
         Retrieve cached query results if valid (not expired).
@@ -199,6 +220,10 @@ class Database:
         Args:
             query_key: Query cache key (hash)
             output_format: Desired output format (min/max)
+            allow_expired: Also return expired entries (used as the base for
+                incremental refreshes)
+            max_stale_seconds: Also return entries that expired at most this many
+                seconds ago (stale-while-revalidate)
 
         Returns:
             List of tweet dicts if cache hit and valid, None if miss or expired
@@ -222,97 +247,207 @@ class Database:
             expires_at = entry.expires_at
             if expires_at.tzinfo is None:
                 expires_at = expires_at.replace(tzinfo=UTC)
-            if expires_at < now:
-                log.debug(f"Cache expired for query_key={query_key[:16]}...")
-                return None
+            if expires_at < now and not allow_expired:
+                stale_for = (now - expires_at).total_seconds()
+                if max_stale_seconds is None or stale_for > max_stale_seconds:
+                    log.debug(f"Cache expired for query_key={query_key[:16]}...")
+                    return None
 
-            # Load tweets with relationship
-            cache_items = (
-                session.query(QueryCacheItem)
+            # Load ordered tweets (with authors) in one query
+            query = (
+                session.query(Tweet)
+                .join(QueryCacheItem, QueryCacheItem.tweet_id == Tweet.id)
+                .options(joinedload(Tweet.author))
                 .filter(QueryCacheItem.query_key == query_key)
                 .order_by(QueryCacheItem.idx)
-                .all()
             )
+            if output_format == "max":
+                query = query.options(selectinload(Tweet.raw_payload))
+            tweets = [self._tweet_to_dict(t, output_format) for t in query.all()]
 
-            if not cache_items:
+            if not tweets:
                 log.debug(f"No cache items found for query_key={query_key[:16]}...")
                 return []
 
-            # Build result list
-            tweets = []
-            for item in cache_items:
-                # Load tweet explicitly (in case of lazy loading issues)
-                tweet = session.query(Tweet).filter(Tweet.id == item.tweet_id).first()
-                if not tweet:
-                    log.warning(
-                        f"Tweet {item.tweet_id} not found for cache item {item.id}"
-                    )
-                    continue
-                if output_format == "min":
-                    # Return minimized format
-                    tweet_dict = {
-                        "id": tweet.id,
-                        "url": tweet.url,
-                        "text": tweet.text,
-                        "fullText": tweet.full_text,
-                        "retweetCount": tweet.retweet_count,
-                        "replyCount": tweet.reply_count,
-                        "likeCount": tweet.like_count,
-                        "quoteCount": tweet.quote_count,
-                        "viewCount": tweet.view_count,
-                        "createdAt": tweet.created_at.isoformat()
-                        if tweet.created_at
-                        else None,
-                    }
-                    tweet_dict = {k: v for k, v in tweet_dict.items() if v is not None}
-
-                    # Add author if available
-                    if tweet.author:
-                        author_dict = {
-                            "id": tweet.author.id,
-                            "userName": tweet.author.username,
-                            "name": tweet.author.name,
-                            "url": tweet.author.url,
-                        }
-                        author_dict = {
-                            k: v for k, v in author_dict.items() if v is not None
-                        }
-                        tweet_dict["author"] = author_dict
-                else:
-                    # Return max format (raw_data if available, otherwise reconstruct)
-                    if tweet.raw_data:
-                        tweet_dict = tweet.raw_data.copy()
-                    else:
-                        # Reconstruct from normalized fields
-                        tweet_dict = {
-                            "id": tweet.id,
-                            "url": tweet.url,
-                            "text": tweet.text,
-                            "fullText": tweet.full_text,
-                            "retweetCount": tweet.retweet_count,
-                            "replyCount": tweet.reply_count,
-                            "likeCount": tweet.like_count,
-                            "quoteCount": tweet.quote_count,
-                            "viewCount": tweet.view_count,
-                            "createdAt": tweet.created_at.isoformat()
-                            if tweet.created_at
-                            else None,
-                        }
-                        if tweet.author:
-                            tweet_dict["author"] = {
-                                "id": tweet.author.id,
-                                "userName": tweet.author.username,
-                                "name": tweet.author.name,
-                                "url": tweet.author.url,
-                            }
-
-                tweets.append(tweet_dict)
-
             log.info(
                 f"Cache hit for query_key={query_key[:16]}... ({len(tweets)} items)"
             )
             return tweets
 
+    def get_cached_queries(
+        self, query_keys: list[str], output_format: OutputFormat = "min"
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Retrieve several cached queries with a single round-trip.
+
+        Entries, their ordered cache items and tweets (with authors) are loaded in
+        one joined SELECT, so a batch of N queries costs one query instead of N.
+
+        Args:
+            query_keys: Query cache keys (hashes) to look up
+            output_format: Desired output format (min/max)
+
+        Returns:
+            Mapping of query_key -> tweet dicts for every valid (not expired) entry.
+            Keys that miss or have expired are absent from the mapping.
+
+        """
+        if not self.Session or not query_keys:
+            return {}
+
+        with self.Session() as session:
+            rows = (
+                session.query(QueryCacheEntry.query_key, QueryCacheEntry.expires_at, Tweet)
+                .outerjoin(
+                    QueryCacheItem, QueryCacheItem.query_key == QueryCacheEntry.query_key
+                )
+                .outerjoin(Tweet, Tweet.id == QueryCacheItem.tweet_id)
+                .options(joinedload(Tweet.author))
+                .filter(QueryCacheEntry.query_key.in_(set(query_keys)))
+                .order_by(QueryCacheEntry.query_key, QueryCacheItem.idx)
+            )
+            if output_format == "max":
+                rows = rows.options(selectinload(Tweet.raw_payload))
+            rows = rows.all()
+
+            now = datetime.now(UTC)
+            results: dict[str, list[dict[str, Any]]] = {}
+            for query_key, expires_at, tweet in rows:
+                # Handle SQLite which may return naive datetimes
+                if expires_at.tzinfo is None:
+                    expires_at = expires_at.replace(tzinfo=UTC)
+                if expires_at < now:
+                    continue
+                tweets = results.setdefault(query_key, [])
+                if tweet is not None:
+                    tweets.append(self._tweet_to_dict(tweet, output_format))
+
+            log.info(
+                f"Batch cache lookup: {len(results)}/{len(set(query_keys))} hits"
+            )
+            return results
+
+    def get_cache_expirations(self, query_keys: list[str]) -> dict[str, datetime]:
+        """
+        Get expiry times for cached queries (metadata only, no tweets).
+
+        Args:
+            query_keys: Query cache keys (hashes)
+
+        Returns:
+            Mapping of query_key -> expires_at for keys present in the cache
+
+        """
+        if not self.Session or not query_keys:
+            return {}
+
+        with self.Session() as session:
+            rows = (
+                session.query(QueryCacheEntry.query_key, QueryCacheEntry.expires_at)
+                .filter(QueryCacheEntry.query_key.in_(set(query_keys)))
+                .all()
+            )
+        expirations: dict[str, datetime] = {}
+        for query_key, expires_at in rows:
+            # Handle SQLite which may return naive datetimes
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=UTC)
+            expirations[query_key] = expires_at
+        return expirations
+
+    def get_latest_author_tweet(
+        self, query_key: str, username: str
+    ) -> tuple[str, datetime | None] | None:
+        """
+        Find the newest tweet by an author within a cached query.
+
+        Args:
+            query_key: Query cache key (hash) whose items are considered
+            username: Author username (case-insensitive, without @)
+
+        Returns:
+            (tweet_id, created_at) of the newest tweet, or None if there is none
+
+        """
+        if not self.Session:
+            return None
+
+        with self.Session() as session:
+            row = (
+                session.query(Tweet.id, Tweet.created_at)
+                .join(QueryCacheItem, QueryCacheItem.tweet_id == Tweet.id)
+                .join(TweetAuthor, TweetAuthor.id == Tweet.author_id)
+                .filter(QueryCacheItem.query_key == query_key)
+                .filter(func.lower(TweetAuthor.username) == username.lower())
+                .order_by(Tweet.created_at.desc().nulls_last(), Tweet.id.desc())
+                .first()
+            )
+            if row is None:
+                return None
+            tweet_id, created_at = row
+            if created_at is not None and created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=UTC)
+            return tweet_id, created_at
+
+    @staticmethod
+    def _tweet_to_dict(tweet: Tweet, output_format: OutputFormat) -> dict[str, Any]:
+        """Convert a stored tweet row to the min/max item shape returned by Apify."""
+        if output_format == "min":
+            # Return minimized format
+            tweet_dict = {
+                "id": tweet.id,
+                "url": tweet.url,
+                "text": tweet.text,
+                "fullText": tweet.full_text,
+                "retweetCount": tweet.retweet_count,
+                "replyCount": tweet.reply_count,
+                "likeCount": tweet.like_count,
+                "quoteCount": tweet.quote_count,
+                "viewCount": tweet.view_count,
+                "createdAt": tweet.created_at.isoformat() if tweet.created_at else None,
+            }
+            tweet_dict = {k: v for k, v in tweet_dict.items() if v is not None}
+
+            # Add author if available
+            if tweet.author:
+                author_dict = {
+                    "id": tweet.author.id,
+                    "userName": tweet.author.username,
+                    "name": tweet.author.name,
+                    "url": tweet.author.url,
+                }
+                author_dict = {k: v for k, v in author_dict.items() if v is not None}
+                tweet_dict["author"] = author_dict
+            return tweet_dict
+
+        # Return max format (raw payload if available, otherwise reconstruct)
+        if tweet.raw_data:
+            return tweet.raw_data.copy()
+        if tweet.raw_payload is not None:
+            return decode_raw(tweet.raw_payload.payload)
+
+        # Reconstruct from normalized fields
+        tweet_dict = {
+            "id": tweet.id,
+            "url": tweet.url,
+            "text": tweet.text,
+            "fullText": tweet.full_text,
+            "retweetCount": tweet.retweet_count,
+            "replyCount": tweet.reply_count,
+            "likeCount": tweet.like_count,
+            "quoteCount": tweet.quote_count,
+            "viewCount": tweet.view_count,
+            "createdAt": tweet.created_at.isoformat() if tweet.created_at else None,
+        }
+        if tweet.author:
+            tweet_dict["author"] = {
+                "id": tweet.author.id,
+                "userName": tweet.author.username,
+                "name": tweet.author.name,
+                "url": tweet.author.url,
+            }
+        return tweet_dict
+
     def save_query_cache(
         self,
         query_key: str,
@@ -370,6 +505,17 @@ class Database:
                 )
                 session.add(entry)
 
+            # Load the tweets being upserted in one query. Their raw payloads are
+            # only needed (and then eagerly loaded) for max format saves, where
+            # the loop checks whether a tweet already has one.
+            tweet_ids = {item["id"] for item in items if item.get("id")}
+            tweets_by_id: dict[str, Tweet] = {}
+            if tweet_ids:
+                existing = session.query(Tweet).filter(Tweet.id.in_(tweet_ids))
+                if output_format == "max":
+                    existing = existing.options(selectinload(Tweet.raw_payload))
+                tweets_by_id = {t.id: t for t in existing.all()}
+
             # Save tweets and link to cache
             for idx, item in enumerate(items):
                 tweet_id = item.get("id")
@@ -410,7 +556,7 @@ class Database:
                                 author.url = url
 
                 # Get or create tweet
-                tweet = session.query(Tweet).filter(Tweet.id == tweet_id).first()
+                tweet = tweets_by_id.get(tweet_id)
                 if not tweet:
                     tweet = Tweet(
                         id=tweet_id,
@@ -425,13 +571,19 @@ class Database:
                         view_count=item.get("viewCount"),
                         created_at=self._parse_twitter_date(item.get("createdAt")),
                         format=output_format,
-                        raw_data=item if output_format == "max" else None,
                     )
+                    if output_format == "max":
+                        self._store_raw(tweet, item)
                     session.add(tweet)
+                    tweets_by_id[tweet_id] = tweet
                 else:
                     # Update tweet if newer or if we have max format data
-                    if output_format == "max" and not tweet.raw_data:
-                        tweet.raw_data = item
+                    if (
+                        output_format == "max"
+                        and not tweet.raw_data
+                        and tweet.raw_payload is None
+                    ):
+                        self._store_raw(tweet, item)
                     if item.get("retweetCount") is not None:
                         tweet.retweet_count = item["retweetCount"]
                     if item.get("replyCount") is not None:
@@ -457,6 +609,64 @@ class Database:
                 f"expires_at={expires_at.isoformat()})"
             )
 
+    def _store_raw(self, tweet: Tweet, item: dict[str, Any]) -> None:
+        """Attach a max format payload to a tweet according to `raw_storage`."""
+        if self.raw_storage != "compressed":
+            tweet.raw_data = item
+            return
+        self._store_compressed(tweet, item)
+
+    def _store_compressed(self, tweet: Tweet, item: dict[str, Any]) -> None:
+        tweet.raw_payload = TweetRawPayload(
+            codec=self.raw_codec,
+            payload=encode_raw(item, self.raw_codec),
+            raw_size=len(json.dumps(item, ensure_ascii=False).encode("utf-8")),
+        )
+
+    def migrate_raw_payloads(self, batch_size: int = 500) -> int:
+        """
+        Move inline `raw_data` JSON into the compressed side table.
+
+        Safe to re-run and to interrupt: each batch is committed separately and
+        only tweets that still carry inline data are selected.
+
+        Args:
+            batch_size: Tweets converted per transaction
+
+        Returns:
+            Number of tweets migrated
+
+        """
+        if not self.Session:
+            raise RuntimeError("Database session not initialized")
+
+        migrated = 0
+        last_id = ""
+        while True:
+            with self.Session() as session:
+                tweets = (
+                    session.query(Tweet)
+                    .options(selectinload(Tweet.raw_payload))
+                    .filter(Tweet.raw_data.is_not(None), Tweet.id > last_id)
+                    .order_by(Tweet.id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not tweets:
+                    break
+                last_id = tweets[-1].id
+                for tweet in tweets:
+                    # Rows may hold a JSON null rather than SQL NULL
+                    if tweet.raw_data is None:
+                        continue
+                    if tweet.raw_payload is None:
+                        self._store_compressed(tweet, tweet.raw_data)
+                    tweet.raw_data = null()
+                    migrated += 1
+                session.commit()
+                log.info(f"Migrated {migrated} raw payloads to twitter_tweet_raw")
+        return migrated
+
     @staticmethod
     def _parse_twitter_date(date_str: str | None) -> datetime | None:
         """
@@ -15,6 +15,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     func,
@@ -99,7 +100,8 @@ class Tweet(Base):
 
     Supports both 'min' and 'max' output formats:
     - Common fields are stored as columns for efficient querying
-    - Full raw data is stored in `raw_data` JSON column (for max format)
+    - Full raw data is stored in `raw_data` JSON column (for max format), or
+      compressed in `twitter_tweet_raw` when `CACHE_RAW_STORAGE=compressed`
     - `format` indicates whether this was stored as min or max
 
     The same tweet can appear in multiple query cache entries (via QueryCacheItem).
@@ -144,7 +146,14 @@ class Tweet(Base):
     )  # 'min' or 'max'
     raw_data: Mapped[dict[str, Any] | None] = mapped_column(
         _json_type(), nullable=True
-    )  # Full tweet JSON for max format
+    )  # Full tweet JSON for max format (inline storage mode)
+    raw_payload: Mapped[TweetRawPayload | None] = relationship(
+        "TweetRawPayload",
+        back_populates="tweet",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="select",
+    )  # Compressed full tweet JSON (compressed storage mode), loaded on access
 
     # Relationship to query cache items
     cache_items: Mapped[list[QueryCacheItem]] = relationship(
@@ -152,6 +161,30 @@ class Tweet(Base):
     )
 
 
+class TweetRawPayload(Base):
+    """
+    Compressed raw tweet payload, kept out of the hot `twitter_tweets` rows.
+
+    `payload` is produced by `db.raw_store.encode_raw` and is only read when a
+    caller asks for max format items.
+    """
+
+    __tablename__ = "twitter_tweet_raw"
+
+    tweet_id: Mapped[str] = mapped_column(
+        String(64),
+        ForeignKey("twitter_tweets.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    codec: Mapped[str] = mapped_column(String(8), nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    raw_size: Mapped[int] = mapped_column(
+        Integer, nullable=False
+    )  # Uncompressed JSON size in bytes
+
+    tweet: Mapped[Tweet] = relationship("Tweet", back_populates="raw_payload")
+
+
 class QueryCacheItem(Base):
     """
     Links tweets to query cache entries (many-to-many).
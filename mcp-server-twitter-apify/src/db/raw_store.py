@@ -0,0 +1,65 @@
+"""
+Compressed encoding for raw (max format) tweet payloads.
+
+Main responsibility: Serialize full Apify tweet dicts to compact, self-describing
+byte blobs for the `twitter_tweet_raw` side table, and decode them back on demand.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any, Literal
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+RawCodec = Literal["gzip", "zstd"]
+
+# One-byte header so stored payloads stay readable if the configured codec changes
+_CODEC_HEADERS: dict[RawCodec, bytes] = {"gzip": b"g", "zstd": b"z"}
+_HEADER_CODECS = {v: k for k, v in _CODEC_HEADERS.items()}
+
+
+def resolve_codec(codec: str) -> RawCodec:
+    """Return the codec to write with, falling back to gzip if zstd is unavailable."""
+    if codec == "zstd" and zstandard is not None:
+        return "zstd"
+    return "gzip"
+
+
+def encode_raw(item: dict[str, Any], codec: RawCodec = "gzip") -> bytes:
+    """
+    Compress a raw tweet dict.
+
+    Args:
+        item: Full tweet dict as returned by the actor
+        codec: Compression codec (see `resolve_codec`)
+
+    Returns:
+        Header byte followed by the compressed compact JSON
+
+    """
+    data = json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd codec requires the 'zstandard' package")
+        return _CODEC_HEADERS["zstd"] + zstandard.ZstdCompressor(level=3).compress(data)
+    return _CODEC_HEADERS["gzip"] + gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def decode_raw(payload: bytes) -> dict[str, Any]:
+    """Decompress a payload produced by `encode_raw`."""
+    codec = _HEADER_CODECS.get(payload[:1])
+    body = payload[1:]
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd payload requires the 'zstandard' package")
+        data = zstandard.ZstdDecompressor().decompress(body)
+    elif codec == "gzip":
+        data = gzip.decompress(body)
+    else:
+        raise ValueError(f"Unknown raw payload header: {payload[:1]!r}")
+    return json.loads(data)
@@ -5,8 +5,12 @@ Main responsibility: Define an example paid admin REST endpoint that demonstrate
 """
 
 import logging
+from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from mcp_twitter.dependencies import get_cache_warmer
+from mcp_twitter.twitter import CacheWarmer
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -43,3 +47,29 @@ async def get_admin_logs():
             },
         ]
     }
+
+
+@router.get(
+    "/admin/cache-warmer",
+    tags=["Admin"],
+    # Priced in `tool_pricing.yaml` like `get_admin_logs`: the x402 middleware
+    # only lets paid requests through.
+    operation_id="get_cache_warmer_status",
+)
+async def get_cache_warmer_status(
+    warmer: CacheWarmer | None = Depends(get_cache_warmer),
+) -> dict[str, Any]:
+    """
+    Lists queries scheduled for proactive cache refresh and their hit-rate impact.
+
+    This is a premium endpoint that requires x402 payment. Queries are ranked by
+    decayed request count and identified by cache key only, without their
+    search parameters; `hit_rate_without_warmer` estimates the hit rate had
+    warmed and stale-served requests been misses.
+    """
+    if warmer is None:
+        return {
+            "enabled": False,
+            "message": "Cache warmer disabled; set CACHE_WARMER_ENABLED=true",
+        }
+    return warmer.status()
@@ -47,6 +47,10 @@ async def app_lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Lifespan: Database cache not available: {e}")
 
+    cache_warmer = DependencyContainer.get_cache_warmer()
+    if cache_warmer is not None:
+        await cache_warmer.start()
+
     logger.info("Lifespan: Services initialized successfully.")
     yield
     logger.info("Lifespan: Shutting down application services...")
@@ -40,6 +40,10 @@ class ApifyConfig(BaseModel):
         "apidojo/twitter-scraper-lite",  # Default fallback
     )
 
+    # Upper bound on concurrent actor runs across batch requests and the cache
+    # warmer (Apify rate limits)
+    max_concurrent_runs: int = int(os.getenv("APIFY_MAX_CONCURRENT_RUNS", "5"))
+
 
 class DatabaseConfig(BaseModel):
     """Database configuration for Postgres cache."""
@@ -65,6 +69,53 @@ class DatabaseConfig(BaseModel):
     cache_ttl_profile: int = int(os.getenv("CACHE_TTL_PROFILE", "1800"))  # 30 min
     cache_ttl_replies: int = int(os.getenv("CACHE_TTL_REPLIES", "3600"))  # 1 hour
 
+    # Refresh expired profile queries by fetching only tweets newer than the cache
+    incremental_profile_refresh: bool = os.getenv(
+        "CACHE_INCREMENTAL_PROFILE_REFRESH", "true"
+    ).lower() in ("1", "true", "yes")
+
+    # Where max format raw payloads live: `inline` keeps them in the
+    # twitter_tweets.raw_data JSON column, `compressed` moves them to the
+    # twitter_tweet_raw side table and loads them only for max format reads
+    raw_storage: Literal["inline", "compressed"] = (
+        "compressed"
+        if os.getenv("CACHE_RAW_STORAGE", "inline").lower() == "compressed"
+        else "inline"
+    )
+    # Compression codec for the side table (zstd needs the `zstandard` package)
+    raw_codec: Literal["gzip", "zstd"] = (
+        "zstd" if os.getenv("CACHE_RAW_CODEC", "gzip").lower() == "zstd" else "gzip"
+    )
+
+
+class CacheWarmerConfig(BaseModel):
+    """Background refresh of popular cached queries before they expire."""
+
+    enabled: bool = os.getenv("CACHE_WARMER_ENABLED", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    # Number of most-requested queries kept warm
+    top_n: int = int(os.getenv("CACHE_WARMER_TOP_N", "10"))
+    # Scheduler tick and how long before expiry a query is refreshed
+    interval_seconds: int = int(os.getenv("CACHE_WARMER_INTERVAL_SECONDS", "60"))
+    refresh_ahead_seconds: int = int(
+        os.getenv("CACHE_WARMER_REFRESH_AHEAD_SECONDS", "120")
+    )
+    # Concurrency and cost budget for warmer-initiated actor runs
+    max_concurrency: int = int(os.getenv("CACHE_WARMER_MAX_CONCURRENCY", "2"))
+    max_refreshes_per_hour: int = int(
+        os.getenv("CACHE_WARMER_MAX_REFRESHES_PER_HOUR", "30")
+    )
+    # How long past expiry a warmed query may be served while it is refreshed
+    stale_grace_seconds: int = int(os.getenv("CACHE_STALE_GRACE_SECONDS", "300"))
+    # Popularity tracking: bounded table with exponential decay
+    max_tracked_queries: int = int(os.getenv("CACHE_WARMER_MAX_TRACKED", "1000"))
+    popularity_half_life_seconds: int = int(
+        os.getenv("CACHE_WARMER_HALF_LIFE_SECONDS", "3600")
+    )
+
 
 class AppSettings(BaseSettings):
     """Application settings for the MCP Twitter scraper CLI."""
@@ -76,6 +127,7 @@ class AppSettings(BaseSettings):
 
     apify: ApifyConfig = ApifyConfig()
     database: DatabaseConfig = DatabaseConfig()
+    cache_warmer: CacheWarmerConfig = CacheWarmerConfig()
 
     model_config = SettingsConfigDict(
         env_file=_env_file,
@@ -1,6 +1,12 @@
 import logging
 
-from mcp_twitter.twitter import QueryRegistry, TwitterScraper, build_default_registry
+from mcp_twitter.config import get_app_settings
+from mcp_twitter.twitter import (
+    CacheWarmer,
+    QueryRegistry,
+    TwitterScraper,
+    build_default_registry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +34,7 @@ class DependencyContainer:
 
     _registry: QueryRegistry | None = None
     _scraper: TwitterScraper | None = None
+    _cache_warmer: CacheWarmer | None = None
 
     @classmethod
     def initialize(cls, apify_token: str, actor_name: str) -> None:
@@ -52,6 +59,14 @@ class DependencyContainer:
             use_cache=True,  # Enable database cache
         )
 
+        warmer_config = get_app_settings().cache_warmer
+        if warmer_config.enabled:
+            cls._cache_warmer = CacheWarmer(
+                config=warmer_config,
+                apify_token=apify_token,
+                actor_name=actor_name,
+            )
+
         logger.info("Dependencies initialized successfully.")
 
     @classmethod
@@ -63,6 +78,9 @@ class DependencyContainer:
         """
         logger.info("Shutting down dependencies...")
 
+        if cls._cache_warmer is not None:
+            await cls._cache_warmer.stop()
+            cls._cache_warmer = None
         cls._scraper = None
         cls._registry = None
 
@@ -100,7 +118,18 @@ class DependencyContainer:
             )
         return cls._scraper
 
+    @classmethod
+    def get_cache_warmer(cls) -> CacheWarmer | None:
+        """
+        Get the CacheWarmer instance, or None if cache warming is disabled.
+
+        Used as a FastAPI dependency by the paid admin status endpoint
+        (`get_cache_warmer_status` in `api_routers/admin.py`).
+        """
+        return cls._cache_warmer
+
 
 # Alias the class methods for use as FastAPI dependencies
 get_registry = DependencyContainer.get_registry
 get_scraper = DependencyContainer.get_scraper
+get_cache_warmer = DependencyContainer.get_cache_warmer
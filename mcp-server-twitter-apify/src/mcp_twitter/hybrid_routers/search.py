@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 from datetime import date
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
 from mcp_twitter.dependencies import get_registry, get_scraper
@@ -17,6 +19,7 @@ from mcp_twitter.twitter import (
     create_profile_query,
     create_replies_query,
     create_topic_query,
+    iter_profile_batch,
 )
 from mcp_twitter.twitter import scraper as scraper_mod
 from mcp_twitter.twitter.registry import QueryRegistry
@@ -31,11 +34,8 @@ def _run_query_and_read(
     temp_scraper: TwitterScraper, query: QueryDefinition
 ) -> list[dict[str, Any]]:
     """Run query and return items directly from scraper (which uses DB cache)."""
-    temp_scraper.run_query(query)
-    items = temp_scraper.get_last_items()
-    if items is None:
-        return []
-    return [i for i in items if isinstance(i, dict)]
+    result = temp_scraper.run_query(query)
+    return [i for i in result.items if isinstance(i, dict)]
 
 
 # Request Models
@@ -433,25 +433,10 @@ async def search_replies(
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}") from e
 
 
-@router.post(
-    "/v1/search/profile/batch",
-    tags=["Search"],
-    operation_id="search_profile_batch",
-    response_model=list[ProfileBatchResult],
-)
-async def search_profile_batch(
-    request: ProfileBatchSearchRequest,
-    scraper: TwitterScraper = Depends(get_scraper),
-    timeout_seconds: int = Query(
-        DEFAULT_TIMEOUT_SECONDS,
-        ge=1,
-        le=3600,
-        description="Max time to wait for the batch to finish (seconds).",
-    ),
-) -> list[ProfileBatchResult]:
-    """Search tweets from multiple user profiles in one request (looping per username)."""
+def _normalize_usernames(raw_usernames: list[str]) -> list[str]:
+    """Split comma-separated entries and strip '@' prefixes."""
     usernames: list[str] = []
-    for raw in request.usernames:
+    for raw in raw_usernames:
         if not raw:
             continue
         parts = [p.strip() for p in raw.split(",")]
@@ -464,77 +449,128 @@ async def search_profile_batch(
             status_code=422,
             detail="usernames must contain at least one non-empty username",
         )
-
+    return usernames
+
+
+async def _execute_profile_batch(
+    queries: list[tuple[str, QueryDefinition]],
+    scraper: TwitterScraper,
+    *,
+    output_format: OutputFormat,
+    continue_on_error: bool,
+    timeout_seconds: int,
+    stream: bool,
+    label: str,
+) -> list[ProfileBatchResult] | StreamingResponse:
+    """
+    Run a profile batch concurrently and shape the response.
+
+    Non-streaming responses keep the request order. Streaming responses emit one
+    NDJSON line per username as soon as it finishes.
+    """
     temp_scraper = scraper_mod.TwitterScraper(
         apify_token=scraper.apify_token,
         results_dir=None,
         actor_name=scraper.actor_id,
-        output_format=request.output_format,
+        output_format=output_format,
         use_cache=True,
     )
-
-    results: list[ProfileBatchResult] = []
-    # Calculate timeout per username (distribute total timeout across all usernames)
-    timeout_per_username = (
-        max(1, timeout_seconds // len(usernames)) if usernames else timeout_seconds
+    outcomes = iter_profile_batch(
+        temp_scraper, queries, timeout_seconds=timeout_seconds
     )
 
-    for username in usernames:
-        try:
-            logger.info(
-                "profile batch item start user=%r max_items=%s since=%r until=%r lang=%s format=%s timeout=%ss",
-                username,
-                request.max_items,
-                request.since,
-                request.until,
-                request.lang,
-                request.output_format,
-                timeout_per_username,
+    if stream:
+
+        async def ndjson_lines() -> AsyncIterator[str]:
+            try:
+                async for _, outcome in outcomes:
+                    result = ProfileBatchResult(
+                        username=outcome.username,
+                        items=outcome.items,
+                        error=outcome.error,
+                    )
+                    yield result.model_dump_json() + "\n"
+                    if outcome.error is not None and not continue_on_error:
+                        break
+            finally:
+                # Cancel the remaining runs now rather than when garbage collected
+                await outcomes.aclose()
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    results: list[ProfileBatchResult | None] = [None] * len(queries)
+    async for idx, outcome in outcomes:
+        if outcome.error is not None and not continue_on_error:
+            await outcomes.aclose()
+            if outcome.timed_out:
+                raise HTTPException(
+                    status_code=504,
+                    detail=f"{label} timed out for username={outcome.username!r} after {timeout_seconds} seconds",
+                )
+            raise HTTPException(
+                status_code=500,
+                detail=f"{label} failed for username={outcome.username!r}: {outcome.error}",
             )
-            query = create_profile_query(
+        results[idx] = ProfileBatchResult(
+            username=outcome.username, items=outcome.items, error=outcome.error
+        )
+    return [r for r in results if r is not None]
+
+
+@router.post(
+    "/v1/search/profile/batch",
+    tags=["Search"],
+    operation_id="search_profile_batch",
+    response_model=list[ProfileBatchResult],
+)
+async def search_profile_batch(
+    request: ProfileBatchSearchRequest,
+    scraper: TwitterScraper = Depends(get_scraper),
+    timeout_seconds: int = Query(
+        DEFAULT_TIMEOUT_SECONDS,
+        ge=1,
+        le=3600,
+        description="Max time to wait for the batch to finish (seconds).",
+    ),
+    stream: bool = Query(
+        False,
+        description="Stream NDJSON results per username as they finish.",
+    ),
+) -> list[ProfileBatchResult] | StreamingResponse:
+    """Search tweets from multiple user profiles in one request (concurrently per username)."""
+    usernames = _normalize_usernames(request.usernames)
+    logger.info(
+        "profile batch start users=%d max_items=%s since=%r until=%r lang=%s format=%s timeout=%ss",
+        len(usernames),
+        request.max_items,
+        request.since,
+        request.until,
+        request.lang,
+        request.output_format,
+        timeout_seconds,
+    )
+    queries = [
+        (
+            username,
+            create_profile_query(
                 username,
                 max_items=request.max_items,
                 since=request.since.isoformat() if request.since else None,
                 until=request.until.isoformat() if request.until else None,
                 lang=request.lang,
-            )
-            items = await asyncio.wait_for(
-                asyncio.to_thread(_run_query_and_read, temp_scraper, query),
-                timeout=timeout_per_username,
-            )
-            results.append(
-                ProfileBatchResult(username=username, items=items, error=None)
-            )
-        except TimeoutError:
-            logger.error(
-                "profile batch item timeout user=%r timeout=%ss",
-                username,
-                timeout_per_username,
-            )
-            if not request.continue_on_error:
-                raise HTTPException(
-                    status_code=504,
-                    detail=f"Batch search timed out for username={username!r} after {timeout_per_username} seconds",
-                )
-            results.append(
-                ProfileBatchResult(
-                    username=username,
-                    items=[],
-                    error=f"Timeout after {timeout_per_username} seconds",
-                )
-            )
-        except Exception as e:
-            logger.exception("profile batch item failed user=%r error=%s", username, e)
-            if not request.continue_on_error:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Batch search failed for username={username!r}: {str(e)}",
-                ) from e
-            results.append(
-                ProfileBatchResult(username=username, items=[], error=str(e))
-            )
-
-    return results
+            ),
+        )
+        for username in usernames
+    ]
+    return await _execute_profile_batch(
+        queries,
+        scraper,
+        output_format=request.output_format,
+        continue_on_error=request.continue_on_error,
+        timeout_seconds=timeout_seconds,
+        stream=stream,
+        label="Batch search",
+    )
 
 
 @router.post(
@@ -552,93 +588,43 @@ async def search_profile_latest_batch(
         le=3600,
         description="Max time to wait for the batch to finish (seconds).",
     ),
-) -> list[ProfileBatchResult]:
-    """Get the latest tweets from multiple user profiles in one request (looping per username)."""
-    usernames: list[str] = []
-    for raw in request.usernames:
-        if not raw:
-            continue
-        parts = [p.strip() for p in raw.split(",")]
-        for p in parts:
-            if not p:
-                continue
-            usernames.append(p.lstrip("@").strip())
-    if not usernames:
-        raise HTTPException(
-            status_code=422,
-            detail="usernames must contain at least one non-empty username",
-        )
-
-    temp_scraper = scraper_mod.TwitterScraper(
-        apify_token=scraper.apify_token,
-        results_dir=None,
-        actor_name=scraper.actor_id,
-        output_format=request.output_format,
-        use_cache=True,
-    )
-
-    results: list[ProfileBatchResult] = []
-    # Calculate timeout per username (distribute total timeout across all usernames)
-    timeout_per_username = (
-        max(1, timeout_seconds // len(usernames)) if usernames else timeout_seconds
+    stream: bool = Query(
+        False,
+        description="Stream NDJSON results per username as they finish.",
+    ),
+) -> list[ProfileBatchResult] | StreamingResponse:
+    """Get the latest tweets from multiple user profiles in one request (concurrently per username)."""
+    usernames = _normalize_usernames(request.usernames)
+    logger.info(
+        "profile latest batch start users=%d max_items=%s lang=%s format=%s timeout=%ss",
+        len(usernames),
+        request.max_items,
+        request.lang,
+        request.output_format,
+        timeout_seconds,
     )
-
-    for username in usernames:
-        try:
-            logger.info(
-                "profile latest batch item start user=%r max_items=%s lang=%s format=%s timeout=%ss",
-                username,
-                request.max_items,
-                request.lang,
-                request.output_format,
-                timeout_per_username,
-            )
-            query = create_profile_query(
+    queries = [
+        (
+            username,
+            create_profile_query(
                 username,
                 max_items=request.max_items,
                 since=None,
                 until=None,
                 lang=request.lang,
-            )
-            items = await asyncio.wait_for(
-                asyncio.to_thread(_run_query_and_read, temp_scraper, query),
-                timeout=timeout_per_username,
-            )
-            results.append(
-                ProfileBatchResult(username=username, items=items, error=None)
-            )
-        except TimeoutError:
-            logger.error(
-                "profile latest batch item timeout user=%r timeout=%ss",
-                username,
-                timeout_per_username,
-            )
-            if not request.continue_on_error:
-                raise HTTPException(
-                    status_code=504,
-                    detail=f"Batch latest search timed out for username={username!r} after {timeout_per_username} seconds",
-                )
-            results.append(
-                ProfileBatchResult(
-                    username=username,
-                    items=[],
-                    error=f"Timeout after {timeout_per_username} seconds",
-                )
-            )
-        except Exception as e:
-            logger.exception(
-                "profile latest batch item failed user=%r error=%s", username, e
-            )
-            if not request.continue_on_error:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Batch latest search failed for username={username!r}: {str(e)}",
-                ) from e
-            results.append(
-                ProfileBatchResult(username=username, items=[], error=str(e))
-            )
-
-    return results
+            ),
+        )
+        for username in usernames
+    ]
+    return await _execute_profile_batch(
+        queries,
+        scraper,
+        output_format=request.output_format,
+        continue_on_error=request.continue_on_error,
+        timeout_seconds=timeout_seconds,
+        stream=stream,
+        label="Batch latest search",
+    )
 
 
 @router.post(
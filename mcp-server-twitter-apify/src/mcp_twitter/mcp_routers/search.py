@@ -32,11 +32,8 @@ def _run_query_and_read(
     temp_scraper: TwitterScraper, query: QueryDefinition
 ) -> list[dict[str, Any]]:
     """Run query and return items directly from scraper (which uses DB cache)."""
-    temp_scraper.run_query(query)
-    items = temp_scraper.get_last_items()
-    if items is None:
-        return []
-    return [i for i in items if isinstance(i, dict)]
+    result = temp_scraper.run_query(query)
+    return [i for i in result.items if isinstance(i, dict)]
 
 
 # Request Models (same as hybrid routers)
@@ -4,6 +4,7 @@ This module should be changed to fit your domain-specific service layer, using i
 Main responsibility: Provide a public facade for the twitter service by re-exporting the client, configuration helpers, error types, and data models.
 """
 
+from mcp_twitter.twitter.batch import ProfileBatchOutcome, iter_profile_batch
 from mcp_twitter.twitter.config import TwitterConfig, get_twitter_config
 from mcp_twitter.twitter.errors import (
                                         TwitterApiError,
@@ -15,6 +16,7 @@ from mcp_twitter.twitter.models import (
                                         OutputFormat,
                                         QueryDefinition,
                                         QueryType,
+                                        ScrapeResult,
                                         SortOrder,
                                         TwitterScraperInput,
 )
@@ -27,6 +29,11 @@ from mcp_twitter.twitter.queries import (
 )
 from mcp_twitter.twitter.registry import QueryRegistry
 from mcp_twitter.twitter.scraper import TwitterScraper
+from mcp_twitter.twitter.warmer import (
+                                        CacheWarmer,
+                                        QueryPopularityTracker,
+                                        get_query_tracker,
+)
 
 __all__ = [
     "TwitterClient",
@@ -44,10 +51,16 @@ __all__ = [
     "TwitterScraperInput",
     "QueryDefinition",
     "MinimalTweet",
+    "ScrapeResult",
     "QueryRegistry",
     "build_default_registry",
     "create_profile_query",
     "create_replies_query",
     "create_topic_query",
     "TwitterScraper",
+    "ProfileBatchOutcome",
+    "iter_profile_batch",
+    "CacheWarmer",
+    "QueryPopularityTracker",
+    "get_query_tracker",
 ]
@@ -0,0 +1,183 @@
+"""
+Bounded-concurrency execution of batched profile queries.
+
+Main responsibility: Run many per-username queries concurrently under the
+process-wide actor run limiter, resolving cache hits for the whole batch up front
+and yielding per-username outcomes as soon as each one finishes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import weakref
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from mcp_twitter.config import get_app_settings
+from mcp_twitter.twitter.models import QueryDefinition
+from mcp_twitter.twitter.scraper import TwitterScraper
+
+logger = logging.getLogger(__name__)
+
+# Apify run slots shared by every batch request and the cache warmer. Keyed by
+# event loop because a semaphore cannot be shared across loops.
+_run_limiters: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def get_actor_run_limiter() -> asyncio.Semaphore:
+    """Process-wide limiter of `APIFY_MAX_CONCURRENT_RUNS` concurrent actor runs."""
+    loop = asyncio.get_running_loop()
+    limiter = _run_limiters.get(loop)
+    if limiter is None:
+        max_runs = get_app_settings().apify.max_concurrent_runs
+        limiter = _run_limiters[loop] = asyncio.Semaphore(max(1, max_runs))
+    return limiter
+
+
+@dataclass
+class ProfileBatchOutcome:
+    """Result of a single username within a batch."""
+
+    username: str
+    items: list[dict[str, Any]] = field(default_factory=list)
+    error: str | None = None
+    timed_out: bool = False
+    cached: bool = False
+
+
+def _run_uncached(
+    scraper: TwitterScraper, query: QueryDefinition, timeout_secs: int
+) -> list[dict[str, Any]]:
+    """Run a query the batch already knows is a cache miss."""
+    result = scraper.run_query(
+        query, skip_cache_lookup=True, timeout_secs=timeout_secs
+    )
+    return [i for i in result.items if isinstance(i, dict)]
+
+
+def _release_when_done(
+    semaphore: asyncio.Semaphore,
+) -> Callable[[asyncio.Future[Any]], None]:
+    """Done-callback that frees a slot and consumes the abandoned run's result."""
+
+    def release(work: asyncio.Future[Any]) -> None:
+        semaphore.release()
+        if not work.cancelled() and work.exception() is not None:
+            logger.warning(
+                "profile batch run finished after timeout with error: %s",
+                work.exception(),
+            )
+
+    return release
+
+
+async def iter_profile_batch(
+    scraper: TwitterScraper,
+    queries: Sequence[tuple[str, QueryDefinition]],
+    *,
+    timeout_seconds: float,
+    limiter: asyncio.Semaphore | None = None,
+) -> AsyncIterator[tuple[int, ProfileBatchOutcome]]:
+    """
+    Run profile queries concurrently and yield outcomes in completion order.
+
+    Cache hits for the whole batch are resolved with a single lookup before any
+    actor run starts; only misses go to Apify, each holding a slot of `limiter`.
+    The timeout is a deadline for the whole batch, and a username that cannot
+    finish before it is reported as timed out without affecting the others.
+    Each actor run gets the remaining time as its Apify run timeout, so the
+    platform aborts a run the batch has given up on. Its thread cannot be
+    interrupted from here, so it keeps its concurrency slot until it returns;
+    the limit bounds the actor runs actually in flight, not just those awaited.
+
+    Args:
+        scraper: Scraper configured for this request (shared by all runs)
+        queries: (username, query) pairs in request order
+        timeout_seconds: Deadline for the whole batch in seconds
+        limiter: Actor run slots (defaults to the process-wide limiter, shared
+            with other batches and the cache warmer)
+
+    Yields:
+        (index into `queries`, outcome) tuples as each username finishes
+
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+
+    cached = await asyncio.to_thread(
+        scraper.get_cached_items_batch, [q for _, q in queries]
+    )
+
+    pending: list[tuple[int, str, QueryDefinition]] = []
+    for idx, ((username, query), items) in enumerate(
+        zip(queries, cached, strict=True)
+    ):
+        if items is not None:
+            yield idx, ProfileBatchOutcome(username=username, items=items, cached=True)
+        else:
+            pending.append((idx, username, query))
+
+    if not pending:
+        return
+
+    logger.info(
+        "profile batch: %d cached, %d to run",
+        len(queries) - len(pending),
+        len(pending),
+    )
+    semaphore = limiter if limiter is not None else get_actor_run_limiter()
+
+    async def run_one(
+        idx: int, username: str, query: QueryDefinition
+    ) -> tuple[int, ProfileBatchOutcome]:
+        await semaphore.acquire()
+        work: asyncio.Future[list[dict[str, Any]]] | None = None
+        try:
+            remaining = deadline - loop.time()
+            try:
+                if remaining <= 0:
+                    raise TimeoutError
+                work = asyncio.ensure_future(
+                    asyncio.to_thread(
+                        _run_uncached, scraper, query, math.ceil(remaining)
+                    )
+                )
+                # Shielded so `work` keeps tracking the thread after a timeout
+                items = await asyncio.wait_for(asyncio.shield(work), timeout=remaining)
+                return idx, ProfileBatchOutcome(username=username, items=items)
+            except TimeoutError:
+                logger.error(
+                    "profile batch item timeout user=%r timeout=%ss",
+                    username,
+                    timeout_seconds,
+                )
+                return idx, ProfileBatchOutcome(
+                    username=username,
+                    error=f"Timeout after {timeout_seconds} seconds",
+                    timed_out=True,
+                )
+            except Exception as e:
+                logger.exception(
+                    "profile batch item failed user=%r error=%s", username, e
+                )
+                return idx, ProfileBatchOutcome(username=username, error=str(e))
+        finally:
+            if work is None or work.done():
+                semaphore.release()
+            else:
+                # The thread is still running its actor call: release on exit
+                work.add_done_callback(_release_when_done(semaphore))
+
+    tasks = [asyncio.create_task(run_one(*p)) for p in pending]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # The consumer may stop early (continue_on_error=False, client disconnect).
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,140 @@
+"""
+Incremental (since-id) refresh helpers for cached profile queries.
+
+Main responsibility: Decide whether an expired profile query can be refreshed
+incrementally, build the narrowed actor input, and merge newer tweets into the
+previously cached ordering.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+from mcp_twitter.twitter.models import QueryType, TwitterScraperInput
+
+MinimalTweet = dict[str, Any]
+
+
+def incremental_username(
+    query_type: QueryType | None, run_input: TwitterScraperInput
+) -> str | None:
+    """
+    Return the profile username if the query can be refreshed incrementally.
+
+    Only open-ended, newest-first profile queries qualify: a closed `until:` window
+    never gains tweets, and queries already carrying `since_id:` are left alone.
+    """
+    if query_type != "profile" or len(run_input.searchTerms) != 1:
+        return None
+    if run_input.sort != "Latest":
+        return None
+    tokens = run_input.searchTerms[0].split()
+    if not tokens or not tokens[0].startswith("from:"):
+        return None
+    if any(t.startswith(("until:", "since_id:")) for t in tokens[1:]):
+        return None
+    username = tokens[0].removeprefix("from:").lstrip("@")
+    return username or None
+
+
+def build_incremental_input(
+    run_input: TwitterScraperInput, since_id: str
+) -> TwitterScraperInput:
+    """Narrow a profile query to tweets newer than `since_id`."""
+    term = f"{run_input.searchTerms[0]} since_id:{since_id}"
+    return run_input.model_copy(update={"searchTerms": [term]})
+
+
+def _tweet_id_int(item: MinimalTweet) -> int | None:
+    try:
+        return int(str(item.get("id")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _created_at(item: MinimalTweet) -> datetime | None:
+    value = item.get("createdAt")
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        if "T" in value:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        else:
+            # Twitter format: "Thu Dec 25 13:49:02 +0000 2025"
+            dt = datetime.strptime(value, "%a %b %d %H:%M:%S %z %Y")
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
+
+
+def _recency_key(item: MinimalTweet) -> tuple[int, datetime]:
+    return (
+        _tweet_id_int(item) or 0,
+        _created_at(item) or datetime.min.replace(tzinfo=UTC),
+    )
+
+
+def _is_newer(
+    item: MinimalTweet, since_id: str, since_time: datetime | None
+) -> bool:
+    """
+    Check whether a fetched tweet is newer than the cached head.
+
+    Tweet ids are time-ordered snowflakes, so the id comparison is authoritative;
+    the timestamp is only used when an id is not numeric.
+    """
+    item_id = _tweet_id_int(item)
+    try:
+        head_id = int(since_id)
+    except ValueError:
+        head_id = None
+    if item_id is not None and head_id is not None:
+        return item_id > head_id
+    created_at = _created_at(item)
+    if created_at is not None and since_time is not None:
+        return created_at > since_time
+    return False
+
+
+def merge_incremental(
+    cached: list[MinimalTweet],
+    fresh: list[MinimalTweet],
+    *,
+    since_id: str,
+    since_time: datetime | None = None,
+    max_items: int | None = None,
+) -> list[MinimalTweet]:
+    """
+    Merge newly fetched tweets in front of a cached newest-first ordering.
+
+    Fresh tweets that are not newer than the cached head are dropped (some actors
+    ignore `since_id:`), duplicates keep their newest copy, and the result is
+    truncated to `max_items` so the merged list matches a full re-scrape.
+
+    Args:
+        cached: Previously cached items, newest first
+        fresh: Items returned by the incremental actor run
+        since_id: Id of the newest cached tweet
+        since_time: Creation time of the newest cached tweet
+        max_items: Maximum number of items the query returns
+
+    Returns:
+        Merged items, newest first
+
+    """
+    newer = [i for i in fresh if _is_newer(i, since_id, since_time)]
+    newer.sort(key=_recency_key, reverse=True)
+
+    merged: list[MinimalTweet] = []
+    seen: set[str] = set()
+    for item in [*newer, *cached]:
+        tweet_id = str(item.get("id"))
+        if tweet_id in seen:
+            continue
+        seen.add(tweet_id)
+        merged.append(item)
+
+    if max_items is not None:
+        merged = merged[:max_items]
+    return merged
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -47,6 +49,25 @@ class QueryDefinition(BaseModel):
 MinimalTweet = dict[str, Any]
 
 
+@dataclass(frozen=True, slots=True)
+class ScrapeResult:
+    """
+    Outcome of a single scraper run.
+
+    Returned by `TwitterScraper.run`/`run_query` instead of being stored on the
+    scraper, so concurrent runs on a shared scraper never see each other's items.
+    """
+
+    items: list[MinimalTweet]
+    query_type: QueryType | None = None
+    query_key: str | None = None
+    dataset_id: str | None = None
+    from_cache: bool = False
+    stale: bool = False
+    incremental: bool = False
+    output_path: Path | None = None
+
+
 class TwitterData(BaseModel):
     """Container for Twitter data returned by the API."""
 
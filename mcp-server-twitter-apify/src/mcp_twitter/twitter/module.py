@@ -123,8 +123,8 @@ class TwitterClient:
         try:
             scraper = self._ensure_scraper()
             # Run the query synchronously (scraper is sync)
-            scraper.run_query(query)
-            items = scraper.get_last_items() or []
+            result = scraper.run_query(query)
+            items = result.items
 
             twitter_data = TwitterData.from_api_response(
                 {"items": items},
@@ -2,20 +2,29 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from apify_client import ApifyClient
 
-from mcp_twitter.config import AppSettings
+from mcp_twitter.config import AppSettings, get_app_settings
+from mcp_twitter.twitter.incremental import (
+    build_incremental_input,
+    incremental_username,
+    merge_incremental,
+)
 from mcp_twitter.twitter.models import (
     OutputFormat,
     QueryDefinition,
     QueryType,
+    ScrapeResult,
     TwitterScraperInput,
 )
 
-# Import moved to _get_db method to avoid circular import
+# Runtime import lives in _get_db to avoid a circular import
+if TYPE_CHECKING:
+    from db import Database
 
 log = logging.getLogger(__name__)
 
@@ -34,6 +43,8 @@ class TwitterScraper:
         actor_name: str | None = None,
         output_format: OutputFormat = "min",
         use_cache: bool = True,
+        incremental_refresh: bool | None = None,
+        track_popularity: bool = True,
     ):
         # Use config actor_name if not provided
         if actor_name is None:
@@ -45,12 +56,18 @@ class TwitterScraper:
         self.actor_id = actor_name  # Internal name remains actor_id for Apify client
         self.output_format: OutputFormat = output_format
         self.use_cache = use_cache
+        # Refresh expired profile queries with since-id runs (config default)
+        if incremental_refresh is None:
+            incremental_refresh = (
+                get_app_settings().database.incremental_profile_refresh
+            )
+        self.incremental_refresh = incremental_refresh
+        # Feed cache lookups to the cache warmer's popularity tracker
+        self.track_popularity = track_popularity
 
         # Database instance (lazy-loaded)
         self._db: Database | None = None
-
-        # Store last run items for API access
-        self._last_items: list[dict[str, Any]] | None = None
+        self._db_lock = threading.Lock()
 
         # Legacy file support (deprecated)
         if results_dir:
@@ -93,88 +110,240 @@ class TwitterScraper:
         """Get database instance, initializing if needed."""
         if not self.use_cache:
             return None
-        if self._db is None:
-            try:
-                from db import get_db_instance
-
-                self._db = get_db_instance()
-            except Exception as e:
-                log.warning(f"Failed to initialize database cache: {e}")
-                return None
+        with self._db_lock:
+            if self._db is None:
+                try:
+                    from db import get_db_instance
+
+                    self._db = get_db_instance()
+                except Exception as e:
+                    log.warning(f"Failed to initialize database cache: {e}")
+                    return None
         return self._db
 
+    def get_cached_items_batch(
+        self, queries: list[QueryDefinition]
+    ) -> list[list[dict[str, Any]] | None]:
+        """
+        Look up cached results for several queries in one database round-trip.
+
+        Args:
+            queries: Query definitions to look up
+
+        Returns:
+            Cached items per query (same order as `queries`), None for misses
+
+        """
+        db = self._get_db()
+        if not db or not queries:
+            return [None] * len(queries)
+
+        from db import generate_query_key
+
+        keys = [
+            generate_query_key(q.type, q.input.model_dump(exclude_none=True))
+            for q in queries
+        ]
+        try:
+            cached = db.get_cached_queries(keys, self.output_format)
+        except Exception as e:
+            log.warning(f"Batch cache lookup failed: {e}")
+            return [None] * len(queries)
+        for query, key in zip(queries, keys, strict=True):
+            self._record_lookup(
+                key,
+                query.type,
+                query.input.model_dump(exclude_none=True),
+                hit=key in cached,
+            )
+        return [cached.get(key) for key in keys]
+
+    def _record_lookup(
+        self,
+        query_key: str,
+        query_type: QueryType,
+        run_dict: dict[str, Any],
+        *,
+        hit: bool,
+        stale: bool = False,
+    ) -> None:
+        """Report a client cache lookup to the popularity tracker."""
+        if not self.track_popularity:
+            return
+        from mcp_twitter.twitter.warmer import get_query_tracker
+
+        get_query_tracker().record(
+            query_key, query_type, run_dict, self.output_format, hit=hit, stale=stale
+        )
+
+    def _call_actor(
+        self, run_dict: dict[str, Any], timeout_secs: int | None = None
+    ) -> tuple[list[dict[str, Any]], str]:
+        """
+        Run the Apify actor and return formatted items with the dataset id.
+
+        `timeout_secs` makes Apify abort the run (and stop billing it) once the
+        caller has given up waiting; None keeps the actor's default timeout.
+        """
+        call_options: dict[str, Any] = {}
+        if timeout_secs is not None:
+            call_options["timeout_secs"] = timeout_secs
+        run = self.client.actor(self.actor_id).call(run_input=run_dict, **call_options)
+        dataset_id = run["defaultDatasetId"]
+        print("💾 Dataset:", f"https://console.apify.com/storage/datasets/{dataset_id}")
+
+        items: list[dict[str, Any]] = []
+        for item in self.client.dataset(dataset_id).iterate_items():
+            items.append(item)
+
+        # Apply format transformation
+        if self.output_format == "min":
+            items = [self._minimize_item(i) for i in items]
+        return items, dataset_id
+
+    def _refresh_incrementally(
+        self,
+        db: Database,
+        query_type: QueryType,
+        run_input: TwitterScraperInput,
+        run_dict: dict[str, Any],
+        timeout_secs: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str] | None:
+        """
+        Refresh an expired profile query with a since-id actor run.
+
+        Returns:
+            (merged items, dataset id), or None when the query is not eligible or
+            there is no previously cached ordering to merge into
+
+        """
+        username = incremental_username(query_type, run_input)
+        if username is None:
+            return None
+
+        from db import generate_query_key
+
+        query_key = generate_query_key(query_type, run_dict)
+        stale_items = db.get_cached_query(
+            query_key, self.output_format, allow_expired=True
+        )
+        if not stale_items:
+            return None
+        head = db.get_latest_author_tweet(query_key, username)
+        if head is None:
+            return None
+        since_id, since_time = head
+
+        log.info(
+            f"Incremental refresh for @{username} since_id={since_id} "
+            f"({len(stale_items)} cached items)"
+        )
+        fresh_input = build_incremental_input(run_input, since_id)
+        fresh_items, dataset_id = self._call_actor(
+            fresh_input.model_dump(exclude_none=True), timeout_secs
+        )
+        merged = merge_incremental(
+            stale_items,
+            fresh_items,
+            since_id=since_id,
+            since_time=since_time,
+            max_items=run_input.maxItems,
+        )
+        log.info(
+            f"Incremental refresh for @{username}: {len(fresh_items)} fetched, "
+            f"{len(merged)} items after merge"
+        )
+        return merged, dataset_id
+
     def run(
         self,
         run_input: TwitterScraperInput,
         output_filename: str | None = None,
         query_type: QueryType | None = None,
-    ) -> Path:
+        skip_cache_lookup: bool = False,
+        timeout_secs: int | None = None,
+    ) -> ScrapeResult:
         """
         Run Apify query with caching support.
 
+        The scraper keeps no per-run state, so one instance can serve concurrent
+        runs from several threads; everything a caller needs is on the result.
+
         Args:
             run_input: Apify input parameters
             output_filename: Legacy filename (deprecated, kept for compatibility)
             query_type: Query type for cache key generation (topic/profile/replies)
+            skip_cache_lookup: Go straight to Apify (the caller already checked the
+                cache); results are still saved to the cache
+            timeout_secs: Abort the actor run on Apify after this many seconds
 
         Returns:
-            Path object (for backward compatibility, but data is stored in DB)
+            ScrapeResult with this run's items and cache/run metadata
 
         """
         db = self._get_db()
         run_dict: dict[str, Any] = run_input.model_dump(exclude_none=True)
-
-        # Try cache first if enabled
+        query_key: str | None = None
         if db and query_type:
             from db import generate_query_key
 
             query_key = generate_query_key(query_type, run_dict)
+
+        # Try cache first if enabled
+        if db and query_key and not skip_cache_lookup:
             cached_items = db.get_cached_query(query_key, self.output_format)
+            stale = False
+            if cached_items is None and self.track_popularity:
+                cached_items = self._get_stale_while_revalidating(db, query_key)
+                stale = cached_items is not None
+            if query_type:
+                self._record_lookup(
+                    query_key,
+                    query_type,
+                    run_dict,
+                    hit=cached_items is not None,
+                    stale=stale,
+                )
             if cached_items is not None:
                 log.info(
-                    f"Cache hit for query_type={query_type}, returning {len(cached_items)} items"
+                    f"Cache {'stale hit' if stale else 'hit'} for query_type={query_type}, "
+                    f"returning {len(cached_items)} items"
+                )
+                return ScrapeResult(
+                    items=cached_items,
+                    query_type=query_type,
+                    query_key=query_key,
+                    from_cache=True,
+                    stale=stale,
+                    output_path=self._write_legacy_file(
+                        cached_items, output_filename
+                    ),
                 )
-                self._last_items = cached_items
-                # Still write to file for backward compatibility if results_dir exists
-                if self.results_dir and output_filename:
-                    filename = (
-                        output_filename
-                        if output_filename.endswith(".json")
-                        else f"{output_filename}.json"
-                    )
-                    output_path = self.results_dir / filename
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        json.dump(cached_items, f, indent=2, ensure_ascii=False)
-                    return output_path
-                # Return a dummy path if no file writing
-                return Path(output_filename or "cached_results.json")
-
-        # Cache miss or cache disabled - call Apify
-        log.info(
-            f"Cache miss or cache disabled, calling Apify for query_type={query_type}"
-        )
-        run = self.client.actor(self.actor_id).call(run_input=run_dict)
-        dataset_id = run["defaultDatasetId"]
-        print("💾 Dataset:", f"https://console.apify.com/storage/datasets/{dataset_id}")
-
-        items: list[dict[str, Any]] = []
-        for item in self.client.dataset(dataset_id).iterate_items():
-            items.append(item)
 
-        # Apply format transformation
-        if self.output_format == "min":
-            items = [self._minimize_item(i) for i in items]
+        # Expired profile query - fetch only tweets newer than the cached head
+        refreshed = None
+        if db and query_type and self.incremental_refresh:
+            try:
+                refreshed = self._refresh_incrementally(
+                    db, query_type, run_input, run_dict, timeout_secs
+                )
+            except Exception as e:
+                log.warning(f"Incremental refresh failed, running full query: {e}")
 
-        # Store items for API access
-        self._last_items = items
+        if refreshed is not None:
+            items, dataset_id = refreshed
+        else:
+            # Cache miss or cache disabled - call Apify
+            log.info(
+                f"Cache miss or cache disabled, calling Apify for query_type={query_type}"
+            )
+            items, dataset_id = self._call_actor(run_dict, timeout_secs)
 
         # Save to cache if enabled
-        if db and query_type:
+        if db and query_type and query_key:
             try:
-                from db import generate_query_key
-
                 db.save_query_cache(
-                    query_key=generate_query_key(query_type, run_dict),
+                    query_key=query_key,
                     query_type=query_type,
                     params=run_dict,
                     items=items,
@@ -185,26 +354,66 @@ class TwitterScraper:
             except Exception as e:
                 log.warning(f"Failed to save to cache: {e}")
 
-        # Legacy file writing (deprecated)
-        if self.results_dir:
-            filename = output_filename or "results.json"
-            if not filename.endswith(".json"):
-                filename += ".json"
-            output_path = self.results_dir / filename
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(items, f, indent=2, ensure_ascii=False)
-            print(f"✅ Saved {len(items)} items to: {output_path}")
-            return output_path
-
-        # Return dummy path if no file writing
-        dummy_path = Path(output_filename or "results.json")
-        print(f"✅ Processed {len(items)} items (cached in database)")
-        return dummy_path
-
-    def get_last_items(self) -> list[dict[str, Any]] | None:
-        """Get items from the last run (for API access)."""
-        return self._last_items
-
-    def run_query(self, query: QueryDefinition) -> Path:
+        output_path = self._write_legacy_file(items, output_filename)
+        if output_path is None:
+            print(f"✅ Processed {len(items)} items (cached in database)")
+        return ScrapeResult(
+            items=items,
+            query_type=query_type,
+            query_key=query_key,
+            dataset_id=dataset_id,
+            incremental=refreshed is not None,
+            output_path=output_path,
+        )
+
+    def _get_stale_while_revalidating(
+        self, db: Database, query_key: str
+    ) -> list[dict[str, Any]] | None:
+        """
+        Serve a recently expired entry for a query the cache warmer keeps warm.
+
+        The warmer is asked to refresh the entry on its next tick, so clients get
+        the stale result immediately instead of waiting for an actor run.
+        """
+        from mcp_twitter.twitter.warmer import get_query_tracker
+
+        tracker = get_query_tracker()
+        if not tracker.is_scheduled(query_key):
+            return None
+        grace = get_app_settings().cache_warmer.stale_grace_seconds
+        stale_items = db.get_cached_query(
+            query_key, self.output_format, max_stale_seconds=grace
+        )
+        if stale_items is not None:
+            tracker.request_refresh(query_key)
+        return stale_items
+
+    def _write_legacy_file(
+        self, items: list[dict[str, Any]], output_filename: str | None
+    ) -> Path | None:
+        """Write items to `results_dir` (deprecated file storage), if configured."""
+        if not self.results_dir:
+            return None
+        filename = output_filename or "results.json"
+        if not filename.endswith(".json"):
+            filename += ".json"
+        output_path = self.results_dir / filename
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(items, f, indent=2, ensure_ascii=False)
+        print(f"✅ Saved {len(items)} items to: {output_path}")
+        return output_path
+
+    def run_query(
+        self,
+        query: QueryDefinition,
+        skip_cache_lookup: bool = False,
+        timeout_secs: int | None = None,
+    ) -> ScrapeResult:
         """Run a query definition with caching."""
-        return self.run(query.input, query.output_filename(), query_type=query.type)
+        return self.run(
+            query.input,
+            query.output_filename(),
+            query_type=query.type,
+            skip_cache_lookup=skip_cache_lookup,
+            timeout_secs=timeout_secs,
+        )
@@ -0,0 +1,410 @@
+"""
+Scheduled cache warming for popular twitter-apify queries.
+
+Main responsibility: Track query popularity from cache lookups and proactively
+refresh the most requested queries shortly before their cache entries expire,
+within a concurrency and cost budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any
+
+from mcp_twitter.config import CacheWarmerConfig, get_app_settings
+from mcp_twitter.twitter.batch import get_actor_run_limiter
+from mcp_twitter.twitter.models import OutputFormat, QueryType, TwitterScraperInput
+from mcp_twitter.twitter.scraper import TwitterScraper
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TrackedQuery:
+    """Popularity and refresh bookkeeping for one cached query."""
+
+    query_key: str
+    query_type: QueryType
+    params: dict[str, Any]
+    output_format: OutputFormat
+    score: float = 0.0
+    last_seen: float = 0.0
+    hits: int = 0
+    misses: int = 0
+    stale_served: int = 0
+    # Hits served by an entry the warmer wrote (would have been misses otherwise)
+    warmed_hits: int = 0
+    warmed: bool = False
+    # Expiry the last warm refresh pre-empted; later hits count as warmed hits
+    preempted_expiry: datetime | None = None
+    refresh_count: int = 0
+    last_refreshed_at: datetime | None = None
+    last_error: str | None = None
+    expires_at: datetime | None = None
+
+
+class QueryPopularityTracker:
+    """
+    Thread-safe, bounded popularity table fed by scraper cache lookups.
+
+    Scores decay exponentially with `half_life_seconds`, so the ranking follows
+    what clients poll now rather than what they polled yesterday.
+    """
+
+    def __init__(self, max_tracked: int = 1000, half_life_seconds: float = 3600):
+        self.max_tracked = max_tracked
+        self.half_life_seconds = half_life_seconds
+        self.active = False
+        self._lock = threading.Lock()
+        self._queries: dict[str, TrackedQuery] = {}
+        self._scheduled: set[str] = set()
+        self._refresh_requested: set[str] = set()
+
+    def _decayed(self, entry: TrackedQuery, now: float) -> float:
+        elapsed = max(0.0, now - entry.last_seen)
+        return entry.score * 0.5 ** (elapsed / self.half_life_seconds)
+
+    def record(
+        self,
+        query_key: str,
+        query_type: QueryType,
+        params: dict[str, Any],
+        output_format: OutputFormat,
+        *,
+        hit: bool,
+        stale: bool = False,
+    ) -> None:
+        """Record one client request for a query and whether the cache served it."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._queries.get(query_key)
+            if entry is None:
+                entry = TrackedQuery(
+                    query_key=query_key,
+                    query_type=query_type,
+                    params=params,
+                    output_format=output_format,
+                )
+                self._queries[query_key] = entry
+            entry.score = self._decayed(entry, now) + 1.0
+            entry.last_seen = now
+            entry.output_format = output_format
+            if stale:
+                entry.stale_served += 1
+            elif hit:
+                entry.hits += 1
+                if (
+                    entry.warmed
+                    and entry.preempted_expiry is not None
+                    and datetime.now(UTC) >= entry.preempted_expiry
+                ):
+                    entry.warmed_hits += 1
+            else:
+                entry.misses += 1
+                # An organic run rewrites the entry; it is no longer warmer-owned.
+                entry.warmed = False
+            if len(self._queries) > self.max_tracked:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        coldest = min(
+            (k for k in self._queries if k not in self._scheduled),
+            key=lambda k: self._decayed(self._queries[k], now),
+            default=None,
+        )
+        if coldest is not None:
+            del self._queries[coldest]
+
+    def top(self, n: int) -> list[TrackedQuery]:
+        """Return copies of the `n` most popular queries, most popular first."""
+        now = time.monotonic()
+        with self._lock:
+            ranked = sorted(
+                self._queries.values(),
+                key=lambda e: self._decayed(e, now),
+                reverse=True,
+            )
+            return [replace(e) for e in ranked[:n]]
+
+    def set_scheduled(self, query_keys: set[str]) -> None:
+        with self._lock:
+            self._scheduled = set(query_keys)
+
+    def is_scheduled(self, query_key: str) -> bool:
+        with self._lock:
+            return self.active and query_key in self._scheduled
+
+    def request_refresh(self, query_key: str) -> None:
+        """Ask the warmer to refresh a query on its next tick (stale entry served)."""
+        with self._lock:
+            self._refresh_requested.add(query_key)
+
+    def take_refresh_requests(self) -> set[str]:
+        with self._lock:
+            requested, self._refresh_requested = self._refresh_requested, set()
+            return requested
+
+    def mark_refreshed(
+        self,
+        query_key: str,
+        *,
+        expires_at: datetime | None,
+        previous_expires_at: datetime | None = None,
+        error: str | None = None,
+    ) -> None:
+        with self._lock:
+            entry = self._queries.get(query_key)
+            if entry is None:
+                return
+            entry.last_error = error
+            if error is None:
+                entry.warmed = True
+                entry.preempted_expiry = previous_expires_at
+                entry.refresh_count += 1
+                entry.last_refreshed_at = datetime.now(UTC)
+                entry.expires_at = expires_at
+
+    def snapshot(self) -> list[TrackedQuery]:
+        with self._lock:
+            return [replace(e) for e in self._queries.values()]
+
+
+@lru_cache(maxsize=1)
+def get_query_tracker() -> QueryPopularityTracker:
+    """Get the process-wide popularity tracker shared by all scrapers."""
+    config = get_app_settings().cache_warmer
+    return QueryPopularityTracker(
+        max_tracked=config.max_tracked_queries,
+        half_life_seconds=config.popularity_half_life_seconds,
+    )
+
+
+class CacheWarmer:
+    """
+    Background scheduler that refreshes the top-N queries before they expire.
+
+    Each tick ranks tracked queries, reads their expiry times in one query, and
+    re-runs those due within `refresh_ahead_seconds` (plus any stale entries
+    served since the last tick), bounded by `max_concurrency` concurrent runs
+    and `max_refreshes_per_hour` actor runs.
+    """
+
+    def __init__(
+        self,
+        config: CacheWarmerConfig,
+        apify_token: str,
+        actor_name: str,
+        tracker: QueryPopularityTracker | None = None,
+    ):
+        self.config = config
+        self.apify_token = apify_token
+        self.actor_name = actor_name
+        self.tracker = tracker or get_query_tracker()
+        self._scrapers: dict[OutputFormat, TwitterScraper] = {}
+        self._refresh_times: deque[float] = deque()
+        self._task: asyncio.Task[None] | None = None
+        self._last_tick_at: datetime | None = None
+        self._skipped_for_budget = 0
+
+    def _scraper(self, output_format: OutputFormat) -> TwitterScraper:
+        if output_format not in self._scrapers:
+            self._scrapers[output_format] = TwitterScraper(
+                apify_token=self.apify_token,
+                results_dir=None,
+                actor_name=self.actor_name,
+                output_format=output_format,
+                use_cache=True,
+                track_popularity=False,
+            )
+        return self._scrapers[output_format]
+
+    def _budget_left(self) -> int:
+        cutoff = time.monotonic() - 3600
+        while self._refresh_times and self._refresh_times[0] < cutoff:
+            self._refresh_times.popleft()
+        return max(0, self.config.max_refreshes_per_hour - len(self._refresh_times))
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self.tracker.active = True
+        self._task = asyncio.create_task(self._loop(), name="twitter-cache-warmer")
+        logger.info(
+            "Cache warmer started (top_n=%d, interval=%ss, budget=%d/h)",
+            self.config.top_n,
+            self.config.interval_seconds,
+            self.config.max_refreshes_per_hour,
+        )
+
+    async def stop(self) -> None:
+        self.tracker.active = False
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Cache warmer stopped")
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.exception("Cache warmer tick failed: %s", e)
+            await asyncio.sleep(self.config.interval_seconds)
+
+    async def run_once(self) -> int:
+        """
+        Run one scheduling tick.
+
+        Returns:
+            Number of queries refreshed successfully
+
+        """
+        self._last_tick_at = datetime.now(UTC)
+        candidates = self.tracker.top(self.config.top_n)
+        self.tracker.set_scheduled({c.query_key for c in candidates})
+        if not candidates:
+            return 0
+
+        scraper = self._scraper("min")
+        db = scraper._get_db()
+        if db is None:
+            return 0
+        expirations = await asyncio.to_thread(
+            db.get_cache_expirations, [c.query_key for c in candidates]
+        )
+
+        requested = self.tracker.take_refresh_requests()
+        horizon = datetime.now(UTC) + timedelta(
+            seconds=self.config.refresh_ahead_seconds
+        )
+        due = [
+            c
+            for c in candidates
+            if c.query_key in requested
+            or (
+                c.query_key in expirations and expirations[c.query_key] <= horizon
+            )
+        ]
+        budget = self._budget_left()
+        if len(due) > budget:
+            self._skipped_for_budget += len(due) - budget
+            logger.warning(
+                "Cache warmer budget exhausted: refreshing %d of %d due queries",
+                budget,
+                len(due),
+            )
+            due = due[:budget]
+        if not due:
+            return 0
+
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+        run_limiter = get_actor_run_limiter()
+
+        async def refresh(entry: TrackedQuery) -> bool:
+            # Warmer runs also take slots of the limiter shared with batch requests
+            async with semaphore, run_limiter:
+                self._refresh_times.append(time.monotonic())
+                try:
+                    result = await asyncio.to_thread(
+                        self._scraper(entry.output_format).run,
+                        TwitterScraperInput(**entry.params),
+                        None,
+                        entry.query_type,
+                        True,
+                    )
+                    expires = await asyncio.to_thread(
+                        db.get_cache_expirations, [entry.query_key]
+                    )
+                    self.tracker.mark_refreshed(
+                        entry.query_key,
+                        expires_at=expires.get(entry.query_key),
+                        previous_expires_at=expirations.get(entry.query_key),
+                    )
+                    logger.info(
+                        "Cache warmer refreshed %s query %s... (%d items)",
+                        entry.query_type,
+                        entry.query_key[:16],
+                        len(result.items),
+                    )
+                    return True
+                except Exception as e:
+                    logger.warning(
+                        "Cache warmer refresh failed for %s...: %s",
+                        entry.query_key[:16],
+                        e,
+                    )
+                    self.tracker.mark_refreshed(
+                        entry.query_key, expires_at=None, error=str(e)
+                    )
+                    return False
+
+        results = await asyncio.gather(*(refresh(e) for e in due))
+        return sum(results)
+
+    def status(self) -> dict[str, Any]:
+        """
+        Summarize scheduled refreshes and their effect on the hit rate.
+
+        Only counts and timings are reported: queries are identified by their
+        cache key hash, never by their search parameters, since the status is
+        shared by every client's queries.
+        """
+        scheduled = {q.query_key for q in self.tracker.top(self.config.top_n)}
+        queries = []
+        totals = {"hits": 0, "misses": 0, "stale_served": 0, "warmed_hits": 0}
+        for entry in self.tracker.snapshot():
+            for k in totals:
+                totals[k] += getattr(entry, k)
+            if entry.query_key not in scheduled:
+                continue
+            requests = entry.hits + entry.misses + entry.stale_served
+            queries.append(
+                {
+                    "query_key": entry.query_key,
+                    "query_type": entry.query_type,
+                    "score": round(entry.score, 3),
+                    "hits": entry.hits,
+                    "misses": entry.misses,
+                    "stale_served": entry.stale_served,
+                    "warmed_hits": entry.warmed_hits,
+                    "hit_rate": (entry.hits + entry.stale_served) / requests
+                    if requests
+                    else None,
+                    "refresh_count": entry.refresh_count,
+                    "refresh_failed": entry.last_error is not None,
+                    "last_refreshed_at": entry.last_refreshed_at,
+                    "expires_at": entry.expires_at,
+                }
+            )
+        queries.sort(key=lambda r: r["score"], reverse=True)
+
+        requests = totals["hits"] + totals["misses"] + totals["stale_served"]
+        served = totals["hits"] + totals["stale_served"]
+        saved = totals["warmed_hits"] + totals["stale_served"]
+        return {
+            "enabled": True,
+            "running": self._task is not None,
+            "last_tick_at": self._last_tick_at,
+            "refreshes_last_hour": self.config.max_refreshes_per_hour
+            - self._budget_left(),
+            "skipped_for_budget": self._skipped_for_budget,
+            "hit_rate": served / requests if requests else None,
+            # Hit rate had warmed/stale-served requests been misses instead
+            "hit_rate_without_warmer": (served - saved) / requests
+            if requests
+            else None,
+            "totals": totals,
+            "scheduled": queries,
+        }
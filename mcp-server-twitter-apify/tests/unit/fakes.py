@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import random
+import threading
+import time
 from collections.abc import Iterator
 from typing import Any
 
@@ -13,12 +16,19 @@ class FakeApifyDataset:
 
 
 class FakeApifyActor:
-    def __init__(self, dataset_id: str, record_calls: list[dict[str, Any]]):
+    def __init__(
+        self,
+        dataset_id: str,
+        record_calls: list[dict[str, Any]],
+        record_options: list[dict[str, Any]],
+    ):
         self._dataset_id = dataset_id
         self._record_calls = record_calls
+        self._record_options = record_options
 
-    def call(self, run_input: dict[str, Any]) -> dict[str, Any]:
+    def call(self, run_input: dict[str, Any], **options: Any) -> dict[str, Any]:
         self._record_calls.append(run_input)
+        self._record_options.append(options)
         return {"defaultDatasetId": self._dataset_id}
 
 
@@ -27,12 +37,45 @@ class FakeApifyClient:
         self._dataset_id = dataset_id
         self._items = items
         self.calls: list[dict[str, Any]] = []
+        self.call_options: list[dict[str, Any]] = []
         self.actor_ids: list[str] = []
 
     def actor(self, actor_id: str) -> FakeApifyActor:
         self.actor_ids.append(actor_id)
-        return FakeApifyActor(self._dataset_id, self.calls)
+        return FakeApifyActor(self._dataset_id, self.calls, self.call_options)
 
     def dataset(self, dataset_id: str) -> FakeApifyDataset:
         assert dataset_id == self._dataset_id
         return FakeApifyDataset(self._items)
+
+
+class EchoApifyActor:
+    def __init__(self, client: EchoApifyClient):
+        self._client = client
+
+    def call(self, run_input: dict[str, Any]) -> dict[str, Any]:
+        term = run_input["searchTerms"][0]
+        # Stagger runs so overlapping calls interleave inside the scraper.
+        time.sleep(random.uniform(0, self._client.max_delay))
+        with self._client.lock:
+            dataset_id = f"ds-{len(self._client.datasets)}"
+            self._client.datasets[dataset_id] = [
+                {"id": f"{term}-{i}", "text": term} for i in range(3)
+            ]
+        return {"defaultDatasetId": dataset_id}
+
+
+class EchoApifyClient:
+    """Thread-safe fake whose datasets echo the search term of each run."""
+
+    def __init__(self, max_delay: float = 0.01):
+        self.max_delay = max_delay
+        self.lock = threading.Lock()
+        self.datasets: dict[str, list[dict[str, Any]]] = {}
+
+    def actor(self, actor_id: str) -> EchoApifyActor:  # noqa: ARG002
+        return EchoApifyActor(self)
+
+    def dataset(self, dataset_id: str) -> FakeApifyDataset:
+        with self.lock:
+            return FakeApifyDataset(self.datasets[dataset_id])
@@ -8,7 +8,8 @@ import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
-from mcp_twitter.twitter import build_default_registry
+from mcp_twitter.dependencies import get_registry, get_scraper
+from mcp_twitter.twitter import ScrapeResult, build_default_registry
 
 
 class FakeScraper:
@@ -18,15 +19,16 @@ class FakeScraper:
         self.actor_id = "actor"
         self.use_cache = False  # For API compatibility
 
-    def run_query(self, query) -> Path:  # noqa: ANN001
+    def run_query(self, query, skip_cache_lookup: bool = False, timeout_secs=None) -> ScrapeResult:  # noqa: ANN001, ARG002
         # Write a deterministic JSON file the API will read back.
         out = self.results_dir / query.output_filename()
-        out.write_text(json.dumps([{"id": "1", "text": "hello"}]), encoding="utf-8")
-        return out
+        items = [{"id": "1", "text": "hello"}]
+        out.write_text(json.dumps(items), encoding="utf-8")
+        return ScrapeResult(items=items, query_type=query.type, output_path=out)
 
-    def get_last_items(self) -> list[dict[str, Any]] | None:
-        """Return fake items for API access."""
-        return [{"id": "1", "text": "hello"}]
+    def get_cached_items_batch(self, queries) -> list[Any]:  # noqa: ANN001
+        """Fake cache: every query is a miss."""
+        return [None] * len(queries)
 
 
 class FakeTwitterScraper(FakeScraper):
@@ -67,6 +69,8 @@ async def client(monkeypatch, tmp_results_dir: Path) -> AsyncClient:
     # Set up app state manually (bypassing lifespan)
     app.state.registry = build_default_registry()
     app.state.scraper = FakeScraper(tmp_results_dir)
+    app.dependency_overrides[get_registry] = lambda: app.state.registry
+    app.dependency_overrides[get_scraper] = lambda: app.state.scraper
 
     # Patch TwitterScraper class for tests
     from mcp_twitter.twitter import scraper as scraper_mod
@@ -168,7 +172,7 @@ async def test_search_profile_batch_continue_on_error_returns_error_entry(
     from mcp_twitter.twitter import scraper as scraper_mod
 
     class ErroringFakeTwitterScraper(FakeTwitterScraper):  # type: ignore[misc]
-        def run_query(self, query) -> Path:  # noqa: ANN001
+        def run_query(self, query, skip_cache_lookup: bool = False, timeout_secs=None) -> ScrapeResult:  # noqa: ANN001, ARG002
             term = ""
             try:
                 term = query.input.searchTerms[0]
@@ -176,7 +180,7 @@ async def test_search_profile_batch_continue_on_error_returns_error_entry(
                 term = ""
             if "from:baduser" in term:
                 raise ValueError("boom")
-            return super().run_query(query)
+            return super().run_query(query, skip_cache_lookup)
 
     monkeypatch.setattr(scraper_mod, "TwitterScraper", ErroringFakeTwitterScraper)
 
@@ -265,3 +269,120 @@ async def test_get_results_deprecated(client: AsyncClient) -> None:
     """Test that file-based results endpoint is deprecated."""
     r = await client.get("/api/v1/results/test.json")
     assert r.status_code == 410  # Gone
+
+
+@pytest.mark.asyncio
+async def test_search_profile_batch_runs_usernames_concurrently_within_limit(
+    client: AsyncClient, monkeypatch
+) -> None:
+    import threading
+    import time
+
+    from mcp_twitter.config import get_app_settings
+    from mcp_twitter.twitter import scraper as scraper_mod
+
+    monkeypatch.setattr(get_app_settings().apify, "max_concurrent_runs", 3)
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    class SlowFakeTwitterScraper(FakeTwitterScraper):  # type: ignore[misc]
+        def run_query(self, query, skip_cache_lookup: bool = False, timeout_secs=None) -> ScrapeResult:  # noqa: ANN001, ARG002
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            return super().run_query(query, skip_cache_lookup)
+
+    monkeypatch.setattr(scraper_mod, "TwitterScraper", SlowFakeTwitterScraper)
+
+    usernames = [f"user{i}" for i in range(8)]
+    r = await client.post(
+        "/hybrid/v1/search/profile/batch",
+        json={"usernames": usernames, "max_items": 2, "continue_on_error": True},
+    )
+    assert r.status_code == 200
+    assert [row["username"] for row in r.json()] == usernames
+    assert 1 < state["peak"] <= 3
+
+
+@pytest.mark.asyncio
+async def test_search_profile_latest_batch_streams_ndjson_with_per_user_errors(
+    client: AsyncClient, monkeypatch
+) -> None:
+    from mcp_twitter.twitter import scraper as scraper_mod
+
+    class ErroringFakeTwitterScraper(FakeTwitterScraper):  # type: ignore[misc]
+        def run_query(self, query, skip_cache_lookup: bool = False, timeout_secs=None) -> ScrapeResult:  # noqa: ANN001, ARG002
+            if "from:baduser" in query.input.searchTerms[0]:
+                raise ValueError("boom")
+            return super().run_query(query, skip_cache_lookup)
+
+    monkeypatch.setattr(scraper_mod, "TwitterScraper", ErroringFakeTwitterScraper)
+
+    r = await client.post(
+        "/hybrid/v1/search/profile/latest/batch?stream=true",
+        json={"usernames": ["gooduser", "baduser"], "continue_on_error": True},
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    rows = {
+        row["username"]: row
+        for row in (json.loads(line) for line in r.text.splitlines() if line)
+    }
+    assert rows["gooduser"]["error"] is None
+    assert rows["gooduser"]["items"][0]["id"] == "1"
+    assert rows["baduser"]["error"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_search_profile_batch_skips_actor_for_cached_usernames(
+    client: AsyncClient, monkeypatch
+) -> None:
+    from mcp_twitter.twitter import scraper as scraper_mod
+
+    ran: list[str] = []
+
+    class PartiallyCachedFakeTwitterScraper(FakeTwitterScraper):  # type: ignore[misc]
+        def get_cached_items_batch(self, queries) -> list[Any]:  # noqa: ANN001
+            return [
+                [{"id": "cached"}] if "from:cacheduser" in q.input.searchTerms[0] else None
+                for q in queries
+            ]
+
+        def run_query(self, query, skip_cache_lookup: bool = False, timeout_secs=None) -> ScrapeResult:  # noqa: ANN001, ARG002
+            assert skip_cache_lookup
+            ran.append(query.input.searchTerms[0])
+            return super().run_query(query, skip_cache_lookup)
+
+    monkeypatch.setattr(
+        scraper_mod, "TwitterScraper", PartiallyCachedFakeTwitterScraper
+    )
+
+    r = await client.post(
+        "/hybrid/v1/search/profile/batch",
+        json={"usernames": ["cacheduser", "freshuser"], "continue_on_error": True},
+    )
+    assert r.status_code == 200
+    body = r.json()
+    assert body[0]["items"] == [{"id": "cached"}]
+    assert body[1]["items"][0]["id"] == "1"
+    assert ran == ["from:freshuser"]
+
+
+@pytest.mark.asyncio
+async def test_cache_warmer_status_when_disabled(client: AsyncClient) -> None:
+    r = await client.get("/api/admin/cache-warmer")
+    assert r.status_code == 200
+    assert r.json()["enabled"] is False
+
+
+def test_admin_endpoints_are_priced() -> None:
+    from mcp_twitter.x402_config import X402Config
+
+    pricing = X402Config(
+        pricing_config_path=Path(__file__).parents[2] / "tool_pricing.yaml"
+    ).pricing
+
+    assert {"get_admin_logs", "get_cache_warmer_status"} <= set(pricing)
@@ -0,0 +1,119 @@
+"""
+Tests for bounded-concurrency profile batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from mcp_twitter.config import get_app_settings
+from mcp_twitter.hybrid_routers import search as search_mod
+from mcp_twitter.hybrid_routers.search import _execute_profile_batch
+from mcp_twitter.twitter import ScrapeResult
+from mcp_twitter.twitter import scraper as scraper_mod
+from mcp_twitter.twitter.batch import get_actor_run_limiter, iter_profile_batch
+
+
+class SlowScraper:
+    """Scraper whose actor runs block their thread and are counted."""
+
+    def __init__(self, run_seconds: float, fail: set[str] | None = None):
+        self.run_seconds = run_seconds
+        self.fail = fail or set()
+        self.started: list[str] = []
+        self.running = 0
+        self.peak = 0
+        self.timeouts: list[int | None] = []
+        self._lock = threading.Lock()
+
+    def get_cached_items_batch(self, queries) -> list[Any]:  # noqa: ANN001
+        return [None] * len(queries)
+
+    def run_query(self, query, skip_cache_lookup: bool = False, timeout_secs=None) -> ScrapeResult:  # noqa: ANN001, ARG002
+        self.timeouts.append(timeout_secs)
+        self.started.append(query)
+        if query in self.fail:
+            raise ValueError("boom")
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.run_seconds)
+        with self._lock:
+            self.running -= 1
+        return ScrapeResult(items=[{"id": query}], query_type="profile")
+
+
+@pytest.mark.asyncio
+async def test_timed_out_run_keeps_its_slot_until_the_thread_finishes() -> None:
+    scraper = SlowScraper(run_seconds=0.5)
+
+    outcomes = [
+        outcome
+        async for _, outcome in iter_profile_batch(
+            scraper,  # type: ignore[arg-type]
+            [("a", "qa"), ("b", "qb")],  # type: ignore[list-item]
+            timeout_seconds=0.2,
+            limiter=asyncio.Semaphore(1),
+        )
+    ]
+
+    assert [o.timed_out for o in outcomes] == [True, True]
+    # "b" never started: the slot was held by "a"'s actor run past the deadline
+    assert scraper.peak == 1
+    # ...and Apify was told to abort that run when the batch gives up on it
+    assert scraper.timeouts == [1]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batches_share_the_process_wide_limiter(monkeypatch) -> None:
+    monkeypatch.setattr(get_app_settings().apify, "max_concurrent_runs", 2)
+    scraper = SlowScraper(run_seconds=0.05)
+
+    async def run_batch(prefix: str) -> None:
+        queries = [(f"{prefix}{i}", f"q{prefix}{i}") for i in range(4)]
+        async for _ in iter_profile_batch(scraper, queries, timeout_seconds=5):  # type: ignore[arg-type]
+            pass
+
+    await asyncio.gather(run_batch("a"), run_batch("b"), run_batch("c"))
+
+    assert len(scraper.started) == 12
+    assert scraper.peak == 2
+    assert get_actor_run_limiter()._value == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_stopped_on_error_cancels_remaining_runs(monkeypatch) -> None:
+    monkeypatch.setattr(get_app_settings().apify, "max_concurrent_runs", 1)
+    scraper = SlowScraper(run_seconds=0.2, fail={"qa"})
+    monkeypatch.setattr(scraper_mod, "TwitterScraper", lambda **_: scraper)
+    batches = []
+
+    def recording_iter_profile_batch(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+        # Holding a reference keeps garbage collection from closing the batch
+        batches.append(iter_profile_batch(*args, **kwargs))
+        return batches[-1]
+
+    monkeypatch.setattr(search_mod, "iter_profile_batch", recording_iter_profile_batch)
+
+    response = await _execute_profile_batch(
+        [("a", "qa"), ("b", "qb"), ("c", "qc")],  # type: ignore[list-item]
+        SimpleNamespace(apify_token="token", actor_id="actor"),  # type: ignore[arg-type]  # noqa: S106
+        output_format="min",
+        continue_on_error=False,
+        timeout_seconds=5,
+        stream=True,
+        label="Profile batch",
+    )
+    lines = [line async for line in response.body_iterator]  # type: ignore[union-attr]
+    await asyncio.sleep(0.4)
+
+    assert len(lines) == 1
+    assert batches[0].ag_frame is None  # closed by the stream itself
+    # "b" already held the slot; "c" was still waiting for it and never starts
+    assert "qc" not in scraper.started
@@ -0,0 +1,208 @@
+"""
+Tests for query popularity tracking, the cache warmer and stale-while-revalidate.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import mcp_twitter.twitter.scraper as scraper_mod
+import mcp_twitter.twitter.warmer as warmer_mod
+from db import Database, generate_query_key
+from db.models import Base, QueryCacheEntry
+from mcp_twitter.config import CacheWarmerConfig
+from mcp_twitter.twitter import (
+    CacheWarmer,
+    QueryDefinition,
+    QueryPopularityTracker,
+    TwitterScraper,
+    TwitterScraperInput,
+)
+from tests.unit.fakes import FakeApifyClient
+
+
+@pytest.fixture
+def in_memory_db(monkeypatch) -> Database:
+    # The warmer reads the cache from worker threads; share one connection.
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    db = Database.__new__(Database)
+    db.engine = engine
+    db.Session = sessionmaker(bind=engine)
+    monkeypatch.setattr("db.get_db_instance", lambda: db)
+    return db
+
+
+@pytest.fixture
+def tracker(monkeypatch) -> QueryPopularityTracker:
+    t = QueryPopularityTracker(max_tracked=10)
+    monkeypatch.setattr(warmer_mod, "get_query_tracker", lambda: t)
+    return t
+
+
+@pytest.fixture
+def fake_client(monkeypatch) -> FakeApifyClient:
+    client = FakeApifyClient(
+        dataset_id="ds-warm", items=[{"id": "fresh", "text": "fresh tweet"}]
+    )
+    monkeypatch.setattr(scraper_mod, "ApifyClient", lambda token: client)  # noqa: ARG005
+    return client
+
+
+def _seed(db: Database, term: str, expires_in: float) -> str:
+    params = TwitterScraperInput(searchTerms=[term]).model_dump(exclude_none=True)
+    key = generate_query_key("topic", params)
+    db.save_query_cache(
+        query_key=key,
+        query_type="topic",
+        params=params,
+        items=[{"id": f"old-{term}", "text": "old"}],
+    )
+    with db.Session() as session:
+        entry = session.get(QueryCacheEntry, key)
+        entry.expires_at = datetime.now(UTC) + timedelta(seconds=expires_in)
+        session.commit()
+    return key
+
+
+def _record(t: QueryPopularityTracker, key: str, times: int) -> None:
+    for _ in range(times):
+        t.record(key, "topic", {"searchTerms": [key]}, "min", hit=True)
+
+
+def test_tracker_ranks_by_request_count_and_stays_bounded(
+    tracker: QueryPopularityTracker,
+) -> None:
+    _record(tracker, "a", 1)
+    _record(tracker, "b", 5)
+    _record(tracker, "c", 3)
+    assert [q.query_key for q in tracker.top(2)] == ["b", "c"]
+
+    for i in range(20):
+        _record(tracker, f"extra{i}", 1)
+    assert len(tracker.snapshot()) <= tracker.max_tracked
+
+
+def test_tracker_scores_decay_over_time(monkeypatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr(warmer_mod.time, "monotonic", lambda: clock[0])
+    t = QueryPopularityTracker(half_life_seconds=10)
+    _record(t, "old", 4)
+    clock[0] += 30  # three half-lives: 4 -> 0.5
+    _record(t, "new", 1)
+    assert [q.query_key for q in t.top(2)] == ["new", "old"]
+
+
+@pytest.mark.asyncio
+async def test_warmer_refreshes_popular_queries_due_for_expiry(
+    in_memory_db: Database,
+    tracker: QueryPopularityTracker,
+    fake_client: FakeApifyClient,
+) -> None:
+    due_key = _seed(in_memory_db, "due", expires_in=30)
+    fresh_key = _seed(in_memory_db, "fresh", expires_in=3600)
+    unpopular_key = _seed(in_memory_db, "unpopular", expires_in=30)
+    for key, term, n in [(due_key, "due", 5), (fresh_key, "fresh", 4), (unpopular_key, "unpopular", 1)]:
+        for _ in range(n):
+            tracker.record(key, "topic", {"searchTerms": [term]}, "min", hit=True)
+
+    warmer = CacheWarmer(
+        CacheWarmerConfig(top_n=2, refresh_ahead_seconds=120, max_refreshes_per_hour=10),
+        apify_token="token",
+        actor_name="actor",
+        tracker=tracker,
+    )
+    refreshed = await warmer.run_once()
+
+    assert refreshed == 1
+    assert [c["searchTerms"] for c in fake_client.calls] == [["due"]]
+    assert in_memory_db.get_cached_query(due_key)[0]["id"] == "fresh"
+    status = warmer.status()
+    scheduled = {row["query_key"]: row for row in status["scheduled"]}
+    assert set(scheduled) == {due_key, fresh_key}
+    assert scheduled[due_key]["refresh_count"] == 1
+    assert status["refreshes_last_hour"] == 1
+    # Shared across clients: no search parameters or settings are exposed
+    assert "params" not in scheduled[due_key]
+    assert "config" not in status
+
+
+@pytest.mark.asyncio
+async def test_warmer_respects_hourly_budget(
+    in_memory_db: Database,
+    tracker: QueryPopularityTracker,
+    fake_client: FakeApifyClient,
+) -> None:
+    for term in ["a", "b", "c"]:
+        key = _seed(in_memory_db, term, expires_in=10)
+        tracker.record(key, "topic", {"searchTerms": [term]}, "min", hit=True)
+
+    warmer = CacheWarmer(
+        CacheWarmerConfig(top_n=3, max_refreshes_per_hour=2),
+        apify_token="token",
+        actor_name="actor",
+        tracker=tracker,
+    )
+    assert await warmer.run_once() == 2
+    assert await warmer.run_once() == 0
+    assert len(fake_client.calls) == 2
+    assert warmer.status()["skipped_for_budget"] == 2
+
+
+def test_scraper_serves_stale_entry_for_scheduled_query(
+    in_memory_db: Database,
+    tracker: QueryPopularityTracker,
+    fake_client: FakeApifyClient,
+) -> None:
+    key = _seed(in_memory_db, "hot", expires_in=-10)
+    tracker.active = True
+    tracker.set_scheduled({key})
+
+    scraper = TwitterScraper(apify_token="token", actor_name="actor", use_cache=True)
+    result = scraper.run_query(
+        QueryDefinition(
+            id="t",
+            type="topic",
+            name="n",
+            input=TwitterScraperInput(searchTerms=["hot"]),
+        )
+    )
+
+    assert result.stale and result.from_cache
+    assert result.items[0]["id"] == "old-hot"
+    assert fake_client.calls == []
+    assert tracker.take_refresh_requests() == {key}
+
+
+def test_scraper_runs_actor_for_expired_unscheduled_query(
+    in_memory_db: Database,
+    tracker: QueryPopularityTracker,
+    fake_client: FakeApifyClient,
+) -> None:
+    _seed(in_memory_db, "cold", expires_in=-10)
+    tracker.active = True
+
+    scraper = TwitterScraper(apify_token="token", actor_name="actor", use_cache=True)
+    result = scraper.run_query(
+        QueryDefinition(
+            id="t",
+            type="topic",
+            name="n",
+            input=TwitterScraperInput(searchTerms=["cold"]),
+        )
+    )
+
+    assert not result.stale
+    assert result.items[0]["id"] == "fresh"
+    snapshot: dict[str, Any] = {q.query_key: q for q in tracker.snapshot()}
+    assert next(iter(snapshot.values())).misses == 1
@@ -10,11 +10,19 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from db import Database, generate_query_key
-from db.models import Base, QueryCacheEntry, QueryCacheItem, Tweet, TweetAuthor
+from db.models import (
+    Base,
+    QueryCacheEntry,
+    QueryCacheItem,
+    Tweet,
+    TweetAuthor,
+    TweetRawPayload,
+)
+from db.raw_store import decode_raw, encode_raw
 from mcp_twitter.twitter import QueryType
 
 
@@ -451,3 +459,130 @@ def test_cache_without_author(in_memory_db: Database) -> None:
     assert len(cached) == 1
     assert cached[0]["id"] == "tweet_no_author"
     assert "author" not in cached[0] or cached[0].get("author") is None
+
+
+def test_get_cached_queries_returns_valid_entries_in_one_lookup(
+    in_memory_db: Database, sample_tweet_data: list[dict[str, Any]]
+) -> None:
+    """Test batch lookup returns ordered items for valid keys and skips misses."""
+    in_memory_db.save_query_cache(
+        query_key="key_a",
+        query_type="profile",
+        params={"searchTerms": ["from:a"]},
+        items=sample_tweet_data,
+    )
+    in_memory_db.save_query_cache(
+        query_key="key_empty",
+        query_type="profile",
+        params={"searchTerms": ["from:empty"]},
+        items=[],
+    )
+    in_memory_db.save_query_cache(
+        query_key="key_expired",
+        query_type="profile",
+        params={"searchTerms": ["from:old"]},
+        items=sample_tweet_data,
+    )
+    with in_memory_db.Session() as session:
+        entry = session.get(QueryCacheEntry, "key_expired")
+        entry.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+        session.commit()
+
+    result = in_memory_db.get_cached_queries(
+        ["key_a", "key_empty", "key_expired", "key_missing"]
+    )
+
+    assert set(result) == {"key_a", "key_empty"}
+    assert [t["id"] for t in result["key_a"]] == ["1234567890", "0987654321"]
+    assert result["key_a"][0]["author"]["userName"] == "testuser"
+    assert result["key_empty"] == []
+
+
+def test_raw_payload_roundtrip() -> None:
+    """Test compressed raw payloads decode to the original dict."""
+    item = {"id": "1", "text": "héllo " * 50, "entities": {"urls": []}}
+    payload = encode_raw(item, "gzip")
+    assert payload[:1] == b"g"
+    assert len(payload) < len(str(item))
+    assert decode_raw(payload) == item
+    with pytest.raises(ValueError):
+        decode_raw(b"?" + payload[1:])
+
+
+def test_compressed_raw_storage_keeps_hot_rows_minimal(
+    in_memory_db: Database, sample_tweet_data: list[dict[str, Any]]
+) -> None:
+    """Test compressed mode stores max payloads in the side table only."""
+    in_memory_db.raw_storage = "compressed"
+    raw_items = [{**t, "extra": {"entities": ["x"] * 20}} for t in sample_tweet_data]
+    in_memory_db.save_query_cache(
+        query_key="key_compressed",
+        query_type="topic",
+        params={"searchTerms": ["test"]},
+        items=raw_items,
+        output_format="max",
+    )
+
+    with in_memory_db.Session() as session:
+        assert all(t.raw_data is None for t in session.query(Tweet).all())
+        payloads = session.query(TweetRawPayload).all()
+        assert len(payloads) == 2
+        assert all(p.codec == "gzip" and p.raw_size > 0 for p in payloads)
+
+    assert in_memory_db.get_cached_query("key_compressed", "max") == raw_items
+    assert in_memory_db.get_cached_queries(["key_compressed"], "max") == {
+        "key_compressed": raw_items
+    }
+    minimized = in_memory_db.get_cached_query("key_compressed", "min")
+    assert minimized is not None
+    assert "extra" not in minimized[0]
+
+
+def test_save_loads_existing_tweets_and_payloads_in_bulk(
+    in_memory_db: Database, sample_tweet_data: list[dict[str, Any]]
+) -> None:
+    """Test re-saving max items does not lazy-load each tweet's raw payload."""
+    in_memory_db.raw_storage = "compressed"
+    items = [
+        {**sample_tweet_data[0], "id": str(i), "author": None} for i in range(20)
+    ]
+    params = {"searchTerms": ["test"]}
+    in_memory_db.save_query_cache("key_bulk", "topic", params, items, None, "max")
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:  # noqa: ANN001, ARG001
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(in_memory_db.engine, "before_cursor_execute", record)
+    try:
+        in_memory_db.save_query_cache("key_bulk", "topic", params, items, None, "max")
+    finally:
+        event.remove(in_memory_db.engine, "before_cursor_execute", record)
+
+    assert sum("FROM twitter_tweets" in s for s in statements) == 1
+    assert sum("FROM twitter_tweet_raw" in s for s in statements) == 1
+    assert in_memory_db.get_cached_query("key_bulk", "max") == items
+
+
+def test_migrate_raw_payloads_moves_inline_json(
+    in_memory_db: Database, sample_tweet_data: list[dict[str, Any]]
+) -> None:
+    """Test inline raw_data is migrated to the side table without changing reads."""
+    in_memory_db.save_query_cache(
+        query_key="key_inline",
+        query_type="topic",
+        params={"searchTerms": ["test"]},
+        items=sample_tweet_data,
+        output_format="max",
+    )
+    before = in_memory_db.get_cached_query("key_inline", "max")
+
+    assert in_memory_db.migrate_raw_payloads(batch_size=1) == 2
+    assert in_memory_db.migrate_raw_payloads() == 0
+
+    with in_memory_db.Session() as session:
+        assert all(t.raw_data is None for t in session.query(Tweet).all())
+        assert session.query(TweetRawPayload).count() == 2
+    assert in_memory_db.get_cached_query("key_inline", "max") == before
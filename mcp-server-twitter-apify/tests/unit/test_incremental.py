@@ -0,0 +1,206 @@
+"""
+Tests for incremental (since-id) refresh of cached profile queries.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import mcp_twitter.twitter.scraper as scraper_mod
+from db import Database, generate_query_key
+from db.models import Base, QueryCacheEntry
+from mcp_twitter.twitter.incremental import (
+    build_incremental_input,
+    incremental_username,
+    merge_incremental,
+)
+from mcp_twitter.twitter.models import QueryDefinition, TwitterScraperInput
+from mcp_twitter.twitter.scraper import TwitterScraper
+from tests.unit.fakes import FakeApifyClient
+
+
+def _tweet(tweet_id: str, created_at: str, likes: int = 0) -> dict[str, Any]:
+    return {
+        "id": tweet_id,
+        "text": f"tweet {tweet_id}",
+        "author": {"id": "u1", "userName": "TestUser"},
+        "likeCount": likes,
+        "createdAt": created_at,
+    }
+
+
+@pytest.fixture
+def cached_tweets() -> list[dict[str, Any]]:
+    """Cached ordering, newest first."""
+    return [
+        _tweet("1003", "Thu Dec 25 13:00:00 +0000 2025"),
+        _tweet("1002", "Thu Dec 25 12:00:00 +0000 2025"),
+        _tweet("1001", "Thu Dec 25 11:00:00 +0000 2025"),
+    ]
+
+
+@pytest.fixture
+def fresh_tweets() -> list[dict[str, Any]]:
+    """Actor output that also echoes an already-cached tweet."""
+    return [
+        _tweet("1005", "Thu Dec 25 15:00:00 +0000 2025"),
+        _tweet("1003", "Thu Dec 25 13:00:00 +0000 2025", likes=99),
+        _tweet("1004", "Thu Dec 25 14:00:00 +0000 2025"),
+    ]
+
+
+@pytest.fixture
+def in_memory_db() -> Database:
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(engine)
+    db = Database.__new__(Database)
+    db.engine = engine
+    db.Session = sessionmaker(bind=engine)
+    return db
+
+
+def test_merge_prepends_newer_tweets_and_drops_echoes(
+    cached_tweets: list[dict[str, Any]], fresh_tweets: list[dict[str, Any]]
+) -> None:
+    merged = merge_incremental(cached_tweets, fresh_tweets, since_id="1003")
+    assert [t["id"] for t in merged] == ["1005", "1004", "1003", "1002", "1001"]
+    # The cached copy of the head tweet is kept; the echo is not newer.
+    assert merged[2]["likeCount"] == 0
+
+
+def test_merge_truncates_to_max_items(
+    cached_tweets: list[dict[str, Any]], fresh_tweets: list[dict[str, Any]]
+) -> None:
+    merged = merge_incremental(
+        cached_tweets, fresh_tweets, since_id="1003", max_items=3
+    )
+    assert [t["id"] for t in merged] == ["1005", "1004", "1003"]
+
+
+def test_merge_with_no_new_tweets_keeps_cached_ordering(
+    cached_tweets: list[dict[str, Any]],
+) -> None:
+    merged = merge_incremental(cached_tweets, [], since_id="1003")
+    assert merged == cached_tweets
+
+
+def test_merge_falls_back_to_timestamp_for_non_numeric_ids(
+    cached_tweets: list[dict[str, Any]],
+) -> None:
+    fresh = [
+        _tweet("abc", "2025-12-25T16:00:00Z"),
+        _tweet("old", "2025-12-25T10:00:00Z"),
+    ]
+    merged = merge_incremental(
+        cached_tweets,
+        fresh,
+        since_id="not-a-number",
+        since_time=datetime(2025, 12, 25, 13, tzinfo=UTC),
+    )
+    assert [t["id"] for t in merged] == ["abc", "1003", "1002", "1001"]
+
+
+@pytest.mark.parametrize(
+    ("term", "sort", "expected"),
+    [
+        ("from:TestUser", "Latest", "TestUser"),
+        ("from:@TestUser since:2025-12-01", "Latest", "TestUser"),
+        ("from:TestUser since:2025-12-01 until:2025-12-31", "Latest", None),
+        ("from:TestUser since_id:5", "Latest", None),
+        ("from:TestUser", "Top", None),
+        ("TestUser", "Latest", None),
+    ],
+)
+def test_incremental_username_eligibility(
+    term: str, sort: str, expected: str | None
+) -> None:
+    run_input = TwitterScraperInput(searchTerms=[term], sort=sort)
+    assert incremental_username("profile", run_input) == expected
+
+
+def test_incremental_username_ignores_non_profile_queries() -> None:
+    run_input = TwitterScraperInput(searchTerms=["from:TestUser"])
+    assert incremental_username("topic", run_input) is None
+
+
+def test_build_incremental_input_appends_since_id() -> None:
+    run_input = TwitterScraperInput(searchTerms=["from:TestUser"], maxItems=10)
+    narrowed = build_incremental_input(run_input, "1003")
+    assert narrowed.searchTerms == ["from:TestUser since_id:1003"]
+    assert narrowed.maxItems == 10
+    assert run_input.searchTerms == ["from:TestUser"]
+
+
+def test_scraper_refreshes_expired_profile_query_incrementally(
+    monkeypatch,
+    in_memory_db: Database,
+    cached_tweets: list[dict[str, Any]],
+    fresh_tweets: list[dict[str, Any]],
+) -> None:
+    query_input = TwitterScraperInput(
+        searchTerms=["from:TestUser"], sort="Latest", maxItems=4
+    )
+    run_dict = query_input.model_dump(exclude_none=True)
+    query_key = generate_query_key("profile", run_dict)
+    in_memory_db.save_query_cache(
+        query_key=query_key,
+        query_type="profile",
+        params=run_dict,
+        items=cached_tweets,
+    )
+    with in_memory_db.Session() as session:
+        entry = session.get(QueryCacheEntry, query_key)
+        entry.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+        session.commit()
+
+    fake_client = FakeApifyClient(dataset_id="ds2", items=fresh_tweets)
+    monkeypatch.setattr(scraper_mod, "ApifyClient", lambda token: fake_client)  # noqa: ARG005
+    scraper = TwitterScraper(
+        apify_token="token",
+        actor_name="test-actor",
+        output_format="min",
+        use_cache=True,
+        incremental_refresh=True,
+    )
+    scraper._db = in_memory_db
+
+    result = scraper.run_query(
+        QueryDefinition(id="t", type="profile", name="n", input=query_input)
+    )
+
+    assert fake_client.calls[0]["searchTerms"] == ["from:TestUser since_id:1003"]
+    assert result.incremental
+    assert [t["id"] for t in result.items] == ["1005", "1004", "1003", "1002"]
+    cached = in_memory_db.get_cached_query(query_key, "min")
+    assert cached is not None
+    assert [t["id"] for t in cached] == ["1005", "1004", "1003", "1002"]
+
+
+def test_scraper_runs_full_query_without_cached_ordering(
+    monkeypatch, in_memory_db: Database, fresh_tweets: list[dict[str, Any]]
+) -> None:
+    fake_client = FakeApifyClient(dataset_id="ds1", items=fresh_tweets)
+    monkeypatch.setattr(scraper_mod, "ApifyClient", lambda token: fake_client)  # noqa: ARG005
+    scraper = TwitterScraper(
+        apify_token="token",
+        actor_name="test-actor",
+        use_cache=True,
+        incremental_refresh=True,
+    )
+    scraper._db = in_memory_db
+
+    scraper.run_query(
+        QueryDefinition(
+            id="t",
+            type="profile",
+            name="n",
+            input=TwitterScraperInput(searchTerms=["from:TestUser"]),
+        )
+    )
+
+    assert fake_client.calls[0]["searchTerms"] == ["from:TestUser"]
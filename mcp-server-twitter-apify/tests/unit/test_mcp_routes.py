@@ -13,7 +13,7 @@ import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
-from mcp_twitter.twitter import build_default_registry
+from mcp_twitter.twitter import ScrapeResult, build_default_registry
 
 
 class FakeScraper:
@@ -24,7 +24,7 @@ class FakeScraper:
         self.results_dir = tmp_results_dir
         self.actor_id = "actor"
         self.use_cache = False
-        self._last_items: list[dict[str, Any]] | None = [
+        self._items: list[dict[str, Any]] = [
             {
                 "id": "1234567890",
                 "text": "Great news about AI! This is amazing technology.",
@@ -69,13 +69,13 @@ class FakeScraper:
             },
         ]
 
-    def run_query(self, query) -> Path:  # noqa: ANN001
+    def run_query(self, query) -> ScrapeResult:  # noqa: ANN001
         """Run a query - data already set in __init__."""
-        return self.results_dir / query.output_filename()
-
-    def get_last_items(self) -> list[dict[str, Any]] | None:
-        """Return fake items for API access."""
-        return self._last_items
+        return ScrapeResult(
+            items=self._items,
+            query_type=query.type,
+            output_path=self.results_dir / query.output_filename(),
+        )
 
 
 class FakeTwitterScraper(FakeScraper):
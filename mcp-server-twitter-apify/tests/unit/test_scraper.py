@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Any
 
-from mcp_twitter.twitter import QueryDefinition, TwitterScraper, TwitterScraperInput
-from tests.unit.fakes import FakeApifyClient
+import pytest
+
+from mcp_twitter.twitter import (
+    QueryDefinition,
+    ScrapeResult,
+    TwitterScraper,
+    TwitterScraperInput,
+)
+from tests.unit.fakes import EchoApifyClient, FakeApifyClient
 
 
 def test_minimize_item_keeps_high_signal_fields_and_compacts_author() -> None:
@@ -66,10 +74,11 @@ def test_run_saves_json_and_minimizes_when_output_format_min(
     # Patch the client on the scraper instance after it's created
     monkeypatch.setattr(s, "client", fake_client)
 
-    out_path = s.run(
+    result = s.run(
         TwitterScraperInput(searchTerms=["hi"], maxItems=2), output_filename="out"
     )
-    assert out_path.exists()
+    out_path = result.output_path
+    assert out_path is not None and out_path.exists()
     assert out_path.name == "out.json"
 
     data = json.loads(out_path.read_text(encoding="utf-8"))
@@ -78,6 +87,23 @@ def test_run_saves_json_and_minimizes_when_output_format_min(
     assert "extra" not in data[1]
     assert fake_client.actor_ids == ["apidojo/twitter-scraper-lite"]
     assert fake_client.calls and fake_client.calls[0]["searchTerms"] == ["hi"]
+    assert fake_client.call_options == [{}]
+
+
+def test_run_passes_timeout_to_actor_run(monkeypatch, tmp_results_dir: Path) -> None:
+    fake_client = FakeApifyClient(dataset_id="ds1", items=[{"id": "1"}])
+    s = TwitterScraper(
+        apify_token="token",
+        results_dir=tmp_results_dir,
+        actor_name="actor",
+        use_cache=False,
+    )
+    monkeypatch.setattr(s, "client", fake_client)
+
+    s.run(TwitterScraperInput(searchTerms=["hi"], maxItems=1), timeout_secs=7)
+
+    # Apify aborts the run itself once the caller has stopped waiting
+    assert fake_client.call_options == [{"timeout_secs": 7}]
 
 
 def test_run_saves_raw_when_output_format_max(
@@ -97,8 +123,10 @@ def test_run_saves_raw_when_output_format_max(
     # Patch the client on the scraper instance after it's created
     monkeypatch.setattr(s, "client", fake_client)
 
-    out_path = s.run(TwitterScraperInput(searchTerms=["hi"]))
-    data = json.loads(out_path.read_text(encoding="utf-8"))
+    result = s.run(TwitterScraperInput(searchTerms=["hi"]))
+    assert result.items == fake_items
+    assert result.output_path is not None
+    data = json.loads(result.output_path.read_text(encoding="utf-8"))
     assert data == fake_items
 
 
@@ -117,12 +145,14 @@ def test_run_query_uses_query_output_filename(
         run_input: TwitterScraperInput,
         output_filename: str | None = None,
         query_type: str | None = None,  # noqa: ARG001
-    ) -> Path:
+        skip_cache_lookup: bool = False,  # noqa: ARG001
+        timeout_secs: int | None = None,  # noqa: ARG001
+    ) -> ScrapeResult:
         assert run_input.searchTerms == ["x"]
         assert output_filename == "q.json"
         p = tmp_results_dir / "q.json"
         p.write_text("[]", encoding="utf-8")
-        return p
+        return ScrapeResult(items=[], output_path=p)
 
     monkeypatch.setattr(s, "run", fake_run)
     q = QueryDefinition(
@@ -132,5 +162,32 @@ def test_run_query_uses_query_output_filename(
         input=TwitterScraperInput(searchTerms=["x"]),
         output="q.json",
     )
-    out_path = s.run_query(q)
-    assert out_path.name == "q.json"
+    result = s.run_query(q)
+    assert result.output_path is not None
+    assert result.output_path.name == "q.json"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_on_shared_scraper_return_isolated_results(
+    monkeypatch,
+) -> None:
+    fake_client = EchoApifyClient(max_delay=0.02)
+    s = TwitterScraper(
+        apify_token="token",
+        actor_name="actor",
+        use_cache=False,
+    )
+    monkeypatch.setattr(s, "client", fake_client)
+
+    terms = [f"term{i}" for i in range(50)]
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(s.run, TwitterScraperInput(searchTerms=[term]))
+            for term in terms
+        )
+    )
+
+    for term, result in zip(terms, results, strict=True):
+        assert [i["id"] for i in result.items] == [f"{term}-{n}" for n in range(3)]
+    assert len({r.dataset_id for r in results}) == len(terms)
+    assert not hasattr(s, "_last_items")
@@ -106,14 +106,14 @@ def test_scraper_uses_cache_on_hit(
     fake_client = FakeApifyClient(dataset_id="ds1", items=[])
     monkeypatch.setattr(scraper_mod, "ApifyClient", lambda token: fake_client)  # noqa: ARG005
 
-    result_path = scraper.run_query(query)
+    result = scraper.run_query(query)
 
     # Verify cache was used (no Apify calls)
     assert len(fake_client.calls) == 0
+    assert result.from_cache
 
     # Verify items are available
-    items = scraper.get_last_items()
-    assert items is not None
+    items = result.items
     assert len(items) == 1
     assert items[0]["id"] == "1234567890"
 
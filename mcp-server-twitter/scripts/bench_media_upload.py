@@ -0,0 +1,144 @@
+"""
+Benchmark the chunked media upload against a local fake upload endpoint.
+
+Main responsibility: Serve `/1.1/media/upload.json` (INIT/APPEND/FINALIZE)
+from an aiohttp app with a fixed per-request latency, then report:
+peak Python memory of uploading one large video compared with decoding the
+whole payload up front (what the old `_upload_media` did before handing a
+`BytesIO` copy to tweepy), and wall time of uploading four images one after
+another compared with `create_tweet`'s concurrent uploads.
+
+Usage (from the project root):
+    uv run python scripts/bench_media_upload.py
+    uv run python scripts/bench_media_upload.py --video-mb 64 --latency-ms 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import io
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+import mcp_server_twitter.twitter.module as module  # noqa: E402
+from mcp_server_twitter.twitter.config import TwitterConfig  # noqa: E402
+from mcp_server_twitter.twitter.module import AsyncTwitterClient  # noqa: E402
+
+MB = 1024 * 1024
+
+
+async def start_fake_api(latency_ms: float) -> TestServer:
+    """Start the fake upload endpoint and point the client module at it."""
+    uploads: dict[str, int] = {}
+
+    async def upload(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency_ms / 1000)
+        command = request.query["command"]
+        if command == "INIT":
+            media_id = str(len(uploads) + 1)
+            uploads[media_id] = 0
+            return web.json_response({"media_id_string": media_id})
+        if command == "APPEND":
+            part = await (await request.multipart()).next()
+            while chunk := await part.read_chunk():
+                uploads[request.query["media_id"]] += len(chunk)
+            return web.Response(status=204)
+        return web.json_response({"media_id_string": request.query["media_id"]})
+
+    app = web.Application(client_max_size=8 * MB)
+    app.router.add_post("/1.1/media/upload.json", upload)
+    server = TestServer(app)
+    await server.start_server()
+    base_url = f"http://{server.host}:{server.port}"
+    module.MEDIA_UPLOAD_URL = base_url + "/1.1/media/upload.json"
+    return server
+
+
+def make_client(chunk_mb: int) -> AsyncTwitterClient:
+    config = TwitterConfig(
+        API_KEY="bench",
+        API_SECRET_KEY="bench",
+        ACCESS_TOKEN="bench",
+        ACCESS_TOKEN_SECRET="bench",
+        BEARER_TOKEN="bench",
+        media_chunk_size_bytes=chunk_mb * MB,
+    )
+    client = AsyncTwitterClient(config=config)
+    client.client = AsyncMock()
+    client.client.create_tweet.return_value = MagicMock(data={"id": "1"})
+    return client
+
+
+def payload(header: bytes, size: int) -> str:
+    return base64.b64encode(header + os.urandom(size - len(header))).decode()
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = await start_fake_api(args.latency_ms)
+    client = make_client(args.chunk_mb)
+    video = payload(b"\x00\x00\x00\x18ftypmp42", args.video_mb * MB)
+    images = [payload(b"\x89PNG\r\n\x1a\n", args.image_mb * MB) for _ in range(4)]
+
+    try:
+        tracemalloc.start()
+        decoded = io.BytesIO(base64.b64decode(video))
+        _, decode_all_peak = tracemalloc.get_traced_memory()
+        del decoded
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        await client._upload_media(video)
+        chunked_seconds = time.perf_counter() - start
+        _, chunked_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{args.video_mb} MB video, {args.chunk_mb} MB chunks, "
+            f"fake API latency {args.latency_ms:.0f} ms"
+        )
+        print(f"  decode whole payload     peak {decode_all_peak / MB:7.1f} MB")
+        print(
+            f"  chunked upload           peak {chunked_peak / MB:7.1f} MB "
+            f"({chunked_seconds * 1000:.0f} ms)"
+        )
+
+        start = time.perf_counter()
+        for image in images:
+            await client._upload_media(image)
+        sequential = time.perf_counter() - start
+        start = time.perf_counter()
+        await client.create_tweet(
+            text="bench", image_content_str=images[0], image_contents=images[1:]
+        )
+        concurrent = time.perf_counter() - start
+
+        print(f"4 x {args.image_mb} MB images")
+        print(f"  one after another        {sequential * 1000:7.0f} ms")
+        print(f"  create_tweet (parallel)  {concurrent * 1000:7.0f} ms")
+    finally:
+        await client.close()
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--video-mb", type=int, default=32)
+    parser.add_argument("--image-mb", type=int, default=2)
+    parser.add_argument("--chunk-mb", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark latency recording and percentile queries in `metrics.py`.
+
+Main responsibility: Compare the previous per-operation window (a
+`deque(maxlen=100)` sorted on every p95 read) with `LatencyHistogram` on the
+same lognormal samples: cost per `record`, cost per p95 query, memory held per
+operation, and p50/p95/p99 error against the exact quantiles of the full run.
+
+Usage (from the project root):
+    uv run python scripts/bench_metrics.py
+    uv run python scripts/bench_metrics.py --samples 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp_server_twitter.metrics import LatencyHistogram  # noqa: E402
+
+QUERIES = 10_000
+
+
+def deque_p95(window: deque[float]) -> float:
+    """The p95 calculation `OperationMetrics` used before the histogram."""
+    ordered = sorted(window)
+    return ordered[int(len(ordered) * 0.95)]
+
+
+def per_call_ns(start: float, calls: int) -> float:
+    return (time.perf_counter() - start) * 1e9 / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    samples = [rng.lognormvariate(4, 1) for _ in range(args.samples)]
+    exact = sorted(samples)
+
+    window: deque[float] = deque(maxlen=100)
+    start = time.perf_counter()
+    for sample in samples:
+        window.append(sample)
+    deque_record = per_call_ns(start, len(samples))
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        deque_p95(window)
+    deque_query = per_call_ns(start, QUERIES)
+
+    histogram = LatencyHistogram()
+    start = time.perf_counter()
+    for sample in samples:
+        histogram.record(sample)
+    histogram_record = per_call_ns(start, len(samples))
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        histogram.percentile(95)
+    histogram_query = per_call_ns(start, QUERIES)
+
+    print(f"{args.samples} lognormal samples (median ~{exact[len(exact) // 2]:.0f} ms)")
+    print(f"{'':<22} {'record ns':>10} {'p95 ns':>9} {'slots':>6}")
+    print(f"{'deque(100) + sort':<22} {deque_record:10.0f} {deque_query:9.0f} {100:>6}")
+    print(
+        f"{'LatencyHistogram':<22} {histogram_record:10.0f} {histogram_query:9.0f} "
+        f"{len(histogram.counts):>6}"
+    )
+    print(f"{'percentile':<10} {'exact ms':>9} {'deque err':>10} {'hist err':>9}")
+    for percent in (50, 95, 99):
+        truth = exact[max(0, -(-len(exact) * percent // 100) - 1)]
+        last = sorted(window)[int(len(window) * percent / 100)]
+        print(
+            f"p{percent:<9} {truth:9.1f} {abs(last - truth) / truth:10.1%} "
+            f"{abs(histogram.percentile(percent) - truth) / truth:9.2%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark `AsyncTwitterClient.get_trends` against a local fake trends API.
+
+Main responsibility: Serve `/2/trends/by/woeid/{woeid}` from an aiohttp app
+with a fixed per-request latency, then time `get_trends` for 1, 10 and 50
+countries: sequentially (`trends_concurrency=1`, cache off, like the old
+one-by-one loop), concurrently with a cold cache, and again with a warm cache.
+
+Usage (from the project root):
+    uv run python scripts/bench_trends.py
+    uv run python scripts/bench_trends.py --latency-ms 120 --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+import mcp_server_twitter.twitter.module as module  # noqa: E402
+from mcp_server_twitter.twitter.config import TwitterConfig  # noqa: E402
+from mcp_server_twitter.twitter.module import (  # noqa: E402
+    WOEID_BY_COUNTRY,
+    AsyncTwitterClient,
+)
+
+COUNTRY_COUNTS = (1, 10, 50)
+
+
+async def start_fake_api(latency_ms: float) -> TestServer:
+    """Start the fake trends endpoint and point the client module at it."""
+
+    async def trends(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency_ms / 1000)
+        woeid = request.match_info["woeid"]
+        return web.json_response(
+            {"data": [{"trend_name": f"#{woeid}-{i}"} for i in range(50)]}
+        )
+
+    app = web.Application()
+    app.router.add_get("/2/trends/by/woeid/{woeid}", trends)
+    server = TestServer(app)
+    await server.start_server()
+    base_url = f"http://{server.host}:{server.port}"
+    module.TRENDS_URL = base_url + "/2/trends/by/woeid/{woeid}"
+    return server
+
+
+def make_client(concurrency: int, cache_ttl: float) -> AsyncTwitterClient:
+    config = TwitterConfig(
+        API_KEY="bench",
+        API_SECRET_KEY="bench",
+        ACCESS_TOKEN="bench",
+        ACCESS_TOKEN_SECRET="bench",
+        BEARER_TOKEN="bench",
+        trends_concurrency=concurrency,
+        trends_cache_ttl_seconds=cache_ttl,
+    )
+    return AsyncTwitterClient(config=config)
+
+
+async def time_calls(
+    client: AsyncTwitterClient, countries: list[str], rounds: int, clear_cache: bool
+) -> float:
+    """Median wall time in ms of `rounds` get_trends calls."""
+    timings = []
+    for _ in range(rounds):
+        if clear_cache:
+            client._trends_cache.clear()
+        start = time.perf_counter()
+        result = await client.get_trends(countries)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert all(not t[0].startswith("Error") for t in result.values()), result
+    return statistics.median(timings)
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = await start_fake_api(args.latency_ms)
+    sequential = make_client(concurrency=1, cache_ttl=0)
+    concurrent = make_client(concurrency=args.concurrency, cache_ttl=300)
+
+    print(
+        f"fake API latency {args.latency_ms:.0f} ms, "
+        f"concurrency {args.concurrency}, median of {args.rounds} calls"
+    )
+    print(f"{'countries':>9} {'sequential':>11} {'concurrent':>11} {'cached':>9}")
+    try:
+        for count in COUNTRY_COUNTS:
+            countries = list(WOEID_BY_COUNTRY)[:count]
+            seq = await time_calls(sequential, countries, args.rounds, True)
+            cold = await time_calls(concurrent, countries, args.rounds, True)
+            warm = await time_calls(concurrent, countries, args.rounds, False)
+            print(f"{count:>9} {seq:>9.1f}ms {cold:>9.1f}ms {warm:>7.2f}ms")
+    finally:
+        await sequential.close()
+        await concurrent.close()
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+from mcp_server_twitter.api_routers.health import prometheus_router
 from mcp_server_twitter.api_routers.health import router as health_router
 
 routers = [health_router]
+# Mounted at the application root instead of under /api
+root_routers = [prometheus_router]
@@ -1,11 +1,16 @@
 import logging
 
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 
 from mcp_server_twitter.metrics import get_health_checker, get_metrics_collector
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
+# Mounted without the /api prefix, at the path Prometheus scrapes by default
+prometheus_router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
 
 @router.get(
@@ -36,3 +41,17 @@ async def get_metrics() -> dict:
     logger.debug("Metrics requested", extra={"metrics_summary": metrics})
 
     return metrics
+
+
+@prometheus_router.get(
+    "/metrics",
+    tags=["Health"],
+    operation_id="get_prometheus_metrics",
+    response_class=PlainTextResponse,
+)
+async def get_prometheus_metrics() -> PlainTextResponse:
+    """Get server performance metrics in the Prometheus text format."""
+    metrics_collector = get_metrics_collector()
+    return PlainTextResponse(
+        metrics_collector.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
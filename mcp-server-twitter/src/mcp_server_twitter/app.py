@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastmcp import FastMCP
 
+from mcp_server_twitter.api_routers import root_routers
 from mcp_server_twitter.api_routers import routers as api_routers
 from mcp_server_twitter.dependencies import DependencyContainer
 from mcp_server_twitter.hybrid_routers import routers as hybrid_routers
@@ -166,6 +167,10 @@ def create_app() -> FastAPI:
     for router in api_routers:
         app.include_router(router, prefix="/api")
 
+    # Prometheus scrape endpoint: /metrics
+    for router in root_routers:
+        app.include_router(router)
+
     # Hybrid routes: accessible via /hybrid/* (REST) and /mcp (MCP)
     for router in hybrid_routers:
         app.include_router(router, prefix="/hybrid")
@@ -47,8 +47,9 @@ class DependencyContainer:
         """
         logger.info("Shutting down dependencies...")
 
-        # Twitter client doesn't have explicit close method currently
-        cls._twitter_client = None
+        if cls._twitter_client is not None:
+            await cls._twitter_client.close()
+            cls._twitter_client = None
 
         logger.info("Dependencies shut down successfully.")
 
@@ -5,7 +5,7 @@ from fastmcp.exceptions import ToolError
 from pydantic import ValidationError
 
 from mcp_server_twitter.dependencies import get_twitter_client_dep
-from mcp_server_twitter.errors import TwitterMCPError, TwitterValidationError
+from mcp_server_twitter.errors import TwitterMCPError
 from mcp_server_twitter.logging_config import get_logger
 from mcp_server_twitter.metrics import async_timed
 from mcp_server_twitter.schemas import CreateTweetRequest
@@ -29,7 +29,9 @@ async def create_tweet(
         f"{__name__}.create_tweet",
         operation="create_tweet",
         text_length=len(create_request.text),
-        has_image=bool(create_request.image_content_str),
+        has_image=bool(
+            create_request.image_content_str or create_request.image_contents
+        ),
         has_poll=bool(create_request.poll_options),
         is_reply=bool(create_request.in_reply_to_tweet_id),
         is_quote=bool(create_request.quote_tweet_id),
@@ -49,26 +51,15 @@ async def create_tweet(
     )
 
     try:
-        # Input validation with detailed logging
-        if create_request.image_content_str:
-            operation_logger.debug("Validating image content")
-            image_size = len(create_request.image_content_str.encode("utf-8"))
-            operation_logger.debug(f"Image size: {image_size} bytes")
-
-            if image_size > 5_000_000:
-                raise TwitterValidationError(
-                    "Image content too large (max 5MB)",
-                    field_name="image_content_str",
-                    field_value=f"{image_size} bytes",
-                    context={"max_size_bytes": 5_000_000},
-                )
-
+        # Per-type size limits (5MB images, 15MB GIFs, 512MB videos) are
+        # checked by the client before the chunked upload starts
         operation_logger.debug("Calling Twitter API to create tweet")
 
         # Call Twitter client with validated data
         result = await client.create_tweet(
             text=create_request.text,
             image_content_str=create_request.image_content_str,
+            image_contents=create_request.image_contents,
             poll_options=create_request.poll_options,
             poll_duration=create_request.poll_duration,
             in_reply_to_tweet_id=create_request.in_reply_to_tweet_id,
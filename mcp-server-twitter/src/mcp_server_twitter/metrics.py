@@ -1,6 +1,6 @@
 import logging
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from collections.abc import Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
@@ -10,6 +10,112 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds (seconds) of the Prometheus histogram buckets
+PROMETHEUS_BUCKETS_SECONDS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+PROMETHEUS_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory HDR-style histogram of durations.
+
+    Durations are stored as integer microseconds in log-linear buckets: values
+    below 128us get exact buckets, above that every power-of-two range is split
+    into 64 sub-buckets, so any reported value is within 1/64 (~1.6%) of the
+    recorded one. Recording is O(1). Buckets are also totalled per group of 64,
+    so a quantile query scans at most a few dozen groups and one group's
+    buckets, however many samples were recorded. Histograms with the same
+    layout can be merged. Samples are recorded on the event loop thread, so no
+    lock is taken.
+    """
+
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS  # exact values below this
+    SUB_BUCKET_HALF_BITS = SUB_BUCKET_BITS - 1
+    SUB_BUCKET_HALF = 1 << SUB_BUCKET_HALF_BITS  # buckets per group
+    MAX_VALUE_US = 3_600_000_000  # 1 hour; longer samples are clamped
+
+    def __init__(self):
+        size = self._index(self.MAX_VALUE_US) + 1
+        self.counts: list[int] = [0] * size
+        self.group_counts: list[int] = [0] * -(-size // self.SUB_BUCKET_HALF)
+        self.total_count = 0
+        self.total_us = 0
+        self.max_index = -1
+
+    @classmethod
+    def _index(cls, value_us: int) -> int:
+        if value_us < cls.SUB_BUCKET_COUNT:
+            return value_us
+        shift = value_us.bit_length() - cls.SUB_BUCKET_BITS
+        return (shift << cls.SUB_BUCKET_HALF_BITS) + (value_us >> shift)
+
+    @classmethod
+    def _value(cls, index: int) -> float:
+        """Midpoint of a bucket, in microseconds."""
+        if index < cls.SUB_BUCKET_COUNT:
+            return float(index)
+        shift = (index >> cls.SUB_BUCKET_HALF_BITS) - 1
+        lower = (index - (shift << cls.SUB_BUCKET_HALF_BITS)) << shift
+        return lower + ((1 << shift) - 1) / 2
+
+    def record(self, duration_ms: float) -> None:
+        """Record one duration."""
+        value_us = int(duration_ms * 1000)
+        if value_us < 0:
+            value_us = 0
+        elif value_us > self.MAX_VALUE_US:
+            value_us = self.MAX_VALUE_US
+        if value_us < self.SUB_BUCKET_COUNT:
+            index = value_us
+        else:
+            # Same as _index, inlined: this runs for every timed operation
+            shift = value_us.bit_length() - self.SUB_BUCKET_BITS
+            index = (shift << self.SUB_BUCKET_HALF_BITS) + (value_us >> shift)
+        self.counts[index] += 1
+        self.group_counts[index >> self.SUB_BUCKET_HALF_BITS] += 1
+        self.total_count += 1
+        self.total_us += value_us
+        if index > self.max_index:
+            self.max_index = index
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add another histogram's samples to this one and return self."""
+        for index in range(other.max_index + 1):
+            self.counts[index] += other.counts[index]
+        for group, count in enumerate(other.group_counts):
+            self.group_counts[group] += count
+        self.total_count += other.total_count
+        self.total_us += other.total_us
+        self.max_index = max(self.max_index, other.max_index)
+        return self
+
+    def percentile(self, percent: float) -> float:
+        """Duration in ms at the given percentile (0-100); 0.0 when empty."""
+        if self.total_count == 0:
+            return 0.0
+        rank = max(1, -(-self.total_count * percent // 100))  # ceil, at least 1
+        seen = 0
+        for group, group_count in enumerate(self.group_counts):
+            if seen + group_count >= rank:
+                index = group << self.SUB_BUCKET_HALF_BITS
+                while True:
+                    seen += self.counts[index]
+                    if seen >= rank:
+                        return self._value(index) / 1000
+                    index += 1
+            seen += group_count
+        return self._value(self.max_index) / 1000
+
+    def count_at_or_below(self, duration_ms: float) -> int:
+        """Number of samples no larger than `duration_ms` (bucket precision)."""
+        limit = self._index(min(int(duration_ms * 1000), self.MAX_VALUE_US))
+        group = limit >> self.SUB_BUCKET_HALF_BITS
+        first = group << self.SUB_BUCKET_HALF_BITS
+        return sum(self.group_counts[:group]) + sum(self.counts[first : limit + 1])
+
 
 @dataclass
 class OperationMetrics:
@@ -22,7 +128,7 @@ class OperationMetrics:
     max_duration_ms: float = 0.0
     success_count: int = 0
     error_count: int = 0
-    recent_durations: deque = field(default_factory=lambda: deque(maxlen=100))
+    durations: LatencyHistogram = field(default_factory=LatencyHistogram)
     last_called: datetime | None = None
 
     @property
@@ -39,14 +145,20 @@ class OperationMetrics:
             return 0.0
         return (self.success_count / self.total_calls) * 100
 
+    @property
+    def p50_duration_ms(self) -> float:
+        """Median duration over all calls."""
+        return self.durations.percentile(50)
+
     @property
     def p95_duration_ms(self) -> float:
-        """Calculate 95th percentile duration."""
-        if not self.recent_durations:
-            return 0.0
-        sorted_durations = sorted(self.recent_durations)
-        index = int(0.95 * len(sorted_durations))
-        return sorted_durations[min(index, len(sorted_durations) - 1)]
+        """95th percentile duration over all calls."""
+        return self.durations.percentile(95)
+
+    @property
+    def p99_duration_ms(self) -> float:
+        """99th percentile duration over all calls."""
+        return self.durations.percentile(99)
 
 
 class MetricsCollector:
@@ -72,7 +184,7 @@ class MetricsCollector:
         metrics.total_duration_ms += duration_ms
         metrics.min_duration_ms = min(metrics.min_duration_ms, duration_ms)
         metrics.max_duration_ms = max(metrics.max_duration_ms, duration_ms)
-        metrics.recent_durations.append(duration_ms)
+        metrics.durations.record(duration_ms)
         metrics.last_called = datetime.now(UTC)
 
         if success:
@@ -101,7 +213,9 @@ class MetricsCollector:
                 "avg_duration_ms": round(metrics.avg_duration_ms, 2),
                 "min_duration_ms": round(metrics.min_duration_ms, 2),
                 "max_duration_ms": round(metrics.max_duration_ms, 2),
+                "p50_duration_ms": round(metrics.p50_duration_ms, 2),
                 "p95_duration_ms": round(metrics.p95_duration_ms, 2),
+                "p99_duration_ms": round(metrics.p99_duration_ms, 2),
                 "last_called": metrics.last_called.isoformat()
                 if metrics.last_called
                 else None,
@@ -109,11 +223,84 @@ class MetricsCollector:
 
         return result
 
+    def merged_durations(self, prefix: str = "") -> LatencyHistogram:
+        """Combined durations of all operations whose name starts with `prefix`."""
+        merged = LatencyHistogram()
+        for op_name, metrics in self.operations.items():
+            if op_name.startswith(prefix):
+                merged.merge(metrics.durations)
+        return merged
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        now = datetime.now(UTC)
+        lines = [
+            "# HELP twitter_uptime_seconds Seconds since metrics collection started.",
+            "# TYPE twitter_uptime_seconds gauge",
+            f"twitter_uptime_seconds {(now - self._start_time).total_seconds():.3f}",
+            "# HELP twitter_operation_calls_total Completed operations by outcome.",
+            "# TYPE twitter_operation_calls_total counter",
+        ]
+        operations = sorted(self.operations.items())
+        for op_name, metrics in operations:
+            op = _label_value(op_name)
+            lines.append(
+                f'twitter_operation_calls_total{{operation="{op}",outcome="success"}} '
+                f"{metrics.success_count}"
+            )
+            lines.append(
+                f'twitter_operation_calls_total{{operation="{op}",outcome="error"}} '
+                f"{metrics.error_count}"
+            )
+
+        lines += [
+            "# HELP twitter_operation_duration_seconds Operation latency.",
+            "# TYPE twitter_operation_duration_seconds histogram",
+        ]
+        for op_name, metrics in operations:
+            op = _label_value(op_name)
+            durations = metrics.durations
+            for bound in PROMETHEUS_BUCKETS_SECONDS:
+                count = durations.count_at_or_below(bound * 1000)
+                lines.append(
+                    f'twitter_operation_duration_seconds_bucket{{operation="{op}",'
+                    f'le="{bound}"}} {count}'
+                )
+            lines += [
+                f'twitter_operation_duration_seconds_bucket{{operation="{op}",'
+                f'le="+Inf"}} {durations.total_count}',
+                f'twitter_operation_duration_seconds_sum{{operation="{op}"}} '
+                f"{durations.total_us / 1_000_000:.6f}",
+                f'twitter_operation_duration_seconds_count{{operation="{op}"}} '
+                f"{durations.total_count}",
+            ]
+
+        lines += [
+            "# HELP twitter_operation_duration_quantile_seconds "
+            "Latency quantiles over all calls (within 1.6%).",
+            "# TYPE twitter_operation_duration_quantile_seconds gauge",
+        ]
+        for op_name, metrics in operations:
+            op = _label_value(op_name)
+            for quantile in PROMETHEUS_QUANTILES:
+                value = metrics.durations.percentile(quantile * 100) / 1000
+                lines.append(
+                    f'twitter_operation_duration_quantile_seconds{{operation="{op}",'
+                    f'quantile="{quantile}"}} {value:.6f}'
+                )
+
+        return "\n".join(lines) + "\n"
+
     def log_summary(self):
         """Log a summary of all metrics."""
         pass
 
 
+def _label_value(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
 # Global metrics collector instance
 _metrics_collector = MetricsCollector()
 
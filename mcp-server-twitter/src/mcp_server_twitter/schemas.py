@@ -13,6 +13,11 @@ class CreateTweetRequest(BaseModel):
         None,
         description="A Base64-encoded string of image data to attach as media. Optional, pass null for no image. Requires media uploads to be enabled in config.",
     )
+    image_contents: list[str] | None = Field(
+        None,
+        max_length=4,
+        description="Up to 4 Base64-encoded media files (PNG, JPEG, WEBP, GIF or MP4 video) to attach, uploaded concurrently. Optional, pass null for none. Used together with image_content_str, the total must not exceed 4.",
+    )
     poll_options: list[str] | None = Field(
         None,
         description="A list of 2 to 4 options to include in a poll. Optional, pass null for no poll.",
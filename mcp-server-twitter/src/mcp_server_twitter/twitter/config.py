@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,3 +20,10 @@ class TwitterConfig(BaseSettings):
     max_tweet_length: int = 280
     poll_max_options: int = 4
     poll_max_duration: int = 10080
+    # Trends: countries fetched in parallel and seconds results are reused (0 = off)
+    trends_concurrency: int = Field(default=8, ge=1)
+    trends_cache_ttl_seconds: float = Field(default=300.0, ge=0)
+    # Media: bytes sent per chunked-upload APPEND request (Twitter allows up to 5 MB)
+    media_chunk_size_bytes: int = Field(
+        default=1024 * 1024, ge=1024, le=5 * 1024 * 1024
+    )
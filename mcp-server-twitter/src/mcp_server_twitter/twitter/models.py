@@ -0,0 +1,28 @@
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class UploadedMedia:
+    """A media file that finished uploading and can be attached to a tweet."""
+
+    media_id: str
+    size_bytes: int
+    media_type: str
+
+
+@dataclass
+class MediaUploadSession:
+    """Progress of a chunked upload, kept so a failed upload can resume."""
+
+    media_id: str
+    total_bytes: int
+    media_type: str
+    media_category: str
+    # Monotonic time after which Twitter discards the uploaded segments
+    expires_at: float
+    next_segment: int = 0
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
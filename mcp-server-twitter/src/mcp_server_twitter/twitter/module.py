@@ -1,12 +1,16 @@
 import asyncio
 import base64
-import io
+import hashlib
+import json
 import os
+import re
 import ssl
+import time
+from collections.abc import Iterator
+from urllib.parse import urlencode
 
 import aiohttp
-import anyio
-import requests
+from oauthlib.oauth1 import Client as OAuthClient
 from tenacity import (
     retry,
     retry_if_exception,
@@ -14,7 +18,6 @@ from tenacity import (
     stop_after_attempt,
     wait_exponential,
 )
-from tweepy import API, OAuth1UserHandler
 from tweepy.asynchronous import AsyncClient
 from tweepy.errors import TweepyException
 
@@ -23,12 +26,14 @@ from mcp_server_twitter.errors import (
     TwitterAuthenticationError,
     TwitterClientError,
     TwitterMediaUploadError,
+    TwitterValidationError,
     map_aiohttp_error,
     map_tweepy_error,
     on_final_retry_failure,
 )
 from mcp_server_twitter.logging_config import get_logger, log_retry_attempt
 from mcp_server_twitter.metrics import async_operation_timer, async_timed
+from mcp_server_twitter.twitter.models import MediaUploadSession, UploadedMedia
 
 logger = get_logger(__name__)
 
@@ -56,6 +61,119 @@ def is_retryable_tweepy_error(exception: Exception) -> bool:
     return is_retryable
 
 
+# Yahoo! Where On Earth IDs of the countries the trends endpoint supports
+WOEID_BY_COUNTRY: dict[str, int] = {
+    "Worldwide": 1,
+    "Algeria": 23424740,
+    "Argentina": 23424747,
+    "Australia": 23424748,
+    "Austria": 23424750,
+    "Bahrain": 23424753,
+    "Belgium": 23424757,
+    "Belarus": 23424765,
+    "Brazil": 23424768,
+    "Canada": 23424775,
+    "Chile": 23424782,
+    "China": 23424781,
+    "Colombia": 23424787,
+    "Dominican Republic": 23424800,
+    "Ecuador": 23424801,
+    "Egypt": 23424802,
+    "Ireland": 23424803,
+    "France": 23424819,
+    "Germany": 23424829,
+    "Ghana": 23424824,
+    "Greece": 23424833,
+    "Guatemala": 23424834,
+    "Indonesia": 23424846,
+    "India": 23424848,
+    "Italy": 23424853,
+    "Japan": 23424856,
+    "Jordan": 23424860,
+    "Kenya": 23424863,
+    "South Korea": 23424868,
+    "Kuwait": 23424870,
+    "Lebanon": 23424873,
+    "Latvia": 23424874,
+    "Oman": 23424898,
+    "Malaysia": 23424901,
+    "Mexico": 23424900,
+    "Netherlands": 23424909,
+    "Norway": 23424910,
+    "Nigeria": 23424908,
+    "New Zealand": 23424916,
+    "Pakistan": 23424922,
+    "Poland": 23424923,
+    "Panama": 23424924,
+    "Portugal": 23424925,
+    "Qatar": 23424930,
+    "Russia": 23424936,
+    "Saudi Arabia": 23424938,
+    "South Africa": 23424942,
+    "Singapore": 23424948,
+    "Spain": 23424950,
+    "Sweden": 23424954,
+    "Switzerland": 23424957,
+    "Thailand": 23424960,
+    "Turkey": 23424969,
+    "United Arab Emirates": 23424738,
+    "Ukraine": 23424976,
+    "United Kingdom": 23424975,
+    "United States": 23424977,
+    "Venezuela": 23424982,
+    "Vietnam": 23424984,
+}
+
+TRENDS_URL = "https://api.twitter.com/2/trends/by/woeid/{woeid}"
+
+MEDIA_UPLOAD_URL = "https://upload.twitter.com/1.1/media/upload.json"
+# Largest file Twitter accepts per media category, in bytes
+MEDIA_SIZE_LIMITS: dict[str, int] = {
+    "tweet_image": 5 * 1024 * 1024,
+    "tweet_gif": 15 * 1024 * 1024,
+    "tweet_video": 512 * 1024 * 1024,
+}
+MAX_MEDIA_PER_TWEET = 4
+MEDIA_PROCESSING_TIMEOUT_SECONDS = 300
+
+
+def detect_media_type(head: bytes) -> tuple[str, str]:
+    """Return (MIME type, media category) from the first bytes of a file."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg", "tweet_image"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif", "tweet_gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp", "tweet_image"
+    if head[4:8] == b"ftyp":
+        return "video/mp4", "tweet_video"
+    # PNG, and anything unrecognised, is sent as PNG like before
+    return "image/png", "tweet_image"
+
+
+def iter_base64_chunks(
+    content: str, chunk_size: int, first_chunk: int = 0
+) -> Iterator[bytes]:
+    """
+    Decode base64 `content` lazily, `chunk_size` bytes (rounded down to a
+    multiple of 3) at a time, starting at chunk `first_chunk`.
+
+    Every slice covers a multiple of 4 characters, so it decodes on its own and
+    only one decoded chunk is held in memory.
+    """
+    step = chunk_size // 3 * 4
+    for offset in range(first_chunk * step, len(content), step):
+        yield base64.b64decode(content[offset : offset + step], validate=True)
+
+
+def _media_key(content: str) -> str:
+    """Stable key of a base64 payload, used to find an upload to resume."""
+    digest = hashlib.sha256()
+    for offset in range(0, len(content), 1 << 20):
+        digest.update(content[offset : offset + (1 << 20)].encode("ascii"))
+    return digest.hexdigest()
+
+
 # Enhanced retry wrappers with proper final failure handling
 retry_async_wrapper = retry(
     stop=stop_after_attempt(5),
@@ -67,16 +185,6 @@ retry_async_wrapper = retry(
     reraise=True,
 )
 
-retry_sync_in_async_wrapper = retry(
-    stop=stop_after_attempt(5),
-    wait=wait_exponential(min=0.5, max=10),
-    retry=retry_if_exception_type(requests.exceptions.RequestException)
-    | retry_if_exception(is_retryable_tweepy_error),
-    before_sleep=log_retry_attempt,
-    retry_error_callback=on_final_retry_failure,
-    reraise=True,
-)
-
 
 class AsyncTwitterClient:
     def __init__(self, config):
@@ -98,6 +206,14 @@ class AsyncTwitterClient:
         self.ssl_context.check_hostname = True
         self.ssl_context.verify_mode = ssl.CERT_REQUIRED
 
+        # Shared HTTP session for trends and media uploads, opened on first use
+        self._session: aiohttp.ClientSession | None = None
+        self._trends_semaphore: asyncio.Semaphore | None = None
+        # (country, max_trends) -> (expiry on the monotonic clock, trends)
+        self._trends_cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        # Unfinished chunked uploads by payload key, resumed on the next attempt
+        self._media_uploads: dict[str, MediaUploadSession] = {}
+
         try:
             self.client = AsyncClient(
                 consumer_key=config.API_KEY,
@@ -110,11 +226,13 @@ class AsyncTwitterClient:
 
             logger.debug("AsyncClient created successfully")
 
-            auth = OAuth1UserHandler(config.API_KEY, config.API_SECRET_KEY)
-            auth.set_access_token(config.ACCESS_TOKEN, config.ACCESS_TOKEN_SECRET)
-            self._sync_api = API(auth, wait_on_rate_limit=True)
-
-            logger.debug("Sync API client created successfully")
+            # Signs media upload requests (v1.1, user context)
+            self._oauth = OAuthClient(
+                config.API_KEY,
+                config.API_SECRET_KEY,
+                config.ACCESS_TOKEN,
+                config.ACCESS_TOKEN_SECRET,
+            )
 
         except Exception as e:
             logger.error(
@@ -132,57 +250,207 @@ class AsyncTwitterClient:
                 original_exception=e,
             )
 
-    @retry_sync_in_async_wrapper
-    @async_timed("media_upload")
-    async def _upload_media(self, image_content_str: str):
-        """Upload media to Twitter with comprehensive logging."""
-        logger.debug("Starting media upload")
-
-        try:
-            image_content = base64.b64decode(image_content_str)
-            image_size = len(image_content)
+    async def _media_request(
+        self, params: dict[str, str], chunk: bytes | None = None
+    ) -> dict:
+        """Send one INIT/APPEND/FINALIZE/STATUS command to the upload endpoint."""
+        command = params["command"]
+        method = "GET" if command == "STATUS" else "POST"
+        url = f"{MEDIA_UPLOAD_URL}?{urlencode(sorted(params.items()))}"
+        url, headers, _ = self._oauth.sign(url, method)
+
+        data = None
+        if chunk is not None:
+            data = aiohttp.FormData()
+            data.add_field(
+                "media",
+                chunk,
+                filename="media",
+                content_type="application/octet-stream",
+            )
 
-            logger.debug(
-                "Media decoded successfully",
-                extra={
-                    "original_base64_size": len(image_content_str),
-                    "decoded_image_size": image_size,
-                },
+        session = await self._get_session()
+        async with session.request(method, url, headers=headers, data=data) as resp:
+            body = await resp.read()
+            if resp.status >= 500:
+                # A ClientError, so the retry policy retries and the upload resumes
+                raise aiohttp.ClientResponseError(
+                    resp.request_info,
+                    resp.history,
+                    status=resp.status,
+                    message=body[:100].decode(errors="replace"),
+                )
+            if resp.status >= 400:
+                raise TwitterMediaUploadError(
+                    f"Media {command} failed: {resp.status} "
+                    f"{body[:100].decode(errors='replace')}",
+                    context={"command": command, "status_code": resp.status},
+                )
+        return json.loads(body) if body else {}
+
+    async def _init_media_upload(self, content: str) -> MediaUploadSession:
+        """Check the media against its size limit and open a chunked upload."""
+        total_bytes = len(content) // 4 * 3 - content[-2:].count("=")
+        head = base64.b64decode(content[:16], validate=True)
+        media_type, media_category = detect_media_type(head)
+
+        limit = MEDIA_SIZE_LIMITS[media_category]
+        if total_bytes > limit:
+            raise TwitterMediaUploadError(
+                f"Media size exceeds {limit // (1024 * 1024)}MB limit "
+                f"for {media_category}",
+                media_size=total_bytes,
+                media_type=media_type,
+                context={"limit_bytes": limit},
             )
 
-            if image_size > 5 * 1024 * 1024:  # 5MB limit
+        result = await self._media_request(
+            {
+                "command": "INIT",
+                "total_bytes": str(total_bytes),
+                "media_type": media_type,
+                "media_category": media_category,
+            }
+        )
+        return MediaUploadSession(
+            media_id=result["media_id_string"],
+            total_bytes=total_bytes,
+            media_type=media_type,
+            media_category=media_category,
+            expires_at=time.monotonic() + result.get("expires_after_secs", 86400),
+        )
+
+    async def _wait_for_media_processing(
+        self, media_id: str, processing_info: dict | None
+    ):
+        """Poll STATUS until Twitter has finished processing a GIF or video."""
+        deadline = time.monotonic() + MEDIA_PROCESSING_TIMEOUT_SECONDS
+        while processing_info and processing_info.get("state") in (
+            "pending",
+            "in_progress",
+        ):
+            if time.monotonic() >= deadline:
                 raise TwitterMediaUploadError(
-                    "Image size exceeds 5MB limit",
-                    media_size=image_size,
-                    context={"limit_bytes": 5 * 1024 * 1024},
+                    "Media processing timed out", context={"media_id": media_id}
                 )
+            await asyncio.sleep(processing_info.get("check_after_secs", 1))
+            result = await self._media_request(
+                {"command": "STATUS", "media_id": media_id}
+            )
+            processing_info = result.get("processing_info")
 
-            image_file = io.BytesIO(image_content)
-            image_file.name = "image.png"
+        if processing_info and processing_info.get("state") == "failed":
+            error = processing_info.get("error") or {}
+            raise TwitterMediaUploadError(
+                f"Media processing failed: {error.get('message', 'unknown error')}",
+                context={"media_id": media_id},
+            )
+
+    @retry_async_wrapper
+    @async_timed("media_upload")
+    async def _upload_media(self, image_content_str: str) -> UploadedMedia:
+        """
+        Upload base64 media with the chunked INIT/APPEND/FINALIZE flow.
+
+        The payload is decoded one chunk at a time. Progress is kept per
+        payload, so a retry (or a later call with the same media) continues
+        from the first segment that was not acknowledged instead of restarting.
+        """
+        logger.debug("Starting media upload")
+        content = image_content_str
+        key = None
+        upload = None
 
-            logger.debug("Uploading media via sync API")
+        try:
+            if re.search(r"\s", content):
+                content = "".join(content.split())
+            if not content or not content.isascii() or len(content) % 4:
+                raise TwitterMediaUploadError(
+                    "Media content is not valid base64",
+                    context={"base64_length": len(content)},
+                )
 
-            media = await anyio.to_thread.run_sync(
-                lambda: self._sync_api.media_upload(
-                    filename=image_file.name, file=image_file
+            key = _media_key(content)
+            upload = self._media_uploads.get(key)
+            if upload is not None and not upload.expired:
+                logger.info(
+                    "Resuming media upload",
+                    extra={
+                        "media_id": upload.media_id,
+                        "next_segment": upload.next_segment,
+                    },
                 )
+            else:
+                self._media_uploads = {
+                    k: u for k, u in self._media_uploads.items() if not u.expired
+                }
+                upload = await self._init_media_upload(content)
+                self._media_uploads[key] = upload
+                logger.debug(
+                    "Media upload initialized",
+                    extra={
+                        "media_id": upload.media_id,
+                        "media_size": upload.total_bytes,
+                        "media_type": upload.media_type,
+                    },
+                )
+
+            chunks = iter_base64_chunks(
+                content, self.config.media_chunk_size_bytes, upload.next_segment
+            )
+            for segment, chunk in enumerate(chunks, start=upload.next_segment):
+                await self._media_request(
+                    {
+                        "command": "APPEND",
+                        "media_id": upload.media_id,
+                        "segment_index": str(segment),
+                    },
+                    chunk,
+                )
+                upload.next_segment = segment + 1
+
+            result = await self._media_request(
+                {"command": "FINALIZE", "media_id": upload.media_id}
+            )
+            await self._wait_for_media_processing(
+                upload.media_id, result.get("processing_info")
             )
+            self._media_uploads.pop(key, None)
 
             logger.info(
                 "Media uploaded successfully",
-                extra={"media_id": media.media_id, "media_size": image_size},
+                extra={
+                    "media_id": upload.media_id,
+                    "media_size": upload.total_bytes,
+                    "segments": upload.next_segment,
+                },
             )
 
-            return media
+            return UploadedMedia(
+                media_id=upload.media_id,
+                size_bytes=upload.total_bytes,
+                media_type=upload.media_type,
+            )
+
+        except aiohttp.ClientError:
+            # Keep the progress so the retry resumes the upload
+            logger.warning(
+                "Media upload interrupted",
+                extra={
+                    "media_id": upload.media_id if upload else None,
+                    "next_segment": upload.next_segment if upload else 0,
+                },
+            )
+            raise
 
         except Exception as e:
+            if key is not None:
+                self._media_uploads.pop(key, None)
             logger.error(
                 "Media upload failed",
                 extra={
                     "error_type": type(e).__name__,
-                    "image_size": len(image_content_str)
-                    if "image_content_str" in locals()
-                    else None,
+                    "base64_length": len(content),
                 },
                 exc_info=True,
             )
@@ -204,13 +472,15 @@ class AsyncTwitterClient:
         poll_duration: int | None = None,
         in_reply_to_tweet_id: str | None = None,
         quote_tweet_id: str | None = None,
+        image_contents: list[str] | None = None,
     ):
         """Create a new tweet with comprehensive logging and error handling."""
+        media_payloads = [c for c in [image_content_str, *(image_contents or [])] if c]
         logger.info(
             "Creating tweet",
             extra={
                 "text_length": len(text),
-                "has_media": bool(image_content_str),
+                "media_count": len(media_payloads),
                 "has_poll": bool(poll_options),
                 "is_reply": bool(in_reply_to_tweet_id),
                 "is_quote": bool(quote_tweet_id),
@@ -220,12 +490,24 @@ class AsyncTwitterClient:
 
         try:
             media_ids = []
-            if image_content_str and self.config.media_upload_enabled:
-                logger.debug("Media upload requested")
+            if media_payloads and self.config.media_upload_enabled:
+                if len(media_payloads) > MAX_MEDIA_PER_TWEET:
+                    raise TwitterValidationError(
+                        f"A tweet can have at most {MAX_MEDIA_PER_TWEET} media",
+                        context={"provided_media": len(media_payloads)},
+                    )
+                # The same media attached twice is uploaded (and attached) once, so
+                # concurrent uploads never share a resumable session
+                unique_payloads = list(
+                    dict.fromkeys("".join(payload.split()) for payload in media_payloads)
+                )
+                logger.debug(f"Uploading {len(unique_payloads)} media concurrently")
                 async with async_operation_timer("tweet_media_upload"):
-                    media = await self._upload_media(image_content_str)
-                    media_ids.append(media.media_id)
-                    logger.debug(f"Media ID added: {media.media_id}")
+                    uploaded = await asyncio.gather(
+                        *(self._upload_media(payload) for payload in unique_payloads)
+                    )
+                media_ids = [media.media_id for media in uploaded]
+                logger.debug(f"Media IDs added: {media_ids}")
 
             poll_params = {}
             if poll_options:
@@ -432,80 +714,108 @@ class AsyncTwitterClient:
                     f"Failed to follow user {user_id}: {str(e)}", original_exception=e
                 )
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, opening it on first use."""
+        if self._session is None or self._session.closed:
+            limit = self.config.trends_concurrency
+            self._trends_semaphore = asyncio.Semaphore(limit)
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(ssl=self.ssl_context, limit=limit),
+            )
+            logger.debug("HTTP session opened", extra={"connection_limit": limit})
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            logger.debug("HTTP session closed")
+
+    def _cached_trends(self, country: str, max_trends: int) -> list[str] | None:
+        """Return unexpired cached trends for a country, if any."""
+        cached = self._trends_cache.get((country, max_trends))
+        if cached is None:
+            return None
+        expires_at, trends = cached
+        if time.monotonic() >= expires_at:
+            del self._trends_cache[(country, max_trends)]
+            return None
+        return trends
+
+    async def _fetch_country_trends(
+        self,
+        session: aiohttp.ClientSession,
+        country: str,
+        headers: dict[str, str],
+        max_trends: int,
+    ) -> list[str]:
+        """Fetch one country's trends; failures become an error entry."""
+        country_logger = get_logger(f"{__name__}.get_trends", country=country)
+
+        woeid = WOEID_BY_COUNTRY.get(country)
+        if woeid is None:
+            country_logger.warning(f"WOEID not found for country: {country}")
+            return [f"Error: WOEID not found for country {country}"]
+
+        url = TRENDS_URL.format(woeid=woeid)
+        params = {"max_trends": max_trends}
+
+        country_logger.debug(
+            f"Fetching trends for {country}", extra={"woeid": woeid, "url": url}
+        )
+
+        try:
+            async with self._trends_semaphore:
+                async with async_operation_timer(
+                    f"get_trends.{country}",
+                    context={"country": country, "woeid": woeid},
+                ):
+                    async with session.get(url, headers=headers, params=params) as resp:
+                        if resp.status != 200:
+                            error_text = await resp.text()
+                            country_logger.error(
+                                f"Trends API returned error for {country}",
+                                extra={
+                                    "status_code": resp.status,
+                                    "error_text": error_text[:200],
+                                },
+                            )
+                            return [f"Error: {resp.status} {error_text[:100]}"]
+
+                        data = await resp.json()
+
+        except Exception as country_error:
+            country_logger.error(
+                f"Error retrieving trends for {country}",
+                extra={"error_type": type(country_error).__name__},
+                exc_info=True,
+            )
+            return [f"Error retrieving trends: {str(country_error)}"]
+
+        trends = [
+            t.get("trend_name")
+            for t in data.get("data", [])
+            if isinstance(t, dict) and t.get("trend_name")
+        ]
+        if self.config.trends_cache_ttl_seconds > 0:
+            expires_at = time.monotonic() + self.config.trends_cache_ttl_seconds
+            self._trends_cache[(country, max_trends)] = (expires_at, trends)
+        country_logger.info(f"Retrieved {len(trends)} trends for {country}")
+        return trends
+
     @retry_async_wrapper
     @async_timed("get_trends")
     async def get_trends(
         self, countries: list[str], max_trends: int = 50
     ) -> dict[str, list[str]]:
-        """Retrieve trending topics with comprehensive logging."""
+        """Retrieve trending topics for several countries concurrently."""
         logger.info(
             "Retrieving trends",
             extra={"countries": countries, "max_trends_per_country": max_trends},
         )
 
-        trends_result: dict[str, list[str]] = {}
-        woeid_by_country = {
-            "Worldwide": 1,
-            "Algeria": 23424740,
-            "Argentina": 23424747,
-            "Australia": 23424748,
-            "Austria": 23424750,
-            "Bahrain": 23424753,
-            "Belgium": 23424757,
-            "Belarus": 23424765,
-            "Brazil": 23424768,
-            "Canada": 23424775,
-            "Chile": 23424782,
-            "China": 23424781,
-            "Colombia": 23424787,
-            "Dominican Republic": 23424800,
-            "Ecuador": 23424801,
-            "Egypt": 23424802,
-            "Ireland": 23424803,
-            "France": 23424819,
-            "Germany": 23424829,
-            "Ghana": 23424824,
-            "Greece": 23424833,
-            "Guatemala": 23424834,
-            "Indonesia": 23424846,
-            "India": 23424848,
-            "Italy": 23424853,
-            "Japan": 23424856,
-            "Jordan": 23424860,
-            "Kenya": 23424863,
-            "South Korea": 23424868,
-            "Kuwait": 23424870,
-            "Lebanon": 23424873,
-            "Latvia": 23424874,
-            "Oman": 23424898,
-            "Malaysia": 23424901,
-            "Mexico": 23424900,
-            "Netherlands": 23424909,
-            "Norway": 23424910,
-            "Nigeria": 23424908,
-            "New Zealand": 23424916,
-            "Pakistan": 23424922,
-            "Poland": 23424923,
-            "Panama": 23424924,
-            "Portugal": 23424925,
-            "Qatar": 23424930,
-            "Russia": 23424936,
-            "Saudi Arabia": 23424938,
-            "South Africa": 23424942,
-            "Singapore": 23424948,
-            "Spain": 23424950,
-            "Sweden": 23424954,
-            "Switzerland": 23424957,
-            "Thailand": 23424960,
-            "Turkey": 23424969,
-            "United Arab Emirates": 23424738,
-            "Ukraine": 23424976,
-            "United Kingdom": 23424975,
-            "United States": 23424977,
-            "Venezuela": 23424982,
-            "Vietnam": 23424984,
-        }
-
         bearer_token = getattr(self.config, "BEARER_TOKEN", None) or os.getenv(
             "BEARER_TOKEN"
         )
@@ -516,83 +826,36 @@ class AsyncTwitterClient:
             )
 
         headers = {"Authorization": f"Bearer {bearer_token}"}
-        timeout = aiohttp.ClientTimeout(total=30)
 
         try:
-            async with aiohttp.ClientSession(
-                timeout=timeout, connector=aiohttp.TCPConnector(ssl=self.ssl_context)
-            ) as session:
-                for country in countries:
-                    country_logger = get_logger(
-                        f"{__name__}.get_trends", country=country
-                    )
-
-                    if country not in woeid_by_country:
-                        country_logger.warning(
-                            f"WOEID not found for country: {country}"
+            trends_result: dict[str, list[str]] = {}
+            to_fetch: list[str] = []
+            for country in dict.fromkeys(countries):
+                cached = self._cached_trends(country, max_trends)
+                if cached is not None:
+                    trends_result[country] = cached
+                else:
+                    to_fetch.append(country)
+
+            if to_fetch:
+                session = await self._get_session()
+                fetched = await asyncio.gather(
+                    *(
+                        self._fetch_country_trends(
+                            session, country, headers, max_trends
                         )
-                        trends_result[country] = [
-                            f"Error: WOEID not found for country {country}"
-                        ]
-                        continue
-
-                    woeid = woeid_by_country[country]
-                    url = f"https://api.twitter.com/2/trends/by/woeid/{woeid}"
-                    params = {"max_trends": max_trends}
-
-                    country_logger.debug(
-                        f"Fetching trends for {country}",
-                        extra={"woeid": woeid, "url": url},
+                        for country in to_fetch
                     )
-
-                    try:
-                        async with async_operation_timer(
-                            f"get_trends.{country}",
-                            context={"country": country, "woeid": woeid},
-                        ):
-                            async with session.get(
-                                url, headers=headers, params=params
-                            ) as resp:
-                                if resp.status != 200:
-                                    error_text = await resp.text()
-                                    country_logger.error(
-                                        f"Trends API returned error for {country}",
-                                        extra={
-                                            "status_code": resp.status,
-                                            "error_text": error_text[:200],
-                                        },
-                                    )
-                                    trends_result[country] = [
-                                        f"Error: {resp.status} {error_text[:100]}"
-                                    ]
-                                    continue
-
-                                data = await resp.json()
-                                trends = [
-                                    t.get("trend_name")
-                                    for t in data.get("data", [])
-                                    if isinstance(t, dict) and t.get("trend_name")
-                                ]
-
-                                trends_result[country] = trends
-                                country_logger.info(
-                                    f"Retrieved {len(trends)} trends for {country}"
-                                )
-
-                    except Exception as country_error:
-                        country_logger.error(
-                            f"Error retrieving trends for {country}",
-                            extra={"error_type": type(country_error).__name__},
-                            exc_info=True,
-                        )
-                        trends_result[country] = [
-                            f"Error retrieving trends: {str(country_error)}"
-                        ]
+                )
+                trends_result.update(zip(to_fetch, fetched))
+            # Keep the requested country order
+            trends_result = {c: trends_result[c] for c in dict.fromkeys(countries)}
 
             logger.info(
                 "Trends retrieval completed",
                 extra={
                     "countries_requested": len(countries),
+                    "countries_cached": len(trends_result) - len(to_fetch),
                     "countries_successful": len(
                         [
                             c
@@ -150,6 +150,9 @@ def mock_config():
     config.max_tweet_length = 280
     config.poll_max_options = 4
     config.poll_max_duration = 10080  # 7 days in minutes
+    config.trends_concurrency = 8
+    config.trends_cache_ttl_seconds = 300.0
+    config.media_chunk_size_bytes = 1024 * 1024
     return config
 
 
@@ -0,0 +1,125 @@
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from mcp_server_twitter.api_routers import root_routers
+from mcp_server_twitter.metrics import LatencyHistogram, MetricsCollector
+
+# --- Tests for LatencyHistogram ---
+
+
+def test_histogram_percentiles_within_precision():
+    """Percentiles stay within the 1/64 bucket precision of exact values."""
+    rng = random.Random(0)
+    samples = sorted(rng.lognormvariate(3, 1) for _ in range(20_000))
+    histogram = LatencyHistogram()
+    for sample in samples:
+        histogram.record(sample)
+
+    for percent in (50, 95, 99):
+        exact = samples[int(len(samples) * percent / 100) - 1]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=0.02)
+    assert histogram.total_count == len(samples)
+
+
+def test_histogram_memory_is_fixed():
+    """Recording more samples never grows the bucket array."""
+    histogram = LatencyHistogram()
+    size = len(histogram.counts)
+
+    for duration_ms in (0.0, 0.001, 5.0, 90_000.0, 10**9):
+        histogram.record(duration_ms)
+
+    assert len(histogram.counts) == size
+    assert histogram.percentile(100) == pytest.approx(3_600_000, rel=0.02)
+
+
+def test_histogram_empty_and_small_values():
+    """Empty histograms report 0 and sub-128us values are exact."""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(95) == 0.0
+
+    histogram.record(0.1)
+    histogram.record(0.05)
+
+    assert histogram.percentile(50) == 0.05
+    assert histogram.percentile(100) == 0.1
+
+
+def test_histogram_merge():
+    """Merging gives the same result as recording into one histogram."""
+    fast, slow, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i in range(100):
+        fast.record(i / 10)
+        slow.record(100 + i)
+        combined.record(i / 10)
+        combined.record(100 + i)
+
+    merged = LatencyHistogram().merge(fast).merge(slow)
+
+    assert merged.counts == combined.counts
+    assert merged.total_us == combined.total_us
+    assert merged.percentile(75) == combined.percentile(75)
+
+
+# --- Tests for Prometheus exposition ---
+
+
+def test_render_prometheus():
+    """Counters, cumulative buckets, sum/count and quantiles are rendered."""
+    collector = MetricsCollector()
+    for duration_ms in (3, 20, 200):
+        collector.record_operation("get_trends", duration_ms)
+    collector.record_operation("get_trends", 2000, success=False)
+    collector.record_operation('odd"name', 1)
+
+    text = collector.render_prometheus()
+    lines = text.splitlines()
+    calls = 'twitter_operation_calls_total{operation="get_trends",'
+    bucket = 'twitter_operation_duration_seconds_bucket{operation="get_trends",'
+
+    assert calls + 'outcome="success"} 3' in lines
+    assert calls + 'outcome="error"} 1' in lines
+    assert bucket + 'le="0.005"} 1' in lines
+    assert bucket + 'le="0.25"} 3' in lines
+    assert bucket + 'le="+Inf"} 4' in lines
+    assert 'twitter_operation_duration_seconds_count{operation="get_trends"} 4' in lines
+    assert 'operation="odd\\"name"' in text
+    assert text.endswith("\n")
+
+
+def test_merged_durations_by_prefix():
+    """Per-country trend timings merge into one distribution."""
+    collector = MetricsCollector()
+    collector.record_operation("get_trends.Egypt", 10)
+    collector.record_operation("get_trends.France", 30)
+    collector.record_operation("create_tweet", 500)
+
+    merged = collector.merged_durations("get_trends.")
+
+    assert merged.total_count == 2
+    assert merged.percentile(100) == pytest.approx(30, rel=0.02)
+
+
+def test_prometheus_endpoint(mocker):
+    """/metrics serves the text format at the application root."""
+    collector = MetricsCollector()
+    collector.record_operation("follow_user", 12)
+    mocker.patch(
+        "mcp_server_twitter.api_routers.health.get_metrics_collector",
+        return_value=collector,
+    )
+    app = FastAPI()
+    for router in root_routers:
+        app.include_router(router)
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE twitter_operation_duration_seconds histogram" in response.text
+    assert 'twitter_operation_duration_seconds_count{operation="follow_user"} 1' in (
+        response.text
+    )
@@ -1,8 +1,10 @@
+import asyncio
+import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
-import requests
+from aioresponses import aioresponses
 from tweepy.errors import TweepyException
 
 from mcp_server_twitter.twitter.module import (
@@ -268,31 +270,6 @@ async def test_create_tweet_fails_on_invalid_poll(mock_config):
         )
 
 
-# --- Tests for _upload_media (Sync Retry Logic) ---
-
-
-@pytest.mark.asyncio
-async def test_upload_media_retries_on_requests_exception(mock_config, mocker, caplog):
-    """Test that the sync media upload retries on requests.RequestException."""
-    # Arrange
-    caplog.set_level(logging.WARNING)
-    twitter_client = AsyncTwitterClient(config=mock_config)
-    mock_media_obj = MagicMock(media_id="media123")
-    mock_run_sync = mocker.patch("anyio.to_thread.run_sync", new_callable=AsyncMock)
-    mock_run_sync.side_effect = [
-        requests.exceptions.RequestException("Sync connection error"),
-        mock_media_obj,
-    ]
-
-    # Act
-    result = await twitter_client._upload_media(image_content_str="base64string")
-
-    # Assert
-    assert result.media_id == "media123"
-    assert mock_run_sync.call_count == 2
-    assert "Retrying" in caplog.text
-
-
 # --- Tests for get_user_tweets ---
 
 
@@ -794,43 +771,300 @@ async def test_get_twitter_client_singleton():
                 mock_init.assert_called_once()
 
 
-# --- Tests for _upload_media method ---
+# --- Tests for concurrent, cached trends fetching ---
+
+
+@pytest.fixture
+async def trends_server(monkeypatch):
+    """Local trends endpoint that records requests and peak concurrency."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    import mcp_server_twitter.twitter.module as module
+
+    state = {"requests": [], "in_flight": 0, "peak": 0, "fail": set()}
+
+    async def handler(request):
+        woeid = int(request.match_info["woeid"])
+        state["requests"].append(woeid)
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            await asyncio.sleep(0.02)
+            if woeid in state["fail"]:
+                return web.Response(status=503, text="Service Unavailable")
+            return web.json_response({"data": [{"trend_name": f"#t{woeid}"}]})
+        finally:
+            state["in_flight"] -= 1
+
+    app = web.Application()
+    app.router.add_get("/2/trends/by/woeid/{woeid}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    base_url = f"http://{server.host}:{server.port}"
+    monkeypatch.setattr(module, "TRENDS_URL", base_url + "/2/trends/by/woeid/{woeid}")
+    yield state
+    await server.close()
 
 
 @pytest.mark.asyncio
-async def test_upload_media_success(mock_config, mocker):
-    """Test successful media upload."""
-    # Arrange
+async def test_get_trends_fetches_concurrently_under_limit(mock_config, trends_server):
+    """Countries are fetched in parallel, bounded by trends_concurrency."""
+    from mcp_server_twitter.twitter.module import WOEID_BY_COUNTRY
+
+    mock_config.trends_concurrency = 4
     twitter_client = AsyncTwitterClient(config=mock_config)
-    mock_media = MagicMock(media_id="media123")
-    mock_run_sync = mocker.patch("anyio.to_thread.run_sync", new_callable=AsyncMock)
-    mock_run_sync.return_value = mock_media
+    countries = list(WOEID_BY_COUNTRY)[10:20]
 
-    # Act
-    result = await twitter_client._upload_media("base64string")
+    result = await twitter_client.get_trends(countries)
 
-    # Assert
-    assert result.media_id == "media123"
-    mock_run_sync.assert_awaited_once()
+    assert list(result) == countries
+    assert result["France"] == ["#t23424819"]
+    assert trends_server["peak"] == 4
+    await twitter_client.close()
 
 
 @pytest.mark.asyncio
-async def test_upload_media_retries_on_tweepy_5xx(mock_config, mocker):
-    """Test that media upload retries on TweepyException with 5xx status."""
-    # Arrange
+async def test_get_trends_reuses_session_and_caches(mock_config, trends_server):
+    """Repeated countries come from the TTL cache over one shared session."""
     twitter_client = AsyncTwitterClient(config=mock_config)
-    mock_response = MagicMock()
-    mock_response.status_code = 502
-    tweepy_exception = TweepyException("Bad Gateway")
-    tweepy_exception.response = mock_response
 
-    mock_media = MagicMock(media_id="media123")
-    mock_run_sync = mocker.patch("anyio.to_thread.run_sync", new_callable=AsyncMock)
-    mock_run_sync.side_effect = [tweepy_exception, mock_media]
+    await twitter_client.get_trends(["Egypt", "France"])
+    session = twitter_client._session
+    result = await twitter_client.get_trends(["France", "Japan", "France"])
 
-    # Act
-    result = await twitter_client._upload_media("base64string")
+    assert result == {"France": ["#t23424819"], "Japan": ["#t23424856"]}
+    assert trends_server["requests"].count(23424819) == 1
+    assert twitter_client._session is session
 
-    # Assert
-    assert result.media_id == "media123"
-    assert mock_run_sync.call_count == 2
+    await twitter_client.close()
+    assert session.closed
+    assert twitter_client._session is None
+
+
+@pytest.mark.asyncio
+async def test_get_trends_cache_expires_and_skips_errors(mock_config, trends_server):
+    """Entries expire after the TTL and failed countries are retried."""
+    mock_config.trends_cache_ttl_seconds = 0.5
+    trends_server["fail"].add(23424802)  # Egypt
+    twitter_client = AsyncTwitterClient(config=mock_config)
+
+    first = await twitter_client.get_trends(["Egypt", "France"])
+    await twitter_client.get_trends(["Egypt", "France"])
+    await asyncio.sleep(0.5)
+    await twitter_client.get_trends(["France"])
+
+    assert first["Egypt"][0].startswith("Error: 503")
+    assert trends_server["requests"].count(23424802) == 2
+    assert trends_server["requests"].count(23424819) == 2
+    await twitter_client.close()
+
+
+# --- Tests for chunked, resumable media upload ---
+
+
+@pytest.fixture
+async def upload_server(monkeypatch):
+    """Local media upload endpoint implementing INIT/APPEND/FINALIZE/STATUS."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    import mcp_server_twitter.twitter.module as module
+
+    state = {
+        "uploads": {},
+        "commands": [],
+        "auth": [],
+        "fail_append": set(),
+        "in_flight": 0,
+        "peak": 0,
+    }
+
+    async def handler(request):
+        params = request.query
+        command = params["command"]
+        state["commands"].append((command, params.get("segment_index")))
+        state["auth"].append(request.headers.get("Authorization", ""))
+
+        if command == "INIT":
+            media_id = str(1000 + len(state["uploads"]))
+            state["uploads"][media_id] = {
+                "total": int(params["total_bytes"]),
+                "category": params["media_category"],
+                "segments": {},
+            }
+            return web.json_response(
+                {"media_id_string": media_id, "expires_after_secs": 3600}
+            )
+
+        upload = state["uploads"][params["media_id"]]
+        if command == "APPEND":
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            try:
+                await asyncio.sleep(0.01)
+                segment = int(params["segment_index"])
+                if (params["media_id"], segment) in state["fail_append"]:
+                    state["fail_append"].discard((params["media_id"], segment))
+                    return web.Response(status=503, text="Service Unavailable")
+                part = await (await request.multipart()).next()
+                upload["segments"][segment] = await part.read()
+                return web.Response(status=204)
+            finally:
+                state["in_flight"] -= 1
+
+        if command == "FINALIZE":
+            data = b"".join(v for _, v in sorted(upload["segments"].items()))
+            if len(data) != upload["total"]:
+                return web.json_response({"error": "size mismatch"}, status=400)
+            upload["data"] = data
+            result = {"media_id_string": params["media_id"], "size": len(data)}
+            if upload["category"] == "tweet_video":
+                result["processing_info"] = {"state": "pending", "check_after_secs": 0}
+            return web.json_response(result)
+
+        return web.json_response({"processing_info": {"state": "succeeded"}})
+
+    app = web.Application()
+    app.router.add_route("*", "/1.1/media/upload.json", handler)
+    server = TestServer(app)
+    await server.start_server()
+    base_url = f"http://{server.host}:{server.port}"
+    monkeypatch.setattr(module, "MEDIA_UPLOAD_URL", base_url + "/1.1/media/upload.json")
+    yield state
+    await server.close()
+
+
+def _media_payload(header: bytes, size: int) -> tuple[bytes, str]:
+    """Raw bytes starting with `header` and their base64 encoding."""
+    import base64
+    import os
+
+    raw = header + os.urandom(size - len(header))
+    return raw, base64.b64encode(raw).decode()
+
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.mark.asyncio
+async def test_upload_media_streams_chunks(mock_config, upload_server):
+    """Media is sent as signed INIT, APPEND per chunk and FINALIZE requests."""
+    mock_config.media_chunk_size_bytes = 4096
+    twitter_client = AsyncTwitterClient(config=mock_config)
+    raw, payload = _media_payload(PNG_HEADER, 10_000)
+
+    result = await twitter_client._upload_media(payload)
+
+    assert result.media_id == "1000"
+    assert result.size_bytes == 10_000
+    assert result.media_type == "image/png"
+    assert upload_server["commands"] == [
+        ("INIT", None),
+        ("APPEND", "0"),
+        ("APPEND", "1"),
+        ("APPEND", "2"),
+        ("FINALIZE", None),
+    ]
+    assert upload_server["uploads"]["1000"]["data"] == raw
+    assert upload_server["uploads"]["1000"]["category"] == "tweet_image"
+    assert all(auth.startswith("OAuth ") for auth in upload_server["auth"])
+    assert twitter_client._media_uploads == {}
+    await twitter_client.close()
+
+
+@pytest.mark.asyncio
+async def test_upload_media_resumes_after_failed_append(mock_config, upload_server):
+    """A failed APPEND is retried from that segment without a new INIT."""
+    mock_config.media_chunk_size_bytes = 4096
+    upload_server["fail_append"].add(("1000", 1))
+    twitter_client = AsyncTwitterClient(config=mock_config)
+    raw, payload = _media_payload(PNG_HEADER, 10_000)
+
+    result = await twitter_client._upload_media(payload)
+
+    assert result.media_id == "1000"
+    assert upload_server["commands"] == [
+        ("INIT", None),
+        ("APPEND", "0"),
+        ("APPEND", "1"),
+        ("APPEND", "1"),
+        ("APPEND", "2"),
+        ("FINALIZE", None),
+    ]
+    assert upload_server["uploads"]["1000"]["data"] == raw
+    await twitter_client.close()
+
+
+@pytest.mark.asyncio
+async def test_upload_media_waits_for_video_processing(mock_config, upload_server):
+    """Videos are uploaded as tweet_video and polled until processed."""
+    twitter_client = AsyncTwitterClient(config=mock_config)
+    _, payload = _media_payload(b"\x00\x00\x00\x18ftypmp42", 3000)
+
+    result = await twitter_client._upload_media(payload)
+
+    assert result.media_type == "video/mp4"
+    assert upload_server["uploads"]["1000"]["category"] == "tweet_video"
+    assert upload_server["commands"][-1] == ("STATUS", None)
+    await twitter_client.close()
+
+
+@pytest.mark.asyncio
+async def test_upload_media_rejects_invalid_and_oversized(
+    mock_config, upload_server, monkeypatch
+):
+    """Bad base64 and media over the category limit fail before INIT."""
+    import mcp_server_twitter.twitter.module as module
+    from mcp_server_twitter.errors import TwitterMediaUploadError
+
+    monkeypatch.setitem(module.MEDIA_SIZE_LIMITS, "tweet_image", 1000)
+    twitter_client = AsyncTwitterClient(config=mock_config)
+    _, payload = _media_payload(PNG_HEADER, 2000)
+
+    with pytest.raises(TwitterMediaUploadError, match="exceeds"):
+        await twitter_client._upload_media(payload)
+    with pytest.raises(TwitterMediaUploadError, match="not valid base64"):
+        await twitter_client._upload_media("not base64!")
+
+    assert upload_server["commands"] == []
+    assert twitter_client._media_uploads == {}
+
+
+@pytest.mark.asyncio
+async def test_create_tweet_uploads_media_concurrently(mock_config, upload_server):
+    """All media of a multi-image tweet are uploaded at the same time."""
+    twitter_client = AsyncTwitterClient(config=mock_config)
+    twitter_client.client = AsyncMock()
+    twitter_client.client.create_tweet.return_value = MagicMock(data={"id": "126"})
+    payloads = [_media_payload(PNG_HEADER, 1000 + i)[1] for i in range(3)]
+
+    tweet_id = await twitter_client.create_tweet(
+        text="Three images", image_content_str=payloads[0], image_contents=payloads[1:]
+    )
+
+    assert tweet_id == "126"
+    assert upload_server["peak"] == 3
+    media_ids = twitter_client.client.create_tweet.call_args.kwargs["media_ids"]
+    assert sorted(media_ids) == ["1000", "1001", "1002"]
+    await twitter_client.close()
+
+
+@pytest.mark.asyncio
+async def test_create_tweet_uploads_duplicate_media_once(mock_config, upload_server):
+    """The same image attached twice is uploaded once and attached once."""
+    twitter_client = AsyncTwitterClient(config=mock_config)
+    twitter_client.client = AsyncMock()
+    twitter_client.client.create_tweet.return_value = MagicMock(data={"id": "127"})
+    _, payload = _media_payload(PNG_HEADER, 1000)
+
+    tweet_id = await twitter_client.create_tweet(
+        text="Same image twice", image_content_str=payload, image_contents=[payload]
+    )
+
+    assert tweet_id == "127"
+    assert [c for c, _ in upload_server["commands"]].count("INIT") == 1
+    media_ids = twitter_client.client.create_tweet.call_args.kwargs["media_ids"]
+    assert media_ids == ["1000"]
+    assert twitter_client._media_uploads == {}
+    await twitter_client.close()
@@ -0,0 +1,164 @@
+"""
+Benchmark plain-text vs compressed transcript storage.
+
+Main responsibility: Load a corpus of synthetic transcripts under both
+`DB_TRANSCRIPT_STORAGE` modes, then report table size and read latency for
+metadata-only and full-transcript reads.
+
+Usage (from the project root):
+    uv run python scripts/bench_transcript_storage.py --videos 20000
+    uv run python scripts/bench_transcript_storage.py --db-url postgresql+psycopg://...
+
+Without `--db-url` each mode gets a fresh SQLite file in a temporary directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert, text
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp_server_youtube.youtube.methods import DatabaseManager  # noqa: E402
+from mcp_server_youtube.youtube.models import Base, YouTubeVideo  # noqa: E402
+
+WORDS = (
+    "so today we are going to talk about how the model learns from data and why "
+    "that matters for you when you build your own project in python right now"
+).split()
+
+
+def synthetic_transcript(rng: random.Random, words: int) -> str:
+    """Spoken-style transcript: short sentences drawn from a small vocabulary."""
+    sentences = []
+    remaining = words
+    while remaining > 0:
+        n = min(remaining, rng.randint(6, 18))
+        sentences.append(" ".join(rng.choices(WORDS, k=n)).capitalize() + ".")
+        remaining -= n
+    return " ".join(sentences)
+
+
+def open_db(db_url: str | None, workdir: Path, mode: str) -> tuple[DatabaseManager, str]:
+    url = db_url or f"sqlite:///{workdir / f'bench_{mode}.db'}"
+    manager = DatabaseManager(url, transcript_storage=mode)
+    Base.metadata.drop_all(manager.engine)
+    Base.metadata.create_all(manager.engine)
+    return manager, url
+
+
+def load(
+    manager: DatabaseManager, n: int, min_words: int, max_words: int, batch: int = 1000
+) -> int:
+    """Bulk-insert `n` videos and return the total transcript size in bytes."""
+    rng = random.Random(42)
+    total = 0
+    with manager.engine.begin() as conn:
+        for start in range(0, n, batch):
+            rows = []
+            for i in range(start, min(n, start + batch)):
+                transcript = synthetic_transcript(rng, rng.randint(min_words, max_words))
+                total += len(transcript.encode("utf-8"))
+                columns = manager._transcript_columns(transcript)
+                rows.append(
+                    {
+                        "video_id": f"vid_{i:08d}",
+                        "title": f"Video {i}",
+                        "channel": "Bench Channel",
+                        "video_url": f"https://www.youtube.com/watch?v=vid_{i:08d}",
+                        "transcript_success": True,
+                        "transcript_length": len(transcript),
+                        "language": "en",
+                        # Core insert: keyed by column name, not ORM attribute
+                        "transcript": columns["transcript_text"],
+                        "transcript_data": columns["transcript_data"],
+                        "transcript_index": columns["transcript_index"],
+                    }
+                )
+            conn.execute(insert(YouTubeVideo), rows)
+            print(f"  loaded {min(n, start + batch):,}/{n:,}", end="\r", flush=True)
+    print()
+    return total
+
+
+def table_size(manager: DatabaseManager, url: str) -> int:
+    table = YouTubeVideo.__tablename__
+    with manager.engine.connect() as conn:
+        if url.startswith("postgresql"):
+            return conn.execute(
+                text("SELECT pg_total_relation_size(:t)"), {"t": table}
+            ).scalar_one()
+        try:
+            return (
+                conn.execute(
+                    text("SELECT SUM(pgsize) FROM dbstat WHERE name = :t"), {"t": table}
+                ).scalar_one()
+                or 0
+            )
+        except Exception:
+            return Path(url.removeprefix("sqlite:///")).stat().st_size
+
+
+def read_latency(
+    manager: DatabaseManager, n: int, samples: int, batch: int
+) -> dict[str, float]:
+    """Time status lookups, row loads without transcript access, and full reads."""
+    rng = random.Random(7)
+    timings: dict[str, list[float]] = {"status": [], "rows": [], "transcripts": []}
+    for _ in range(samples):
+        ids = [f"vid_{rng.randrange(n):08d}" for _ in range(batch)]
+        t0 = time.perf_counter()
+        manager.batch_get_transcript_status(ids)
+        t1 = time.perf_counter()
+        rows = manager.batch_get_videos(ids)
+        t2 = time.perf_counter()
+        for row in rows.values():
+            if row is not None:
+                row.transcript  # noqa: B018 - force decompression
+        t3 = time.perf_counter()
+        timings["status"].append((t1 - t0) * 1000)
+        timings["rows"].append((t2 - t1) * 1000)
+        timings["transcripts"].append((t3 - t1) * 1000)
+    return {name: statistics.median(values) for name, values in timings.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--videos", type=int, default=20_000)
+    parser.add_argument("--min-words", type=int, default=500)
+    parser.add_argument("--max-words", type=int, default=6000)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=10, help="Videos per request")
+    parser.add_argument("--db-url", default=None, help="Reused for both modes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("text", "compressed"):
+            manager, url = open_db(args.db_url, Path(tmp), mode)
+            print(f"[{mode}] loading {args.videos:,} transcripts")
+            t0 = time.perf_counter()
+            raw = load(manager, args.videos, args.min_words, args.max_words)
+            print(f"[{mode}] load: {time.perf_counter() - t0:.1f}s")
+            size = table_size(manager, url)
+            print(
+                f"[{mode}] youtube_videos: {size / 1024 / 1024:.1f} MiB "
+                f"(raw transcripts {raw / 1024 / 1024:.1f} MiB)"
+            )
+            stats = read_latency(manager, args.videos, args.samples, args.batch)
+            print(
+                f"[{mode}] p50 per {args.batch}-video request: "
+                f"status={stats['status']:.2f}ms rows={stats['rows']:.2f}ms "
+                f"rows+transcripts={stats['transcripts']:.2f}ms"
+            )
+            manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,9 @@ API routers - REST-only endpoints.
 from fastapi import APIRouter
 
 from .health import router as health_router
+from .search_cache import router as search_cache_router
 
 routers: list[APIRouter] = [
     health_router,
+    search_cache_router,
 ]
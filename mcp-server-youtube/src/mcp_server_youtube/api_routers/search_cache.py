@@ -0,0 +1,33 @@
+"""
+Search cache statistics endpoint (REST-only).
+"""
+
+import logging
+
+from fastapi import APIRouter, Depends
+
+from mcp_server_youtube.dependencies import get_youtube_service
+from mcp_server_youtube.youtube import YouTubeVideoSearchAndTranscript
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get(
+    "/search-cache",
+    tags=["Admin"],
+    operation_id="get_search_cache_stats",
+)
+async def get_search_cache_stats(
+    service: YouTubeVideoSearchAndTranscript = Depends(get_youtube_service),
+):
+    """
+    Returns hit rate and lookup latency of the YouTube search result cache.
+
+    Latency is reported separately for in-memory hits, database hits and misses
+    (which include the Apify search run).
+    """
+    cache = getattr(service, "search_cache", None)
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
@@ -15,7 +15,10 @@ from mcp_server_youtube.api_routers import routers as api_routers
 from mcp_server_youtube.config import get_app_settings
 from mcp_server_youtube.dependencies import DependencyContainer
 from mcp_server_youtube.hybrid_routers import routers as hybrid_routers
-from mcp_server_youtube.middlewares import X402WrapperMiddleware
+from mcp_server_youtube.middlewares import (
+    TranscriptCachingMiddleware,
+    X402WrapperMiddleware,
+)
 from mcp_server_youtube.x402_config import get_x402_settings
 
 logger = logging.getLogger(__name__)
@@ -112,6 +115,11 @@ def create_app() -> FastAPI:
     x402_settings.validate_against_routes(all_routes)
 
     # --- Middleware Configuration ---
+    # Added first so it runs inside x402: cached responses are still paid for
+    if get_app_settings().response_cache.enabled:
+        app.add_middleware(TranscriptCachingMiddleware)
+        logger.info("Transcript response cache enabled.")
+
     if x402_settings.pricing_mode == "on":
         app.add_middleware(X402WrapperMiddleware, tool_pricing=x402_settings.pricing)
         logger.info("x402 payment middleware enabled.")
@@ -33,6 +33,12 @@ class DatabaseConfig(BaseModel):
     DB_PORT_RAW: str = os.getenv("DB_PORT", "5432")
     DB_PORT: str = ""
     DATABASE_URL: str = ""
+    # "compressed" stores new transcripts in transcript_data, "text" in the legacy column
+    TRANSCRIPT_STORAGE: str = os.getenv("DB_TRANSCRIPT_STORAGE", "compressed")
+    # "zstd" (needs the zstandard package, falls back to zlib) or "zlib"
+    TRANSCRIPT_CODEC: str = os.getenv("DB_TRANSCRIPT_CODEC", "zstd")
+    # Target size of the precomputed transcript chunks served by chunk pagination
+    TRANSCRIPT_CHUNK_CHARS: int = int(os.getenv("DB_TRANSCRIPT_CHUNK_CHARS", "2000"))
 
     @model_validator(mode="after")
     def compute_database_url(self):
@@ -72,6 +78,34 @@ class YouTubeConfig(BaseModel):
     max_results: int = Field(default=10, env="MAX_RESULTS")
     num_videos: int = Field(default=5, env="NUM_VIDEOS")
     query: str = Field(default="quantum computing basics", env="QUERY")
+    # Transcript actor runs: in-flight cap and sustained start rate (token bucket)
+    transcript_max_concurrency: int = Field(
+        default=4, env="TRANSCRIPT_MAX_CONCURRENCY"
+    )
+    transcript_rate_per_second: float = Field(
+        default=2.0, env="TRANSCRIPT_RATE_PER_SECOND"
+    )
+    # Videos submitted per multi-video transcript actor run (1 disables batching).
+    # Off by default: the actor's `videoUrls` input is not confirmed yet.
+    transcript_batch_size: int = Field(default=1, env="TRANSCRIPT_BATCH_SIZE")
+    # Search result cache: in-memory LRU in front of the youtube_search_cache table
+    search_cache_enabled: bool = Field(default=True, env="SEARCH_CACHE_ENABLED")
+    search_cache_ttl_seconds: int = Field(default=3600, env="SEARCH_CACHE_TTL_SECONDS")
+    search_cache_max_entries: int = Field(default=256, env="SEARCH_CACHE_MAX_ENTRIES")
+
+
+class ResponseCacheConfig(BaseModel):
+    """HTTP response cache for the transcript endpoints."""
+
+    enabled: bool = Field(default=True, env="RESPONSE_CACHE_ENABLED")
+    ttl_seconds: int = Field(default=3600, env="RESPONSE_CACHE_TTL_SECONDS")
+    max_entries: int = Field(default=512, env="RESPONSE_CACHE_MAX_ENTRIES")
+    max_bytes: int = Field(default=64 * 1024 * 1024, env="RESPONSE_CACHE_MAX_BYTES")
+    # Directory for the disk tier (unset keeps the cache in memory only)
+    disk_path: str | None = Field(default=None, env="RESPONSE_CACHE_DISK_PATH")
+    disk_max_bytes: int = Field(
+        default=512 * 1024 * 1024, env="RESPONSE_CACHE_DISK_MAX_BYTES"
+    )
 
 
 class LoggingConfig(BaseModel):
@@ -97,6 +131,7 @@ class AppSettings(BaseSettings):
 
     # --- Nested Configurations ---
     youtube: YouTubeConfig = YouTubeConfig()
+    response_cache: ResponseCacheConfig = ResponseCacheConfig()
     apify: ApifyConfig = ApifyConfig()
     logging: LoggingConfig = LoggingConfig()
     database: DatabaseConfig = DatabaseConfig()
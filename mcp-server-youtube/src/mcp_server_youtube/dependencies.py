@@ -4,6 +4,7 @@ FastAPI dependencies for YouTube service.
 
 import logging
 
+from mcp_server_youtube.middlewares.caching import get_response_cache
 from mcp_server_youtube.youtube import YouTubeVideoSearchAndTranscript
 from mcp_server_youtube.youtube import get_youtube_client as create_youtube_client
 from mcp_server_youtube.youtube.methods import DatabaseManager
@@ -48,6 +49,10 @@ class DependencyContainer:
         try:
             cls._db_manager = create_db_manager()
             logger.info("Database manager initialized successfully.")
+            response_cache = get_response_cache()
+            if response_cache is not None:
+                # Drop cached transcript responses when a video's transcript changes
+                cls._db_manager.add_save_listener(response_cache.invalidate_video)
         except Exception as e:
             logger.warning(
                 "Database initialization failed; caching disabled. Error: %s", e
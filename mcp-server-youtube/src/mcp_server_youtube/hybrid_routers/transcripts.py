@@ -8,30 +8,117 @@ import logging
 
 from fastapi import APIRouter, Depends, HTTPException
 
+from mcp_server_youtube.config import get_app_settings
 from mcp_server_youtube.dependencies import get_db_manager, get_youtube_service
 from mcp_server_youtube.schemas import (
     ExtractTranscriptsRequest,
     ExtractTranscriptsResponse,
     SearchTranscriptsResponse,
     SearchVideosRequest,
+    TranscriptWindow,
     VideoResponse,
 )
 from mcp_server_youtube.youtube import YouTubeVideoSearchAndTranscript
+from mcp_server_youtube.youtube.api_models import ApifyTranscriptResult
 from mcp_server_youtube.youtube.methods import DatabaseManager
+from mcp_server_youtube.youtube.models import YouTubeVideo
+from mcp_server_youtube.youtube.transcript_chunks import (
+    INDEX_VERSION,
+    InvalidCursorError,
+    build_transcript_index,
+    slice_transcript,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+async def _load_cache_state(
+    video_ids: list[str], db_manager: DatabaseManager
+) -> tuple[dict[str, bool], dict[str, bool], dict[str, YouTubeVideo]]:
+    """
+    Look up cache state for a request's videos with at most two queries.
+
+    A projection-only status query decides which videos are cached; full rows
+    (including transcript text) are then loaded in one query for the stored
+    videos only and handed to the processing functions.
+
+    Returns:
+        (cached_transcripts, existing_videos, stored rows by video_id)
+    """
+    status = await asyncio.to_thread(db_manager.batch_get_transcript_status, video_ids)
+    cached_transcripts = {video_id: status.get(video_id, False) for video_id in video_ids}
+    existing_videos = {video_id: video_id in status for video_id in video_ids}
+    rows: dict[str, YouTubeVideo] = {}
+    if status:
+        fetched = await asyncio.to_thread(db_manager.batch_get_videos, list(status))
+        rows = {video_id: row for video_id, row in fetched.items() if row is not None}
+    return cached_transcripts, existing_videos, rows
+
+
+def _apply_window(video: dict, window: TranscriptWindow | None) -> dict:
+    """
+    Replace the transcript with the requested window, using the stored index.
+
+    Rows saved before indexes existed (or fresh results that were not saved)
+    get an index built on the fly; it matches the one save_video would store.
+    """
+    index = video.pop("transcript_index", None)
+    segments = video.pop("transcript_segments", None)
+    transcript = video.get("transcript")
+    if window is None or not transcript:
+        return video
+    if (
+        not isinstance(index, dict)
+        or index.get("v") != INDEX_VERSION
+        or index.get("length") != len(transcript)
+    ):
+        index = build_transcript_index(
+            transcript, segments, get_app_settings().database.TRANSCRIPT_CHUNK_CHARS
+        )
+    video["transcript"], video["transcript_window"] = slice_transcript(
+        transcript, index, video["video_id"], **window.model_dump(exclude_none=True)
+    )
+    return video
+
+
+async def _prefetch_uncached_transcripts(
+    video_ids: list[str],
+    service: YouTubeVideoSearchAndTranscript,
+    cached_transcripts: dict[str, bool],
+    existing_videos: dict[str, bool],
+) -> dict[str, ApifyTranscriptResult]:
+    """
+    Fetch transcripts for all uncached videos with batched actor runs.
+
+    Only used when more than one video needs the API; a single video keeps the
+    single-video path in the processing functions.
+    """
+    uncached = list(
+        dict.fromkeys(
+            video_id
+            for video_id in video_ids
+            if not cached_transcripts.get(video_id, False)
+            and not existing_videos.get(video_id, False)
+        )
+    )
+    if len(uncached) <= 1:
+        return {}
+    logger.info(f"📦 Batch fetching transcripts for {len(uncached)} uncached videos")
+    return await service.get_transcripts_batch(uncached)
+
+
 async def _process_video_transcript(
     video: any,
     service: YouTubeVideoSearchAndTranscript,
     db_manager: DatabaseManager,
     cached_transcripts: dict[str, bool],
     existing_videos: dict[str, bool],
+    prefetched: dict[str, ApifyTranscriptResult] | None = None,
+    cached_rows: dict[str, YouTubeVideo] | None = None,
 ) -> dict:
     """
-    Process transcript for a single video (cached or fetch from API).
+    Process transcript for a single video (cached, prefetched or fetch from API).
 
     This function is designed to be called in parallel for multiple videos.
     """
@@ -45,7 +132,7 @@ async def _process_video_transcript(
     # Check cache first
     if cached_transcripts.get(video_id, False):
         logger.info(f"💾 Loading transcript from cache for video {video_id}")
-        cached_video = await asyncio.to_thread(db_manager.get_video, video_id)
+        cached_video = (cached_rows or {}).get(video_id)
         if cached_video and cached_video.transcript_success and cached_video.transcript:
             transcript_result = {
                 "success": cached_video.transcript_success,
@@ -54,13 +141,14 @@ async def _process_video_transcript(
                 "is_generated": cached_video.is_auto_generated,
                 "language": cached_video.language,
                 "error": cached_video.error,
+                "index": cached_video.transcript_index,
             }
     elif existing_videos.get(video_id, False):
         # Video exists in DB but transcript failed - load from cache to avoid retrying
         logger.info(
             f"💾 Loading failed transcript attempt from cache for video {video_id} - skipping retry"
         )
-        cached_video = await asyncio.to_thread(db_manager.get_video, video_id)
+        cached_video = (cached_rows or {}).get(video_id)
         if cached_video:
             transcript_result = {
                 "success": cached_video.transcript_success,
@@ -69,12 +157,15 @@ async def _process_video_transcript(
                 "is_generated": cached_video.is_auto_generated,
                 "language": cached_video.language,
                 "error": cached_video.error,
+                "index": cached_video.transcript_index,
             }
 
     # Fetch from API if not cached
     if transcript_result is None:
-        logger.info(f"🌐 Fetching transcript from API for video {video_id}")
-        transcript_api_result = await service.get_transcript_safe(video_id)
+        transcript_api_result = (prefetched or {}).get(video_id)
+        if transcript_api_result is None:
+            logger.info(f"🌐 Fetching transcript from API for video {video_id}")
+            transcript_api_result = await service.get_transcript_safe(video_id)
         transcript_result = {
             "success": transcript_api_result.success,
             "transcript": transcript_api_result.transcript,
@@ -84,6 +175,7 @@ async def _process_video_transcript(
             "is_generated": transcript_api_result.is_generated,
             "language": transcript_api_result.language,
             "error": transcript_api_result.error,
+            "segments": transcript_api_result.segments,
         }
 
         # Save to cache
@@ -111,6 +203,7 @@ async def _process_video_transcript(
                 "error": transcript_result["error"],
                 "is_auto_generated": transcript_result["is_generated"],
                 "language": transcript_result["language"],
+                "transcript_segments": transcript_result.get("segments"),
             }
             await asyncio.to_thread(db_manager.save_video, video_data)
 
@@ -138,6 +231,8 @@ async def _process_video_transcript(
         "error": transcript_result["error"],
         "is_auto_generated": transcript_result["is_generated"],
         "language": transcript_result["language"],
+        "transcript_index": transcript_result.get("index"),
+        "transcript_segments": transcript_result.get("segments"),
     }
     return combined
 
@@ -148,9 +243,11 @@ async def _process_video_id_transcript(
     db_manager: DatabaseManager,
     cached_transcripts: dict[str, bool],
     existing_videos: dict[str, bool],
+    prefetched: dict[str, ApifyTranscriptResult] | None = None,
+    cached_rows: dict[str, YouTubeVideo] | None = None,
 ) -> dict:
     """
-    Process transcript for a single video ID (cached or fetch from API).
+    Process transcript for a single video ID (cached, prefetched or fetch from API).
 
     This function is designed to be called in parallel for multiple video IDs.
     """
@@ -159,7 +256,7 @@ async def _process_video_id_transcript(
 
     if cached_transcripts.get(video_id, False):
         logger.info(f"💾 Loading transcript from cache for video {video_id}")
-        cached_video = await asyncio.to_thread(db_manager.get_video, video_id)
+        cached_video = (cached_rows or {}).get(video_id)
         if cached_video and cached_video.transcript_success and cached_video.transcript:
             transcript_result = {
                 "success": cached_video.transcript_success,
@@ -168,13 +265,14 @@ async def _process_video_id_transcript(
                 "is_generated": cached_video.is_auto_generated,
                 "language": cached_video.language,
                 "error": cached_video.error,
+                "index": cached_video.transcript_index,
             }
     elif existing_videos.get(video_id, False):
         # Video exists in DB but transcript failed - load from cache to avoid retrying
         logger.info(
             f"💾 Loading failed transcript attempt from cache for video {video_id} - skipping retry"
         )
-        cached_video = await asyncio.to_thread(db_manager.get_video, video_id)
+        cached_video = (cached_rows or {}).get(video_id)
         if cached_video:
             transcript_result = {
                 "success": cached_video.transcript_success,
@@ -183,11 +281,14 @@ async def _process_video_id_transcript(
                 "is_generated": cached_video.is_auto_generated,
                 "language": cached_video.language,
                 "error": cached_video.error,
+                "index": cached_video.transcript_index,
             }
 
     if transcript_result is None:
-        logger.info(f"🌐 Fetching transcript from API for video {video_id}")
-        transcript_api_result = await service.get_transcript_safe(video_id)
+        transcript_api_result = (prefetched or {}).get(video_id)
+        if transcript_api_result is None:
+            logger.info(f"🌐 Fetching transcript from API for video {video_id}")
+            transcript_api_result = await service.get_transcript_safe(video_id)
         transcript_result = {
             "success": transcript_api_result.success,
             "transcript": transcript_api_result.transcript,
@@ -197,6 +298,7 @@ async def _process_video_id_transcript(
             "is_generated": transcript_api_result.is_generated,
             "language": transcript_api_result.language,
             "error": transcript_api_result.error,
+            "segments": transcript_api_result.segments,
         }
 
         # Save to cache (both successful and failed attempts to avoid retrying)
@@ -226,6 +328,7 @@ async def _process_video_id_transcript(
             "error": transcript_result["error"],
             "is_auto_generated": transcript_result["is_generated"],
             "language": transcript_result["language"],
+            "transcript_segments": transcript_result.get("segments"),
         }
         saved = await asyncio.to_thread(db_manager.save_video, video_data)
         if saved:
@@ -235,10 +338,8 @@ async def _process_video_id_transcript(
                 logger.info(
                     f"💾 Cached failed transcript attempt for video {video_id} (error: {transcript_result.get('error')}) - will not retry"
                 )
-        # Reload cached_video after saving
-        cached_video = await asyncio.to_thread(db_manager.get_video, video_id)
 
-    # Use cached_video if available, otherwise use defaults
+    # Same metadata that was just saved, so no reload is needed
     combined = {
         "title": cached_video.title if cached_video else "Unknown",
         "channel": cached_video.channel if cached_video else "Unknown",
@@ -261,6 +362,8 @@ async def _process_video_id_transcript(
         "error": transcript_result["error"],
         "is_auto_generated": transcript_result["is_generated"],
         "language": transcript_result["language"],
+        "transcript_index": transcript_result.get("index"),
+        "transcript_segments": transcript_result.get("segments"),
     }
     return combined
 
@@ -320,11 +423,12 @@ async def search_and_extract_transcripts(
             for v in videos
             if v.video_id or v.id or v.display_id
         ]
-        cached_transcripts = await asyncio.to_thread(
-            db_manager.batch_check_transcripts, video_ids
+        cached_transcripts, existing_videos, cached_rows = await _load_cache_state(
+            video_ids, db_manager
         )
-        existing_videos = await asyncio.to_thread(
-            db_manager.batch_check_video_exists, video_ids
+
+        prefetched = await _prefetch_uncached_transcripts(
+            video_ids, service, cached_transcripts, existing_videos
         )
 
         # Process all videos in parallel
@@ -333,7 +437,13 @@ async def search_and_extract_transcripts(
         )
         tasks = [
             _process_video_transcript(
-                video, service, db_manager, cached_transcripts, existing_videos
+                video,
+                service,
+                db_manager,
+                cached_transcripts,
+                existing_videos,
+                prefetched,
+                cached_rows,
             )
             for video in videos
             if video.video_id or video.id or video.display_id
@@ -356,6 +466,10 @@ async def search_and_extract_transcripts(
             raise HTTPException(status_code=404, detail="No videos found")
 
         cached_count = sum(cached_transcripts.values())
+        try:
+            results = [_apply_window(video, request.window) for video in results]
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
         video_responses = [VideoResponse.from_video(video) for video in results]
 
         return SearchTranscriptsResponse(
@@ -396,11 +510,12 @@ async def extract_transcripts(
     try:
         logger.info(f"MCP: Extract transcripts for {len(request.video_ids)} video IDs")
 
-        cached_transcripts = await asyncio.to_thread(
-            db_manager.batch_check_transcripts, request.video_ids
+        cached_transcripts, existing_videos, cached_rows = await _load_cache_state(
+            request.video_ids, db_manager
         )
-        existing_videos = await asyncio.to_thread(
-            db_manager.batch_check_video_exists, request.video_ids
+
+        prefetched = await _prefetch_uncached_transcripts(
+            request.video_ids, service, cached_transcripts, existing_videos
         )
 
         # Process all video IDs in parallel
@@ -409,7 +524,13 @@ async def extract_transcripts(
         )
         tasks = [
             _process_video_id_transcript(
-                video_id, service, db_manager, cached_transcripts, existing_videos
+                video_id,
+                service,
+                db_manager,
+                cached_transcripts,
+                existing_videos,
+                prefetched,
+                cached_rows,
             )
             for video_id in request.video_ids
         ]
@@ -430,11 +551,19 @@ async def extract_transcripts(
                 status_code=404, detail="No transcripts could be extracted"
             )
 
-        cached_transcripts_after = await asyncio.to_thread(
-            db_manager.batch_check_transcripts, request.video_ids
-        )
-        cached_count_after = sum(cached_transcripts_after.values())
+        if all(existing_videos.values()):
+            # Nothing was fetched or saved, so the cache state is unchanged
+            cached_count_after = sum(cached_transcripts.values())
+        else:
+            status_after = await asyncio.to_thread(
+                db_manager.batch_get_transcript_status, request.video_ids
+            )
+            cached_count_after = sum(status_after.values())
 
+        try:
+            results = [_apply_window(video, request.window) for video in results]
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
         video_responses = [VideoResponse.from_video(video) for video in results]
 
         return ExtractTranscriptsResponse(
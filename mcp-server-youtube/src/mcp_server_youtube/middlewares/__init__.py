@@ -2,6 +2,7 @@
 Middleware modules.
 """
 
+from .caching import TranscriptCachingMiddleware
 from .x402_wrapper import X402WrapperMiddleware
 
-__all__ = ["X402WrapperMiddleware"]
+__all__ = ["TranscriptCachingMiddleware", "X402WrapperMiddleware"]
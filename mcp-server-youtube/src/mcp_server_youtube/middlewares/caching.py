@@ -1,46 +1,488 @@
 """
-Caching middleware for YouTube transcript caching.
+HTTP response cache for the transcript endpoints.
+
+Main responsibility: Answer repeated, identical transcript requests with stored,
+pre-serialized response bytes (memory LRU plus optional disk tier) before routing,
+dependency setup or database work happen, with ETag/If-None-Match support and
+invalidation when a video's transcript changes.
 """
 
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
 import logging
-from collections.abc import Callable
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from mcp_server_youtube.youtube.methods import DatabaseManager
+from mcp_server_youtube.config import get_app_settings
 
 logger = logging.getLogger(__name__)
 
+# Idempotent transcript endpoints whose responses are cached
+CACHED_PATHS = ("/hybrid/extract-transcripts", "/hybrid/search-transcripts")
+
+# Response headers that are not stored with an entry: hop-by-hop headers and the
+# ones the middleware sets itself when replaying the body
+UNCACHED_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+        "content-length",
+        "content-type",
+        "etag",
+        "x-cache",
+    }
+)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body with the videos it depends on."""
+
+    body: bytes
+    etag: str
+    media_type: str
+    video_ids: tuple[str, ...]
+    expires_at: float  # wall clock, so disk entries survive restarts
+    headers: tuple[tuple[str, str], ...] = ()  # endpoint headers replayed on hits
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at <= time.time()
+
+
+def make_cache_key(path: str, query: str, body: bytes) -> str | None:
+    """
+    Build a key from the path, query string and canonicalized JSON body.
+
+    Returns:
+        Hex digest, or None when the body is not valid JSON (not cached)
+
+    """
+    try:
+        payload = json.loads(body) if body else None
+    except ValueError:
+        return None
+    canonical = json.dumps(
+        {
+            "path": path,
+            "query": sorted(q for q in query.split("&") if q),
+            "body": payload,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def cacheable_headers(
+    raw_headers: Iterable[tuple[bytes, bytes]],
+) -> tuple[tuple[str, str], ...]:
+    """Endpoint response headers worth replaying, minus `UNCACHED_HEADERS`."""
+    headers = ((k.decode("latin-1"), v.decode("latin-1")) for k, v in raw_headers)
+    return tuple((k, v) for k, v in headers if k.lower() not in UNCACHED_HEADERS)
+
+
+def referenced_video_ids(request_body: bytes, response_body: bytes) -> tuple[str, ...]:
+    """Video ids named in the request (`video_ids`) or response (`videos[].video_id`)."""
+    ids: dict[str, None] = {}
+    for raw, extract in (
+        (request_body, lambda d: d.get("video_ids") or []),
+        (response_body, lambda d: [v.get("video_id") for v in d.get("videos") or []]),
+    ):
+        try:
+            data = json.loads(raw) if raw else {}
+            ids.update(dict.fromkeys(v for v in extract(data) if isinstance(v, str)))
+        except (ValueError, AttributeError):
+            continue
+    return tuple(ids)
+
+
+class ResponseCache:
+    """
+    Bounded in-memory LRU of response bytes with an optional disk tier.
+
+    Entries expire after `ttl_seconds`. Each entry is indexed by the video ids it
+    references so `invalidate_video` can drop every response containing a video.
+    The index covers the entries held by the tiers: memory evictions unindex the
+    entry unless the disk tier still holds it, and expired or pruned disk files
+    are unindexed when they are deleted.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_entries: int = 512,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_path: str | Path | None = None,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        Args:
+            ttl_seconds: Time to live for cached responses
+            max_entries: Maximum number of responses kept in memory
+            max_bytes: Maximum total body size kept in memory
+            disk_path: Directory for the disk tier (None disables it)
+            disk_max_bytes: Maximum total size of the disk tier
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._memory_bytes = 0
+        self._by_video: dict[str, set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+        self._disk: Path | None = Path(disk_path) if disk_path else None
+        if self._disk is not None:
+            self._disk.mkdir(parents=True, exist_ok=True)
+            self._index_disk()
+
+    # --- Memory tier ---
+
+    def _index(self, key: str, video_ids: Iterable[str]) -> None:
+        for video_id in video_ids:
+            self._by_video.setdefault(video_id, set()).add(key)
+
+    def _unindex(self, key: str, video_ids: Iterable[str]) -> None:
+        for video_id in video_ids:
+            keys = self._by_video.get(video_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_video[video_id]
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= len(old.body)
+                self._unindex(key, old.video_ids)
+            self._memory[key] = entry
+            self._memory_bytes += len(entry.body)
+            self._index(key, entry.video_ids)
+            while self._memory and (
+                len(self._memory) > self.max_entries
+                or self._memory_bytes > self.max_bytes
+            ):
+                evicted_key, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted.body)
+                if self._disk is None:
+                    self._unindex(evicted_key, evicted.video_ids)
+
+    def _from_memory(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if entry.expired:
+                del self._memory[key]
+                self._memory_bytes -= len(entry.body)
+                self._unindex(key, entry.video_ids)
+                return None
+            self._memory.move_to_end(key)
+            return entry
+
+    # --- Disk tier ---
+
+    def _disk_file(self, key: str) -> Path:
+        return self._disk / f"{key}.resp"  # type: ignore[operator]
+
+    @staticmethod
+    def _read_disk(path: Path) -> CachedResponse | None:
+        """Read an entry file: one JSON metadata line followed by the body."""
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(
+            body=body,
+            etag=meta["etag"],
+            media_type=meta["media_type"],
+            video_ids=tuple(meta["video_ids"]),
+            expires_at=meta["expires_at"],
+            headers=tuple((k, v) for k, v in meta.get("headers", [])),
+        )
+
+    def _index_disk(self) -> None:
+        """Rebuild the video index for entries written by earlier processes."""
+        for path in self._disk.glob("*.resp"):  # type: ignore[union-attr]
+            try:
+                with open(path, "rb") as f:
+                    meta = json.loads(f.readline())
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+                continue
+            if meta.get("expires_at", 0) <= time.time():
+                path.unlink(missing_ok=True)
+            else:
+                self._index(path.stem, meta.get("video_ids", []))
+
+    def _get_disk(self, key: str) -> CachedResponse | None:
+        path = self._disk_file(key)
+        if not path.exists():
+            return None
+        entry = self._read_disk(path)
+        if entry is None or entry.expired:
+            path.unlink(missing_ok=True)
+            if entry is not None:
+                with self._lock:
+                    self._unindex(key, entry.video_ids)
+            return None
+        return entry
+
+    def _set_disk(self, key: str, entry: CachedResponse) -> None:
+        meta = {
+            "etag": entry.etag,
+            "media_type": entry.media_type,
+            "video_ids": list(entry.video_ids),
+            "expires_at": entry.expires_at,
+            "headers": [list(header) for header in entry.headers],
+        }
+        path = self._disk_file(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                f.write(entry.body)
+            os.replace(tmp, path)
+            self._prune_disk()
+        except OSError as e:
+            logger.warning(f"Could not write response cache entry to disk: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def _prune_disk(self) -> None:
+        """Delete the oldest entry files until the disk tier fits `disk_max_bytes`."""
+        files = []
+        for path in self._disk.glob("*.resp"):  # type: ignore[union-attr]
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                with open(path, "rb") as f:
+                    video_ids = json.loads(f.readline()).get("video_ids", [])
+            except (OSError, ValueError):
+                video_ids = []
+            path.unlink(missing_ok=True)
+            total -= size
+            with self._lock:
+                if path.stem not in self._memory:
+                    self._unindex(path.stem, video_ids)
+
+    # --- Public API ---
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Look up a response in memory, then on disk (promoting disk hits)."""
+        entry = self._from_memory(key)
+        if entry is None and self._disk is not None:
+            entry = await asyncio.to_thread(self._get_disk, key)
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    async def set(
+        self,
+        key: str,
+        body: bytes,
+        media_type: str,
+        video_ids: tuple[str, ...],
+        headers: tuple[tuple[str, str], ...] = (),
+    ) -> CachedResponse:
+        """Store response bytes (and headers to replay) in both tiers."""
+        entry = CachedResponse(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            media_type=media_type,
+            video_ids=video_ids,
+            expires_at=time.time() + self.ttl_seconds,
+            headers=headers,
+        )
+        self._remember(key, entry)
+        if self._disk is not None:
+            with self._lock:
+                self._index(key, video_ids)
+            await asyncio.to_thread(self._set_disk, key, entry)
+        return entry
+
+    def invalidate_video(self, video_id: str) -> None:
+        """Drop every cached response that references `video_id`."""
+        with self._lock:
+            keys = self._by_video.pop(video_id, set())
+            for key in keys:
+                entry = self._memory.pop(key, None)
+                if entry is not None:
+                    self._memory_bytes -= len(entry.body)
+                    self._unindex(key, entry.video_ids)
+        if self._disk is not None:
+            for key in keys:
+                self._disk_file(key).unlink(missing_ok=True)
+        if keys:
+            self.invalidations += len(keys)
+            logger.debug(f"Invalidated {len(keys)} cached responses for {video_id}")
+
+    def clear(self) -> None:
+        """Drop all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._by_video.clear()
+        if self._disk is not None:
+            for path in self._disk.glob("*.resp"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Entry counts, memory use and hit statistics."""
+        with self._lock:
+            entries, size = len(self._memory), self._memory_bytes
+        return {
+            "entries": entries,
+            "bytes": size,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "disk_enabled": self._disk is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+        }
+
+
+# Global response cache instance
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Get or create the global response cache (None when disabled)."""
+    global _response_cache
+    config = get_app_settings().response_cache
+    if not config.enabled:
+        return None
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            ttl_seconds=config.ttl_seconds,
+            max_entries=config.max_entries,
+            max_bytes=config.max_bytes,
+            disk_path=config.disk_path,
+            disk_max_bytes=config.disk_max_bytes,
+        )
+    return _response_cache
+
 
 class TranscriptCachingMiddleware(BaseHTTPMiddleware):
     """
-    Middleware that handles transcript caching for YouTube videos.
+    Response cache for the idempotent transcript endpoints.
+
+    Requests are keyed on path, query string and canonicalized JSON body. Hits
+    are answered with the stored bytes and the headers the endpoint set, before
+    routing. These POSTs are idempotent lookups, so `If-None-Match` with the
+    current ETag gets a 304. `Cache-Control: no-cache` skips the lookup but
+    still refreshes the entry. Only 200 JSON responses are stored.
 
-    This middleware intercepts requests to transcript-related endpoints and
-    checks the cache before making API calls. It also saves transcripts to
-    the cache after successful API calls.
+    Add it before the x402 middleware so it runs inside it and cached responses
+    are still paid for.
     """
 
-    def __init__(self, app, db_manager: DatabaseManager):
+    def __init__(
+        self,
+        app,
+        cache_provider: Callable[[], ResponseCache | None] = get_response_cache,
+        paths: Iterable[str] = CACHED_PATHS,
+    ):
         """
         Initialize the caching middleware.
 
         Args:
             app: The FastAPI application
-            db_manager: Database manager instance for cache operations
+            cache_provider: Returns the response cache (None disables caching)
+            paths: Request paths whose POST responses are cached
 
         """
         super().__init__(app)
-        self.db_manager = db_manager
+        self.cache_provider = cache_provider
+        self.paths = frozenset(paths)
+
+    @staticmethod
+    def _respond(
+        request: Request, cache: ResponseCache, entry: CachedResponse, status: str
+    ) -> Response:
+        if_none_match = request.headers.get("if-none-match", "")
+        if entry.etag in {tag.strip() for tag in if_none_match.split(",")}:
+            cache.not_modified += 1
+            response = Response(status_code=304)
+        else:
+            response = Response(content=entry.body, media_type=entry.media_type)
+        for name, value in entry.headers:
+            response.headers.append(name, value)
+        response.headers["ETag"] = entry.etag
+        response.headers["X-Cache"] = status
+        return response
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Process the request and handle caching.
+        """Serve cached responses for transcript requests and store new ones."""
+        if request.method != "POST" or request.url.path not in self.paths:
+            return await call_next(request)
+        cache = self.cache_provider()
+        if cache is None:
+            return await call_next(request)
+
+        request_body = await request.body()
+        key = make_cache_key(request.url.path, request.url.query, request_body)
+        if key is None:
+            return await call_next(request)
+
+        if "no-cache" not in request.headers.get("cache-control", "").lower():
+            entry = await cache.get(key)
+            if entry is not None:
+                return self._respond(request, cache, entry, "HIT")
 
-        This middleware doesn't modify the request/response flow directly,
-        but provides caching functionality that can be used by endpoints.
-        The actual caching logic is handled by the service layer.
-        """
         response = await call_next(request)
-        return response
+        media_type = response.headers.get("content-type", "")
+        if response.status_code != 200 or not media_type.startswith("application/json"):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        entry = await cache.set(
+            key,
+            body,
+            media_type,
+            referenced_video_ids(request_body, body),
+            cacheable_headers(response.raw_headers),
+        )
+        return self._respond(request, cache, entry, "MISS")
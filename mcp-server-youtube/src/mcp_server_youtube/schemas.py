@@ -3,7 +3,74 @@ Pydantic schemas for request/response models.
 """
 
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class TranscriptWindow(BaseModel):
+    """Part of each transcript to return (default: the whole transcript)."""
+
+    start_seconds: float | None = Field(
+        None, ge=0, description="Start of a time range (needs segment timings)"
+    )
+    end_seconds: float | None = Field(
+        None, gt=0, description="End of a time range (needs segment timings)"
+    )
+    char_offset: int = Field(0, ge=0, description="Character offset to start from")
+    max_chars: int | None = Field(
+        None, ge=1, description="Maximum characters returned per transcript"
+    )
+    max_tokens: int | None = Field(
+        None, ge=1, description="Approximate token budget (~4 characters per token)"
+    )
+    page_size: int | None = Field(
+        None,
+        ge=1,
+        le=100,
+        description="Precomputed chunks per page; enables cursor pagination",
+    )
+    cursor: str | None = Field(
+        None, description="`next_cursor` from a previous page of the same video"
+    )
+
+    @model_validator(mode="after")
+    def check_modes(self):
+        """Pagination and time/character windows are mutually exclusive."""
+        paginated = self.page_size is not None or self.cursor is not None
+        windowed = (
+            self.start_seconds is not None
+            or self.end_seconds is not None
+            or self.char_offset
+            or self.max_chars is not None
+            or self.max_tokens is not None
+        )
+        if paginated and windowed:
+            raise ValueError(
+                "Use either page_size/cursor pagination or a time/character window"
+            )
+        if (
+            self.start_seconds is not None
+            and self.end_seconds is not None
+            and self.end_seconds <= self.start_seconds
+        ):
+            raise ValueError("end_seconds must be greater than start_seconds")
+        return self
+
+
+class TranscriptWindowInfo(BaseModel):
+    """Which part of the transcript a windowed response contains."""
+
+    start_char: int
+    end_char: int
+    start_seconds: float | None = None
+    end_seconds: float | None = None
+    truncated: bool = Field(..., description="More transcript follows end_char")
+    total_chunks: int
+    chunk_start: int | None = None
+    chunk_end: int | None = None
+    next_cursor: str | None = None
+    time_range_unavailable: bool = Field(
+        False, description="Time range ignored: no segment timings stored"
+    )
 
 
 class VideoResponse(BaseModel):
@@ -46,6 +113,9 @@ class VideoResponse(BaseModel):
     error: str | None = None
     is_auto_generated: bool | None = None
     language: str | None = None
+    transcript_window: TranscriptWindowInfo | None = Field(
+        None, description="Set when a transcript window was requested"
+    )
 
     @classmethod
     def from_video(
@@ -180,6 +250,9 @@ class SearchVideosRequest(BaseModel):
     max_retries: int = Field(
         3, ge=0, le=10, description="Maximum number of retries for failed requests"
     )
+    window: TranscriptWindow | None = Field(
+        None, description="Return only part of each transcript (transcript endpoints)"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -210,6 +283,9 @@ class ExtractTranscriptsRequest(BaseModel):
     video_ids: list[str] = Field(
         ..., min_length=1, max_length=50, description="List of YouTube video IDs"
     )
+    window: TranscriptWindow | None = Field(
+        None, description="Return only part of each transcript"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={"example": {"video_ids": ["dQw4w9WgXcQ", "jNQXAC9IVRw"]}}
@@ -7,7 +7,8 @@ from mcp_server_youtube.youtube.client import (
                                                get_youtube_client,
 )
 from mcp_server_youtube.youtube.methods import DatabaseManager, get_db_manager
-from mcp_server_youtube.youtube.models import Base, YouTubeVideo
+from mcp_server_youtube.youtube.models import Base, YouTubeSearchCacheEntry, YouTubeVideo
+from mcp_server_youtube.youtube.search_cache import SearchResultCache
 
 __all__ = [
     "YouTubeVideoSearchAndTranscript",
@@ -15,5 +16,7 @@ __all__ = [
     "DatabaseManager",
     "get_db_manager",
     "YouTubeVideo",
+    "YouTubeSearchCacheEntry",
+    "SearchResultCache",
     "Base",
 ]
@@ -66,6 +66,17 @@ class ApifyTranscriptResult(BaseModel):
     is_generated: bool | None = None
     language: str | None = None
     error: str | None = None
+    # (start seconds, character offset in `transcript`) per caption segment
+    segments: list[tuple[float, int]] | None = None
+
+    @staticmethod
+    def _segment_start(segment: dict) -> float | None:
+        """Segment start time in seconds (actors use `start` or `offset`)."""
+        value = segment.get("start", segment.get("offset"))
+        try:
+            return float(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
 
     @classmethod
     def from_apify_response(
@@ -100,13 +111,23 @@ class ApifyTranscriptResult(BaseModel):
             )
 
         text_parts = []
+        timings: list[tuple[float, int]] | None = []
+        offset = 0
         for segment in transcript_segments:
             if isinstance(segment, dict):
                 text = segment.get("text", "").strip()
                 if text:
+                    start = cls._segment_start(segment)
+                    if start is None:
+                        timings = None
+                    elif timings is not None:
+                        timings.append((start, offset))
                     text_parts.append(text)
+                    offset += len(text) + 1
             elif isinstance(segment, str):
+                timings = None
                 text_parts.append(segment.strip())
+                offset += len(text_parts[-1]) + 1
 
         transcript_text = " ".join(text_parts)
 
@@ -123,6 +144,7 @@ class ApifyTranscriptResult(BaseModel):
             transcript=transcript_text,
             is_generated=None,
             language=None,
+            segments=timings or None,
         )
 
     # --- Dict-like compatibility (tests + legacy callers) ---
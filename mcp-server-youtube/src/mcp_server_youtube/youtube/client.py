@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
+import time
 from datetime import datetime
 from functools import lru_cache
 
@@ -17,9 +19,18 @@ from mcp_server_youtube.youtube.api_models import (
     ApifyTranscriptResult,
     YouTubeSearchResult,
 )
+from mcp_server_youtube.youtube.scheduler import TranscriptFetchScheduler
+from mcp_server_youtube.youtube.search_cache import (
+    SearchResultCache,
+    make_search_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
+TRANSCRIPT_ACTOR_ID = "pintostudio/youtube-transcript-scraper"
+
+_VIDEO_ID_PATTERN = re.compile(r"(?:v=|youtu\.be/|shorts/|embed/)([\w-]{11})")
+
 
 @lru_cache(maxsize=1)
 def get_youtube_client() -> YouTubeVideoSearchAndTranscript:
@@ -31,9 +42,17 @@ def get_youtube_client() -> YouTubeVideoSearchAndTranscript:
 
     """
     settings = get_app_settings()
+    search_cache = None
+    if settings.youtube.search_cache_enabled:
+        search_cache = SearchResultCache(
+            ttl_seconds=settings.youtube.search_cache_ttl_seconds,
+            max_entries=settings.youtube.search_cache_max_entries,
+            db_manager_factory=lambda: get_db_manager(),
+        )
     return YouTubeVideoSearchAndTranscript(
         delay_between_requests=settings.youtube.delay_between_requests,
         apify_api_token=settings.apify.apify_token,
+        search_cache=search_cache,
     )
 
 
@@ -45,6 +64,8 @@ class YouTubeVideoSearchAndTranscript:
         delay_between_requests: float | None = None,
         apify_api_token: str | None = None,
         require_apify: bool = True,
+        search_cache: SearchResultCache | None = None,
+        transcript_scheduler: TranscriptFetchScheduler | None = None,
     ):
         """
         Args:
@@ -52,10 +73,15 @@ class YouTubeVideoSearchAndTranscript:
             apify_api_token: Apify API token. Defaults to config value if not provided.
             require_apify: If False, skip Apify initialization (for search-only mode).
                           Note: Search now requires Apify, so this only affects transcript extraction.
+            search_cache: Cache for search results. None disables search caching.
+            transcript_scheduler: Concurrency/rate limits for transcript actor runs.
+                Defaults to config values.
 
         """
         settings = get_app_settings()
         self.delay = delay_between_requests or settings.youtube.delay_between_requests
+        self.search_cache = search_cache
+        self._transcript_scheduler = transcript_scheduler
 
         # Rely on Pydantic BaseSettings - no hidden logic
         if apify_api_token is not None:
@@ -78,6 +104,17 @@ class YouTubeVideoSearchAndTranscript:
 
         logger.info("YouTubeVideoSearchAndTranscript initialized")
 
+    @property
+    def transcript_scheduler(self) -> TranscriptFetchScheduler:
+        """Limits for transcript actor runs (built from config on first use)."""
+        if self._transcript_scheduler is None:
+            settings = get_app_settings()
+            self._transcript_scheduler = TranscriptFetchScheduler(
+                max_concurrency=settings.youtube.transcript_max_concurrency,
+                rate_per_second=settings.youtube.transcript_rate_per_second,
+            )
+        return self._transcript_scheduler
+
     def _video_id_from(self, video) -> str | None:
         if isinstance(video, dict):
             return video.get("video_id") or video.get("id") or video.get("display_id")
@@ -130,6 +167,61 @@ class YouTubeVideoSearchAndTranscript:
         if max_results is None:
             max_results = settings.youtube.max_results
 
+        if self.search_cache is None:
+            return await self._run_search(
+                query,
+                max_results,
+                exclude_shorts,
+                shorts_only,
+                upload_date_filter,
+                sort_by,
+                sleep_interval,
+                max_retries,
+            )
+
+        cache_key, normalized_query, params = make_search_cache_key(
+            query,
+            max_results,
+            exclude_shorts=exclude_shorts,
+            shorts_only=shorts_only,
+            upload_date_filter=upload_date_filter,
+            sort_by=sort_by,
+        )
+        cached = await self.search_cache.get(cache_key)
+        if cached is not None:
+            logger.info(
+                f"💾 Search cache hit for '{query}' ({len(cached)} videos)"
+            )
+            return cached
+
+        start = time.perf_counter()
+        results = await self._run_search(
+            query,
+            max_results,
+            exclude_shorts,
+            shorts_only,
+            upload_date_filter,
+            sort_by,
+            sleep_interval,
+            max_retries,
+        )
+        self.search_cache.record_miss(time.perf_counter() - start)
+        if results:
+            await self.search_cache.set(cache_key, normalized_query, params, results)
+        return results
+
+    async def _run_search(
+        self,
+        query: str,
+        max_results: int,
+        exclude_shorts: bool,
+        shorts_only: bool,
+        upload_date_filter: str,
+        sort_by: str,
+        sleep_interval: int,
+        max_retries: int,
+    ) -> list[YouTubeSearchResult]:
+        """Run the Apify YouTube Search actor (no caching)."""
         if not self.apify_client:
             logger.error(
                 "❌ Apify client not initialized. APIFY_TOKEN is required for search."
@@ -323,21 +415,22 @@ class YouTubeVideoSearchAndTranscript:
 
         for attempt in range(max_retries + 1):
             try:
-                run = await asyncio.to_thread(
-                    lambda: self.apify_client.actor(
-                        "pintostudio/youtube-transcript-scraper"
-                    ).call(run_input={"videoUrl": video_url})
-                )
+                async with self.transcript_scheduler.slot():
+                    run = await asyncio.to_thread(
+                        lambda: self.apify_client.actor(TRANSCRIPT_ACTOR_ID).call(
+                            run_input={"videoUrl": video_url}
+                        )
+                    )
 
-                def get_dataset_items():
-                    items = []
-                    for item in self.apify_client.dataset(
-                        run["defaultDatasetId"]
-                    ).iterate_items():
-                        items.append(item)
-                    return items
+                    def get_dataset_items():
+                        items = []
+                        for item in self.apify_client.dataset(
+                            run["defaultDatasetId"]
+                        ).iterate_items():
+                            items.append(item)
+                        return items
 
-                dataset_items = await asyncio.to_thread(get_dataset_items)
+                    dataset_items = await asyncio.to_thread(get_dataset_items)
 
                 result = ApifyTranscriptResult.from_apify_response(
                     video_id, dataset_items
@@ -352,50 +445,20 @@ class YouTubeVideoSearchAndTranscript:
                         await asyncio.sleep(wait_time)
                         continue
                     else:
-                        # Normalize error message
-                        error_msg = result.error or "Unknown error"
-                        if (
-                            "No transcript" in error_msg
-                            or "not available" in error_msg.lower()
-                        ):
-                            error_msg = "No subtitles available for this video"
-                        elif (
-                            "API token" in error_msg
-                            or "authentication" in error_msg.lower()
-                        ):
-                            error_msg = (
-                                "Apify API authentication failed. Check your API token."
-                            )
-                        elif len(error_msg) > 200:
-                            error_msg = error_msg[:200] + "..."
                         return ApifyTranscriptResult(
                             success=False,
                             video_id=video_id,
-                            error=error_msg,
+                            error=self._normalize_transcript_error(
+                                result.error or "Unknown error"
+                            ),
                         )
 
             except Exception as e:
                 if attempt == max_retries:
-                    error_msg = str(e)
-                    if (
-                        "No transcript" in error_msg
-                        or "not available" in error_msg.lower()
-                    ):
-                        error_msg = "No subtitles available for this video"
-                    elif (
-                        "API token" in error_msg
-                        or "authentication" in error_msg.lower()
-                    ):
-                        error_msg = (
-                            "Apify API authentication failed. Check your API token."
-                        )
-                    elif len(error_msg) > 200:
-                        error_msg = error_msg[:200] + "..."
-
                     return ApifyTranscriptResult(
                         success=False,
                         video_id=video_id,
-                        error=error_msg,
+                        error=self._normalize_transcript_error(str(e)),
                     )
                 wait_time = self.delay * (2**attempt)
                 await asyncio.sleep(wait_time)
@@ -404,6 +467,142 @@ class YouTubeVideoSearchAndTranscript:
             success=False, video_id=video_id, error="Unknown error"
         )
 
+    @staticmethod
+    def _normalize_transcript_error(error_msg: str) -> str:
+        """Map actor errors to the messages returned to clients."""
+        if "No transcript" in error_msg or "not available" in error_msg.lower():
+            return "No subtitles available for this video"
+        if "API token" in error_msg or "authentication" in error_msg.lower():
+            return "Apify API authentication failed. Check your API token."
+        if len(error_msg) > 200:
+            return error_msg[:200] + "..."
+        return error_msg
+
+    @staticmethod
+    def _item_video_id(item: dict) -> str | None:
+        """Find which video a transcript dataset item belongs to."""
+        for key in ("videoId", "video_id"):
+            if isinstance(item.get(key), str):
+                return item[key]
+        for key in ("videoUrl", "url", "inputUrl", "input"):
+            value = item.get(key)
+            if isinstance(value, str):
+                match = _VIDEO_ID_PATTERN.search(value)
+                if match:
+                    return match.group(1)
+        return None
+
+    async def _run_transcript_batch(
+        self, video_ids: list[str], language: str
+    ) -> dict[str, ApifyTranscriptResult]:
+        """
+        Fetch transcripts for several videos with a single actor run.
+
+        Dataset items are split by video id; videos whose items cannot be
+        attributed (or a failed run) are simply absent from the result.
+        """
+        urls = [f"https://www.youtube.com/watch?v={video_id}" for video_id in video_ids]
+
+        def run_batch() -> list[dict]:
+            run = self.apify_client.actor(TRANSCRIPT_ACTOR_ID).call(
+                run_input={"videoUrls": urls}
+            )
+            return list(
+                self.apify_client.dataset(run["defaultDatasetId"]).iterate_items()
+            )
+
+        try:
+            async with self.transcript_scheduler.slot():
+                dataset_items = await asyncio.to_thread(run_batch)
+        except Exception as e:
+            logger.warning(
+                f"⚠️ Batch transcript run for {len(video_ids)} videos failed: {e}"
+            )
+            return {}
+
+        grouped: dict[str, list[dict]] = {}
+        for item in dataset_items:
+            if not isinstance(item, dict):
+                continue
+            video_id = self._item_video_id(item)
+            if video_id is None and len(video_ids) == 1:
+                video_id = video_ids[0]
+            if video_id in video_ids:
+                grouped.setdefault(video_id, []).append(item)
+
+        results = {}
+        for video_id, items in grouped.items():
+            result = ApifyTranscriptResult.from_apify_response(video_id, items)
+            if result.success:
+                result.language = language
+            else:
+                result.error = self._normalize_transcript_error(
+                    result.error or "Unknown error"
+                )
+            results[video_id] = result
+        return results
+
+    async def get_transcripts_batch(
+        self, video_ids: list[str], language: str = "en"
+    ) -> dict[str, ApifyTranscriptResult]:
+        """
+        Fetch transcripts for many videos using multi-video actor runs.
+
+        Video ids are submitted in chunks of `transcript_batch_size` per actor run
+        (chunks run concurrently under the transcript scheduler). Only videos
+        missing from a chunk's output (or from a failed run) are retried with
+        single-video runs via `get_transcript_safe`; a video the batch reported
+        without a transcript keeps that result instead of paying for a second run.
+
+        Args:
+            video_ids: YouTube video IDs (duplicates are fetched once)
+            language: Language recorded on successful results
+
+        Returns:
+            Dictionary mapping every requested video_id to its ApifyTranscriptResult
+
+        """
+        unique_ids = list(dict.fromkeys(video_ids))
+        if not unique_ids:
+            return {}
+        if not self.apify_client:
+            return {
+                video_id: ApifyTranscriptResult(
+                    success=False,
+                    video_id=video_id,
+                    error="Apify client not initialized",
+                )
+                for video_id in unique_ids
+            }
+
+        batch_size = max(1, get_app_settings().youtube.transcript_batch_size)
+        results: dict[str, ApifyTranscriptResult] = {}
+        if batch_size > 1 and len(unique_ids) > 1:
+            chunks = [
+                unique_ids[i : i + batch_size]
+                for i in range(0, len(unique_ids), batch_size)
+            ]
+            logger.info(
+                f"📦 Fetching {len(unique_ids)} transcripts in {len(chunks)} batch run(s)"
+            )
+            for chunk_results in await asyncio.gather(
+                *(self._run_transcript_batch(chunk, language) for chunk in chunks)
+            ):
+                results.update(chunk_results)
+
+        fallback = [video_id for video_id in unique_ids if video_id not in results]
+        if fallback:
+            if len(fallback) < len(unique_ids):
+                logger.info(
+                    f"↩️ Falling back to single-video runs for {len(fallback)} video(s)"
+                )
+            single_results = await self.transcript_scheduler.map(
+                lambda video_id: self.get_transcript_safe(video_id, language),
+                fallback,
+            )
+            results.update(zip(fallback, single_results, strict=True))
+        return results
+
     async def search_and_get_transcripts(
         self, query: str, num_videos: int | None = None
     ) -> list[dict]:
@@ -432,16 +631,26 @@ class YouTubeVideoSearchAndTranscript:
 
         logger.info(f"📊 Found {len(videos)} videos (sorted by likes)")
 
-        results = []
-        for i, video in enumerate(videos, 1):
+        videos_with_ids = []
+        for video in videos:
             video_id = self._video_id_from(video)
             if not video_id:
                 logger.warning("Skipping video: Could not find video ID")
                 continue
+            videos_with_ids.append((video_id, video))
 
-            logger.info(f"🌐 Fetching transcript from API for video {video_id}")
-            transcript_result = await self.get_transcript_safe(video_id)
+        logger.info(
+            f"🌐 Fetching {len(videos_with_ids)} transcripts from API "
+            f"(max {self.transcript_scheduler.max_concurrency} concurrent)"
+        )
+        transcript_results = await self.transcript_scheduler.map(
+            self.get_transcript_safe, [video_id for video_id, _ in videos_with_ids]
+        )
 
+        results = []
+        for (video_id, video), transcript_result in zip(
+            videos_with_ids, transcript_results, strict=True
+        ):
             transcript_text = (
                 self._transcript_field(transcript_result, "transcript", "") or ""
             )
@@ -487,9 +696,6 @@ class YouTubeVideoSearchAndTranscript:
             }
             results.append(combined)
 
-            if i < len(videos):
-                await asyncio.sleep(self.delay)
-
         return results
 
     async def extract_transcripts_for_video_ids(
@@ -512,13 +718,18 @@ class YouTubeVideoSearchAndTranscript:
 
         logger.info(f"📝 Extracting transcripts for {len(video_ids)} video IDs")
 
-        results = []
-        for i, video_id in enumerate(video_ids, 1):
-            logger.info(f"\n[{i}/{len(video_ids)}] Processing video ID: {video_id}")
-
-            logger.info(f"🌐 Fetching transcript from API for video {video_id}")
-            transcript_result = await self.get_transcript_safe(video_id)
+        logger.info(
+            f"🌐 Fetching transcripts from API "
+            f"(max {self.transcript_scheduler.max_concurrency} concurrent)"
+        )
+        transcript_results = await self.transcript_scheduler.map(
+            self.get_transcript_safe, video_ids
+        )
 
+        results = []
+        for video_id, transcript_result in zip(
+            video_ids, transcript_results, strict=True
+        ):
             transcript_text = (
                 self._transcript_field(transcript_result, "transcript", "") or ""
             )
@@ -552,9 +763,6 @@ class YouTubeVideoSearchAndTranscript:
 
             results.append(combined)
 
-            if i < len(video_ids):
-                await asyncio.sleep(self.delay)
-
         return results
 
 
@@ -1,12 +1,27 @@
 import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import and_, create_engine, inspect, or_, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
 from mcp_server_youtube.config import DatabaseConfig
-from mcp_server_youtube.youtube.models import Base, YouTubeVideo
+from mcp_server_youtube.youtube.models import (
+    Base,
+    YouTubeSearchCacheEntry,
+    YouTubeVideo,
+)
+from mcp_server_youtube.youtube.transcript_chunks import (
+    DEFAULT_CHUNK_CHARS,
+    build_transcript_index,
+)
+from mcp_server_youtube.youtube.transcript_store import (
+    TranscriptCodec,
+    encode_transcript,
+    resolve_codec,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +44,15 @@ class NullDatabaseManager:
     def save_video(self, video_data: dict[str, Any]) -> bool:
         return False
 
+    def add_save_listener(self, callback: Callable[[str], None]) -> None:
+        return None
+
     def batch_get_videos(self, video_ids: list[str]) -> dict[str, YouTubeVideo | None]:
         return {video_id: None for video_id in video_ids}
 
+    def batch_get_transcript_status(self, video_ids: list[str]) -> dict[str, bool]:
+        return {}
+
     def batch_check_transcripts(self, video_ids: list[str]) -> dict[str, bool]:
         return {video_id: False for video_id in video_ids}
 
@@ -41,24 +62,56 @@ class NullDatabaseManager:
     def batch_check_video_exists(self, video_ids: list[str]) -> dict[str, bool]:
         return {video_id: False for video_id in video_ids}
 
+    def get_search_results(self, cache_key: str) -> YouTubeSearchCacheEntry | None:
+        return None
+
+    def save_search_results(
+        self,
+        cache_key: str,
+        query: str,
+        params: dict[str, Any],
+        results: list[dict[str, Any]],
+        ttl_seconds: int,
+    ) -> bool:
+        return False
+
+
+def _utcnow() -> datetime:
+    """Naive UTC timestamp (the DateTime columns are timezone-naive)."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
 
 class DatabaseManager:
     """Manages database connections and operations for YouTube video caching."""
 
-    def __init__(self, database_url: str | None = None):
+    # How new transcripts are written ("compressed" or "text"); reads handle both
+    transcript_storage: str = "compressed"
+    transcript_codec: TranscriptCodec = "zlib"
+    transcript_chunk_chars: int = DEFAULT_CHUNK_CHARS
+    # Called with the video_id after a transcript is saved (e.g. response cache)
+    _save_listeners: tuple[Callable[[str], None], ...] = ()
+
+    def __init__(
+        self, database_url: str | None = None, transcript_storage: str | None = None
+    ):
         """
         Initialize database manager.
 
         Args:
             database_url: PostgreSQL connection URL. Defaults to DatabaseConfig.DATABASE_URL.
+            transcript_storage: "compressed" or "text". Defaults to
+                DatabaseConfig.TRANSCRIPT_STORAGE.
 
         Raises:
             ValueError: If DATABASE_URL is not configured or connection cannot be established.
 
         """
+        db_config = DatabaseConfig()
         if database_url is None:
-            db_config = DatabaseConfig()
             database_url = db_config.DATABASE_URL
+        self.transcript_storage = transcript_storage or db_config.TRANSCRIPT_STORAGE
+        self.transcript_codec = resolve_codec(db_config.TRANSCRIPT_CODEC)
+        self.transcript_chunk_chars = db_config.TRANSCRIPT_CHUNK_CHARS
 
         if not database_url:
             raise ValueError(
@@ -94,11 +147,67 @@ class DatabaseManager:
         """Create database tables if they don't exist."""
         try:
             Base.metadata.create_all(self.engine)
+            self._add_missing_columns()
             logger.info("Database tables created/verified")
         except Exception as e:
             logger.error(f"Error creating database tables: {e}")
             raise
 
+    def _add_missing_columns(self) -> None:
+        """Add `youtube_videos` columns introduced after a table was created."""
+        table = YouTubeVideo.__tablename__
+        existing = {c["name"] for c in inspect(self.engine).get_columns(table)}
+        postgres = self.engine.dialect.name == "postgresql"
+        added = {
+            "transcript_data": "BYTEA" if postgres else "BLOB",
+            "transcript_index": "JSON",
+        }
+        for column, column_type in added.items():
+            if column in existing:
+                continue
+            with self.engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+            logger.info(f"Added {column} column to {table}")
+
+    def _transcript_columns(
+        self,
+        transcript: str | None,
+        segments: list[tuple[float, int]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Column values for a transcript under the configured storage mode.
+
+        Also precomputes the chunk/timing index used for windowed retrieval.
+        """
+        index = (
+            build_transcript_index(transcript, segments, self.transcript_chunk_chars)
+            if transcript
+            else None
+        )
+        if transcript and self.transcript_storage == "compressed":
+            return {
+                "transcript_text": None,
+                "transcript_data": encode_transcript(transcript, self.transcript_codec),
+                "transcript_index": index,
+            }
+        return {
+            "transcript_text": transcript,
+            "transcript_data": None,
+            "transcript_index": index,
+        }
+
+    def add_save_listener(self, callback: Callable[[str], None]) -> None:
+        """Register a callback run with the video_id whenever a transcript is saved."""
+        if callback not in self._save_listeners:
+            self._save_listeners = (*self._save_listeners, callback)
+
+    def _notify_saved(self, video_id: str) -> None:
+        for callback in self._save_listeners:
+            try:
+                callback(video_id)
+            except Exception as e:
+                logger.warning(f"Save listener failed for video {video_id}: {e}")
+
     def get_session(self) -> Session:
         """Get a database session."""
         return self.SessionLocal()
@@ -135,10 +244,7 @@ class DatabaseManager:
             True if transcript exists and is successful, False otherwise
 
         """
-        video = self.get_video(video_id)
-        if video and video.transcript_success and video.transcript:
-            return True
-        return False
+        return self.batch_get_transcript_status([video_id]).get(video_id, False)
 
     def save_video(self, video_data: dict[str, Any]) -> bool:
         """
@@ -165,21 +271,35 @@ class DatabaseManager:
                 else:
                     video_data["transcript_length"] = 0
 
+            row_data = {
+                k: v
+                for k, v in video_data.items()
+                if k not in ("transcript", "transcript_segments")
+            }
+            if "transcript" in video_data:
+                row_data.update(
+                    self._transcript_columns(
+                        video_data["transcript"], video_data.get("transcript_segments")
+                    )
+                )
+
             existing_video = (
                 session.query(YouTubeVideo).filter_by(video_id=video_id).first()
             )
 
             if existing_video:
-                for key, value in video_data.items():
+                for key, value in row_data.items():
                     if hasattr(existing_video, key):
                         setattr(existing_video, key, value)
                 logger.debug(f"Updated video {video_id} in database")
             else:
-                video = YouTubeVideo(**video_data)
+                video = YouTubeVideo(**row_data)
                 session.add(video)
                 logger.debug(f"Saved new video {video_id} to database")
 
             session.commit()
+            if "transcript" in video_data or "transcript_success" in video_data:
+                self._notify_saved(video_id)
             return True
         except SQLAlchemyError as e:
             session.rollback()
@@ -217,10 +337,48 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def batch_get_transcript_status(self, video_ids: list[str]) -> dict[str, bool]:
+        """
+        Look up which videos are stored and which have a successful transcript.
+
+        Selects only the video id and a transcript-present flag, so transcript
+        text and metadata are never read. Use `batch_get_videos` afterwards for
+        the rows that are actually needed.
+
+        Args:
+            video_ids: List of YouTube video IDs
+
+        Returns:
+            Dictionary mapping each stored video_id to True if it has a successful
+            transcript (ids missing from the dict are not in the database)
+
+        """
+        if not video_ids:
+            return {}
+        session = self.get_session()
+        try:
+            has_transcript = and_(
+                YouTubeVideo.transcript_success.is_(True),
+                or_(
+                    YouTubeVideo.transcript_text.isnot(None),
+                    YouTubeVideo.transcript_data.isnot(None),
+                ),
+            ).label("has_transcript")
+            rows = (
+                session.query(YouTubeVideo.video_id, has_transcript)
+                .filter(YouTubeVideo.video_id.in_(video_ids))
+                .all()
+            )
+            return {video_id: bool(flag) for video_id, flag in rows}
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking transcript status in database: {e}")
+            return {}
+        finally:
+            session.close()
+
     def batch_check_transcripts(self, video_ids: list[str]) -> dict[str, bool]:
         """
         Check which videos have transcripts in database.
-        Also checks if video exists (even with failed transcript) to avoid retrying.
 
         Args:
             video_ids: List of YouTube video IDs
@@ -228,15 +386,8 @@ class DatabaseManager:
         Returns:
             Dictionary mapping video_id to boolean (True if transcript exists and is successful)
         """
-        videos = self.batch_get_videos(video_ids)
-        return {
-            video_id: (
-                video is not None
-                and video.transcript_success
-                and video.transcript is not None
-            )
-            for video_id, video in videos.items()
-        }
+        status = self.batch_get_transcript_status(video_ids)
+        return {video_id: status.get(video_id, False) for video_id in video_ids}
 
     def video_exists(self, video_id: str) -> bool:
         """
@@ -249,8 +400,7 @@ class DatabaseManager:
             True if video exists in database, False otherwise
 
         """
-        video = self.get_video(video_id)
-        return video is not None
+        return video_id in self.batch_get_transcript_status([video_id])
 
     def batch_check_video_exists(self, video_ids: list[str]) -> dict[str, bool]:
         """
@@ -264,8 +414,134 @@ class DatabaseManager:
             Dictionary mapping video_id to boolean (True if video exists in DB)
 
         """
-        videos = self.batch_get_videos(video_ids)
-        return {video_id: video is not None for video_id, video in videos.items()}
+        status = self.batch_get_transcript_status(video_ids)
+        return {video_id: video_id in status for video_id in video_ids}
+
+    def migrate_transcripts(self, batch_size: int = 200) -> int:
+        """
+        Compress plain-text transcripts of existing rows into `transcript_data`.
+
+        Rows without a chunk index get one (without segment timings, which
+        were not stored before indexes existed).
+
+        Walks the table in video_id order and commits per batch, so it can be
+        interrupted and rerun; already compressed rows are skipped.
+
+        Args:
+            batch_size: Rows loaded and committed per batch
+
+        Returns:
+            Number of rows migrated
+
+        """
+        migrated = 0
+        last_id = ""
+        while True:
+            session = self.get_session()
+            try:
+                videos = (
+                    session.query(YouTubeVideo)
+                    .filter(
+                        YouTubeVideo.video_id > last_id,
+                        YouTubeVideo.transcript_text.isnot(None),
+                        YouTubeVideo.transcript_data.is_(None),
+                    )
+                    .order_by(YouTubeVideo.video_id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not videos:
+                    return migrated
+                for video in videos:
+                    if video.transcript_index is None:
+                        video.transcript_index = build_transcript_index(
+                            video.transcript_text,
+                            chunk_chars=self.transcript_chunk_chars,
+                        )
+                    video.transcript_data = encode_transcript(
+                        video.transcript_text, self.transcript_codec
+                    )
+                    video.transcript_text = None
+                last_id = videos[-1].video_id
+                session.commit()
+                migrated += len(videos)
+                logger.info(f"Compressed {migrated} transcripts so far")
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.error(f"Error migrating transcripts: {e}")
+                return migrated
+            finally:
+                session.close()
+
+    def get_search_results(self, cache_key: str) -> YouTubeSearchCacheEntry | None:
+        """
+        Get a cached search result if it has not expired.
+
+        Args:
+            cache_key: Search cache key (hash of normalized query and filters)
+
+        Returns:
+            YouTubeSearchCacheEntry if found and valid, None otherwise
+
+        """
+        session = self.get_session()
+        try:
+            return (
+                session.query(YouTubeSearchCacheEntry)
+                .filter(
+                    YouTubeSearchCacheEntry.cache_key == cache_key,
+                    YouTubeSearchCacheEntry.expires_at > _utcnow(),
+                )
+                .first()
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting search cache entry {cache_key}: {e}")
+            return None
+        finally:
+            session.close()
+
+    def save_search_results(
+        self,
+        cache_key: str,
+        query: str,
+        params: dict[str, Any],
+        results: list[dict[str, Any]],
+        ttl_seconds: int,
+    ) -> bool:
+        """
+        Save or replace a cached search result.
+
+        Args:
+            cache_key: Search cache key (hash of normalized query and filters)
+            query: Normalized search query
+            params: Search filters that are part of the key
+            results: Search result dicts in result order
+            ttl_seconds: Time to live in seconds
+
+        Returns:
+            True if successful, False otherwise
+
+        """
+        session = self.get_session()
+        try:
+            entry = session.get(YouTubeSearchCacheEntry, cache_key)
+            if entry is None:
+                entry = YouTubeSearchCacheEntry(cache_key=cache_key)
+                session.add(entry)
+            entry.query = query
+            entry.params = params
+            entry.video_ids = [r.get("video_id") for r in results]
+            entry.results = results
+            entry.created_at = _utcnow()
+            entry.expires_at = _utcnow() + timedelta(seconds=ttl_seconds)
+            session.commit()
+            return True
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Error saving search cache entry {cache_key}: {e}")
+            return False
+        finally:
+            session.close()
 
 
 # Global database manager instance
@@ -1,6 +1,18 @@
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, func
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import declarative_base
 
+from mcp_server_youtube.youtube.transcript_store import decode_transcript
+
 # Define the base class for declarative class definitions
 Base = declarative_base()
 
@@ -34,7 +46,12 @@ class YouTubeVideo(Base):
 
     # --- Transcript Information ---
     transcript_success = Column(Boolean, nullable=True)
-    transcript = Column(Text, nullable=True)
+    # Plain text (legacy rows / DB_TRANSCRIPT_STORAGE=text) or compressed blob;
+    # read both through the `transcript` property
+    transcript_text = Column("transcript", Text, nullable=True)
+    transcript_data = Column(LargeBinary, nullable=True)
+    # Chunk boundaries and segment timings (see transcript_chunks.build_transcript_index)
+    transcript_index = Column(JSON, nullable=True)
     transcript_length = Column(
         Integer, nullable=True
     )  # Length of transcript in characters
@@ -46,5 +63,51 @@ class YouTubeVideo(Base):
     fetched_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    @property
+    def transcript(self) -> str | None:
+        """Transcript text, decompressed on first access."""
+        data = self.transcript_data
+        if data is None:
+            return self.transcript_text
+        decoded = self.__dict__.get("_decoded_transcript")
+        if decoded is None or decoded[0] is not data:
+            decoded = (data, decode_transcript(data))
+            self.__dict__["_decoded_transcript"] = decoded
+        return decoded[1]
+
+    @transcript.setter
+    def transcript(self, value: str | None) -> None:
+        """Store plain text; `DatabaseManager.save_video` compresses on write."""
+        self.transcript_text = value
+        self.transcript_data = None
+
     def __repr__(self):
         return f"<YouTubeVideo(video_id='{self.video_id}', title='{self.title}', transcript_success={self.transcript_success})>"
+
+
+class YouTubeSearchCacheEntry(Base):
+    """
+    Cached YouTube search results
+    Stores the ordered video ids of one search (normalized query + filters) with a TTL;
+    `results` keeps the search metadata for videos that have no `youtube_videos` row yet
+    """
+
+    __tablename__ = "youtube_search_cache"
+
+    # --- Primary Key ---
+    cache_key = Column(String(64), primary_key=True)  # SHA-256 of query + filters
+
+    # --- Search Parameters ---
+    query = Column(Text, nullable=False)  # Normalized query
+    params = Column(JSON, nullable=False)  # max_results, filters, sort order
+
+    # --- Results ---
+    video_ids = Column(JSON, nullable=False)  # Ordered list of video ids
+    results = Column(JSON, nullable=False)  # Search result dicts, same order
+
+    # --- Timestamps ---
+    created_at = Column(DateTime, server_default=func.now())
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<YouTubeSearchCacheEntry(cache_key='{self.cache_key[:12]}', query='{self.query}', videos={len(self.video_ids or [])})>"
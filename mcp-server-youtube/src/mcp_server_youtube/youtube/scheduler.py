@@ -0,0 +1,101 @@
+"""
+Rate-limited, bounded-concurrency scheduling of transcript actor runs.
+
+Main responsibility: Let several transcript fetches run in parallel while keeping
+the number of in-flight Apify runs and the run start rate within upstream limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, bursts of up to `capacity`.
+
+    Waiters are served in arrival order, so a steady stream of callers cannot
+    starve an earlier one.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class TranscriptFetchScheduler:
+    """
+    Concurrency cap plus token-bucket rate limit for transcript actor runs.
+
+    `slot()` guards a single actor run; `map()` runs a fetch function over many
+    video ids in parallel and returns results in input order.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        rate_per_second: float = 2.0,
+        burst: int | None = None,
+    ):
+        """
+        Args:
+            max_concurrency: Maximum number of actor runs in flight
+            rate_per_second: Sustained actor run starts per second
+            burst: Run starts allowed back to back (defaults to max_concurrency)
+
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._bucket = TokenBucket(
+            rate_per_second, burst if burst is not None else self.max_concurrency
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a concurrency slot and a rate-limit token for one actor run."""
+        async with self._semaphore:
+            await self._bucket.acquire()
+            yield
+
+    async def map(
+        self, fetch: Callable[[T], Awaitable[R]], items: Iterable[T]
+    ) -> list[R]:
+        """
+        Run `fetch` for every item concurrently.
+
+        `fetch` is expected to take a `slot()` around its actor calls; retries
+        and backoff sleeps then do not hold a slot.
+
+        Returns:
+            Results in the same order as `items`
+
+        """
+        return list(await asyncio.gather(*(fetch(item) for item in items)))
@@ -0,0 +1,263 @@
+"""
+Two-tier cache for YouTube search results.
+
+Main responsibility: Answer repeated searches (same normalized query, result count
+and filters) from an in-memory LRU or the `youtube_search_cache` table instead of
+starting the Apify search actor, and keep hit-rate/latency statistics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from mcp_server_youtube.youtube.api_models import YouTubeSearchResult
+
+logger = logging.getLogger(__name__)
+
+# youtube_videos columns that override the search snapshot when a row exists
+_VIDEO_ROW_FIELDS = {
+    "title": "title",
+    "channel": "channel",
+    "channel_id": "channel_id",
+    "channel_url": "channel_url",
+    "video_url": "url",
+    "duration": "duration",
+    "views": "views",
+    "likes": "likes",
+    "comments": "comments",
+    "upload_date": "upload_date",
+    "description": "description",
+    "thumbnail": "thumbnail",
+}
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries share a key."""
+    return " ".join(query.lower().split())
+
+
+def make_search_cache_key(
+    query: str, max_results: int, **filters: Any
+) -> tuple[str, str, dict[str, Any]]:
+    """
+    Build the cache key for a search.
+
+    Args:
+        query: Raw search query
+        max_results: Number of results requested
+        **filters: Search filters that change the result set (shorts, date, sort)
+
+    Returns:
+        (cache key, normalized query, params dict stored with the entry)
+
+    """
+    normalized = normalize_query(query)
+    params = {"max_results": max_results, **dict(sorted(filters.items()))}
+    key_str = json.dumps({"query": normalized, **params}, sort_keys=True)
+    return hashlib.sha256(key_str.encode("utf-8")).hexdigest(), normalized, params
+
+
+class _LatencyStat:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class SearchResultCache:
+    """
+    In-memory LRU in front of the persistent `youtube_search_cache` table.
+
+    Entries expire after `ttl_seconds` in both tiers. Persistent hits are resolved
+    against existing `youtube_videos` rows, so metadata refreshed by transcript
+    extraction wins over the snapshot taken at search time.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_entries: int = 256,
+        db_manager_factory: Callable[[], Any] | None = None,
+    ):
+        """
+        Args:
+            ttl_seconds: Time to live for cached searches
+            max_entries: Maximum number of searches kept in memory
+            db_manager_factory: Returns the DatabaseManager for the persistent tier
+                (None disables it)
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._db_manager_factory = db_manager_factory
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = (
+            OrderedDict()
+        )
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self._latency = {
+            "memory_hit": _LatencyStat(),
+            "db_hit": _LatencyStat(),
+            "miss": _LatencyStat(),
+        }
+
+    def _db_manager(self) -> Any | None:
+        if self._db_manager_factory is None:
+            return None
+        try:
+            return self._db_manager_factory()
+        except Exception as e:
+            logger.warning(f"Search cache database tier unavailable: {e}")
+            return None
+
+    def _remember(
+        self,
+        cache_key: str,
+        results: list[dict[str, Any]],
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Keep results in memory for `ttl_seconds` (default: the full TTL)."""
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+        with self._lock:
+            self._memory[cache_key] = (time.monotonic() + ttl_seconds, results)
+            self._memory.move_to_end(cache_key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _from_memory(self, cache_key: str) -> list[dict[str, Any]] | None:
+        with self._lock:
+            cached = self._memory.get(cache_key)
+            if cached is None:
+                return None
+            expires, results = cached
+            if expires <= time.monotonic():
+                del self._memory[cache_key]
+                return None
+            self._memory.move_to_end(cache_key)
+            return results
+
+    @staticmethod
+    def _resolve(
+        results: list[dict[str, Any]], videos: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Overlay `youtube_videos` row metadata onto cached search results."""
+        resolved = []
+        for result in results:
+            row = videos.get(result.get("video_id"))
+            if row is not None:
+                result = dict(result)
+                for column, field in _VIDEO_ROW_FIELDS.items():
+                    value = getattr(row, column, None)
+                    if value is not None:
+                        result[field] = value
+                if result.get("url"):
+                    result["link"] = result["webpage_url"] = result["url"]
+            resolved.append(result)
+        return resolved
+
+    async def get(self, cache_key: str) -> list[YouTubeSearchResult] | None:
+        """
+        Look up a search in memory, then in the database.
+
+        Returns:
+            Cached results in their original order, or None on a miss
+
+        """
+        start = time.perf_counter()
+        results = self._from_memory(cache_key)
+        if results is not None:
+            self.memory_hits += 1
+            self._latency["memory_hit"].add(time.perf_counter() - start)
+            return [YouTubeSearchResult.from_dict(r) for r in results]
+
+        db_manager = self._db_manager()
+        if db_manager is not None:
+            entry = await asyncio.to_thread(db_manager.get_search_results, cache_key)
+            if entry is not None:
+                videos = await asyncio.to_thread(
+                    db_manager.batch_get_videos, list(entry.video_ids or [])
+                )
+                results = self._resolve(list(entry.results or []), videos)
+                # Keep the row's own expiry: a promoted entry must not outlive it
+                now = datetime.now(UTC).replace(tzinfo=None)
+                remaining = (entry.expires_at - now).total_seconds()
+                self._remember(cache_key, results, remaining)
+                self.db_hits += 1
+                self._latency["db_hit"].add(time.perf_counter() - start)
+                return [YouTubeSearchResult.from_dict(r) for r in results]
+        return None
+
+    async def set(
+        self,
+        cache_key: str,
+        query: str,
+        params: dict[str, Any],
+        results: list[YouTubeSearchResult],
+    ) -> None:
+        """Store search results in both tiers."""
+        dumped = [r.model_dump(exclude_none=True) for r in results]
+        self._remember(cache_key, dumped)
+        db_manager = self._db_manager()
+        if db_manager is not None:
+            await asyncio.to_thread(
+                db_manager.save_search_results,
+                cache_key,
+                query,
+                params,
+                dumped,
+                self.ttl_seconds,
+            )
+
+    def record_miss(self, seconds: float) -> None:
+        """Record a miss and the time the uncached search took."""
+        self.misses += 1
+        self._latency["miss"].add(seconds)
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (persistent entries expire on their own)."""
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counts, hit rate and per-outcome latency."""
+        lookups = self.memory_hits + self.db_hits + self.misses
+        with self._lock:
+            entries = len(self._memory)
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.db_hits) / lookups
+            if lookups
+            else None,
+            "latency": {k: v.as_dict() for k, v in self._latency.items()},
+        }
@@ -0,0 +1,208 @@
+"""
+Precomputed chunk and timing offsets for transcript slicing.
+
+Main responsibility: Build a small index for a transcript at save time (chunk
+boundaries plus segment start times mapped to character offsets) and use it to
+serve time ranges, character/token windows and paginated chunks without
+rescanning the full text.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
+from typing import Any
+
+INDEX_VERSION = 1
+DEFAULT_CHUNK_CHARS = 2000
+# Rough token estimate used for `max_tokens` windows (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+# How far back from a target offset a boundary may move to land on whitespace
+_SNAP_CHARS = 200
+
+
+class InvalidCursorError(ValueError):
+    """A chunk cursor is malformed or was issued for a different chunk layout."""
+
+
+def _snap_back(text: str, offset: int, floor: int) -> int:
+    """Move `offset` back to just after a sentence end or space, if one is close."""
+    if offset >= len(text):
+        return len(text)
+    window_start = max(floor + 1, offset - _SNAP_CHARS)
+    for sep in (". ", "? ", "! ", " "):
+        pos = text.rfind(sep, window_start, offset)
+        if pos != -1:
+            return pos + len(sep)
+    return offset
+
+
+def build_transcript_index(
+    transcript: str,
+    segments: list[tuple[float, int]] | None = None,
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+) -> dict[str, Any]:
+    """
+    Compute chunk boundaries and timing offsets for a transcript.
+
+    Args:
+        transcript: Full transcript text
+        segments: (start seconds, character offset) per caption segment, if known
+        chunk_chars: Target chunk size; boundaries snap back to sentence or word ends
+
+    Returns:
+        JSON-serializable index stored in `youtube_videos.transcript_index`
+
+    """
+    boundaries = [0]
+    while boundaries[-1] < len(transcript):
+        start = boundaries[-1]
+        boundaries.append(_snap_back(transcript, start + chunk_chars, start))
+    return {
+        "v": INDEX_VERSION,
+        "length": len(transcript),
+        "chunk_chars": chunk_chars,
+        "chunks": boundaries,
+        "segments": [[float(s), int(o)] for s, o in segments or []],
+    }
+
+
+def _layout_digest(index: dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(index["chunks"]).encode()).hexdigest()[:12]
+
+
+def encode_cursor(video_id: str, chunk: int, index: dict[str, Any]) -> str:
+    """Opaque cursor for the page starting at `chunk`."""
+    payload = json.dumps(
+        {"v": video_id, "c": chunk, "h": _layout_digest(index)}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int, str]:
+    """
+    Decode a cursor from `encode_cursor`.
+
+    Returns:
+        (video_id, chunk index, layout digest)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        return str(data["v"]), int(data["c"]), str(data["h"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Malformed transcript cursor") from e
+
+
+def _seconds_at(index: dict[str, Any], offset: int) -> float | None:
+    """Start time of the segment containing character `offset`."""
+    segments = index.get("segments") or []
+    if not segments:
+        return None
+    pos = bisect_right([o for _, o in segments], offset) - 1
+    return segments[max(pos, 0)][0]
+
+
+def _offset_at(index: dict[str, Any], seconds: float, *, end: bool) -> int:
+    """
+    Character offset for a time bound.
+
+    A start bound includes the segment in progress at `seconds`; an end bound
+    stops before the first segment starting at or after `seconds`.
+    """
+    segments = index["segments"]
+    starts = [s for s, _ in segments]
+    if end:
+        pos = bisect_left(starts, seconds)
+    else:
+        pos = max(bisect_right(starts, seconds) - 1, 0)
+    if pos >= len(segments):
+        return index["length"]
+    return segments[pos][1]
+
+
+def slice_transcript(
+    transcript: str,
+    index: dict[str, Any],
+    video_id: str,
+    *,
+    start_seconds: float | None = None,
+    end_seconds: float | None = None,
+    char_offset: int = 0,
+    max_chars: int | None = None,
+    max_tokens: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> tuple[str, dict[str, Any]]:
+    """
+    Cut the requested part out of a transcript using its precomputed index.
+
+    Pagination (`page_size`/`cursor`) returns whole precomputed chunks. Otherwise
+    the range is the time range (when given and timings are known) or starts at
+    `char_offset`, and is capped by `max_chars` or `max_tokens`.
+
+    Returns:
+        (sliced text, window metadata for the response)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or stale for this video
+
+    """
+    chunks = index["chunks"]
+    total_chunks = len(chunks) - 1
+    info: dict[str, Any] = {"total_chunks": total_chunks}
+
+    if page_size is not None or cursor is not None:
+        first = 0
+        if cursor is not None:
+            cursor_video, first, digest = decode_cursor(cursor)
+            if cursor_video == video_id:
+                if digest != _layout_digest(index) or not 0 <= first <= total_chunks:
+                    raise InvalidCursorError(
+                        f"Transcript cursor for {video_id} is stale; restart without it"
+                    )
+            else:
+                first = 0  # cursor belongs to another video in the request
+        last = min(total_chunks, first + (page_size or 1))
+        start, end = chunks[first], chunks[last]
+        info.update(
+            chunk_start=first,
+            chunk_end=last,
+            next_cursor=encode_cursor(video_id, last, index)
+            if last < total_chunks
+            else None,
+        )
+    else:
+        start, end = min(char_offset, index["length"]), index["length"]
+        if index.get("segments") and (
+            start_seconds is not None or end_seconds is not None
+        ):
+            if start_seconds is not None:
+                start = _offset_at(index, start_seconds, end=False)
+            if end_seconds is not None:
+                end = _offset_at(index, end_seconds, end=True)
+        elif start_seconds is not None or end_seconds is not None:
+            info["time_range_unavailable"] = True
+        limits = [max_chars] if max_chars is not None else []
+        if max_tokens is not None:
+            limits.append(max_tokens * CHARS_PER_TOKEN)
+        limit = min(limits) if limits else None
+        if limit is not None and end - start > limit:
+            end = _snap_back(transcript, start + limit, start)
+        end = max(start, end)
+
+    info.update(
+        start_char=start,
+        end_char=end,
+        start_seconds=_seconds_at(index, start),
+        end_seconds=_seconds_at(index, end) if end < index["length"] else None,
+        truncated=end < index["length"],
+    )
+    return transcript[start:end], info
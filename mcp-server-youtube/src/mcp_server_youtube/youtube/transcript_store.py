@@ -0,0 +1,71 @@
+"""
+Compressed encoding for stored transcripts.
+
+Main responsibility: Turn transcript text into compact, versioned byte blobs for the
+`youtube_videos.transcript_data` column and decode them back on demand.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Literal
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+TranscriptCodec = Literal["zstd", "zlib"]
+
+# Two-byte frame header: format version, then codec, so stored blobs stay readable
+# when the configured codec changes or the format evolves
+FORMAT_VERSION = 1
+_CODEC_IDS: dict[TranscriptCodec, int] = {"zlib": 1, "zstd": 2}
+_ID_CODECS = {v: k for k, v in _CODEC_IDS.items()}
+
+
+def resolve_codec(codec: str) -> TranscriptCodec:
+    """Return the codec to write with, falling back to zlib if zstd is unavailable."""
+    if codec == "zstd" and zstandard is not None:
+        return "zstd"
+    return "zlib"
+
+
+def encode_transcript(text: str, codec: TranscriptCodec = "zlib") -> bytes:
+    """
+    Compress transcript text.
+
+    Args:
+        text: Transcript text
+        codec: Compression codec (see `resolve_codec`)
+
+    Returns:
+        Version byte and codec byte followed by the compressed UTF-8 text
+
+    """
+    data = text.encode("utf-8")
+    header = bytes((FORMAT_VERSION, _CODEC_IDS[codec]))
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd codec requires the 'zstandard' package")
+        return header + zstandard.ZstdCompressor(level=3).compress(data)
+    return header + zlib.compress(data, 6)
+
+
+def decode_transcript(payload: bytes) -> str:
+    """Decompress a payload produced by `encode_transcript`."""
+    payload = bytes(payload)  # some drivers return memoryview for bytea
+    version, codec_id = payload[0], payload[1]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported transcript format version: {version}")
+    codec = _ID_CODECS.get(codec_id)
+    body = payload[2:]
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd transcript requires the 'zstandard' package")
+        data = zstandard.ZstdDecompressor().decompress(body)
+    elif codec == "zlib":
+        data = zlib.decompress(body)
+    else:
+        raise ValueError(f"Unknown transcript codec id: {codec_id}")
+    return data.decode("utf-8")
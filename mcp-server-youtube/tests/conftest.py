@@ -22,11 +22,13 @@ def initialize_dependency_container():
     mock_youtube = Mock(spec=YouTubeVideoSearchAndTranscript)
     mock_youtube.search_videos = AsyncMock(return_value=[])
     mock_youtube.get_transcript_safe = AsyncMock(return_value=None)
+    mock_youtube.get_transcripts_batch = AsyncMock(return_value={})
     mock_youtube.search_and_get_transcripts = AsyncMock(return_value=[])
     mock_youtube.extract_transcripts_for_video_ids = AsyncMock(return_value=[])
 
     # Create mock DB manager
     mock_db = MagicMock()
+    mock_db.batch_get_transcript_status = Mock(return_value={})
     mock_db.batch_check_transcripts = Mock(return_value={})
     mock_db.batch_check_video_exists = Mock(return_value={})
     mock_db.get_video = Mock(return_value=None)
@@ -51,6 +53,7 @@ def mock_youtube_client() -> Mock:
     client = Mock(spec=YouTubeVideoSearchAndTranscript)
     client.search_videos = AsyncMock(return_value=[])
     client.get_transcript_safe = AsyncMock(return_value=None)
+    client.get_transcripts_batch = AsyncMock(return_value={})
     client.search_and_get_transcripts = AsyncMock(return_value=[])
     client.extract_transcripts_for_video_ids = AsyncMock(return_value=[])
     return client
@@ -167,3 +170,13 @@ def reset_config_cache():
     # Clear after test too
     get_app_settings.cache_clear()
     get_x402_settings.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_response_cache():
+    """Start each test with an empty transcript response cache."""
+    from mcp_server_youtube.middlewares import caching
+
+    caching._response_cache = None
+    yield
+    caching._response_cache = None
@@ -126,8 +126,7 @@ class TestSearchTranscriptsEndpoint:
 
         # Create mock db manager
         mock_db = MagicMock()
-        mock_db.batch_check_transcripts = Mock(return_value={})
-        mock_db.batch_check_video_exists = Mock(return_value={})
+        mock_db.batch_get_transcript_status = Mock(return_value={})
         mock_db.get_video = Mock(return_value=None)
         mock_db.save_video = Mock(return_value=True)
 
@@ -159,8 +158,7 @@ class TestSearchTranscriptsEndpoint:
         mock_youtube_client.search_videos = AsyncMock(return_value=[])
 
         mock_db = MagicMock()
-        mock_db.batch_check_transcripts = Mock(return_value={})
-        mock_db.batch_check_video_exists = Mock(return_value={})
+        mock_db.batch_get_transcript_status = Mock(return_value={})
 
         app.dependency_overrides[get_youtube_service] = lambda: mock_youtube_client
         app.dependency_overrides[get_db_manager] = lambda: mock_db
@@ -191,8 +189,7 @@ class TestExtractTranscriptsEndpoint:
         mock_youtube_client.get_transcript_safe = AsyncMock(return_value=sample_transcript_result)
 
         mock_db = MagicMock()
-        mock_db.batch_check_transcripts = Mock(return_value={})
-        mock_db.batch_check_video_exists = Mock(return_value={})
+        mock_db.batch_get_transcript_status = Mock(return_value={})
         mock_db.get_video = Mock(return_value=None)
         mock_db.save_video = Mock(return_value=True)
 
@@ -213,6 +210,68 @@ class TestExtractTranscriptsEndpoint:
         finally:
             app.dependency_overrides.clear()
 
+    def test_extract_transcripts_endpoint_batches_uncached_videos(
+        self, app: FastAPI, mock_youtube_client: Mock
+    ):
+        """Test uncached videos are fetched with one batch call, cached ones skipped."""
+        from mcp_server_youtube.dependencies import get_db_manager, get_youtube_service
+        from mcp_server_youtube.youtube.api_models import ApifyTranscriptResult
+
+        mock_youtube_client.get_transcripts_batch = AsyncMock(
+            return_value={
+                vid: ApifyTranscriptResult(
+                    success=True, video_id=vid, transcript=f"text {vid}"
+                )
+                for vid in ["new_1", "new_2"]
+            }
+        )
+        mock_youtube_client.get_transcript_safe = AsyncMock()
+
+        cached_row = MagicMock(
+            transcript_success=True,
+            transcript="cached text",
+            transcript_length=11,
+            title="Cached",
+            channel="Channel",
+            channel_id=None,
+            channel_url=None,
+            video_url="https://www.youtube.com/watch?v=cached",
+            duration=None,
+            views=None,
+            likes=None,
+            comments=None,
+            upload_date=None,
+            description="",
+            thumbnail=None,
+            error=None,
+            is_auto_generated=None,
+            language="en",
+        )
+        mock_db = MagicMock()
+        mock_db.batch_get_transcript_status = Mock(return_value={"cached": True})
+        mock_db.batch_get_videos = Mock(return_value={"cached": cached_row})
+        mock_db.save_video = Mock(return_value=True)
+
+        app.dependency_overrides[get_youtube_service] = lambda: mock_youtube_client
+        app.dependency_overrides[get_db_manager] = lambda: mock_db
+
+        client = TestClient(app)
+        try:
+            response = client.post(
+                "/hybrid/extract-transcripts",
+                json={"video_ids": ["cached", "new_1", "new_2"]},
+            )
+
+            assert response.status_code == 200
+            mock_youtube_client.get_transcripts_batch.assert_awaited_once_with(
+                ["new_1", "new_2"]
+            )
+            mock_youtube_client.get_transcript_safe.assert_not_awaited()
+            transcripts = [v["transcript"] for v in response.json()["videos"]]
+            assert transcripts == ["cached text", "text new_1", "text new_2"]
+        finally:
+            app.dependency_overrides.clear()
+
     def test_extract_transcripts_endpoint_failed_transcripts(
         self, app: FastAPI, mock_youtube_client: Mock
     ):
@@ -229,8 +288,7 @@ class TestExtractTranscriptsEndpoint:
         mock_youtube_client.get_transcript_safe = AsyncMock(return_value=failed_result)
 
         mock_db = MagicMock()
-        mock_db.batch_check_transcripts = Mock(return_value={})
-        mock_db.batch_check_video_exists = Mock(return_value={})
+        mock_db.batch_get_transcript_status = Mock(return_value={})
         mock_db.get_video = Mock(return_value=None)
         mock_db.save_video = Mock(return_value=True)
 
@@ -0,0 +1,184 @@
+"""
+Query count and bytes read by the hybrid transcript endpoints (SQLite-backed).
+"""
+
+import sqlite3
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from mcp_server_youtube.youtube.api_models import YouTubeSearchResult
+from mcp_server_youtube.youtube.methods import DatabaseManager
+from mcp_server_youtube.youtube.models import Base
+
+TRANSCRIPT_CHARS = 50_000
+
+
+class _MeteredCursor(sqlite3.Cursor):
+    def _count(self, rows):
+        self.connection.stats["rows"] += len(rows)
+        self.connection.stats["bytes"] += sum(
+            len(v) if isinstance(v, str | bytes) else 8 for row in rows for v in row
+        )
+        return rows
+
+    def execute(self, sql, params=()):
+        if sql.lstrip().upper().startswith("SELECT"):
+            self.connection.stats["selects"] += 1
+        return super().execute(sql, params)
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is not None:
+            self._count([row])
+        return row
+
+    def fetchmany(self, size=None):
+        return self._count(super().fetchmany(size) if size else super().fetchmany())
+
+    def fetchall(self):
+        return self._count(super().fetchall())
+
+
+class _MeteredConnection(sqlite3.Connection):
+    stats: dict[str, int]
+
+    def cursor(self, factory=_MeteredCursor):
+        return super().cursor(factory)
+
+
+@pytest.fixture
+def metered_db(tmp_path):
+    """DatabaseManager over SQLite that counts SELECTs and bytes fetched."""
+    stats = {"selects": 0, "rows": 0, "bytes": 0}
+
+    def connect():
+        conn = sqlite3.connect(
+            tmp_path / "youtube.db", factory=_MeteredConnection, check_same_thread=False
+        )
+        conn.stats = stats
+        return conn
+
+    manager = DatabaseManager.__new__(DatabaseManager)
+    manager.engine = create_engine("sqlite://", creator=connect)
+    manager.SessionLocal = sessionmaker(bind=manager.engine)
+    Base.metadata.create_all(manager.engine)
+    for i in range(5):
+        manager.save_video(
+            {
+                "video_id": f"cached_{i}",
+                "title": f"Cached {i}",
+                "channel": "Channel",
+                "video_url": f"https://www.youtube.com/watch?v=cached_{i}",
+                "transcript_success": True,
+                "transcript": "x" * TRANSCRIPT_CHARS,
+            }
+        )
+    manager.save_video(
+        {
+            "video_id": "failed_0",
+            "title": "Failed",
+            "channel": "Channel",
+            "video_url": "https://www.youtube.com/watch?v=failed_0",
+            "transcript_success": False,
+            "error": "No subtitles",
+        }
+    )
+    for key in stats:
+        stats[key] = 0
+    return manager, stats
+
+
+def _request(app: FastAPI, db_manager, path: str, body: dict, videos=None) -> dict:
+    from mcp_server_youtube.dependencies import get_db_manager, get_youtube_service
+
+    service = Mock()
+    service.search_videos = AsyncMock(return_value=videos or [])
+    service.get_transcripts_batch = AsyncMock(return_value={})
+    app.dependency_overrides[get_youtube_service] = lambda: service
+    app.dependency_overrides[get_db_manager] = lambda: db_manager
+    try:
+        response = TestClient(app).post(path, json=body)
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestTranscriptEndpointQueries:
+    """Database work done for fully cached requests."""
+
+    def test_extract_transcripts_queries(self, app: FastAPI, metered_db):
+        db_manager, stats = metered_db
+        video_ids = [f"cached_{i}" for i in range(5)] + ["failed_0"]
+
+        data = _request(
+            app, db_manager, "/hybrid/extract-transcripts", {"video_ids": video_ids}
+        )
+
+        assert [v["video_id"] for v in data["videos"]] == video_ids
+        assert data["cached_count"] == 5
+        # One status projection plus one row load; each transcript read once
+        # (was 9 SELECTs and ~4x the transcript bytes)
+        assert stats["selects"] == 2
+        assert stats["bytes"] < 5 * TRANSCRIPT_CHARS * 1.05
+
+    def test_search_transcripts_queries(self, app: FastAPI, metered_db):
+        db_manager, stats = metered_db
+        videos = [
+            YouTubeSearchResult.from_dict({"id": f"cached_{i}", "video_id": f"cached_{i}"})
+            for i in range(5)
+        ]
+
+        data = _request(
+            app,
+            db_manager,
+            "/hybrid/search-transcripts",
+            {"query": "test", "num_videos": 5},
+            videos,
+        )
+
+        assert len(data["videos"]) == 5
+        assert all(v["transcript_length"] == TRANSCRIPT_CHARS for v in data["videos"])
+        # Was 7 SELECTs and ~3x the transcript bytes
+        assert stats["selects"] == 2
+        assert stats["bytes"] < 5 * TRANSCRIPT_CHARS * 1.05
+
+
+class TestBatchGetTranscriptStatus:
+    """Projection-only status lookup."""
+
+    def test_status_flags(self, metered_db):
+        db_manager, stats = metered_db
+
+        status = db_manager.batch_get_transcript_status(
+            ["cached_0", "failed_0", "missing"]
+        )
+
+        assert status == {"cached_0": True, "failed_0": False}
+        assert stats["selects"] == 1
+        assert stats["bytes"] < 100
+
+    def test_wrappers_use_status(self, metered_db):
+        db_manager, _ = metered_db
+        ids = ["cached_1", "failed_0", "missing"]
+
+        assert db_manager.batch_check_transcripts(ids) == {
+            "cached_1": True,
+            "failed_0": False,
+            "missing": False,
+        }
+        assert db_manager.batch_check_video_exists(ids) == {
+            "cached_1": True,
+            "failed_0": True,
+            "missing": False,
+        }
+        assert db_manager.has_transcript("cached_1")
+        assert not db_manager.has_transcript("failed_0")
+        assert db_manager.video_exists("failed_0")
+        assert not db_manager.video_exists("missing")
+        assert db_manager.batch_get_transcript_status([]) == {}
@@ -0,0 +1,277 @@
+"""
+Tests for the transcript HTTP response cache.
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from mcp_server_youtube.middlewares.caching import (
+    ResponseCache,
+    TranscriptCachingMiddleware,
+    make_cache_key,
+    referenced_video_ids,
+)
+from mcp_server_youtube.youtube.api_models import ApifyTranscriptResult
+from mcp_server_youtube.youtube.methods import DatabaseManager
+
+
+class TestCacheKey:
+    """Request canonicalization."""
+
+    def test_key_ignores_formatting_and_field_order(self):
+        a = make_cache_key("/p", "", b'{"video_ids": ["a"], "x": 1}')
+        b = make_cache_key("/p", "", b'{"x":1,"video_ids":["a"]}')
+
+        assert a == b
+
+    def test_key_depends_on_path_query_and_values(self):
+        base = make_cache_key("/p", "", b'{"video_ids": ["a", "b"]}')
+
+        assert base != make_cache_key("/q", "", b'{"video_ids": ["a", "b"]}')
+        assert base != make_cache_key("/p", "v=1", b'{"video_ids": ["a", "b"]}')
+        assert base != make_cache_key("/p", "", b'{"video_ids": ["b", "a"]}')
+
+    def test_invalid_json_is_not_cached(self):
+        assert make_cache_key("/p", "", b"not json") is None
+
+    def test_referenced_video_ids(self):
+        ids = referenced_video_ids(
+            b'{"video_ids": ["a", "b"]}',
+            b'{"videos": [{"video_id": "b"}, {"video_id": "c"}]}',
+        )
+
+        assert ids == ("a", "b", "c")
+
+
+class TestResponseCache:
+    """Memory LRU, disk tier and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_lru_bounded_by_entries_and_bytes(self):
+        cache = ResponseCache(max_entries=2, max_bytes=10)
+        await cache.set("k1", b"aaaa", "application/json", ())
+        await cache.set("k2", b"bbbb", "application/json", ())
+        await cache.get("k1")  # k1 becomes most recent
+        await cache.set("k3", b"cccc", "application/json", ())
+
+        assert await cache.get("k2") is None
+        assert (await cache.get("k1")).body == b"aaaa"
+        assert cache.stats()["bytes"] <= 10
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_dropped(self):
+        cache = ResponseCache(ttl_seconds=0)
+        await cache.set("k", b"body", "application/json", ("a",))
+
+        assert await cache.get("k") is None
+        assert cache._by_video == {}
+
+    @pytest.mark.asyncio
+    async def test_video_index_bounded_by_evictions(self):
+        cache = ResponseCache(max_entries=2)
+        for i in range(1000):
+            await cache.set(f"k{i}", b"body", "application/json", (f"v{i}",))
+
+        assert cache._by_video == {"v998": {"k998"}, "v999": {"k999"}}
+
+    @pytest.mark.asyncio
+    async def test_video_index_bounded_by_disk_pruning(self, tmp_path):
+        cache = ResponseCache(max_entries=1, disk_path=tmp_path, disk_max_bytes=300)
+        for i in range(5):
+            await cache.set(f"k{i}", b"x" * 100, "application/json", (f"v{i}",))
+            time.sleep(0.01)
+
+        on_disk = {p.stem for p in tmp_path.glob("*.resp")}
+        indexed = set().union(*cache._by_video.values())
+        assert indexed == on_disk
+
+    @pytest.mark.asyncio
+    async def test_invalidate_video(self, tmp_path):
+        cache = ResponseCache(disk_path=tmp_path)
+        await cache.set("k1", b"1", "application/json", ("a", "b"))
+        await cache.set("k2", b"2", "application/json", ("b",))
+        await cache.set("k3", b"3", "application/json", ("c",))
+
+        cache.invalidate_video("b")
+
+        assert await cache.get("k1") is None
+        assert await cache.get("k2") is None
+        assert (await cache.get("k3")).body == b"3"
+        assert sorted(p.stem for p in tmp_path.glob("*.resp")) == ["k3"]
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        first = ResponseCache(disk_path=tmp_path)
+        stored = await first.set(
+            "k", b'{"ok": true}', "application/json", ("a",), (("x-endpoint", "1"),)
+        )
+
+        second = ResponseCache(disk_path=tmp_path)
+        entry = await second.get("k")
+
+        assert entry == stored
+        assert entry.headers == (("x-endpoint", "1"),)
+        second.invalidate_video("a")
+        assert not list(tmp_path.glob("*.resp"))
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_bounded(self, tmp_path):
+        cache = ResponseCache(disk_path=tmp_path, disk_max_bytes=300)
+        for i in range(5):
+            await cache.set(f"k{i}", b"x" * 100, "application/json", ())
+            time.sleep(0.01)
+
+        assert sum(p.stat().st_size for p in tmp_path.glob("*.resp")) <= 300
+        assert (tmp_path / "k4.resp").exists()
+
+
+@pytest.fixture
+def cached_app():
+    """Minimal app with the middleware in front of a counting endpoint."""
+    app = FastAPI()
+    cache = ResponseCache()
+    calls = []
+
+    @app.post("/hybrid/extract-transcripts")
+    async def extract(payload: dict, response: Response):
+        calls.append(payload)
+        response.headers["X-Endpoint"] = "extract"
+        return {"videos": [{"video_id": v} for v in payload["video_ids"]]}
+
+    @app.post("/other")
+    async def other(payload: dict):
+        calls.append(payload)
+        return {}
+
+    app.add_middleware(TranscriptCachingMiddleware, cache_provider=lambda: cache)
+    return TestClient(app), cache, calls
+
+
+class TestTranscriptCachingMiddleware:
+    """HTTP behaviour of the middleware."""
+
+    def test_identical_requests_hit_cache(self, cached_app):
+        client, cache, calls = cached_app
+
+        first = client.post("/hybrid/extract-transcripts", json={"video_ids": ["a"]})
+        second = client.post(
+            "/hybrid/extract-transcripts",
+            content=b'{ "video_ids" : ["a"] }',
+            headers={"content-type": "application/json"},
+        )
+
+        assert len(calls) == 1
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.content == first.content
+        assert second.headers["etag"] == first.headers["etag"]
+
+    def test_if_none_match_returns_304(self, cached_app):
+        client, cache, calls = cached_app
+        first = client.post("/hybrid/extract-transcripts", json={"video_ids": ["a"]})
+
+        response = client.post(
+            "/hybrid/extract-transcripts",
+            json={"video_ids": ["a"]},
+            headers={"If-None-Match": f'"other", {first.headers["etag"]}'},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == first.headers["etag"]
+        assert len(calls) == 1
+        assert cache.stats()["not_modified"] == 1
+
+    def test_endpoint_headers_kept_on_miss_and_hit(self, cached_app):
+        client, _, _ = cached_app
+        body = {"video_ids": ["h"]}
+
+        miss = client.post("/hybrid/extract-transcripts", json=body)
+        hit = client.post("/hybrid/extract-transcripts", json=body)
+
+        assert miss.headers["x-cache"] == "MISS"
+        assert hit.headers["x-cache"] == "HIT"
+        for response in (miss, hit):
+            assert response.headers["x-endpoint"] == "extract"
+            assert response.headers["content-type"] == "application/json"
+            assert response.headers["content-length"] == str(len(miss.content))
+        assert hit.headers["etag"] == miss.headers["etag"]
+
+    def test_no_cache_header_refreshes(self, cached_app):
+        client, _, calls = cached_app
+        client.post("/hybrid/extract-transcripts", json={"video_ids": ["a"]})
+
+        response = client.post(
+            "/hybrid/extract-transcripts",
+            json={"video_ids": ["a"]},
+            headers={"Cache-Control": "no-cache"},
+        )
+
+        assert response.headers["x-cache"] == "MISS"
+        assert len(calls) == 2
+
+    def test_invalidation_forces_recompute(self, cached_app):
+        client, cache, calls = cached_app
+        client.post("/hybrid/extract-transcripts", json={"video_ids": ["a"]})
+
+        cache.invalidate_video("a")
+        client.post("/hybrid/extract-transcripts", json={"video_ids": ["a"]})
+
+        assert len(calls) == 2
+
+    def test_other_paths_pass_through(self, cached_app):
+        client, cache, calls = cached_app
+        client.post("/other", json={"x": 1})
+        client.post("/other", json={"x": 1})
+
+        assert len(calls) == 2
+        assert cache.stats()["entries"] == 0
+
+
+class TestTranscriptEndpointCaching:
+    """Middleware on the real application, invalidated by database saves."""
+
+    def test_repeat_request_skips_endpoint_and_save_invalidates(self, app, tmp_path):
+        from mcp_server_youtube.dependencies import get_db_manager, get_youtube_service
+        from mcp_server_youtube.middlewares.caching import get_response_cache
+
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'youtube.db'}")
+        db_manager.add_save_listener(get_response_cache().invalidate_video)
+        service = MagicMock()
+        service.get_transcript_safe = AsyncMock(
+            return_value=ApifyTranscriptResult(
+                success=True, video_id="vid_1", transcript="first"
+            )
+        )
+        service.get_transcripts_batch = AsyncMock(return_value={})
+        db_calls = []
+
+        def db_provider():
+            db_calls.append(1)
+            return db_manager
+
+        app.dependency_overrides[get_youtube_service] = lambda: service
+        app.dependency_overrides[get_db_manager] = db_provider
+        client = TestClient(app)
+        body = {"video_ids": ["vid_1"]}
+        try:
+            first = client.post("/hybrid/extract-transcripts", json=body)
+            second = client.post("/hybrid/extract-transcripts", json=body)
+
+            assert first.status_code == second.status_code == 200
+            assert second.headers["x-cache"] == "HIT"
+            assert len(db_calls) == 1
+
+            db_manager.save_video(
+                {"video_id": "vid_1", "transcript_success": True, "transcript": "second"}
+            )
+            third = client.post("/hybrid/extract-transcripts", json=body)
+
+            assert third.headers["x-cache"] == "MISS"
+            assert third.json()["videos"][0]["transcript"] == "second"
+        finally:
+            app.dependency_overrides.clear()
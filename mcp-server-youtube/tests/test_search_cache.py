@@ -0,0 +1,171 @@
+"""
+Tests for the YouTube search result cache.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mcp_server_youtube.dependencies import DependencyContainer
+from mcp_server_youtube.youtube import (
+    DatabaseManager,
+    SearchResultCache,
+    YouTubeVideoSearchAndTranscript,
+)
+from mcp_server_youtube.youtube.api_models import YouTubeSearchResult
+from mcp_server_youtube.youtube.search_cache import make_search_cache_key
+
+
+def _results(*video_ids: str) -> list[YouTubeSearchResult]:
+    return [
+        YouTubeSearchResult.from_dict(
+            {
+                "id": vid,
+                "video_id": vid,
+                "title": f"Title {vid}",
+                "url": f"https://www.youtube.com/watch?v={vid}",
+                "likes": 10,
+            }
+        )
+        for vid in video_ids
+    ]
+
+
+@pytest.fixture
+def db_manager(tmp_path) -> DatabaseManager:
+    """File-backed SQLite manager (shared across the worker threads)."""
+    return DatabaseManager(f"sqlite:///{tmp_path / 'youtube.db'}")
+
+
+class TestSearchCacheKey:
+    """Test cases for search cache key normalization."""
+
+    def test_key_normalizes_query_case_and_whitespace(self):
+        key_a, normalized, _ = make_search_cache_key("  Python   Tutorial ", 5)
+        key_b, _, _ = make_search_cache_key("python tutorial", 5)
+        assert key_a == key_b
+        assert normalized == "python tutorial"
+
+    def test_key_includes_max_results_and_filters(self):
+        base, _, _ = make_search_cache_key("python", 5, sort_by="relevance")
+        assert make_search_cache_key("python", 10, sort_by="relevance")[0] != base
+        assert make_search_cache_key("python", 5, sort_by="view_count")[0] != base
+
+
+class TestSearchResultCache:
+    """Test cases for the in-memory and persistent tiers."""
+
+    @pytest.mark.asyncio
+    async def test_client_serves_repeated_search_from_cache(self):
+        cache = SearchResultCache(ttl_seconds=60)
+        client = YouTubeVideoSearchAndTranscript(
+            apify_api_token="test_token", search_cache=cache
+        )
+        client._run_search = AsyncMock(return_value=_results("a", "b"))
+
+        first = await client.search_videos("Python Tutorial", max_results=2)
+        second = await client.search_videos("python  tutorial", max_results=2)
+
+        client._run_search.assert_awaited_once()
+        assert [v.video_id for v in second] == [v.video_id for v in first]
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_empty_results_are_not_cached(self):
+        cache = SearchResultCache(ttl_seconds=60)
+        client = YouTubeVideoSearchAndTranscript(
+            apify_api_token="test_token", search_cache=cache
+        )
+        client._run_search = AsyncMock(return_value=[])
+
+        await client.search_videos("nothing", max_results=2)
+        await client.search_videos("nothing", max_results=2)
+
+        assert client._run_search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_and_evicted_entries_miss(self):
+        expired = SearchResultCache(ttl_seconds=0)
+        await expired.set("k", "q", {}, _results("a"))
+        assert await expired.get("k") is None
+
+        lru = SearchResultCache(ttl_seconds=60, max_entries=1)
+        await lru.set("k1", "q1", {}, _results("a"))
+        await lru.set("k2", "q2", {}, _results("b"))
+        assert await lru.get("k1") is None
+        assert [v.video_id for v in await lru.get("k2")] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_persistent_tier_resolves_against_video_rows(
+        self, db_manager: DatabaseManager
+    ):
+        writer = SearchResultCache(
+            ttl_seconds=60, db_manager_factory=lambda: db_manager
+        )
+        await writer.set("key", "python", {"max_results": 2}, _results("a", "b"))
+        db_manager.save_video(
+            {"video_id": "b", "title": "Updated title", "views": 1234}
+        )
+
+        # Fresh process: empty memory tier, same database
+        reader = SearchResultCache(
+            ttl_seconds=60, db_manager_factory=lambda: db_manager
+        )
+        cached = await reader.get("key")
+
+        assert [v.video_id for v in cached] == ["a", "b"]
+        assert cached[0].title == "Title a"
+        assert cached[1].title == "Updated title"
+        assert cached[1].views == 1234
+        assert reader.stats()["db_hits"] == 1
+        # Promoted to memory on the way out
+        await reader.get("key")
+        assert reader.stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_promoted_entry_keeps_database_expiry(
+        self, db_manager: DatabaseManager
+    ):
+        # Persisted with 0.3s left, e.g. by another process near the end of its TTL
+        db_manager.save_search_results("key", "q", {}, [{"video_id": "a"}], 0.3)
+        cache = SearchResultCache(
+            ttl_seconds=3600, db_manager_factory=lambda: db_manager
+        )
+
+        assert [v.video_id for v in await cache.get("key")] == ["a"]
+        await asyncio.sleep(0.5)
+
+        assert await cache.get("key") is None
+        assert cache.stats()["memory_hits"] == 0
+
+    def test_persistent_entries_expire(self, db_manager: DatabaseManager):
+        db_manager.save_search_results("key", "q", {}, [{"video_id": "a"}], 60)
+        assert db_manager.get_search_results("key").video_ids == ["a"]
+        db_manager.save_search_results("key", "q", {}, [{"video_id": "a"}], -1)
+        assert db_manager.get_search_results("key") is None
+
+
+class TestSearchCacheEndpoint:
+    """Test cases for the search cache stats endpoint."""
+
+    def test_stats_endpoint_reports_disabled_cache(self, client: TestClient):
+        response = client.get("/api/search-cache")
+        assert response.status_code == 200
+        assert response.json() == {"enabled": False}
+
+    def test_stats_endpoint_reports_hit_rate(self, client: TestClient):
+        cache = SearchResultCache()
+        cache.record_miss(0.5)
+        DependencyContainer._youtube_service.search_cache = cache
+
+        response = client.get("/api/search-cache")
+
+        data = response.json()
+        assert data["enabled"] is True
+        assert data["misses"] == 1
+        assert data["latency"]["miss"]["avg_ms"] == 500.0
@@ -0,0 +1,130 @@
+"""
+Tests for batched multi-video transcript actor runs.
+"""
+
+import pytest
+
+from mcp_server_youtube.config import get_app_settings
+from mcp_server_youtube.youtube import YouTubeVideoSearchAndTranscript
+from mcp_server_youtube.youtube.scheduler import TranscriptFetchScheduler
+
+
+class FakeBatchTranscriptActor:
+    """Apify client stand-in accepting `videoUrls` (batch) or `videoUrl` (single)."""
+
+    def __init__(
+        self,
+        missing_from_batch: set[str] | None = None,
+        without_transcript: set[str] | None = None,
+    ):
+        self.missing_from_batch = missing_from_batch or set()
+        self.without_transcript = without_transcript or set()
+        self.runs: list[dict] = []
+        self._datasets: dict[str, list[dict]] = {}
+
+    def actor(self, actor_id: str) -> "FakeBatchTranscriptActor":
+        return self
+
+    def call(self, run_input: dict) -> dict:
+        self.runs.append(run_input)
+        urls = run_input.get("videoUrls") or [run_input["videoUrl"]]
+        items = []
+        for url in urls:
+            video_id = url.rsplit("=", 1)[-1]
+            if "videoUrls" in run_input and video_id in self.missing_from_batch:
+                continue
+            if video_id in self.without_transcript:
+                items.append({"videoUrl": url, "data": []})
+                continue
+            items.append(
+                {"videoUrl": url, "data": [{"text": f"transcript of {video_id}"}]}
+            )
+        dataset_id = f"ds{len(self.runs)}"
+        self._datasets[dataset_id] = items
+        return {"defaultDatasetId": dataset_id}
+
+    def dataset(self, dataset_id: str):
+        items = self._datasets[dataset_id]
+
+        class _Dataset:
+            def iterate_items(self):
+                return iter(items)
+
+        return _Dataset()
+
+
+def _client(actor: FakeBatchTranscriptActor) -> YouTubeVideoSearchAndTranscript:
+    client = YouTubeVideoSearchAndTranscript(
+        delay_between_requests=0.01,
+        apify_api_token="test_token",
+        transcript_scheduler=TranscriptFetchScheduler(
+            max_concurrency=4, rate_per_second=100
+        ),
+    )
+    client.apify_client = actor
+    return client
+
+
+VIDEO_IDS = [f"vid{i:08d}" for i in range(5)]  # 11-character ids
+
+
+class TestTranscriptBatch:
+    """Test cases for get_transcripts_batch."""
+
+    @pytest.fixture(autouse=True)
+    def batch_size(self):
+        # Settings cache is reset around every test (conftest)
+        get_app_settings().youtube.transcript_batch_size = 2
+
+    @pytest.mark.asyncio
+    async def test_videos_are_chunked_into_batch_runs(self):
+        actor = FakeBatchTranscriptActor()
+        results = await _client(actor).get_transcripts_batch(VIDEO_IDS + VIDEO_IDS[:1])
+
+        assert [len(r["videoUrls"]) for r in actor.runs] == [2, 2, 1]
+        assert list(results) == VIDEO_IDS
+        assert results["vid00000003"].transcript == "transcript of vid00000003"
+        assert all(r.success and r.language == "en" for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_missing_videos_fall_back_to_single_runs(self):
+        actor = FakeBatchTranscriptActor(missing_from_batch={"vid00000001"})
+        results = await _client(actor).get_transcripts_batch(VIDEO_IDS)
+
+        single_runs = [r for r in actor.runs if "videoUrl" in r]
+        assert [r["videoUrl"] for r in single_runs] == [
+            "https://www.youtube.com/watch?v=vid00000001"
+        ]
+        assert results["vid00000001"].transcript == "transcript of vid00000001"
+
+    @pytest.mark.asyncio
+    async def test_videos_without_transcript_are_not_rerun(self):
+        actor = FakeBatchTranscriptActor(without_transcript={"vid00000002"})
+        results = await _client(actor).get_transcripts_batch(VIDEO_IDS)
+
+        assert all("videoUrls" in r for r in actor.runs)
+        assert not results["vid00000002"].success
+        assert results["vid00000002"].error == "No subtitles available for this video"
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_run_falls_back_for_whole_chunk(self):
+        actor = FakeBatchTranscriptActor()
+        original_call = actor.call
+
+        def call(run_input: dict) -> dict:
+            if "videoUrls" in run_input and "vid00000000" in run_input["videoUrls"][0]:
+                raise RuntimeError("actor crashed")
+            return original_call(run_input)
+
+        actor.call = call
+        results = await _client(actor).get_transcripts_batch(VIDEO_IDS)
+
+        assert all(r.success for r in results.values())
+        assert sorted(r["videoUrl"][-11:] for r in actor.runs if "videoUrl" in r) == [
+            "vid00000000",
+            "vid00000001",
+        ]
+
+
+def test_batching_is_off_by_default():
+    assert get_app_settings().youtube.transcript_batch_size == 1
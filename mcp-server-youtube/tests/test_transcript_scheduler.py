@@ -0,0 +1,121 @@
+"""
+Tests and fake-actor benchmark for concurrent, rate-limited transcript extraction.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mcp_server_youtube.youtube import YouTubeVideoSearchAndTranscript
+from mcp_server_youtube.youtube.scheduler import TokenBucket, TranscriptFetchScheduler
+
+
+class FakeTranscriptActor:
+    """Apify client stand-in whose transcript actor run takes `run_seconds`."""
+
+    def __init__(self, run_seconds: float):
+        self.run_seconds = run_seconds
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def actor(self, actor_id: str) -> "FakeTranscriptActor":
+        return self
+
+    def call(self, run_input: dict) -> dict:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.run_seconds)
+        with self._lock:
+            self.in_flight -= 1
+        return {"defaultDatasetId": run_input["videoUrl"].rsplit("=", 1)[-1]}
+
+    def dataset(self, dataset_id: str) -> "FakeTranscriptActor":
+        self._dataset_id = dataset_id
+        return self
+
+    def iterate_items(self):
+        return iter([{"data": [{"text": f"transcript of {self._dataset_id}"}]}])
+
+
+def _client(actor: FakeTranscriptActor, max_concurrency: int, rate: float):
+    client = YouTubeVideoSearchAndTranscript(
+        delay_between_requests=0.01,
+        apify_api_token="test_token",
+        transcript_scheduler=TranscriptFetchScheduler(
+            max_concurrency=max_concurrency, rate_per_second=rate
+        ),
+    )
+    client.apify_client = actor
+    return client
+
+
+class TestTokenBucket:
+    """Test cases for the token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_bucket_limits_sustained_rate(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        # First token is immediate, the next four arrive every 50 ms
+        assert time.monotonic() - start >= 0.18
+
+    def test_bucket_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestTranscriptFetchScheduler:
+    """Test cases for concurrent transcript extraction."""
+
+    @pytest.mark.asyncio
+    async def test_map_preserves_input_order(self):
+        scheduler = TranscriptFetchScheduler(max_concurrency=4, rate_per_second=100)
+
+        async def fetch(delay: float) -> float:
+            async with scheduler.slot():
+                await asyncio.sleep(delay)
+            return delay
+
+        delays = [0.04, 0.01, 0.03, 0.0, 0.02]
+        assert await scheduler.map(fetch, delays) == delays
+
+    @pytest.mark.asyncio
+    async def test_extraction_respects_concurrency_cap(self):
+        actor = FakeTranscriptActor(run_seconds=0.05)
+        client = _client(actor, max_concurrency=2, rate=100)
+
+        results = await client.extract_transcripts_for_video_ids(
+            [f"v{i}" for i in range(6)]
+        )
+
+        assert actor.max_in_flight == 2
+        assert [r["video_id"] for r in results] == [f"v{i}" for i in range(6)]
+        assert results[3]["transcript"] == "transcript of v3"
+
+    @pytest.mark.asyncio
+    async def test_benchmark_concurrent_vs_sequential(self):
+        """Ten 100 ms fake actor runs: sequential vs 5 concurrent."""
+        video_ids = [f"v{i}" for i in range(10)]
+
+        sequential = _client(FakeTranscriptActor(0.1), max_concurrency=1, rate=100)
+        start = time.perf_counter()
+        seq_results = await sequential.extract_transcripts_for_video_ids(video_ids)
+        seq_elapsed = time.perf_counter() - start
+
+        concurrent = _client(FakeTranscriptActor(0.1), max_concurrency=5, rate=100)
+        start = time.perf_counter()
+        con_results = await concurrent.extract_transcripts_for_video_ids(video_ids)
+        con_elapsed = time.perf_counter() - start
+
+        print(
+            f"\nsequential={seq_elapsed:.3f}s concurrent={con_elapsed:.3f}s "
+            f"speedup={seq_elapsed / con_elapsed:.1f}x"
+        )
+        assert con_results == seq_results
+        assert seq_elapsed / con_elapsed > 2.5
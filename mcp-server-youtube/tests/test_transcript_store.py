@@ -0,0 +1,168 @@
+"""
+Tests for compressed transcript storage.
+"""
+
+import sqlite3
+
+import pytest
+
+from mcp_server_youtube.youtube import models
+from mcp_server_youtube.youtube.methods import DatabaseManager
+from mcp_server_youtube.youtube.models import YouTubeVideo
+from mcp_server_youtube.youtube.transcript_store import (
+    FORMAT_VERSION,
+    decode_transcript,
+    encode_transcript,
+    resolve_codec,
+)
+
+TRANSCRIPT = "Welcome back to the channel. Today we talk about Python. " * 200
+
+
+def _video(video_id: str, transcript: str | None = TRANSCRIPT) -> dict:
+    return {
+        "video_id": video_id,
+        "title": f"Video {video_id}",
+        "transcript_success": transcript is not None,
+        "transcript": transcript,
+    }
+
+
+def _stored_columns(db_path, video_id: str) -> tuple:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT transcript, transcript_data FROM youtube_videos WHERE video_id = ?",
+            (video_id,),
+        ).fetchone()
+
+
+class TestTranscriptCodec:
+    """Encoding and decoding of transcript blobs."""
+
+    def test_round_trip(self):
+        payload = encode_transcript("héllo wörld " * 100, "zlib")
+
+        assert payload[0] == FORMAT_VERSION
+        assert len(payload) < len("héllo wörld " * 100)
+        assert decode_transcript(payload) == "héllo wörld " * 100
+
+    def test_accepts_memoryview(self):
+        payload = encode_transcript("text", "zlib")
+
+        assert decode_transcript(memoryview(payload)) == "text"
+
+    def test_rejects_unknown_version(self):
+        payload = bytearray(encode_transcript("text", "zlib"))
+        payload[0] = FORMAT_VERSION + 1
+
+        with pytest.raises(ValueError, match="format version"):
+            decode_transcript(bytes(payload))
+
+    def test_resolve_codec(self):
+        assert resolve_codec("zlib") == "zlib"
+        assert resolve_codec("unknown") == "zlib"
+
+
+class TestCompressedStorage:
+    """DatabaseManager transcript storage modes and migration."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return tmp_path / "youtube.db"
+
+    def test_compressed_mode_writes_blob(self, db_path):
+        manager = DatabaseManager(f"sqlite:///{db_path}", transcript_storage="compressed")
+
+        assert manager.save_video(_video("vid_1"))
+
+        text_column, blob = _stored_columns(db_path, "vid_1")
+        assert text_column is None
+        assert len(blob) < len(TRANSCRIPT) // 10
+        video = manager.get_video("vid_1")
+        assert video.transcript == TRANSCRIPT
+        assert video.transcript_length == len(TRANSCRIPT)
+        assert manager.batch_check_transcripts(["vid_1"]) == {"vid_1": True}
+
+    def test_text_mode_writes_plain_column(self, db_path):
+        manager = DatabaseManager(f"sqlite:///{db_path}", transcript_storage="text")
+
+        manager.save_video(_video("vid_1"))
+
+        assert _stored_columns(db_path, "vid_1") == (TRANSCRIPT, None)
+        assert manager.get_video("vid_1").transcript == TRANSCRIPT
+
+    def test_update_switches_storage(self, db_path):
+        text_manager = DatabaseManager(f"sqlite:///{db_path}", transcript_storage="text")
+        text_manager.save_video(_video("vid_1", "old transcript"))
+        manager = DatabaseManager(f"sqlite:///{db_path}", transcript_storage="compressed")
+
+        manager.save_video(_video("vid_1", "new transcript"))
+
+        text_column, blob = _stored_columns(db_path, "vid_1")
+        assert text_column is None
+        assert manager.get_video("vid_1").transcript == "new transcript"
+
+    def test_decompresses_lazily_once(self, db_path, monkeypatch):
+        manager = DatabaseManager(f"sqlite:///{db_path}", transcript_storage="compressed")
+        manager.save_video(_video("vid_1"))
+        calls = []
+
+        def counting_decode(payload):
+            calls.append(payload)
+            return decode_transcript(payload)
+
+        monkeypatch.setattr(models, "decode_transcript", counting_decode)
+
+        video = manager.batch_get_videos(["vid_1"])["vid_1"]
+        assert video.title == "Video vid_1"
+        assert calls == []
+        assert video.transcript == TRANSCRIPT
+        assert video.transcript == TRANSCRIPT
+        assert len(calls) == 1
+
+    def test_adds_column_to_legacy_table(self, db_path):
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE youtube_videos (video_id VARCHAR(255) PRIMARY KEY, "
+                "title VARCHAR(500), transcript_success BOOLEAN, transcript TEXT, "
+                "transcript_length INTEGER)"
+            )
+            conn.execute(
+                "INSERT INTO youtube_videos VALUES ('legacy', 'Legacy', 1, 'legacy text', 11)"
+            )
+
+        manager = DatabaseManager(f"sqlite:///{db_path}")
+
+        with sqlite3.connect(db_path) as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(youtube_videos)")}
+        assert "transcript_data" in columns
+        assert manager.has_transcript("legacy")
+
+    def test_migrate_transcripts(self, db_path):
+        text_manager = DatabaseManager(f"sqlite:///{db_path}", transcript_storage="text")
+        for i in range(5):
+            text_manager.save_video(_video(f"vid_{i}", f"transcript {i} " * 50))
+        text_manager.save_video(_video("failed", None))
+        manager = DatabaseManager(f"sqlite:///{db_path}", transcript_storage="compressed")
+
+        assert manager.migrate_transcripts(batch_size=2) == 5
+        assert manager.migrate_transcripts() == 0
+
+        for i in range(5):
+            text_column, blob = _stored_columns(db_path, f"vid_{i}")
+            assert text_column is None and blob is not None
+            assert manager.get_video(f"vid_{i}").transcript == f"transcript {i} " * 50
+        assert _stored_columns(db_path, "failed") == (None, None)
+        assert manager.batch_check_transcripts(["vid_0", "failed"]) == {
+            "vid_0": True,
+            "failed": False,
+        }
+
+
+def test_transcript_setter_clears_blob():
+    video = YouTubeVideo(video_id="vid_1", transcript_data=encode_transcript("old"))
+
+    video.transcript = "new"
+
+    assert video.transcript_data is None
+    assert video.transcript == "new"
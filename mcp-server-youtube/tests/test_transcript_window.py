@@ -0,0 +1,192 @@
+"""
+Tests for chunked and windowed transcript retrieval.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from mcp_server_youtube.schemas import TranscriptWindow
+from mcp_server_youtube.youtube.api_models import ApifyTranscriptResult
+from mcp_server_youtube.youtube.methods import DatabaseManager
+from mcp_server_youtube.youtube.transcript_chunks import (
+    InvalidCursorError,
+    build_transcript_index,
+    encode_cursor,
+    slice_transcript,
+)
+
+
+def _segments(count: int = 600) -> list[dict]:
+    """Caption segments two seconds apart, roughly 60 characters each."""
+    return [
+        {"start": f"{i * 2.0:.2f}", "dur": "2.0", "text": f"Segment {i} says something useful here."}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def result() -> ApifyTranscriptResult:
+    return ApifyTranscriptResult.from_apify_response("vid_1", [{"data": _segments()}])
+
+
+class TestTranscriptIndex:
+    """Index building and slicing."""
+
+    def test_segments_map_to_offsets(self, result):
+        assert len(result.segments) == 600
+        for start, offset in result.segments[:5]:
+            index = int(start / 2)
+            assert result.transcript[offset:].startswith(f"Segment {index} ")
+
+    def test_segments_omitted_without_timings(self):
+        plain = ApifyTranscriptResult.from_apify_response(
+            "vid_1", [{"data": [{"text": "one"}, {"text": "two"}]}]
+        )
+
+        assert plain.transcript == "one two"
+        assert plain.segments is None
+
+    def test_chunks_cover_text_on_word_boundaries(self, result):
+        index = build_transcript_index(result.transcript, result.segments, 500)
+        chunks = index["chunks"]
+
+        assert chunks[0] == 0 and chunks[-1] == len(result.transcript)
+        assert all(0 < b - a <= 500 for a, b in zip(chunks, chunks[1:]))
+        assert all(result.transcript[b - 1] == " " for b in chunks[1:-1])
+
+    def test_time_range(self, result):
+        index = build_transcript_index(result.transcript, result.segments)
+
+        text, info = slice_transcript(
+            result.transcript, index, "vid_1", start_seconds=20.5, end_seconds=30
+        )
+
+        assert text.startswith("Segment 10 ")
+        assert text.rstrip().endswith("Segment 14 says something useful here.")
+        assert info["start_seconds"] == 20.0
+        assert info["end_seconds"] == 30.0
+        assert info["truncated"] is True
+
+    def test_time_range_without_timings(self):
+        transcript = "word " * 100
+        index = build_transcript_index(transcript)
+
+        text, info = slice_transcript(transcript, index, "vid_1", start_seconds=10)
+
+        assert text == transcript
+        assert info["time_range_unavailable"] is True
+
+    def test_char_and_token_windows(self, result):
+        index = build_transcript_index(result.transcript, result.segments)
+
+        text, info = slice_transcript(
+            result.transcript, index, "vid_1", char_offset=100, max_chars=300
+        )
+        assert len(text) <= 300
+        assert result.transcript[100:].startswith(text)
+        assert info["start_char"] == 100 and info["end_char"] == 100 + len(text)
+
+        text, _ = slice_transcript(result.transcript, index, "vid_1", max_tokens=50)
+        assert 150 < len(text) <= 200
+
+    def test_pagination_reassembles_transcript(self, result):
+        index = build_transcript_index(result.transcript, result.segments, 1000)
+        pages, cursor = [], None
+        while True:
+            text, info = slice_transcript(
+                result.transcript, index, "vid_1", page_size=3, cursor=cursor
+            )
+            pages.append(text)
+            cursor = info["next_cursor"]
+            if cursor is None:
+                break
+
+        assert "".join(pages) == result.transcript
+        assert len(pages) == -(-info["total_chunks"] // 3)
+
+    def test_cursor_is_stable_and_checked(self, result):
+        index = build_transcript_index(result.transcript, result.segments, 1000)
+        rebuilt = build_transcript_index(result.transcript, result.segments, 1000)
+        changed = build_transcript_index(result.transcript + " more", None, 1000)
+        cursor = encode_cursor("vid_1", 2, index)
+
+        assert cursor == encode_cursor("vid_1", 2, rebuilt)
+        with pytest.raises(InvalidCursorError):
+            slice_transcript(result.transcript, changed, "vid_1", cursor=cursor)
+        with pytest.raises(InvalidCursorError):
+            slice_transcript(result.transcript, index, "vid_1", cursor="garbage!")
+        _, info = slice_transcript(result.transcript, index, "other", cursor=cursor)
+        assert info["chunk_start"] == 0
+
+    def test_window_modes_are_exclusive(self):
+        with pytest.raises(ValidationError):
+            TranscriptWindow(page_size=2, max_chars=100)
+        with pytest.raises(ValidationError):
+            TranscriptWindow(start_seconds=10, end_seconds=5)
+        assert TranscriptWindow(start_seconds=5, max_tokens=100).max_tokens == 100
+
+
+class TestWindowedEndpoint:
+    """Windowed responses from /hybrid/extract-transcripts."""
+
+    @pytest.fixture
+    def client(self, app: FastAPI, tmp_path, result):
+        from mcp_server_youtube.dependencies import get_db_manager, get_youtube_service
+
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'youtube.db'}")
+        service = MagicMock()
+        service.get_transcript_safe = AsyncMock(return_value=result)
+        service.get_transcripts_batch = AsyncMock(return_value={})
+        app.dependency_overrides[get_youtube_service] = lambda: service
+        app.dependency_overrides[get_db_manager] = lambda: db_manager
+        yield TestClient(app), db_manager
+        app.dependency_overrides.clear()
+
+    def _post(self, client: TestClient, window: dict | None = None):
+        body = {"video_ids": ["vid_1"]}
+        if window is not None:
+            body["window"] = window
+        return client.post("/hybrid/extract-transcripts", json=body)
+
+    def test_index_saved_and_windows_served(self, client, result):
+        client, db_manager = client
+        full = self._post(client)
+        assert full.status_code == 200
+        assert full.json()["videos"][0]["transcript_window"] is None
+
+        stored = db_manager.get_video("vid_1").transcript_index
+        assert stored["segments"][10] == [20.0, result.segments[10][1]]
+
+        windowed = self._post(client, {"start_seconds": 60, "end_seconds": 90})
+        video = windowed.json()["videos"][0]
+        assert video["transcript"].startswith("Segment 30 ")
+        assert video["transcript_length"] == len(result.transcript)
+        assert video["transcript_window"]["start_seconds"] == 60.0
+        assert len(windowed.content) < len(full.content) / 5
+
+    def test_pagination_over_endpoint(self, client, result):
+        client, _ = client
+        pages, cursor = [], None
+        while True:
+            window = {"page_size": 2} | ({"cursor": cursor} if cursor else {})
+            response = self._post(client, window)
+            assert response.status_code == 200
+            info = response.json()["videos"][0]["transcript_window"]
+            pages.append(response.json()["videos"][0]["transcript"])
+            cursor = info["next_cursor"]
+            if cursor is None:
+                break
+
+        assert "".join(pages) == result.transcript
+
+    def test_bad_cursor_is_client_error(self, client):
+        client, _ = client
+        self._post(client)
+
+        response = self._post(client, {"cursor": encode_cursor("vid_1", 1, {"chunks": [0]})})
+
+        assert response.status_code == 400